@@ -0,0 +1,973 @@
+from asdl import const  # For const.NO_INTEGER
+from asdl import runtime
+from asdl.runtime import (
+  PrettyLeaf, PrettyArray, PrettyNode,
+  Color_TypeName, Color_StringConst, Color_OtherConst, Color_UserType,
+)
+
+from typing import Optional, List, Tuple, Dict, Any
+
+class expr_e(object):
+  Concatenation = 1
+  Disjunction = 2
+  Conjunction = 3
+  Negation = 4
+  True_ = 5
+  False_ = 6
+  PathTest = 7
+  StatTest = 8
+  DeleteAction = 9
+  PruneAction = 10
+  QuitAction = 11
+  PrintAction = 12
+  LsAction = 13
+  ExecAction = 14
+
+class expr_t(runtime.CompoundObj):
+  pass
+
+class expr__Concatenation(expr_t):
+  tag = 1
+  __slots__ = ('exprs', 'spids')
+
+  def __init__(self, exprs=None, spids=None):
+    # type: (Optional[List[expr_t]], Optional[List[int]]) -> None
+    self.exprs = exprs or []
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Concatenation')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(('exprs', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Concatenation')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__Disjunction(expr_t):
+  tag = 2
+  __slots__ = ('exprs', 'spids')
+
+  def __init__(self, exprs=None, spids=None):
+    # type: (Optional[List[expr_t]], Optional[List[int]]) -> None
+    self.exprs = exprs or []
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Disjunction')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(('exprs', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Disjunction')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__Conjunction(expr_t):
+  tag = 3
+  __slots__ = ('exprs', 'spids')
+
+  def __init__(self, exprs=None, spids=None):
+    # type: (Optional[List[expr_t]], Optional[List[int]]) -> None
+    self.exprs = exprs or []
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Conjunction')
+    L = out_node.fields
+
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.PrettyTree())
+      L.append(('exprs', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Conjunction')
+    L = out_node.fields
+    if self.exprs:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.exprs:
+        x0.children.append(i0.AbbreviatedTree())
+      L.append(('exprs', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__Negation(expr_t):
+  tag = 4
+  __slots__ = ('expr', 'spids')
+
+  def __init__(self, expr=None, spids=None):
+    # type: (Optional[expr_t], Optional[List[int]]) -> None
+    self.expr = expr
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Negation')
+    L = out_node.fields
+
+    assert self.expr is not None
+    x0 = self.expr.PrettyTree()
+    L.append(('expr', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.Negation')
+    L = out_node.fields
+    assert self.expr is not None
+    x0 = self.expr.AbbreviatedTree()
+    L.append(('expr', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__True_(expr_t):
+  tag = 5
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.True_')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.True_')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__False_(expr_t):
+  tag = 6
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.False_')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.False_')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__PathTest(expr_t):
+  tag = 7
+  __slots__ = ('a', 'p', 'spids')
+
+  def __init__(self, a=None, p=None, spids=None):
+    # type: (Optional[pathAccessor_t], Optional[predicate_t], Optional[List[int]]) -> None
+    self.a = a
+    self.p = p
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PathTest')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = PrettyLeaf(self.a.name, Color_TypeName)
+    L.append(('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.PrettyTree()
+    L.append(('p', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PathTest')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = PrettyLeaf(self.a.name, Color_TypeName)
+    L.append(('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.AbbreviatedTree()
+    L.append(('p', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__StatTest(expr_t):
+  tag = 8
+  __slots__ = ('a', 'p', 'spids')
+
+  def __init__(self, a=None, p=None, spids=None):
+    # type: (Optional[statAccessor_t], Optional[predicate_t], Optional[List[int]]) -> None
+    self.a = a
+    self.p = p
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.StatTest')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = PrettyLeaf(self.a.name, Color_TypeName)
+    L.append(('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.PrettyTree()
+    L.append(('p', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.StatTest')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = PrettyLeaf(self.a.name, Color_TypeName)
+    L.append(('a', x0))
+
+    assert self.p is not None
+    x1 = self.p.AbbreviatedTree()
+    L.append(('p', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__DeleteAction(expr_t):
+  tag = 9
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.DeleteAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.DeleteAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__PruneAction(expr_t):
+  tag = 10
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PruneAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PruneAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__QuitAction(expr_t):
+  tag = 11
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.QuitAction')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.QuitAction')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__PrintAction(expr_t):
+  tag = 12
+  __slots__ = ('file', 'format', 'spids')
+
+  def __init__(self, file=None, format=None, spids=None):
+    # type: (Optional[str], Optional[str], Optional[List[int]]) -> None
+    self.file = file or ''
+    self.format = format or ''
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PrintAction')
+    L = out_node.fields
+
+    if self.file is not None:  # MaybeType
+      x0 = PrettyLeaf(self.file, Color_StringConst)
+      L.append(('file', x0))
+
+    if self.format is not None:  # MaybeType
+      x1 = PrettyLeaf(self.format, Color_StringConst)
+      L.append(('format', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.PrintAction')
+    L = out_node.fields
+    if self.file is not None:  # MaybeType
+      x0 = PrettyLeaf(self.file, Color_StringConst)
+      L.append(('file', x0))
+
+    if self.format is not None:  # MaybeType
+      x1 = PrettyLeaf(self.format, Color_StringConst)
+      L.append(('format', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__LsAction(expr_t):
+  tag = 13
+  __slots__ = ('file', 'spids')
+
+  def __init__(self, file=None, spids=None):
+    # type: (Optional[str], Optional[List[int]]) -> None
+    self.file = file or ''
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.LsAction')
+    L = out_node.fields
+
+    if self.file is not None:  # MaybeType
+      x0 = PrettyLeaf(self.file, Color_StringConst)
+      L.append(('file', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.LsAction')
+    L = out_node.fields
+    if self.file is not None:  # MaybeType
+      x0 = PrettyLeaf(self.file, Color_StringConst)
+      L.append(('file', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr__ExecAction(expr_t):
+  tag = 14
+  __slots__ = ('batch', 'dir', 'ok', 'argv', 'spids')
+
+  def __init__(self, batch=None, dir=None, ok=None, argv=None, spids=None):
+    # type: (Optional[bool], Optional[bool], Optional[bool], Optional[List[str]], Optional[List[int]]) -> None
+    self.batch = batch
+    self.dir = dir
+    self.ok = ok
+    self.argv = argv or []
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.ExecAction')
+    L = out_node.fields
+
+    x0 = PrettyLeaf('T' if self.batch else 'F', Color_OtherConst)
+    L.append(('batch', x0))
+
+    x1 = PrettyLeaf('T' if self.dir else 'F', Color_OtherConst)
+    L.append(('dir', x1))
+
+    x2 = PrettyLeaf('T' if self.ok else 'F', Color_OtherConst)
+    L.append(('ok', x2))
+
+    if self.argv:  # ArrayType
+      x3 = PrettyArray()
+      for i3 in self.argv:
+        x3.children.append(PrettyLeaf(i3, Color_StringConst))
+      L.append(('argv', x3))
+
+    if self.spids:  # ArrayType
+      x4 = PrettyArray()
+      for i4 in self.spids:
+        x4.children.append(PrettyLeaf(str(i4), Color_OtherConst))
+      L.append(('spids', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('expr.ExecAction')
+    L = out_node.fields
+    x0 = PrettyLeaf('T' if self.batch else 'F', Color_OtherConst)
+    L.append(('batch', x0))
+
+    x1 = PrettyLeaf('T' if self.dir else 'F', Color_OtherConst)
+    L.append(('dir', x1))
+
+    x2 = PrettyLeaf('T' if self.ok else 'F', Color_OtherConst)
+    L.append(('ok', x2))
+
+    if self.argv:  # ArrayType
+      x3 = PrettyArray()
+      for i3 in self.argv:
+        x3.children.append(PrettyLeaf(i3, Color_StringConst))
+      L.append(('argv', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class expr(object):
+  Concatenation = expr__Concatenation
+  Disjunction = expr__Disjunction
+  Conjunction = expr__Conjunction
+  Negation = expr__Negation
+  True_ = expr__True_
+  False_ = expr__False_
+  PathTest = expr__PathTest
+  StatTest = expr__StatTest
+  DeleteAction = expr__DeleteAction
+  PruneAction = expr__PruneAction
+  QuitAction = expr__QuitAction
+  PrintAction = expr__PrintAction
+  LsAction = expr__LsAction
+  ExecAction = expr__ExecAction
+
+class pathAccessor_t(runtime.SimpleObj):
+  pass
+
+class pathAccessor_e(object):
+  FullPath = pathAccessor_t(1, 'FullPath')
+  Filename = pathAccessor_t(2, 'Filename')
+
+class statAccessor_t(runtime.SimpleObj):
+  pass
+
+class statAccessor_e(object):
+  AccessTime = statAccessor_t(1, 'AccessTime')
+  CreationTime = statAccessor_t(2, 'CreationTime')
+  ModificationTime = statAccessor_t(3, 'ModificationTime')
+  Filesystem = statAccessor_t(4, 'Filesystem')
+  Inode = statAccessor_t(5, 'Inode')
+  LinkCount = statAccessor_t(6, 'LinkCount')
+  Mode = statAccessor_t(7, 'Mode')
+  Filetype = statAccessor_t(8, 'Filetype')
+  Uid = statAccessor_t(9, 'Uid')
+  Gid = statAccessor_t(10, 'Gid')
+  Username = statAccessor_t(11, 'Username')
+  Groupname = statAccessor_t(12, 'Groupname')
+  Size = statAccessor_t(13, 'Size')
+
+class predicate_e(object):
+  EQ = 1
+  GE = 2
+  LE = 3
+  StringMatch = 4
+  GlobMatch = 5
+  RegexMatch = 6
+  Readable = 7
+  Writable = 8
+  Executable = 9
+
+class predicate_t(runtime.CompoundObj):
+  pass
+
+class predicate__EQ(predicate_t):
+  tag = 1
+  __slots__ = ('n', 'spids')
+
+  def __init__(self, n=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.n = n
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.EQ')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.EQ')
+    L = out_node.fields
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__GE(predicate_t):
+  tag = 2
+  __slots__ = ('n', 'spids')
+
+  def __init__(self, n=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.n = n
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.GE')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.GE')
+    L = out_node.fields
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__LE(predicate_t):
+  tag = 3
+  __slots__ = ('n', 'spids')
+
+  def __init__(self, n=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.n = n
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.LE')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.LE')
+    L = out_node.fields
+    x0 = PrettyLeaf(str(self.n), Color_OtherConst)
+    L.append(('n', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__StringMatch(predicate_t):
+  tag = 4
+  __slots__ = ('str', 'ignoreCase', 'spids')
+
+  def __init__(self, str=None, ignoreCase=None, spids=None):
+    # type: (Optional[str], Optional[bool], Optional[List[int]]) -> None
+    self.str = str
+    self.ignoreCase = ignoreCase or None
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.StringMatch')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.str, Color_StringConst)
+    L.append(('str', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.StringMatch')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.str, Color_StringConst)
+    L.append(('str', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__GlobMatch(predicate_t):
+  tag = 5
+  __slots__ = ('glob', 'ignoreCase', 'spids')
+
+  def __init__(self, glob=None, ignoreCase=None, spids=None):
+    # type: (Optional[str], Optional[bool], Optional[List[int]]) -> None
+    self.glob = glob
+    self.ignoreCase = ignoreCase or None
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.GlobMatch')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.glob, Color_StringConst)
+    L.append(('glob', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.GlobMatch')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.glob, Color_StringConst)
+    L.append(('glob', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__RegexMatch(predicate_t):
+  tag = 6
+  __slots__ = ('re', 'ignoreCase', 'spids')
+
+  def __init__(self, re=None, ignoreCase=None, spids=None):
+    # type: (Optional[str], Optional[bool], Optional[List[int]]) -> None
+    self.re = re
+    self.ignoreCase = ignoreCase or None
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.RegexMatch')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.re, Color_StringConst)
+    L.append(('re', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.RegexMatch')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.re, Color_StringConst)
+    L.append(('re', x0))
+
+    if self.ignoreCase is not None:  # MaybeType
+      x1 = PrettyLeaf('T' if self.ignoreCase else 'F', Color_OtherConst)
+      L.append(('ignoreCase', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__Readable(predicate_t):
+  tag = 7
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Readable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Readable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__Writable(predicate_t):
+  tag = 8
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Writable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Writable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate__Executable(predicate_t):
+  tag = 9
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Executable')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('predicate.Executable')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class predicate(object):
+  EQ = predicate__EQ
+  GE = predicate__GE
+  LE = predicate__LE
+  StringMatch = predicate__StringMatch
+  GlobMatch = predicate__GlobMatch
+  RegexMatch = predicate__RegexMatch
+  Readable = predicate__Readable
+  Writable = predicate__Writable
+  Executable = predicate__Executable
+
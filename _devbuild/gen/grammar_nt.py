@@ -0,0 +1,113 @@
+# This code is generated by pgen2/grammar.py
+
+single_input = 256
+and_expr = 257
+and_test = 258
+annassign = 259
+arglist = 260
+argument = 261
+arith_expr = 262
+array_literal = 263
+assert_stmt = 264
+async_funcdef = 265
+async_stmt = 266
+atom = 267
+atom_expr = 268
+augassign = 269
+break_stmt = 270
+char_class = 271
+char_class_part = 272
+classdef = 273
+command_sub = 274
+comp_for = 275
+comp_if = 276
+comp_iter = 277
+comp_op = 278
+comparison = 279
+compound_stmt = 280
+continue_stmt = 281
+del_stmt = 282
+dictorsetmaker = 283
+dotted_as_name = 284
+dotted_as_names = 285
+dotted_name = 286
+dq_part = 287
+dq_string = 288
+encoding_decl = 289
+end_stmt = 290
+eval_input = 291
+except_clause = 292
+expr = 293
+expr_stmt = 294
+exprlist = 295
+factor = 296
+file_input = 297
+flow_stmt = 298
+for_stmt = 299
+funcdef = 300
+global_stmt = 301
+if_stmt = 302
+import_as_name = 303
+import_as_names = 304
+import_from = 305
+import_name = 306
+import_stmt = 307
+lambdef = 308
+lambdef_nocond = 309
+lvalue = 310
+lvalue_list = 311
+lvalue_trailer = 312
+nonlocal_stmt = 313
+not_test = 314
+oil_arglist = 315
+oil_expr = 316
+oil_for = 317
+oil_func_proc = 318
+oil_setvar = 319
+oil_var = 320
+or_test = 321
+param = 322
+parameters = 323
+params = 324
+pass_stmt = 325
+power = 326
+raise_stmt = 327
+regex_literal = 328
+regex_part = 329
+return_expr = 330
+return_stmt = 331
+sh_array_literal = 332
+sh_command_sub = 333
+shift_expr = 334
+simple_stmt = 335
+sliceop = 336
+small_stmt = 337
+star_expr = 338
+stmt = 339
+subscript = 340
+subscriptlist = 341
+suite = 342
+sync_comp_for = 343
+term = 344
+test = 345
+test_nocond = 346
+testlist = 347
+testlist_comp = 348
+testlist_star_expr = 349
+tfpdef = 350
+trailer = 351
+try_stmt = 352
+type_expr = 353
+typedargslist = 354
+var_sub = 355
+varargslist = 356
+vfpdef = 357
+while_stmt = 358
+with_item = 359
+with_stmt = 360
+word = 361
+word_part = 362
+xor_expr = 363
+yield_arg = 364
+yield_expr = 365
+yield_stmt = 366
@@ -0,0 +1,311 @@
+#define id__Undefined_Tok 1
+#define id__Unknown_Tok 2
+#define id__Eol_Tok 3
+#define id__Eof_Real 4
+#define id__Eof_RParen 5
+#define id__Eof_Backtick 6
+#define id__Ignored_LineCont 7
+#define id__Ignored_Space 8
+#define id__Ignored_Comment 9
+#define id__WS_Space 10
+#define id__Lit_Chars 11
+#define id__Lit_VarLike 12
+#define id__Lit_ArrayLhsOpen 13
+#define id__Lit_ArrayLhsClose 14
+#define id__Lit_Splice 15
+#define id__Lit_Other 16
+#define id__Lit_EscapedChar 17
+#define id__Lit_RegexMeta 18
+#define id__Lit_LBracket 19
+#define id__Lit_RBracket 20
+#define id__Lit_Star 21
+#define id__Lit_QMark 22
+#define id__Lit_LBrace 23
+#define id__Lit_RBrace 24
+#define id__Lit_Comma 25
+#define id__Lit_Equals 26
+#define id__Lit_DRightBracket 27
+#define id__Lit_TildeLike 28
+#define id__Lit_Pound 29
+#define id__Lit_Slash 30
+#define id__Lit_Percent 31
+#define id__Lit_Digits 32
+#define id__Lit_At 33
+#define id__Lit_ArithVarLike 34
+#define id__Lit_CompDummy 35
+#define id__Backtick_Right 36
+#define id__Backtick_Quoted 37
+#define id__Backtick_Other 38
+#define id__History_Op 39
+#define id__History_Num 40
+#define id__History_Search 41
+#define id__History_Other 42
+#define id__Op_Newline 43
+#define id__Op_Amp 44
+#define id__Op_Pipe 45
+#define id__Op_PipeAmp 46
+#define id__Op_DAmp 47
+#define id__Op_DPipe 48
+#define id__Op_Semi 49
+#define id__Op_DSemi 50
+#define id__Op_LParen 51
+#define id__Op_RParen 52
+#define id__Op_DLeftParen 53
+#define id__Op_DRightParen 54
+#define id__Op_Less 55
+#define id__Op_Great 56
+#define id__Op_Bang 57
+#define id__Op_LBracket 58
+#define id__Op_RBracket 59
+#define id__Op_LBrace 60
+#define id__Op_RBrace 61
+#define id__Redir_Less 62
+#define id__Redir_Great 63
+#define id__Redir_DLess 64
+#define id__Redir_TLess 65
+#define id__Redir_DGreat 66
+#define id__Redir_GreatAnd 67
+#define id__Redir_LessAnd 68
+#define id__Redir_DLessDash 69
+#define id__Redir_LessGreat 70
+#define id__Redir_Clobber 71
+#define id__Redir_AndGreat 72
+#define id__Redir_AndDGreat 73
+#define id__Redir_GreatPlus 74
+#define id__Redir_DGreatPlus 75
+#define id__Fd_Number 76
+#define id__Fd_Name 77
+#define id__Left_DoubleQuote 78
+#define id__Left_SingleQuote 79
+#define id__Left_Backtick 80
+#define id__Left_DollarParen 81
+#define id__Left_DollarBrace 82
+#define id__Left_DollarDParen 83
+#define id__Left_DollarBracket 84
+#define id__Left_DollarDoubleQuote 85
+#define id__Left_DollarSingleQuote 86
+#define id__Left_ProcSubIn 87
+#define id__Left_ProcSubOut 88
+#define id__Left_DollarSlash 89
+#define id__Left_AtBracket 90
+#define id__Left_AtParen 91
+#define id__Right_DoubleQuote 92
+#define id__Right_SingleQuote 93
+#define id__Right_Backtick 94
+#define id__Right_DollarBrace 95
+#define id__Right_DollarDParen 96
+#define id__Right_DollarDoubleQuote 97
+#define id__Right_DollarSingleQuote 98
+#define id__Right_Subshell 99
+#define id__Right_FuncDef 100
+#define id__Right_CasePat 101
+#define id__Right_ArrayLiteral 102
+#define id__Right_ExtGlob 103
+#define id__ExtGlob_At 104
+#define id__ExtGlob_Star 105
+#define id__ExtGlob_Plus 106
+#define id__ExtGlob_QMark 107
+#define id__ExtGlob_Bang 108
+#define id__VSub_DollarName 109
+#define id__VSub_Name 110
+#define id__VSub_Number 111
+#define id__VSub_Bang 112
+#define id__VSub_At 113
+#define id__VSub_Pound 114
+#define id__VSub_Dollar 115
+#define id__VSub_Star 116
+#define id__VSub_Hyphen 117
+#define id__VSub_QMark 118
+#define id__VTest_ColonHyphen 119
+#define id__VTest_Hyphen 120
+#define id__VTest_ColonEquals 121
+#define id__VTest_Equals 122
+#define id__VTest_ColonQMark 123
+#define id__VTest_QMark 124
+#define id__VTest_ColonPlus 125
+#define id__VTest_Plus 126
+#define id__VOp0_Q 127
+#define id__VOp0_E 128
+#define id__VOp0_P 129
+#define id__VOp0_A 130
+#define id__VOp0_a 131
+#define id__VOp1_Percent 132
+#define id__VOp1_DPercent 133
+#define id__VOp1_Pound 134
+#define id__VOp1_DPound 135
+#define id__VOp1_Caret 136
+#define id__VOp1_DCaret 137
+#define id__VOp1_Comma 138
+#define id__VOp1_DComma 139
+#define id__VOp2_Slash 140
+#define id__VOp2_Colon 141
+#define id__VOp2_LBracket 142
+#define id__VOp2_RBracket 143
+#define id__Arith_Semi 144
+#define id__Arith_Comma 145
+#define id__Arith_Plus 146
+#define id__Arith_Minus 147
+#define id__Arith_Star 148
+#define id__Arith_Slash 149
+#define id__Arith_Percent 150
+#define id__Arith_DPlus 151
+#define id__Arith_DMinus 152
+#define id__Arith_DStar 153
+#define id__Arith_LParen 154
+#define id__Arith_RParen 155
+#define id__Arith_LBracket 156
+#define id__Arith_RBracket 157
+#define id__Arith_RBrace 158
+#define id__Arith_QMark 159
+#define id__Arith_Colon 160
+#define id__Arith_LessEqual 161
+#define id__Arith_Less 162
+#define id__Arith_GreatEqual 163
+#define id__Arith_Great 164
+#define id__Arith_DEqual 165
+#define id__Arith_NEqual 166
+#define id__Arith_DAmp 167
+#define id__Arith_DPipe 168
+#define id__Arith_Bang 169
+#define id__Arith_DGreat 170
+#define id__Arith_DLess 171
+#define id__Arith_Amp 172
+#define id__Arith_Pipe 173
+#define id__Arith_Caret 174
+#define id__Arith_Tilde 175
+#define id__Arith_Equal 176
+#define id__Arith_PlusEqual 177
+#define id__Arith_MinusEqual 178
+#define id__Arith_StarEqual 179
+#define id__Arith_SlashEqual 180
+#define id__Arith_PercentEqual 181
+#define id__Arith_DGreatEqual 182
+#define id__Arith_DLessEqual 183
+#define id__Arith_AmpEqual 184
+#define id__Arith_PipeEqual 185
+#define id__Arith_CaretEqual 186
+#define id__Expr_Name 187
+#define id__Expr_Digits 188
+#define id__Expr_Dot 189
+#define id__Expr_DColon 190
+#define id__Expr_RArrow 191
+#define id__Expr_RDArrow 192
+#define id__Expr_At 193
+#define id__Expr_DoubleAt 194
+#define id__Expr_NotTilde 195
+#define id__Expr_WordsDummy 196
+#define id__Expr_CommandDummy 197
+#define id__Node_PostDPlus 198
+#define id__Node_PostDMinus 199
+#define id__Node_UnaryPlus 200
+#define id__Node_UnaryMinus 201
+#define id__Word_Compound 202
+#define id__KW_DLeftBracket 203
+#define id__KW_Bang 204
+#define id__KW_For 205
+#define id__KW_While 206
+#define id__KW_Until 207
+#define id__KW_Do 208
+#define id__KW_Done 209
+#define id__KW_In 210
+#define id__KW_Case 211
+#define id__KW_Esac 212
+#define id__KW_If 213
+#define id__KW_Fi 214
+#define id__KW_Then 215
+#define id__KW_Else 216
+#define id__KW_Elif 217
+#define id__KW_Function 218
+#define id__KW_Time 219
+#define id__KW_Const 220
+#define id__KW_Set 221
+#define id__KW_Var 222
+#define id__KW_Auto 223
+#define id__KW_SetVar 224
+#define id__KW_Proc 225
+#define id__KW_Func 226
+#define id__KW_Match 227
+#define id__KW_With 228
+#define id__KW_Switch 229
+#define id__ControlFlow_Break 230
+#define id__ControlFlow_Continue 231
+#define id__ControlFlow_Return 232
+#define id__ControlFlow_Exit 233
+#define id__Char_OneChar 234
+#define id__Char_Stop 235
+#define id__Char_Hex 236
+#define id__Char_Octal3 237
+#define id__Char_Octal4 238
+#define id__Char_Unicode4 239
+#define id__Char_Unicode8 240
+#define id__Char_Literals 241
+#define id__Char_BadBackslash 242
+#define id__Glob_LBracket 243
+#define id__Glob_RBracket 244
+#define id__Glob_Star 245
+#define id__Glob_QMark 246
+#define id__Glob_Bang 247
+#define id__Glob_Caret 248
+#define id__Glob_EscapedChar 249
+#define id__Glob_BadBackslash 250
+#define id__Glob_CleanLiterals 251
+#define id__Glob_OtherLiteral 252
+#define id__Glob_Eof 253
+#define id__Format_EscapedPercent 254
+#define id__Format_Percent 255
+#define id__Format_Flag 256
+#define id__Format_Num 257
+#define id__Format_Dot 258
+#define id__Format_Type 259
+#define id__PS_Subst 260
+#define id__PS_Octal3 261
+#define id__PS_LBrace 262
+#define id__PS_RBrace 263
+#define id__PS_Literals 264
+#define id__PS_BadBackslash 265
+#define id__Range_Int 266
+#define id__Range_Char 267
+#define id__Range_Dots 268
+#define id__Range_Other 269
+#define id__Range_Eof 270
+#define id__BoolUnary_z 271
+#define id__BoolUnary_n 272
+#define id__BoolUnary_o 273
+#define id__BoolUnary_t 274
+#define id__BoolUnary_v 275
+#define id__BoolUnary_R 276
+#define id__BoolUnary_a 277
+#define id__BoolUnary_b 278
+#define id__BoolUnary_c 279
+#define id__BoolUnary_d 280
+#define id__BoolUnary_e 281
+#define id__BoolUnary_f 282
+#define id__BoolUnary_g 283
+#define id__BoolUnary_h 284
+#define id__BoolUnary_L 285
+#define id__BoolUnary_p 286
+#define id__BoolUnary_r 287
+#define id__BoolUnary_s 288
+#define id__BoolUnary_S 289
+#define id__BoolUnary_u 290
+#define id__BoolUnary_w 291
+#define id__BoolUnary_x 292
+#define id__BoolUnary_O 293
+#define id__BoolUnary_G 294
+#define id__BoolUnary_N 295
+#define id__BoolBinary_GlobEqual 296
+#define id__BoolBinary_GlobDEqual 297
+#define id__BoolBinary_GlobNEqual 298
+#define id__BoolBinary_EqualTilde 299
+#define id__BoolBinary_ef 300
+#define id__BoolBinary_nt 301
+#define id__BoolBinary_ot 302
+#define id__BoolBinary_eq 303
+#define id__BoolBinary_ne 304
+#define id__BoolBinary_gt 305
+#define id__BoolBinary_ge 306
+#define id__BoolBinary_lt 307
+#define id__BoolBinary_le 308
+#define id__BoolBinary_Equal 309
+#define id__BoolBinary_DEqual 310
+#define id__BoolBinary_NEqual 311
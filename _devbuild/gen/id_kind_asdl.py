@@ -0,0 +1,710 @@
+from asdl import runtime
+from typing import List
+
+class Id_t(runtime.SimpleObj):
+  pass
+
+class Id(object):
+  Undefined_Tok = Id_t(1, 'Undefined_Tok')
+  Unknown_Tok = Id_t(2, 'Unknown_Tok')
+  Eol_Tok = Id_t(3, 'Eol_Tok')
+  Eof_Real = Id_t(4, 'Eof_Real')
+  Eof_RParen = Id_t(5, 'Eof_RParen')
+  Eof_Backtick = Id_t(6, 'Eof_Backtick')
+  Ignored_LineCont = Id_t(7, 'Ignored_LineCont')
+  Ignored_Space = Id_t(8, 'Ignored_Space')
+  Ignored_Comment = Id_t(9, 'Ignored_Comment')
+  WS_Space = Id_t(10, 'WS_Space')
+  Lit_Chars = Id_t(11, 'Lit_Chars')
+  Lit_VarLike = Id_t(12, 'Lit_VarLike')
+  Lit_ArrayLhsOpen = Id_t(13, 'Lit_ArrayLhsOpen')
+  Lit_ArrayLhsClose = Id_t(14, 'Lit_ArrayLhsClose')
+  Lit_Splice = Id_t(15, 'Lit_Splice')
+  Lit_Other = Id_t(16, 'Lit_Other')
+  Lit_EscapedChar = Id_t(17, 'Lit_EscapedChar')
+  Lit_RegexMeta = Id_t(18, 'Lit_RegexMeta')
+  Lit_LBracket = Id_t(19, 'Lit_LBracket')
+  Lit_RBracket = Id_t(20, 'Lit_RBracket')
+  Lit_Star = Id_t(21, 'Lit_Star')
+  Lit_QMark = Id_t(22, 'Lit_QMark')
+  Lit_LBrace = Id_t(23, 'Lit_LBrace')
+  Lit_RBrace = Id_t(24, 'Lit_RBrace')
+  Lit_Comma = Id_t(25, 'Lit_Comma')
+  Lit_Equals = Id_t(26, 'Lit_Equals')
+  Lit_DRightBracket = Id_t(27, 'Lit_DRightBracket')
+  Lit_TildeLike = Id_t(28, 'Lit_TildeLike')
+  Lit_Pound = Id_t(29, 'Lit_Pound')
+  Lit_Slash = Id_t(30, 'Lit_Slash')
+  Lit_Percent = Id_t(31, 'Lit_Percent')
+  Lit_Digits = Id_t(32, 'Lit_Digits')
+  Lit_At = Id_t(33, 'Lit_At')
+  Lit_ArithVarLike = Id_t(34, 'Lit_ArithVarLike')
+  Lit_CompDummy = Id_t(35, 'Lit_CompDummy')
+  Backtick_Right = Id_t(36, 'Backtick_Right')
+  Backtick_Quoted = Id_t(37, 'Backtick_Quoted')
+  Backtick_Other = Id_t(38, 'Backtick_Other')
+  History_Op = Id_t(39, 'History_Op')
+  History_Num = Id_t(40, 'History_Num')
+  History_Search = Id_t(41, 'History_Search')
+  History_Other = Id_t(42, 'History_Other')
+  Op_Newline = Id_t(43, 'Op_Newline')
+  Op_Amp = Id_t(44, 'Op_Amp')
+  Op_Pipe = Id_t(45, 'Op_Pipe')
+  Op_PipeAmp = Id_t(46, 'Op_PipeAmp')
+  Op_DAmp = Id_t(47, 'Op_DAmp')
+  Op_DPipe = Id_t(48, 'Op_DPipe')
+  Op_Semi = Id_t(49, 'Op_Semi')
+  Op_DSemi = Id_t(50, 'Op_DSemi')
+  Op_LParen = Id_t(51, 'Op_LParen')
+  Op_RParen = Id_t(52, 'Op_RParen')
+  Op_DLeftParen = Id_t(53, 'Op_DLeftParen')
+  Op_DRightParen = Id_t(54, 'Op_DRightParen')
+  Op_Less = Id_t(55, 'Op_Less')
+  Op_Great = Id_t(56, 'Op_Great')
+  Op_Bang = Id_t(57, 'Op_Bang')
+  Op_LBracket = Id_t(58, 'Op_LBracket')
+  Op_RBracket = Id_t(59, 'Op_RBracket')
+  Op_LBrace = Id_t(60, 'Op_LBrace')
+  Op_RBrace = Id_t(61, 'Op_RBrace')
+  Redir_Less = Id_t(62, 'Redir_Less')
+  Redir_Great = Id_t(63, 'Redir_Great')
+  Redir_DLess = Id_t(64, 'Redir_DLess')
+  Redir_TLess = Id_t(65, 'Redir_TLess')
+  Redir_DGreat = Id_t(66, 'Redir_DGreat')
+  Redir_GreatAnd = Id_t(67, 'Redir_GreatAnd')
+  Redir_LessAnd = Id_t(68, 'Redir_LessAnd')
+  Redir_DLessDash = Id_t(69, 'Redir_DLessDash')
+  Redir_LessGreat = Id_t(70, 'Redir_LessGreat')
+  Redir_Clobber = Id_t(71, 'Redir_Clobber')
+  Redir_AndGreat = Id_t(72, 'Redir_AndGreat')
+  Redir_AndDGreat = Id_t(73, 'Redir_AndDGreat')
+  Redir_GreatPlus = Id_t(74, 'Redir_GreatPlus')
+  Redir_DGreatPlus = Id_t(75, 'Redir_DGreatPlus')
+  Fd_Number = Id_t(76, 'Fd_Number')
+  Fd_Name = Id_t(77, 'Fd_Name')
+  Left_DoubleQuote = Id_t(78, 'Left_DoubleQuote')
+  Left_SingleQuote = Id_t(79, 'Left_SingleQuote')
+  Left_Backtick = Id_t(80, 'Left_Backtick')
+  Left_DollarParen = Id_t(81, 'Left_DollarParen')
+  Left_DollarBrace = Id_t(82, 'Left_DollarBrace')
+  Left_DollarDParen = Id_t(83, 'Left_DollarDParen')
+  Left_DollarBracket = Id_t(84, 'Left_DollarBracket')
+  Left_DollarDoubleQuote = Id_t(85, 'Left_DollarDoubleQuote')
+  Left_DollarSingleQuote = Id_t(86, 'Left_DollarSingleQuote')
+  Left_ProcSubIn = Id_t(87, 'Left_ProcSubIn')
+  Left_ProcSubOut = Id_t(88, 'Left_ProcSubOut')
+  Left_DollarSlash = Id_t(89, 'Left_DollarSlash')
+  Left_AtBracket = Id_t(90, 'Left_AtBracket')
+  Left_AtParen = Id_t(91, 'Left_AtParen')
+  Right_DoubleQuote = Id_t(92, 'Right_DoubleQuote')
+  Right_SingleQuote = Id_t(93, 'Right_SingleQuote')
+  Right_Backtick = Id_t(94, 'Right_Backtick')
+  Right_DollarBrace = Id_t(95, 'Right_DollarBrace')
+  Right_DollarDParen = Id_t(96, 'Right_DollarDParen')
+  Right_DollarDoubleQuote = Id_t(97, 'Right_DollarDoubleQuote')
+  Right_DollarSingleQuote = Id_t(98, 'Right_DollarSingleQuote')
+  Right_Subshell = Id_t(99, 'Right_Subshell')
+  Right_FuncDef = Id_t(100, 'Right_FuncDef')
+  Right_CasePat = Id_t(101, 'Right_CasePat')
+  Right_ArrayLiteral = Id_t(102, 'Right_ArrayLiteral')
+  Right_ExtGlob = Id_t(103, 'Right_ExtGlob')
+  ExtGlob_At = Id_t(104, 'ExtGlob_At')
+  ExtGlob_Star = Id_t(105, 'ExtGlob_Star')
+  ExtGlob_Plus = Id_t(106, 'ExtGlob_Plus')
+  ExtGlob_QMark = Id_t(107, 'ExtGlob_QMark')
+  ExtGlob_Bang = Id_t(108, 'ExtGlob_Bang')
+  VSub_DollarName = Id_t(109, 'VSub_DollarName')
+  VSub_Name = Id_t(110, 'VSub_Name')
+  VSub_Number = Id_t(111, 'VSub_Number')
+  VSub_Bang = Id_t(112, 'VSub_Bang')
+  VSub_At = Id_t(113, 'VSub_At')
+  VSub_Pound = Id_t(114, 'VSub_Pound')
+  VSub_Dollar = Id_t(115, 'VSub_Dollar')
+  VSub_Star = Id_t(116, 'VSub_Star')
+  VSub_Hyphen = Id_t(117, 'VSub_Hyphen')
+  VSub_QMark = Id_t(118, 'VSub_QMark')
+  VTest_ColonHyphen = Id_t(119, 'VTest_ColonHyphen')
+  VTest_Hyphen = Id_t(120, 'VTest_Hyphen')
+  VTest_ColonEquals = Id_t(121, 'VTest_ColonEquals')
+  VTest_Equals = Id_t(122, 'VTest_Equals')
+  VTest_ColonQMark = Id_t(123, 'VTest_ColonQMark')
+  VTest_QMark = Id_t(124, 'VTest_QMark')
+  VTest_ColonPlus = Id_t(125, 'VTest_ColonPlus')
+  VTest_Plus = Id_t(126, 'VTest_Plus')
+  VOp0_Q = Id_t(127, 'VOp0_Q')
+  VOp0_E = Id_t(128, 'VOp0_E')
+  VOp0_P = Id_t(129, 'VOp0_P')
+  VOp0_A = Id_t(130, 'VOp0_A')
+  VOp0_a = Id_t(131, 'VOp0_a')
+  VOp1_Percent = Id_t(132, 'VOp1_Percent')
+  VOp1_DPercent = Id_t(133, 'VOp1_DPercent')
+  VOp1_Pound = Id_t(134, 'VOp1_Pound')
+  VOp1_DPound = Id_t(135, 'VOp1_DPound')
+  VOp1_Caret = Id_t(136, 'VOp1_Caret')
+  VOp1_DCaret = Id_t(137, 'VOp1_DCaret')
+  VOp1_Comma = Id_t(138, 'VOp1_Comma')
+  VOp1_DComma = Id_t(139, 'VOp1_DComma')
+  VOp2_Slash = Id_t(140, 'VOp2_Slash')
+  VOp2_Colon = Id_t(141, 'VOp2_Colon')
+  VOp2_LBracket = Id_t(142, 'VOp2_LBracket')
+  VOp2_RBracket = Id_t(143, 'VOp2_RBracket')
+  Arith_Semi = Id_t(144, 'Arith_Semi')
+  Arith_Comma = Id_t(145, 'Arith_Comma')
+  Arith_Plus = Id_t(146, 'Arith_Plus')
+  Arith_Minus = Id_t(147, 'Arith_Minus')
+  Arith_Star = Id_t(148, 'Arith_Star')
+  Arith_Slash = Id_t(149, 'Arith_Slash')
+  Arith_Percent = Id_t(150, 'Arith_Percent')
+  Arith_DPlus = Id_t(151, 'Arith_DPlus')
+  Arith_DMinus = Id_t(152, 'Arith_DMinus')
+  Arith_DStar = Id_t(153, 'Arith_DStar')
+  Arith_LParen = Id_t(154, 'Arith_LParen')
+  Arith_RParen = Id_t(155, 'Arith_RParen')
+  Arith_LBracket = Id_t(156, 'Arith_LBracket')
+  Arith_RBracket = Id_t(157, 'Arith_RBracket')
+  Arith_RBrace = Id_t(158, 'Arith_RBrace')
+  Arith_QMark = Id_t(159, 'Arith_QMark')
+  Arith_Colon = Id_t(160, 'Arith_Colon')
+  Arith_LessEqual = Id_t(161, 'Arith_LessEqual')
+  Arith_Less = Id_t(162, 'Arith_Less')
+  Arith_GreatEqual = Id_t(163, 'Arith_GreatEqual')
+  Arith_Great = Id_t(164, 'Arith_Great')
+  Arith_DEqual = Id_t(165, 'Arith_DEqual')
+  Arith_NEqual = Id_t(166, 'Arith_NEqual')
+  Arith_DAmp = Id_t(167, 'Arith_DAmp')
+  Arith_DPipe = Id_t(168, 'Arith_DPipe')
+  Arith_Bang = Id_t(169, 'Arith_Bang')
+  Arith_DGreat = Id_t(170, 'Arith_DGreat')
+  Arith_DLess = Id_t(171, 'Arith_DLess')
+  Arith_Amp = Id_t(172, 'Arith_Amp')
+  Arith_Pipe = Id_t(173, 'Arith_Pipe')
+  Arith_Caret = Id_t(174, 'Arith_Caret')
+  Arith_Tilde = Id_t(175, 'Arith_Tilde')
+  Arith_Equal = Id_t(176, 'Arith_Equal')
+  Arith_PlusEqual = Id_t(177, 'Arith_PlusEqual')
+  Arith_MinusEqual = Id_t(178, 'Arith_MinusEqual')
+  Arith_StarEqual = Id_t(179, 'Arith_StarEqual')
+  Arith_SlashEqual = Id_t(180, 'Arith_SlashEqual')
+  Arith_PercentEqual = Id_t(181, 'Arith_PercentEqual')
+  Arith_DGreatEqual = Id_t(182, 'Arith_DGreatEqual')
+  Arith_DLessEqual = Id_t(183, 'Arith_DLessEqual')
+  Arith_AmpEqual = Id_t(184, 'Arith_AmpEqual')
+  Arith_PipeEqual = Id_t(185, 'Arith_PipeEqual')
+  Arith_CaretEqual = Id_t(186, 'Arith_CaretEqual')
+  Expr_Name = Id_t(187, 'Expr_Name')
+  Expr_Digits = Id_t(188, 'Expr_Digits')
+  Expr_Dot = Id_t(189, 'Expr_Dot')
+  Expr_DColon = Id_t(190, 'Expr_DColon')
+  Expr_RArrow = Id_t(191, 'Expr_RArrow')
+  Expr_RDArrow = Id_t(192, 'Expr_RDArrow')
+  Expr_At = Id_t(193, 'Expr_At')
+  Expr_DoubleAt = Id_t(194, 'Expr_DoubleAt')
+  Expr_NotTilde = Id_t(195, 'Expr_NotTilde')
+  Expr_WordsDummy = Id_t(196, 'Expr_WordsDummy')
+  Expr_CommandDummy = Id_t(197, 'Expr_CommandDummy')
+  Node_PostDPlus = Id_t(198, 'Node_PostDPlus')
+  Node_PostDMinus = Id_t(199, 'Node_PostDMinus')
+  Node_UnaryPlus = Id_t(200, 'Node_UnaryPlus')
+  Node_UnaryMinus = Id_t(201, 'Node_UnaryMinus')
+  Word_Compound = Id_t(202, 'Word_Compound')
+  KW_DLeftBracket = Id_t(203, 'KW_DLeftBracket')
+  KW_Bang = Id_t(204, 'KW_Bang')
+  KW_For = Id_t(205, 'KW_For')
+  KW_While = Id_t(206, 'KW_While')
+  KW_Until = Id_t(207, 'KW_Until')
+  KW_Do = Id_t(208, 'KW_Do')
+  KW_Done = Id_t(209, 'KW_Done')
+  KW_In = Id_t(210, 'KW_In')
+  KW_Case = Id_t(211, 'KW_Case')
+  KW_Esac = Id_t(212, 'KW_Esac')
+  KW_If = Id_t(213, 'KW_If')
+  KW_Fi = Id_t(214, 'KW_Fi')
+  KW_Then = Id_t(215, 'KW_Then')
+  KW_Else = Id_t(216, 'KW_Else')
+  KW_Elif = Id_t(217, 'KW_Elif')
+  KW_Function = Id_t(218, 'KW_Function')
+  KW_Time = Id_t(219, 'KW_Time')
+  KW_Const = Id_t(220, 'KW_Const')
+  KW_Set = Id_t(221, 'KW_Set')
+  KW_Var = Id_t(222, 'KW_Var')
+  KW_Auto = Id_t(223, 'KW_Auto')
+  KW_SetVar = Id_t(224, 'KW_SetVar')
+  KW_Proc = Id_t(225, 'KW_Proc')
+  KW_Func = Id_t(226, 'KW_Func')
+  KW_Match = Id_t(227, 'KW_Match')
+  KW_With = Id_t(228, 'KW_With')
+  KW_Switch = Id_t(229, 'KW_Switch')
+  ControlFlow_Break = Id_t(230, 'ControlFlow_Break')
+  ControlFlow_Continue = Id_t(231, 'ControlFlow_Continue')
+  ControlFlow_Return = Id_t(232, 'ControlFlow_Return')
+  ControlFlow_Exit = Id_t(233, 'ControlFlow_Exit')
+  Char_OneChar = Id_t(234, 'Char_OneChar')
+  Char_Stop = Id_t(235, 'Char_Stop')
+  Char_Hex = Id_t(236, 'Char_Hex')
+  Char_Octal3 = Id_t(237, 'Char_Octal3')
+  Char_Octal4 = Id_t(238, 'Char_Octal4')
+  Char_Unicode4 = Id_t(239, 'Char_Unicode4')
+  Char_Unicode8 = Id_t(240, 'Char_Unicode8')
+  Char_Literals = Id_t(241, 'Char_Literals')
+  Char_BadBackslash = Id_t(242, 'Char_BadBackslash')
+  Glob_LBracket = Id_t(243, 'Glob_LBracket')
+  Glob_RBracket = Id_t(244, 'Glob_RBracket')
+  Glob_Star = Id_t(245, 'Glob_Star')
+  Glob_QMark = Id_t(246, 'Glob_QMark')
+  Glob_Bang = Id_t(247, 'Glob_Bang')
+  Glob_Caret = Id_t(248, 'Glob_Caret')
+  Glob_EscapedChar = Id_t(249, 'Glob_EscapedChar')
+  Glob_BadBackslash = Id_t(250, 'Glob_BadBackslash')
+  Glob_CleanLiterals = Id_t(251, 'Glob_CleanLiterals')
+  Glob_OtherLiteral = Id_t(252, 'Glob_OtherLiteral')
+  Glob_Eof = Id_t(253, 'Glob_Eof')
+  Format_EscapedPercent = Id_t(254, 'Format_EscapedPercent')
+  Format_Percent = Id_t(255, 'Format_Percent')
+  Format_Flag = Id_t(256, 'Format_Flag')
+  Format_Num = Id_t(257, 'Format_Num')
+  Format_Dot = Id_t(258, 'Format_Dot')
+  Format_Type = Id_t(259, 'Format_Type')
+  PS_Subst = Id_t(260, 'PS_Subst')
+  PS_Octal3 = Id_t(261, 'PS_Octal3')
+  PS_LBrace = Id_t(262, 'PS_LBrace')
+  PS_RBrace = Id_t(263, 'PS_RBrace')
+  PS_Literals = Id_t(264, 'PS_Literals')
+  PS_BadBackslash = Id_t(265, 'PS_BadBackslash')
+  Range_Int = Id_t(266, 'Range_Int')
+  Range_Char = Id_t(267, 'Range_Char')
+  Range_Dots = Id_t(268, 'Range_Dots')
+  Range_Other = Id_t(269, 'Range_Other')
+  Range_Eof = Id_t(270, 'Range_Eof')
+  BoolUnary_z = Id_t(271, 'BoolUnary_z')
+  BoolUnary_n = Id_t(272, 'BoolUnary_n')
+  BoolUnary_o = Id_t(273, 'BoolUnary_o')
+  BoolUnary_t = Id_t(274, 'BoolUnary_t')
+  BoolUnary_v = Id_t(275, 'BoolUnary_v')
+  BoolUnary_R = Id_t(276, 'BoolUnary_R')
+  BoolUnary_a = Id_t(277, 'BoolUnary_a')
+  BoolUnary_b = Id_t(278, 'BoolUnary_b')
+  BoolUnary_c = Id_t(279, 'BoolUnary_c')
+  BoolUnary_d = Id_t(280, 'BoolUnary_d')
+  BoolUnary_e = Id_t(281, 'BoolUnary_e')
+  BoolUnary_f = Id_t(282, 'BoolUnary_f')
+  BoolUnary_g = Id_t(283, 'BoolUnary_g')
+  BoolUnary_h = Id_t(284, 'BoolUnary_h')
+  BoolUnary_L = Id_t(285, 'BoolUnary_L')
+  BoolUnary_p = Id_t(286, 'BoolUnary_p')
+  BoolUnary_r = Id_t(287, 'BoolUnary_r')
+  BoolUnary_s = Id_t(288, 'BoolUnary_s')
+  BoolUnary_S = Id_t(289, 'BoolUnary_S')
+  BoolUnary_u = Id_t(290, 'BoolUnary_u')
+  BoolUnary_w = Id_t(291, 'BoolUnary_w')
+  BoolUnary_x = Id_t(292, 'BoolUnary_x')
+  BoolUnary_O = Id_t(293, 'BoolUnary_O')
+  BoolUnary_G = Id_t(294, 'BoolUnary_G')
+  BoolUnary_N = Id_t(295, 'BoolUnary_N')
+  BoolBinary_GlobEqual = Id_t(296, 'BoolBinary_GlobEqual')
+  BoolBinary_GlobDEqual = Id_t(297, 'BoolBinary_GlobDEqual')
+  BoolBinary_GlobNEqual = Id_t(298, 'BoolBinary_GlobNEqual')
+  BoolBinary_EqualTilde = Id_t(299, 'BoolBinary_EqualTilde')
+  BoolBinary_ef = Id_t(300, 'BoolBinary_ef')
+  BoolBinary_nt = Id_t(301, 'BoolBinary_nt')
+  BoolBinary_ot = Id_t(302, 'BoolBinary_ot')
+  BoolBinary_eq = Id_t(303, 'BoolBinary_eq')
+  BoolBinary_ne = Id_t(304, 'BoolBinary_ne')
+  BoolBinary_gt = Id_t(305, 'BoolBinary_gt')
+  BoolBinary_ge = Id_t(306, 'BoolBinary_ge')
+  BoolBinary_lt = Id_t(307, 'BoolBinary_lt')
+  BoolBinary_le = Id_t(308, 'BoolBinary_le')
+  BoolBinary_Equal = Id_t(309, 'BoolBinary_Equal')
+  BoolBinary_DEqual = Id_t(310, 'BoolBinary_DEqual')
+  BoolBinary_NEqual = Id_t(311, 'BoolBinary_NEqual')
+
+class Kind_t(runtime.SimpleObj):
+  pass
+
+class Kind(object):
+  Undefined = Kind_t(1, 'Undefined')
+  Unknown = Kind_t(2, 'Unknown')
+  Eol = Kind_t(3, 'Eol')
+  Eof = Kind_t(4, 'Eof')
+  Ignored = Kind_t(5, 'Ignored')
+  WS = Kind_t(6, 'WS')
+  Lit = Kind_t(7, 'Lit')
+  Backtick = Kind_t(8, 'Backtick')
+  History = Kind_t(9, 'History')
+  Op = Kind_t(10, 'Op')
+  Redir = Kind_t(11, 'Redir')
+  Fd = Kind_t(12, 'Fd')
+  Left = Kind_t(13, 'Left')
+  Right = Kind_t(14, 'Right')
+  ExtGlob = Kind_t(15, 'ExtGlob')
+  VSub = Kind_t(16, 'VSub')
+  VTest = Kind_t(17, 'VTest')
+  VOp0 = Kind_t(18, 'VOp0')
+  VOp1 = Kind_t(19, 'VOp1')
+  VOp2 = Kind_t(20, 'VOp2')
+  Arith = Kind_t(21, 'Arith')
+  Expr = Kind_t(22, 'Expr')
+  Node = Kind_t(23, 'Node')
+  Word = Kind_t(24, 'Word')
+  KW = Kind_t(25, 'KW')
+  ControlFlow = Kind_t(26, 'ControlFlow')
+  Char = Kind_t(27, 'Char')
+  Glob = Kind_t(28, 'Glob')
+  Format = Kind_t(29, 'Format')
+  PS = Kind_t(30, 'PS')
+  Range = Kind_t(31, 'Range')
+  BoolUnary = Kind_t(32, 'BoolUnary')
+  BoolBinary = Kind_t(33, 'BoolBinary')
+
+
+ID_INSTANCES = [
+  None,  # unused index 0
+  Id.Undefined_Tok,
+  Id.Unknown_Tok,
+  Id.Eol_Tok,
+  Id.Eof_Real,
+  Id.Eof_RParen,
+  Id.Eof_Backtick,
+  Id.Ignored_LineCont,
+  Id.Ignored_Space,
+  Id.Ignored_Comment,
+  Id.WS_Space,
+  Id.Lit_Chars,
+  Id.Lit_VarLike,
+  Id.Lit_ArrayLhsOpen,
+  Id.Lit_ArrayLhsClose,
+  Id.Lit_Splice,
+  Id.Lit_Other,
+  Id.Lit_EscapedChar,
+  Id.Lit_RegexMeta,
+  Id.Lit_LBracket,
+  Id.Lit_RBracket,
+  Id.Lit_Star,
+  Id.Lit_QMark,
+  Id.Lit_LBrace,
+  Id.Lit_RBrace,
+  Id.Lit_Comma,
+  Id.Lit_Equals,
+  Id.Lit_DRightBracket,
+  Id.Lit_TildeLike,
+  Id.Lit_Pound,
+  Id.Lit_Slash,
+  Id.Lit_Percent,
+  Id.Lit_Digits,
+  Id.Lit_At,
+  Id.Lit_ArithVarLike,
+  Id.Lit_CompDummy,
+  Id.Backtick_Right,
+  Id.Backtick_Quoted,
+  Id.Backtick_Other,
+  Id.History_Op,
+  Id.History_Num,
+  Id.History_Search,
+  Id.History_Other,
+  Id.Op_Newline,
+  Id.Op_Amp,
+  Id.Op_Pipe,
+  Id.Op_PipeAmp,
+  Id.Op_DAmp,
+  Id.Op_DPipe,
+  Id.Op_Semi,
+  Id.Op_DSemi,
+  Id.Op_LParen,
+  Id.Op_RParen,
+  Id.Op_DLeftParen,
+  Id.Op_DRightParen,
+  Id.Op_Less,
+  Id.Op_Great,
+  Id.Op_Bang,
+  Id.Op_LBracket,
+  Id.Op_RBracket,
+  Id.Op_LBrace,
+  Id.Op_RBrace,
+  Id.Redir_Less,
+  Id.Redir_Great,
+  Id.Redir_DLess,
+  Id.Redir_TLess,
+  Id.Redir_DGreat,
+  Id.Redir_GreatAnd,
+  Id.Redir_LessAnd,
+  Id.Redir_DLessDash,
+  Id.Redir_LessGreat,
+  Id.Redir_Clobber,
+  Id.Redir_AndGreat,
+  Id.Redir_AndDGreat,
+  Id.Redir_GreatPlus,
+  Id.Redir_DGreatPlus,
+  Id.Fd_Number,
+  Id.Fd_Name,
+  Id.Left_DoubleQuote,
+  Id.Left_SingleQuote,
+  Id.Left_Backtick,
+  Id.Left_DollarParen,
+  Id.Left_DollarBrace,
+  Id.Left_DollarDParen,
+  Id.Left_DollarBracket,
+  Id.Left_DollarDoubleQuote,
+  Id.Left_DollarSingleQuote,
+  Id.Left_ProcSubIn,
+  Id.Left_ProcSubOut,
+  Id.Left_DollarSlash,
+  Id.Left_AtBracket,
+  Id.Left_AtParen,
+  Id.Right_DoubleQuote,
+  Id.Right_SingleQuote,
+  Id.Right_Backtick,
+  Id.Right_DollarBrace,
+  Id.Right_DollarDParen,
+  Id.Right_DollarDoubleQuote,
+  Id.Right_DollarSingleQuote,
+  Id.Right_Subshell,
+  Id.Right_FuncDef,
+  Id.Right_CasePat,
+  Id.Right_ArrayLiteral,
+  Id.Right_ExtGlob,
+  Id.ExtGlob_At,
+  Id.ExtGlob_Star,
+  Id.ExtGlob_Plus,
+  Id.ExtGlob_QMark,
+  Id.ExtGlob_Bang,
+  Id.VSub_DollarName,
+  Id.VSub_Name,
+  Id.VSub_Number,
+  Id.VSub_Bang,
+  Id.VSub_At,
+  Id.VSub_Pound,
+  Id.VSub_Dollar,
+  Id.VSub_Star,
+  Id.VSub_Hyphen,
+  Id.VSub_QMark,
+  Id.VTest_ColonHyphen,
+  Id.VTest_Hyphen,
+  Id.VTest_ColonEquals,
+  Id.VTest_Equals,
+  Id.VTest_ColonQMark,
+  Id.VTest_QMark,
+  Id.VTest_ColonPlus,
+  Id.VTest_Plus,
+  Id.VOp0_Q,
+  Id.VOp0_E,
+  Id.VOp0_P,
+  Id.VOp0_A,
+  Id.VOp0_a,
+  Id.VOp1_Percent,
+  Id.VOp1_DPercent,
+  Id.VOp1_Pound,
+  Id.VOp1_DPound,
+  Id.VOp1_Caret,
+  Id.VOp1_DCaret,
+  Id.VOp1_Comma,
+  Id.VOp1_DComma,
+  Id.VOp2_Slash,
+  Id.VOp2_Colon,
+  Id.VOp2_LBracket,
+  Id.VOp2_RBracket,
+  Id.Arith_Semi,
+  Id.Arith_Comma,
+  Id.Arith_Plus,
+  Id.Arith_Minus,
+  Id.Arith_Star,
+  Id.Arith_Slash,
+  Id.Arith_Percent,
+  Id.Arith_DPlus,
+  Id.Arith_DMinus,
+  Id.Arith_DStar,
+  Id.Arith_LParen,
+  Id.Arith_RParen,
+  Id.Arith_LBracket,
+  Id.Arith_RBracket,
+  Id.Arith_RBrace,
+  Id.Arith_QMark,
+  Id.Arith_Colon,
+  Id.Arith_LessEqual,
+  Id.Arith_Less,
+  Id.Arith_GreatEqual,
+  Id.Arith_Great,
+  Id.Arith_DEqual,
+  Id.Arith_NEqual,
+  Id.Arith_DAmp,
+  Id.Arith_DPipe,
+  Id.Arith_Bang,
+  Id.Arith_DGreat,
+  Id.Arith_DLess,
+  Id.Arith_Amp,
+  Id.Arith_Pipe,
+  Id.Arith_Caret,
+  Id.Arith_Tilde,
+  Id.Arith_Equal,
+  Id.Arith_PlusEqual,
+  Id.Arith_MinusEqual,
+  Id.Arith_StarEqual,
+  Id.Arith_SlashEqual,
+  Id.Arith_PercentEqual,
+  Id.Arith_DGreatEqual,
+  Id.Arith_DLessEqual,
+  Id.Arith_AmpEqual,
+  Id.Arith_PipeEqual,
+  Id.Arith_CaretEqual,
+  Id.Expr_Name,
+  Id.Expr_Digits,
+  Id.Expr_Dot,
+  Id.Expr_DColon,
+  Id.Expr_RArrow,
+  Id.Expr_RDArrow,
+  Id.Expr_At,
+  Id.Expr_DoubleAt,
+  Id.Expr_NotTilde,
+  Id.Expr_WordsDummy,
+  Id.Expr_CommandDummy,
+  Id.Node_PostDPlus,
+  Id.Node_PostDMinus,
+  Id.Node_UnaryPlus,
+  Id.Node_UnaryMinus,
+  Id.Word_Compound,
+  Id.KW_DLeftBracket,
+  Id.KW_Bang,
+  Id.KW_For,
+  Id.KW_While,
+  Id.KW_Until,
+  Id.KW_Do,
+  Id.KW_Done,
+  Id.KW_In,
+  Id.KW_Case,
+  Id.KW_Esac,
+  Id.KW_If,
+  Id.KW_Fi,
+  Id.KW_Then,
+  Id.KW_Else,
+  Id.KW_Elif,
+  Id.KW_Function,
+  Id.KW_Time,
+  Id.KW_Const,
+  Id.KW_Set,
+  Id.KW_Var,
+  Id.KW_Auto,
+  Id.KW_SetVar,
+  Id.KW_Proc,
+  Id.KW_Func,
+  Id.KW_Match,
+  Id.KW_With,
+  Id.KW_Switch,
+  Id.ControlFlow_Break,
+  Id.ControlFlow_Continue,
+  Id.ControlFlow_Return,
+  Id.ControlFlow_Exit,
+  Id.Char_OneChar,
+  Id.Char_Stop,
+  Id.Char_Hex,
+  Id.Char_Octal3,
+  Id.Char_Octal4,
+  Id.Char_Unicode4,
+  Id.Char_Unicode8,
+  Id.Char_Literals,
+  Id.Char_BadBackslash,
+  Id.Glob_LBracket,
+  Id.Glob_RBracket,
+  Id.Glob_Star,
+  Id.Glob_QMark,
+  Id.Glob_Bang,
+  Id.Glob_Caret,
+  Id.Glob_EscapedChar,
+  Id.Glob_BadBackslash,
+  Id.Glob_CleanLiterals,
+  Id.Glob_OtherLiteral,
+  Id.Glob_Eof,
+  Id.Format_EscapedPercent,
+  Id.Format_Percent,
+  Id.Format_Flag,
+  Id.Format_Num,
+  Id.Format_Dot,
+  Id.Format_Type,
+  Id.PS_Subst,
+  Id.PS_Octal3,
+  Id.PS_LBrace,
+  Id.PS_RBrace,
+  Id.PS_Literals,
+  Id.PS_BadBackslash,
+  Id.Range_Int,
+  Id.Range_Char,
+  Id.Range_Dots,
+  Id.Range_Other,
+  Id.Range_Eof,
+  Id.BoolUnary_z,
+  Id.BoolUnary_n,
+  Id.BoolUnary_o,
+  Id.BoolUnary_t,
+  Id.BoolUnary_v,
+  Id.BoolUnary_R,
+  Id.BoolUnary_a,
+  Id.BoolUnary_b,
+  Id.BoolUnary_c,
+  Id.BoolUnary_d,
+  Id.BoolUnary_e,
+  Id.BoolUnary_f,
+  Id.BoolUnary_g,
+  Id.BoolUnary_h,
+  Id.BoolUnary_L,
+  Id.BoolUnary_p,
+  Id.BoolUnary_r,
+  Id.BoolUnary_s,
+  Id.BoolUnary_S,
+  Id.BoolUnary_u,
+  Id.BoolUnary_w,
+  Id.BoolUnary_x,
+  Id.BoolUnary_O,
+  Id.BoolUnary_G,
+  Id.BoolUnary_N,
+  Id.BoolBinary_GlobEqual,
+  Id.BoolBinary_GlobDEqual,
+  Id.BoolBinary_GlobNEqual,
+  Id.BoolBinary_EqualTilde,
+  Id.BoolBinary_ef,
+  Id.BoolBinary_nt,
+  Id.BoolBinary_ot,
+  Id.BoolBinary_eq,
+  Id.BoolBinary_ne,
+  Id.BoolBinary_gt,
+  Id.BoolBinary_ge,
+  Id.BoolBinary_lt,
+  Id.BoolBinary_le,
+  Id.BoolBinary_Equal,
+  Id.BoolBinary_DEqual,
+  Id.BoolBinary_NEqual,
+]  # type: List[Id_t]
+
+
+KIND_INSTANCES = [
+  None,  # unused index 0
+  Kind.Undefined,
+  Kind.Unknown,
+  Kind.Eol,
+  Kind.Eof,
+  Kind.Ignored,
+  Kind.WS,
+  Kind.Lit,
+  Kind.Backtick,
+  Kind.History,
+  Kind.Op,
+  Kind.Redir,
+  Kind.Fd,
+  Kind.Left,
+  Kind.Right,
+  Kind.ExtGlob,
+  Kind.VSub,
+  Kind.VTest,
+  Kind.VOp0,
+  Kind.VOp1,
+  Kind.VOp2,
+  Kind.Arith,
+  Kind.Expr,
+  Kind.Node,
+  Kind.Word,
+  Kind.KW,
+  Kind.ControlFlow,
+  Kind.Char,
+  Kind.Glob,
+  Kind.Format,
+  Kind.PS,
+  Kind.Range,
+  Kind.BoolUnary,
+  Kind.BoolBinary,
+]  # type: List[Kind_t]
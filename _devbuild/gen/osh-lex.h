@@ -0,0 +1,21331 @@
+/* Generated by re2c 4.0 on Sat Oct 17 08:00:41 2026 */
+#line 1 "_devbuild/gen/osh-lex.re2c.h"
+
+/* Common stuff */
+
+#line 8 "_devbuild/gen/osh-lex.re2c.h"
+
+
+static inline void MatchOshToken(int lex_mode, unsigned char* line, int line_len,
+                              int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+  //printf("p: %p q: %p\n", p, q);
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+  switch (lex_mode)  {
+
+  case lex_mode__VSub_Oil:
+    for (;;) {
+      
+#line 23 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1;
+		case '\t':
+		case '\r':
+		case ' ': goto yy4;
+		case '\n': goto yy6;
+		case '!': goto yy7;
+		case '"': goto yy8;
+		case '#': goto yy9;
+		case '$': goto yy11;
+		case '%': goto yy12;
+		case '&': goto yy14;
+		case '\'': goto yy16;
+		case '(': goto yy17;
+		case ')': goto yy18;
+		case '*': goto yy19;
+		case '+': goto yy21;
+		case ',': goto yy23;
+		case '-': goto yy24;
+		case '.': goto yy26;
+		case '/': goto yy27;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy29;
+		case ':': goto yy31;
+		case ';': goto yy33;
+		case '<': goto yy34;
+		case '=': goto yy36;
+		case '>': goto yy38;
+		case '?': goto yy40;
+		case '@': goto yy41;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy43;
+		case '[': goto yy45;
+		case '\\': goto yy46;
+		case ']': goto yy47;
+		case '^': goto yy48;
+		case '{': goto yy50;
+		case '|': goto yy51;
+		case '}': goto yy53;
+		case '~': goto yy54;
+		default: goto yy2;
+	}
+yy1:
+	++p;
+#line 83 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 132 "_devbuild/gen/osh-lex.h"
+yy2:
+	++p;
+yy3:
+#line 82 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 138 "_devbuild/gen/osh-lex.h"
+yy4:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy4;
+		default: goto yy5;
+	}
+yy5:
+#line 80 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Space; break; }
+#line 150 "_devbuild/gen/osh-lex.h"
+yy6:
+	++p;
+#line 78 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 155 "_devbuild/gen/osh-lex.h"
+yy7:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy55;
+		case '~': goto yy56;
+		default: goto yy3;
+	}
+yy8:
+	++p;
+#line 27 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 167 "_devbuild/gen/osh-lex.h"
+yy9:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\n': goto yy10;
+		default: goto yy9;
+	}
+yy10:
+#line 79 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Comment; break; }
+#line 178 "_devbuild/gen/osh-lex.h"
+yy11:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy57;
+		case '/': goto yy58;
+		case '[': goto yy59;
+		case '{': goto yy60;
+		default: goto yy3;
+	}
+yy12:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy61;
+		default: goto yy13;
+	}
+yy13:
+#line 41 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Percent; break; }
+#line 197 "_devbuild/gen/osh-lex.h"
+yy14:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy62;
+		default: goto yy15;
+	}
+yy15:
+#line 59 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Amp; break; }
+#line 207 "_devbuild/gen/osh-lex.h"
+yy16:
+	++p;
+#line 28 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 212 "_devbuild/gen/osh-lex.h"
+yy17:
+	++p;
+#line 47 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 217 "_devbuild/gen/osh-lex.h"
+yy18:
+	++p;
+#line 48 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 222 "_devbuild/gen/osh-lex.h"
+yy19:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy63;
+		default: goto yy20;
+	}
+yy20:
+#line 38 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Star; break; }
+#line 232 "_devbuild/gen/osh-lex.h"
+yy21:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy64;
+		default: goto yy22;
+	}
+yy22:
+#line 36 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Plus; break; }
+#line 242 "_devbuild/gen/osh-lex.h"
+yy23:
+	++p;
+#line 33 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Comma; break; }
+#line 247 "_devbuild/gen/osh-lex.h"
+yy24:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy65;
+		case '>': goto yy66;
+		default: goto yy25;
+	}
+yy25:
+#line 37 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Minus; break; }
+#line 258 "_devbuild/gen/osh-lex.h"
+yy26:
+	++p;
+#line 42 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Dot; break; }
+#line 263 "_devbuild/gen/osh-lex.h"
+yy27:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy67;
+		default: goto yy28;
+	}
+yy28:
+#line 40 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Slash; break; }
+#line 273 "_devbuild/gen/osh-lex.h"
+yy29:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy29;
+		default: goto yy30;
+	}
+yy30:
+#line 32 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Digits; break; }
+#line 292 "_devbuild/gen/osh-lex.h"
+yy31:
+	yych = *++p;
+	switch (yych) {
+		case ':': goto yy68;
+		default: goto yy32;
+	}
+yy32:
+#line 34 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Colon; break; }
+#line 302 "_devbuild/gen/osh-lex.h"
+yy33:
+	++p;
+#line 46 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Semi; break; }
+#line 307 "_devbuild/gen/osh-lex.h"
+yy34:
+	yych = *++p;
+	switch (yych) {
+		case '<': goto yy69;
+		case '=': goto yy71;
+		default: goto yy35;
+	}
+yy35:
+#line 53 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Less; break; }
+#line 318 "_devbuild/gen/osh-lex.h"
+yy36:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy72;
+		case '>': goto yy73;
+		default: goto yy37;
+	}
+yy37:
+#line 67 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Equal; break; }
+#line 329 "_devbuild/gen/osh-lex.h"
+yy38:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy74;
+		case '>': goto yy75;
+		default: goto yy39;
+	}
+yy39:
+#line 54 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Great; break; }
+#line 340 "_devbuild/gen/osh-lex.h"
+yy40:
+	++p;
+#line 35 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_QMark; break; }
+#line 345 "_devbuild/gen/osh-lex.h"
+yy41:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy77;
+		case '@': goto yy78;
+		case '[': goto yy79;
+		default: goto yy42;
+	}
+yy42:
+#line 65 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_At; break; }
+#line 357 "_devbuild/gen/osh-lex.h"
+yy43:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy43;
+		default: goto yy44;
+	}
+yy44:
+#line 31 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Name; break; }
+#line 429 "_devbuild/gen/osh-lex.h"
+yy45:
+	++p;
+#line 49 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBracket; break; }
+#line 434 "_devbuild/gen/osh-lex.h"
+yy46:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy80;
+		default: goto yy3;
+	}
+yy47:
+	++p;
+#line 50 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 445 "_devbuild/gen/osh-lex.h"
+yy48:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy81;
+		default: goto yy49;
+	}
+yy49:
+#line 39 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Caret; break; }
+#line 455 "_devbuild/gen/osh-lex.h"
+yy50:
+	++p;
+#line 51 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBrace; break; }
+#line 460 "_devbuild/gen/osh-lex.h"
+yy51:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy82;
+		default: goto yy52;
+	}
+yy52:
+#line 60 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Pipe; break; }
+#line 470 "_devbuild/gen/osh-lex.h"
+yy53:
+	++p;
+#line 52 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBrace; break; }
+#line 475 "_devbuild/gen/osh-lex.h"
+yy54:
+	++p;
+#line 63 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Tilde; break; }
+#line 480 "_devbuild/gen/osh-lex.h"
+yy55:
+	++p;
+#line 58 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_NEqual; break; }
+#line 485 "_devbuild/gen/osh-lex.h"
+yy56:
+	++p;
+#line 64 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_NotTilde; break; }
+#line 490 "_devbuild/gen/osh-lex.h"
+yy57:
+	++p;
+#line 23 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 495 "_devbuild/gen/osh-lex.h"
+yy58:
+	++p;
+#line 26 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSlash; break; }
+#line 500 "_devbuild/gen/osh-lex.h"
+yy59:
+	++p;
+#line 25 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 505 "_devbuild/gen/osh-lex.h"
+yy60:
+	++p;
+#line 24 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 510 "_devbuild/gen/osh-lex.h"
+yy61:
+	++p;
+#line 72 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PercentEqual; break; }
+#line 515 "_devbuild/gen/osh-lex.h"
+yy62:
+	++p;
+#line 73 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_AmpEqual; break; }
+#line 520 "_devbuild/gen/osh-lex.h"
+yy63:
+	++p;
+#line 70 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_StarEqual; break; }
+#line 525 "_devbuild/gen/osh-lex.h"
+yy64:
+	++p;
+#line 68 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PlusEqual; break; }
+#line 530 "_devbuild/gen/osh-lex.h"
+yy65:
+	++p;
+#line 69 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_MinusEqual; break; }
+#line 535 "_devbuild/gen/osh-lex.h"
+yy66:
+	++p;
+#line 44 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_RArrow; break; }
+#line 540 "_devbuild/gen/osh-lex.h"
+yy67:
+	++p;
+#line 71 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_SlashEqual; break; }
+#line 545 "_devbuild/gen/osh-lex.h"
+yy68:
+	++p;
+#line 43 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_DColon; break; }
+#line 550 "_devbuild/gen/osh-lex.h"
+yy69:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy83;
+		default: goto yy70;
+	}
+yy70:
+#line 62 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLess; break; }
+#line 560 "_devbuild/gen/osh-lex.h"
+yy71:
+	++p;
+#line 55 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_LessEqual; break; }
+#line 565 "_devbuild/gen/osh-lex.h"
+yy72:
+	++p;
+#line 57 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DEqual; break; }
+#line 570 "_devbuild/gen/osh-lex.h"
+yy73:
+	++p;
+#line 45 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_RDArrow; break; }
+#line 575 "_devbuild/gen/osh-lex.h"
+yy74:
+	++p;
+#line 56 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_GreatEqual; break; }
+#line 580 "_devbuild/gen/osh-lex.h"
+yy75:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy84;
+		default: goto yy76;
+	}
+yy76:
+#line 61 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreat; break; }
+#line 590 "_devbuild/gen/osh-lex.h"
+yy77:
+	++p;
+#line 29 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtParen; break; }
+#line 595 "_devbuild/gen/osh-lex.h"
+yy78:
+	++p;
+#line 66 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_DoubleAt; break; }
+#line 600 "_devbuild/gen/osh-lex.h"
+yy79:
+	++p;
+#line 30 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtBracket; break; }
+#line 605 "_devbuild/gen/osh-lex.h"
+yy80:
+	++p;
+#line 81 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 610 "_devbuild/gen/osh-lex.h"
+yy81:
+	++p;
+#line 75 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_CaretEqual; break; }
+#line 615 "_devbuild/gen/osh-lex.h"
+yy82:
+	++p;
+#line 74 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PipeEqual; break; }
+#line 620 "_devbuild/gen/osh-lex.h"
+yy83:
+	++p;
+#line 77 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLessEqual; break; }
+#line 625 "_devbuild/gen/osh-lex.h"
+yy84:
+	++p;
+#line 76 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreatEqual; break; }
+#line 630 "_devbuild/gen/osh-lex.h"
+}
+#line 84 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__DollarSQ:
+    for (;;) {
+      
+#line 640 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy86;
+		case '\'': goto yy89;
+		case '\\': goto yy90;
+		default: goto yy87;
+	}
+yy86:
+	++p;
+#line 103 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 654 "_devbuild/gen/osh-lex.h"
+yy87:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\'':
+		case '\\': goto yy88;
+		default: goto yy87;
+	}
+yy88:
+#line 100 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 666 "_devbuild/gen/osh-lex.h"
+yy89:
+	++p;
+#line 101 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_SingleQuote; break; }
+#line 671 "_devbuild/gen/osh-lex.h"
+yy90:
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case 0x00: goto yy92;
+		case '\n': goto yy93;
+		case '"': goto yy94;
+		case '\'': goto yy95;
+		case '0': goto yy96;
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy98;
+		case 'E':
+		case '\\':
+		case 'a':
+		case 'b':
+		case 'e':
+		case 'f':
+		case 'n':
+		case 'r':
+		case 't':
+		case 'v': goto yy100;
+		case 'U': goto yy101;
+		case 'u': goto yy103;
+		case 'x': goto yy104;
+		default: goto yy91;
+	}
+yy91:
+#line 96 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_BadBackslash; break; }
+#line 705 "_devbuild/gen/osh-lex.h"
+yy92:
+	++p;
+#line 102 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 710 "_devbuild/gen/osh-lex.h"
+yy93:
+	++p;
+#line 95 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 715 "_devbuild/gen/osh-lex.h"
+yy94:
+	++p;
+#line 99 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_OneChar; break; }
+#line 720 "_devbuild/gen/osh-lex.h"
+yy95:
+	++p;
+#line 98 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_OneChar; break; }
+#line 725 "_devbuild/gen/osh-lex.h"
+yy96:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy105;
+		default: goto yy97;
+	}
+yy97:
+#line 94 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_OneChar; break; }
+#line 742 "_devbuild/gen/osh-lex.h"
+yy98:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy105;
+		default: goto yy99;
+	}
+yy99:
+#line 97 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Octal3; break; }
+#line 759 "_devbuild/gen/osh-lex.h"
+yy100:
+	++p;
+	goto yy97;
+yy101:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy106;
+		default: goto yy102;
+	}
+yy102:
+	p = YYMARKER;
+	goto yy91;
+yy103:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy108;
+		default: goto yy102;
+	}
+yy104:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy110;
+		default: goto yy102;
+	}
+yy105:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy112;
+		default: goto yy99;
+	}
+yy106:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy113;
+		default: goto yy107;
+	}
+yy107:
+#line 93 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode8; break; }
+#line 890 "_devbuild/gen/osh-lex.h"
+yy108:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy114;
+		default: goto yy109;
+	}
+yy109:
+#line 92 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode4; break; }
+#line 921 "_devbuild/gen/osh-lex.h"
+yy110:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy115;
+		default: goto yy111;
+	}
+yy111:
+#line 91 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Hex; break; }
+#line 952 "_devbuild/gen/osh-lex.h"
+yy112:
+	++p;
+	goto yy99;
+yy113:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy116;
+		default: goto yy107;
+	}
+yy114:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy117;
+		default: goto yy109;
+	}
+yy115:
+	++p;
+	goto yy111;
+yy116:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy118;
+		default: goto yy107;
+	}
+yy117:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy119;
+		default: goto yy109;
+	}
+yy118:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy120;
+		default: goto yy107;
+	}
+yy119:
+	++p;
+	goto yy109;
+yy120:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy121;
+		default: goto yy107;
+	}
+yy121:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy122;
+		default: goto yy107;
+	}
+yy122:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy123;
+		default: goto yy107;
+	}
+yy123:
+	++p;
+	goto yy107;
+}
+#line 104 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Array:
+    for (;;) {
+      
+#line 1190 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy125;
+		case '\t':
+		case '\r':
+		case ' ': goto yy128;
+		case '"': goto yy130;
+		case '$': goto yy131;
+		case '\'': goto yy132;
+		case '*': goto yy133;
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy134;
+		case '@': goto yy136;
+		case '[': goto yy137;
+		case ']': goto yy138;
+		case '{': goto yy139;
+		case '}': goto yy140;
+		default: goto yy126;
+	}
+yy125:
+	++p;
+#line 127 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 1280 "_devbuild/gen/osh-lex.h"
+yy126:
+	++p;
+yy127:
+#line 126 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 1286 "_devbuild/gen/osh-lex.h"
+yy128:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy128;
+		default: goto yy129;
+	}
+yy129:
+#line 119 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 1298 "_devbuild/gen/osh-lex.h"
+yy130:
+	++p;
+#line 115 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 1303 "_devbuild/gen/osh-lex.h"
+yy131:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy141;
+		case '/': goto yy142;
+		case '[': goto yy143;
+		case '{': goto yy144;
+		default: goto yy127;
+	}
+yy132:
+	++p;
+#line 116 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 1317 "_devbuild/gen/osh-lex.h"
+yy133:
+	++p;
+#line 120 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_Star; break; }
+#line 1322 "_devbuild/gen/osh-lex.h"
+yy134:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy134;
+		default: goto yy135;
+	}
+yy135:
+#line 125 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 1397 "_devbuild/gen/osh-lex.h"
+yy136:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy145;
+		case '[': goto yy146;
+		default: goto yy127;
+	}
+yy137:
+	++p;
+#line 123 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBracket; break; }
+#line 1409 "_devbuild/gen/osh-lex.h"
+yy138:
+	++p;
+#line 124 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 1414 "_devbuild/gen/osh-lex.h"
+yy139:
+	++p;
+#line 121 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBrace; break; }
+#line 1419 "_devbuild/gen/osh-lex.h"
+yy140:
+	++p;
+#line 122 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBrace; break; }
+#line 1424 "_devbuild/gen/osh-lex.h"
+yy141:
+	++p;
+#line 111 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 1429 "_devbuild/gen/osh-lex.h"
+yy142:
+	++p;
+#line 114 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSlash; break; }
+#line 1434 "_devbuild/gen/osh-lex.h"
+yy143:
+	++p;
+#line 113 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 1439 "_devbuild/gen/osh-lex.h"
+yy144:
+	++p;
+#line 112 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 1444 "_devbuild/gen/osh-lex.h"
+yy145:
+	++p;
+#line 117 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtParen; break; }
+#line 1449 "_devbuild/gen/osh-lex.h"
+yy146:
+	++p;
+#line 118 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtBracket; break; }
+#line 1454 "_devbuild/gen/osh-lex.h"
+}
+#line 128 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Expr:
+    for (;;) {
+      
+#line 1464 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy148;
+		case '\t':
+		case '\r':
+		case ' ': goto yy151;
+		case '\n': goto yy153;
+		case '!': goto yy154;
+		case '"': goto yy155;
+		case '#': goto yy156;
+		case '$': goto yy158;
+		case '%': goto yy159;
+		case '&': goto yy161;
+		case '\'': goto yy163;
+		case '(': goto yy164;
+		case ')': goto yy165;
+		case '*': goto yy166;
+		case '+': goto yy168;
+		case ',': goto yy170;
+		case '-': goto yy171;
+		case '.': goto yy173;
+		case '/': goto yy174;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy176;
+		case ':': goto yy178;
+		case ';': goto yy180;
+		case '<': goto yy181;
+		case '=': goto yy183;
+		case '>': goto yy185;
+		case '?': goto yy187;
+		case '@': goto yy188;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy190;
+		case '[': goto yy192;
+		case '\\': goto yy193;
+		case ']': goto yy194;
+		case '^': goto yy195;
+		case '{': goto yy197;
+		case '|': goto yy198;
+		case '}': goto yy200;
+		case '~': goto yy201;
+		default: goto yy149;
+	}
+yy148:
+	++p;
+#line 195 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 1573 "_devbuild/gen/osh-lex.h"
+yy149:
+	++p;
+yy150:
+#line 194 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 1579 "_devbuild/gen/osh-lex.h"
+yy151:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy151;
+		default: goto yy152;
+	}
+yy152:
+#line 192 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Space; break; }
+#line 1591 "_devbuild/gen/osh-lex.h"
+yy153:
+	++p;
+#line 190 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 1596 "_devbuild/gen/osh-lex.h"
+yy154:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy202;
+		case '~': goto yy203;
+		default: goto yy150;
+	}
+yy155:
+	++p;
+#line 139 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 1608 "_devbuild/gen/osh-lex.h"
+yy156:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\n': goto yy157;
+		default: goto yy156;
+	}
+yy157:
+#line 191 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Comment; break; }
+#line 1619 "_devbuild/gen/osh-lex.h"
+yy158:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy204;
+		case '/': goto yy205;
+		case '[': goto yy206;
+		case '{': goto yy207;
+		default: goto yy150;
+	}
+yy159:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy208;
+		default: goto yy160;
+	}
+yy160:
+#line 153 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Percent; break; }
+#line 1638 "_devbuild/gen/osh-lex.h"
+yy161:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy209;
+		default: goto yy162;
+	}
+yy162:
+#line 171 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Amp; break; }
+#line 1648 "_devbuild/gen/osh-lex.h"
+yy163:
+	++p;
+#line 140 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 1653 "_devbuild/gen/osh-lex.h"
+yy164:
+	++p;
+#line 159 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 1658 "_devbuild/gen/osh-lex.h"
+yy165:
+	++p;
+#line 160 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 1663 "_devbuild/gen/osh-lex.h"
+yy166:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy210;
+		default: goto yy167;
+	}
+yy167:
+#line 150 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Star; break; }
+#line 1673 "_devbuild/gen/osh-lex.h"
+yy168:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy211;
+		default: goto yy169;
+	}
+yy169:
+#line 148 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Plus; break; }
+#line 1683 "_devbuild/gen/osh-lex.h"
+yy170:
+	++p;
+#line 145 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Comma; break; }
+#line 1688 "_devbuild/gen/osh-lex.h"
+yy171:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy212;
+		case '>': goto yy213;
+		default: goto yy172;
+	}
+yy172:
+#line 149 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Minus; break; }
+#line 1699 "_devbuild/gen/osh-lex.h"
+yy173:
+	++p;
+#line 154 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Dot; break; }
+#line 1704 "_devbuild/gen/osh-lex.h"
+yy174:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy214;
+		default: goto yy175;
+	}
+yy175:
+#line 152 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Slash; break; }
+#line 1714 "_devbuild/gen/osh-lex.h"
+yy176:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy176;
+		default: goto yy177;
+	}
+yy177:
+#line 144 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Digits; break; }
+#line 1733 "_devbuild/gen/osh-lex.h"
+yy178:
+	yych = *++p;
+	switch (yych) {
+		case ':': goto yy215;
+		default: goto yy179;
+	}
+yy179:
+#line 146 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Colon; break; }
+#line 1743 "_devbuild/gen/osh-lex.h"
+yy180:
+	++p;
+#line 158 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Semi; break; }
+#line 1748 "_devbuild/gen/osh-lex.h"
+yy181:
+	yych = *++p;
+	switch (yych) {
+		case '<': goto yy216;
+		case '=': goto yy218;
+		default: goto yy182;
+	}
+yy182:
+#line 165 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Less; break; }
+#line 1759 "_devbuild/gen/osh-lex.h"
+yy183:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy219;
+		case '>': goto yy220;
+		default: goto yy184;
+	}
+yy184:
+#line 179 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Equal; break; }
+#line 1770 "_devbuild/gen/osh-lex.h"
+yy185:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy221;
+		case '>': goto yy222;
+		default: goto yy186;
+	}
+yy186:
+#line 166 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Great; break; }
+#line 1781 "_devbuild/gen/osh-lex.h"
+yy187:
+	++p;
+#line 147 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_QMark; break; }
+#line 1786 "_devbuild/gen/osh-lex.h"
+yy188:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy224;
+		case '@': goto yy225;
+		case '[': goto yy226;
+		default: goto yy189;
+	}
+yy189:
+#line 177 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_At; break; }
+#line 1798 "_devbuild/gen/osh-lex.h"
+yy190:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy190;
+		default: goto yy191;
+	}
+yy191:
+#line 143 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Name; break; }
+#line 1870 "_devbuild/gen/osh-lex.h"
+yy192:
+	++p;
+#line 161 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBracket; break; }
+#line 1875 "_devbuild/gen/osh-lex.h"
+yy193:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy227;
+		default: goto yy150;
+	}
+yy194:
+	++p;
+#line 162 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 1886 "_devbuild/gen/osh-lex.h"
+yy195:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy228;
+		default: goto yy196;
+	}
+yy196:
+#line 151 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Caret; break; }
+#line 1896 "_devbuild/gen/osh-lex.h"
+yy197:
+	++p;
+#line 163 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBrace; break; }
+#line 1901 "_devbuild/gen/osh-lex.h"
+yy198:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy229;
+		default: goto yy199;
+	}
+yy199:
+#line 172 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Pipe; break; }
+#line 1911 "_devbuild/gen/osh-lex.h"
+yy200:
+	++p;
+#line 164 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBrace; break; }
+#line 1916 "_devbuild/gen/osh-lex.h"
+yy201:
+	++p;
+#line 175 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Tilde; break; }
+#line 1921 "_devbuild/gen/osh-lex.h"
+yy202:
+	++p;
+#line 170 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_NEqual; break; }
+#line 1926 "_devbuild/gen/osh-lex.h"
+yy203:
+	++p;
+#line 176 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_NotTilde; break; }
+#line 1931 "_devbuild/gen/osh-lex.h"
+yy204:
+	++p;
+#line 135 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 1936 "_devbuild/gen/osh-lex.h"
+yy205:
+	++p;
+#line 138 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSlash; break; }
+#line 1941 "_devbuild/gen/osh-lex.h"
+yy206:
+	++p;
+#line 137 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 1946 "_devbuild/gen/osh-lex.h"
+yy207:
+	++p;
+#line 136 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 1951 "_devbuild/gen/osh-lex.h"
+yy208:
+	++p;
+#line 184 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PercentEqual; break; }
+#line 1956 "_devbuild/gen/osh-lex.h"
+yy209:
+	++p;
+#line 185 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_AmpEqual; break; }
+#line 1961 "_devbuild/gen/osh-lex.h"
+yy210:
+	++p;
+#line 182 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_StarEqual; break; }
+#line 1966 "_devbuild/gen/osh-lex.h"
+yy211:
+	++p;
+#line 180 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PlusEqual; break; }
+#line 1971 "_devbuild/gen/osh-lex.h"
+yy212:
+	++p;
+#line 181 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_MinusEqual; break; }
+#line 1976 "_devbuild/gen/osh-lex.h"
+yy213:
+	++p;
+#line 156 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_RArrow; break; }
+#line 1981 "_devbuild/gen/osh-lex.h"
+yy214:
+	++p;
+#line 183 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_SlashEqual; break; }
+#line 1986 "_devbuild/gen/osh-lex.h"
+yy215:
+	++p;
+#line 155 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_DColon; break; }
+#line 1991 "_devbuild/gen/osh-lex.h"
+yy216:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy230;
+		default: goto yy217;
+	}
+yy217:
+#line 174 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLess; break; }
+#line 2001 "_devbuild/gen/osh-lex.h"
+yy218:
+	++p;
+#line 167 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_LessEqual; break; }
+#line 2006 "_devbuild/gen/osh-lex.h"
+yy219:
+	++p;
+#line 169 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DEqual; break; }
+#line 2011 "_devbuild/gen/osh-lex.h"
+yy220:
+	++p;
+#line 157 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_RDArrow; break; }
+#line 2016 "_devbuild/gen/osh-lex.h"
+yy221:
+	++p;
+#line 168 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_GreatEqual; break; }
+#line 2021 "_devbuild/gen/osh-lex.h"
+yy222:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy231;
+		default: goto yy223;
+	}
+yy223:
+#line 173 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreat; break; }
+#line 2031 "_devbuild/gen/osh-lex.h"
+yy224:
+	++p;
+#line 141 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtParen; break; }
+#line 2036 "_devbuild/gen/osh-lex.h"
+yy225:
+	++p;
+#line 178 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_DoubleAt; break; }
+#line 2041 "_devbuild/gen/osh-lex.h"
+yy226:
+	++p;
+#line 142 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtBracket; break; }
+#line 2046 "_devbuild/gen/osh-lex.h"
+yy227:
+	++p;
+#line 193 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 2051 "_devbuild/gen/osh-lex.h"
+yy228:
+	++p;
+#line 187 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_CaretEqual; break; }
+#line 2056 "_devbuild/gen/osh-lex.h"
+yy229:
+	++p;
+#line 186 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PipeEqual; break; }
+#line 2061 "_devbuild/gen/osh-lex.h"
+yy230:
+	++p;
+#line 189 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLessEqual; break; }
+#line 2066 "_devbuild/gen/osh-lex.h"
+yy231:
+	++p;
+#line 188 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreatEqual; break; }
+#line 2071 "_devbuild/gen/osh-lex.h"
+}
+#line 196 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__VSub_ArgUnquoted:
+    for (;;) {
+      
+#line 2081 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy233;
+		case '"': goto yy236;
+		case '#': goto yy237;
+		case '$': goto yy238;
+		case '%': goto yy240;
+		case '\'': goto yy241;
+		case '/': goto yy242;
+		case '<': goto yy243;
+		case '>': goto yy244;
+		case '\\': goto yy245;
+		case '`': goto yy246;
+		case '}': goto yy247;
+		default: goto yy234;
+	}
+yy233:
+	++p;
+#line 231 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 2104 "_devbuild/gen/osh-lex.h"
+yy234:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '"':
+		case '#':
+		case '$':
+		case '%':
+		case '\'':
+		case '/':
+		case '<':
+		case '>':
+		case '\\':
+		case '`':
+		case '}': goto yy235;
+		default: goto yy234;
+	}
+yy235:
+#line 229 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 2125 "_devbuild/gen/osh-lex.h"
+yy236:
+	++p;
+#line 214 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 2130 "_devbuild/gen/osh-lex.h"
+yy237:
+	++p;
+#line 206 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 2135 "_devbuild/gen/osh-lex.h"
+yy238:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy248;
+		case '"': goto yy249;
+		case '#': goto yy250;
+		case '$': goto yy251;
+		case '\'': goto yy252;
+		case '(': goto yy253;
+		case '*': goto yy255;
+		case '-': goto yy256;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy257;
+		case '?': goto yy258;
+		case '@': goto yy259;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy260;
+		case '[': goto yy262;
+		case '{': goto yy263;
+		default: goto yy239;
+	}
+yy239:
+#line 230 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 2219 "_devbuild/gen/osh-lex.h"
+yy240:
+	++p;
+#line 207 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Percent; break; }
+#line 2224 "_devbuild/gen/osh-lex.h"
+yy241:
+	++p;
+#line 215 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 2229 "_devbuild/gen/osh-lex.h"
+yy242:
+	++p;
+#line 205 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Slash; break; }
+#line 2234 "_devbuild/gen/osh-lex.h"
+yy243:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy264;
+		default: goto yy239;
+	}
+yy244:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy265;
+		default: goto yy239;
+	}
+yy245:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy239;
+		case '\n': goto yy267;
+		default: goto yy266;
+	}
+yy246:
+	++p;
+#line 209 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 2258 "_devbuild/gen/osh-lex.h"
+yy247:
+	++p;
+#line 208 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DollarBrace; break; }
+#line 2263 "_devbuild/gen/osh-lex.h"
+yy248:
+	++p;
+#line 222 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 2268 "_devbuild/gen/osh-lex.h"
+yy249:
+	++p;
+#line 216 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 2273 "_devbuild/gen/osh-lex.h"
+yy250:
+	++p;
+#line 224 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 2278 "_devbuild/gen/osh-lex.h"
+yy251:
+	++p;
+#line 225 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 2283 "_devbuild/gen/osh-lex.h"
+yy252:
+	++p;
+#line 217 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 2288 "_devbuild/gen/osh-lex.h"
+yy253:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy268;
+		default: goto yy254;
+	}
+yy254:
+#line 210 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 2298 "_devbuild/gen/osh-lex.h"
+yy255:
+	++p;
+#line 226 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 2303 "_devbuild/gen/osh-lex.h"
+yy256:
+	++p;
+#line 227 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 2308 "_devbuild/gen/osh-lex.h"
+yy257:
+	++p;
+#line 221 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 2313 "_devbuild/gen/osh-lex.h"
+yy258:
+	++p;
+#line 228 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 2318 "_devbuild/gen/osh-lex.h"
+yy259:
+	++p;
+#line 223 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 2323 "_devbuild/gen/osh-lex.h"
+yy260:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy260;
+		default: goto yy261;
+	}
+yy261:
+#line 220 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 2395 "_devbuild/gen/osh-lex.h"
+yy262:
+	++p;
+#line 213 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 2400 "_devbuild/gen/osh-lex.h"
+yy263:
+	++p;
+#line 211 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 2405 "_devbuild/gen/osh-lex.h"
+yy264:
+	++p;
+#line 218 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 2410 "_devbuild/gen/osh-lex.h"
+yy265:
+	++p;
+#line 219 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 2415 "_devbuild/gen/osh-lex.h"
+yy266:
+	++p;
+#line 203 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 2420 "_devbuild/gen/osh-lex.h"
+yy267:
+	++p;
+#line 204 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 2425 "_devbuild/gen/osh-lex.h"
+yy268:
+	++p;
+#line 212 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 2430 "_devbuild/gen/osh-lex.h"
+}
+#line 232 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Command:
+    for (;;) {
+      
+#line 2440 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy270;
+		case '\t':
+		case '\r':
+		case ' ': goto yy273;
+		case '\n': goto yy275;
+		case '!': goto yy276;
+		case '"': goto yy277;
+		case '#': goto yy278;
+		case '$': goto yy279;
+		case '&': goto yy280;
+		case '\'': goto yy281;
+		case '(': goto yy282;
+		case ')': goto yy283;
+		case '*': goto yy284;
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'n':
+		case 'o':
+		case 'q':
+		case 'r':
+		case 'u':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		case ';': goto yy288;
+		case '<': goto yy289;
+		case '>': goto yy291;
+		case '@': goto yy293;
+		case '[': goto yy294;
+		case '\\': goto yy295;
+		case ']': goto yy296;
+		case 'c': goto yy297;
+		case 'd': goto yy298;
+		case 'e': goto yy299;
+		case 'f': goto yy300;
+		case 'i': goto yy301;
+		case 'm': goto yy302;
+		case 'p': goto yy303;
+		case 's': goto yy304;
+		case 't': goto yy305;
+		case 'v': goto yy306;
+		case 'w': goto yy307;
+		case '{': goto yy308;
+		case '|': goto yy309;
+		case '}': goto yy311;
+		default: goto yy271;
+	}
+yy270:
+	++p;
+#line 293 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 2541 "_devbuild/gen/osh-lex.h"
+yy271:
+	++p;
+yy272:
+#line 292 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 2547 "_devbuild/gen/osh-lex.h"
+yy273:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy273;
+		default: goto yy274;
+	}
+yy274:
+#line 271 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 2559 "_devbuild/gen/osh-lex.h"
+yy275:
+	++p;
+#line 272 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 2564 "_devbuild/gen/osh-lex.h"
+yy276:
+	++p;
+#line 281 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Bang; break; }
+#line 2569 "_devbuild/gen/osh-lex.h"
+yy277:
+	++p;
+#line 262 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 2574 "_devbuild/gen/osh-lex.h"
+yy278:
+	++p;
+#line 270 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 2579 "_devbuild/gen/osh-lex.h"
+yy279:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy312;
+		case '/': goto yy313;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy314;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy315;
+		case '[': goto yy317;
+		case '{': goto yy318;
+		default: goto yy272;
+	}
+yy280:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy319;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy320;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy321;
+		default: goto yy272;
+	}
+yy281:
+	++p;
+#line 263 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 2725 "_devbuild/gen/osh-lex.h"
+yy282:
+	++p;
+#line 275 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 2730 "_devbuild/gen/osh-lex.h"
+yy283:
+	++p;
+#line 276 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 2735 "_devbuild/gen/osh-lex.h"
+yy284:
+	++p;
+#line 269 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_Star; break; }
+#line 2740 "_devbuild/gen/osh-lex.h"
+yy285:
+	yych = *++p;
+yy286:
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy287;
+	}
+yy287:
+#line 268 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 2816 "_devbuild/gen/osh-lex.h"
+yy288:
+	++p;
+#line 285 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Semi; break; }
+#line 2821 "_devbuild/gen/osh-lex.h"
+yy289:
+	yych = *++p;
+	switch (yych) {
+		case '<': goto yy323;
+		default: goto yy290;
+	}
+yy290:
+#line 286 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_Less; break; }
+#line 2831 "_devbuild/gen/osh-lex.h"
+yy291:
+	yych = *++p;
+	switch (yych) {
+		case '+': goto yy324;
+		case '>': goto yy325;
+		default: goto yy292;
+	}
+yy292:
+#line 287 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_Great; break; }
+#line 2842 "_devbuild/gen/osh-lex.h"
+yy293:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy327;
+		case '[': goto yy328;
+		default: goto yy272;
+	}
+yy294:
+	++p;
+#line 277 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBracket; break; }
+#line 2854 "_devbuild/gen/osh-lex.h"
+yy295:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy272;
+		case '\n': goto yy330;
+		default: goto yy329;
+	}
+yy296:
+	++p;
+#line 278 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 2866 "_devbuild/gen/osh-lex.h"
+yy297:
+	yych = *++p;
+	switch (yych) {
+		case 'a': goto yy331;
+		case 'o': goto yy332;
+		default: goto yy286;
+	}
+yy298:
+	yych = *++p;
+	switch (yych) {
+		case 'o': goto yy333;
+		default: goto yy286;
+	}
+yy299:
+	yych = *++p;
+	switch (yych) {
+		case 'l': goto yy335;
+		default: goto yy286;
+	}
+yy300:
+	yych = *++p;
+	switch (yych) {
+		case 'o': goto yy336;
+		case 'u': goto yy337;
+		default: goto yy286;
+	}
+yy301:
+	yych = *++p;
+	switch (yych) {
+		case 'f': goto yy338;
+		case 'n': goto yy340;
+		default: goto yy286;
+	}
+yy302:
+	yych = *++p;
+	switch (yych) {
+		case 'a': goto yy342;
+		default: goto yy286;
+	}
+yy303:
+	yych = *++p;
+	switch (yych) {
+		case 'r': goto yy343;
+		default: goto yy286;
+	}
+yy304:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy344;
+		case 'w': goto yy345;
+		default: goto yy286;
+	}
+yy305:
+	yych = *++p;
+	switch (yych) {
+		case 'i': goto yy346;
+		default: goto yy286;
+	}
+yy306:
+	yych = *++p;
+	switch (yych) {
+		case 'a': goto yy347;
+		default: goto yy286;
+	}
+yy307:
+	yych = *++p;
+	switch (yych) {
+		case 'h': goto yy348;
+		case 'i': goto yy349;
+		default: goto yy286;
+	}
+yy308:
+	++p;
+#line 279 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBrace; break; }
+#line 2942 "_devbuild/gen/osh-lex.h"
+yy309:
+	yych = *++p;
+	switch (yych) {
+		case '|': goto yy350;
+		default: goto yy310;
+	}
+yy310:
+#line 282 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Pipe; break; }
+#line 2952 "_devbuild/gen/osh-lex.h"
+yy311:
+	++p;
+#line 280 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBrace; break; }
+#line 2957 "_devbuild/gen/osh-lex.h"
+yy312:
+	++p;
+#line 258 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 2962 "_devbuild/gen/osh-lex.h"
+yy313:
+	++p;
+#line 261 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSlash; break; }
+#line 2967 "_devbuild/gen/osh-lex.h"
+yy314:
+	++p;
+#line 267 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 2972 "_devbuild/gen/osh-lex.h"
+yy315:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy315;
+		default: goto yy316;
+	}
+yy316:
+#line 266 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 3044 "_devbuild/gen/osh-lex.h"
+yy317:
+	++p;
+#line 260 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 3049 "_devbuild/gen/osh-lex.h"
+yy318:
+	++p;
+#line 259 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 3054 "_devbuild/gen/osh-lex.h"
+yy319:
+	++p;
+#line 283 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DAmp; break; }
+#line 3059 "_devbuild/gen/osh-lex.h"
+yy320:
+	++p;
+#line 273 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Fd_Number; break; }
+#line 3064 "_devbuild/gen/osh-lex.h"
+yy321:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy321;
+		default: goto yy322;
+	}
+yy322:
+#line 274 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Fd_Name; break; }
+#line 3136 "_devbuild/gen/osh-lex.h"
+yy323:
+	++p;
+#line 289 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DLess; break; }
+#line 3141 "_devbuild/gen/osh-lex.h"
+yy324:
+	++p;
+#line 288 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_GreatPlus; break; }
+#line 3146 "_devbuild/gen/osh-lex.h"
+yy325:
+	yych = *++p;
+	switch (yych) {
+		case '+': goto yy351;
+		default: goto yy326;
+	}
+yy326:
+#line 290 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DGreat; break; }
+#line 3156 "_devbuild/gen/osh-lex.h"
+yy327:
+	++p;
+#line 264 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtParen; break; }
+#line 3161 "_devbuild/gen/osh-lex.h"
+yy328:
+	++p;
+#line 265 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtBracket; break; }
+#line 3166 "_devbuild/gen/osh-lex.h"
+yy329:
+	++p;
+#line 256 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 3171 "_devbuild/gen/osh-lex.h"
+yy330:
+	++p;
+#line 257 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 3176 "_devbuild/gen/osh-lex.h"
+yy331:
+	yych = *++p;
+	switch (yych) {
+		case 's': goto yy352;
+		default: goto yy286;
+	}
+yy332:
+	yych = *++p;
+	switch (yych) {
+		case 'n': goto yy353;
+		default: goto yy286;
+	}
+yy333:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy334;
+	}
+yy334:
+#line 244 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Do; break; }
+#line 3263 "_devbuild/gen/osh-lex.h"
+yy335:
+	yych = *++p;
+	switch (yych) {
+		case 'i': goto yy354;
+		case 's': goto yy355;
+		default: goto yy286;
+	}
+yy336:
+	yych = *++p;
+	switch (yych) {
+		case 'r': goto yy356;
+		default: goto yy286;
+	}
+yy337:
+	yych = *++p;
+	switch (yych) {
+		case 'n': goto yy358;
+		default: goto yy286;
+	}
+yy338:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy339;
+	}
+yy339:
+#line 249 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_If; break; }
+#line 3357 "_devbuild/gen/osh-lex.h"
+yy340:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy341;
+	}
+yy341:
+#line 247 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_In; break; }
+#line 3432 "_devbuild/gen/osh-lex.h"
+yy342:
+	yych = *++p;
+	switch (yych) {
+		case 't': goto yy359;
+		default: goto yy286;
+	}
+yy343:
+	yych = *++p;
+	switch (yych) {
+		case 'o': goto yy360;
+		default: goto yy286;
+	}
+yy344:
+	yych = *++p;
+	switch (yych) {
+		case 't': goto yy361;
+		default: goto yy286;
+	}
+yy345:
+	yych = *++p;
+	switch (yych) {
+		case 'i': goto yy363;
+		default: goto yy286;
+	}
+yy346:
+	yych = *++p;
+	switch (yych) {
+		case 'm': goto yy364;
+		default: goto yy286;
+	}
+yy347:
+	yych = *++p;
+	switch (yych) {
+		case 'r': goto yy365;
+		default: goto yy286;
+	}
+yy348:
+	yych = *++p;
+	switch (yych) {
+		case 'i': goto yy367;
+		default: goto yy286;
+	}
+yy349:
+	yych = *++p;
+	switch (yych) {
+		case 't': goto yy368;
+		default: goto yy286;
+	}
+yy350:
+	++p;
+#line 284 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DPipe; break; }
+#line 3485 "_devbuild/gen/osh-lex.h"
+yy351:
+	++p;
+#line 291 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DGreatPlus; break; }
+#line 3490 "_devbuild/gen/osh-lex.h"
+yy352:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy369;
+		default: goto yy286;
+	}
+yy353:
+	yych = *++p;
+	switch (yych) {
+		case 's': goto yy371;
+		default: goto yy286;
+	}
+yy354:
+	yych = *++p;
+	switch (yych) {
+		case 'f': goto yy372;
+		default: goto yy286;
+	}
+yy355:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy374;
+		default: goto yy286;
+	}
+yy356:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy357;
+	}
+yy357:
+#line 246 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_For; break; }
+#line 3589 "_devbuild/gen/osh-lex.h"
+yy358:
+	yych = *++p;
+	switch (yych) {
+		case 'c': goto yy376;
+		default: goto yy286;
+	}
+yy359:
+	yych = *++p;
+	switch (yych) {
+		case 'c': goto yy378;
+		default: goto yy286;
+	}
+yy360:
+	yych = *++p;
+	switch (yych) {
+		case 'c': goto yy379;
+		default: goto yy286;
+	}
+yy361:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy362;
+	}
+yy362:
+#line 240 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Set; break; }
+#line 3682 "_devbuild/gen/osh-lex.h"
+yy363:
+	yych = *++p;
+	switch (yych) {
+		case 't': goto yy381;
+		default: goto yy286;
+	}
+yy364:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy382;
+		default: goto yy286;
+	}
+yy365:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy366;
+	}
+yy366:
+#line 241 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Var; break; }
+#line 3769 "_devbuild/gen/osh-lex.h"
+yy367:
+	yych = *++p;
+	switch (yych) {
+		case 'l': goto yy384;
+		default: goto yy286;
+	}
+yy368:
+	yych = *++p;
+	switch (yych) {
+		case 'h': goto yy385;
+		default: goto yy286;
+	}
+yy369:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy370;
+	}
+yy370:
+#line 254 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Case; break; }
+#line 3856 "_devbuild/gen/osh-lex.h"
+yy371:
+	yych = *++p;
+	switch (yych) {
+		case 't': goto yy387;
+		default: goto yy286;
+	}
+yy372:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy373;
+	}
+yy373:
+#line 251 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Elif; break; }
+#line 3937 "_devbuild/gen/osh-lex.h"
+yy374:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy375;
+	}
+yy375:
+#line 250 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Else; break; }
+#line 4012 "_devbuild/gen/osh-lex.h"
+yy376:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy377;
+	}
+yy377:
+#line 243 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Func; break; }
+#line 4087 "_devbuild/gen/osh-lex.h"
+yy378:
+	yych = *++p;
+	switch (yych) {
+		case 'h': goto yy389;
+		default: goto yy286;
+	}
+yy379:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy380;
+	}
+yy380:
+#line 242 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Proc; break; }
+#line 4168 "_devbuild/gen/osh-lex.h"
+yy381:
+	yych = *++p;
+	switch (yych) {
+		case 'c': goto yy391;
+		default: goto yy286;
+	}
+yy382:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy383;
+	}
+yy383:
+#line 245 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Time; break; }
+#line 4249 "_devbuild/gen/osh-lex.h"
+yy384:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy392;
+		default: goto yy286;
+	}
+yy385:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy386;
+	}
+yy386:
+#line 255 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_With; break; }
+#line 4330 "_devbuild/gen/osh-lex.h"
+yy387:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy388;
+	}
+yy388:
+#line 239 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Const; break; }
+#line 4405 "_devbuild/gen/osh-lex.h"
+yy389:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy390;
+	}
+yy390:
+#line 253 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Match; break; }
+#line 4480 "_devbuild/gen/osh-lex.h"
+yy391:
+	yych = *++p;
+	switch (yych) {
+		case 'h': goto yy394;
+		default: goto yy286;
+	}
+yy392:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy393;
+	}
+yy393:
+#line 248 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_While; break; }
+#line 4561 "_devbuild/gen/osh-lex.h"
+yy394:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy285;
+		default: goto yy395;
+	}
+yy395:
+#line 252 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Switch; break; }
+#line 4636 "_devbuild/gen/osh-lex.h"
+}
+#line 294 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Arith:
+    for (;;) {
+      
+#line 4646 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy397;
+		case '\t':
+		case '\n':
+		case '\r':
+		case ' ': goto yy400;
+		case '!': goto yy402;
+		case '"': goto yy404;
+		case '#': goto yy405;
+		case '$': goto yy406;
+		case '%': goto yy407;
+		case '&': goto yy409;
+		case '\'': goto yy411;
+		case '(': goto yy412;
+		case ')': goto yy413;
+		case '*': goto yy414;
+		case '+': goto yy416;
+		case ',': goto yy418;
+		case '-': goto yy419;
+		case '/': goto yy421;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy423;
+		case ':': goto yy425;
+		case ';': goto yy426;
+		case '<': goto yy427;
+		case '=': goto yy429;
+		case '>': goto yy431;
+		case '?': goto yy433;
+		case '@': goto yy434;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy435;
+		case '[': goto yy437;
+		case '\\': goto yy438;
+		case ']': goto yy439;
+		case '^': goto yy440;
+		case '`': goto yy442;
+		case '|': goto yy443;
+		case '}': goto yy445;
+		case '~': goto yy446;
+		default: goto yy398;
+	}
+yy397:
+	++p;
+#line 371 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 4754 "_devbuild/gen/osh-lex.h"
+yy398:
+	++p;
+yy399:
+#line 370 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 4760 "_devbuild/gen/osh-lex.h"
+yy400:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\n':
+		case '\r':
+		case ' ': goto yy400;
+		default: goto yy401;
+	}
+yy401:
+#line 321 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Space; break; }
+#line 4773 "_devbuild/gen/osh-lex.h"
+yy402:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy447;
+		default: goto yy403;
+	}
+yy403:
+#line 351 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Bang; break; }
+#line 4783 "_devbuild/gen/osh-lex.h"
+yy404:
+	++p;
+#line 315 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 4788 "_devbuild/gen/osh-lex.h"
+yy405:
+	++p;
+#line 325 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 4793 "_devbuild/gen/osh-lex.h"
+yy406:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy448;
+		case '"': goto yy449;
+		case '#': goto yy450;
+		case '$': goto yy451;
+		case '\'': goto yy452;
+		case '(': goto yy453;
+		case '*': goto yy455;
+		case '-': goto yy456;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy457;
+		case '?': goto yy458;
+		case '@': goto yy459;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy460;
+		case '[': goto yy462;
+		case '{': goto yy463;
+		default: goto yy399;
+	}
+yy407:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy464;
+		default: goto yy408;
+	}
+yy408:
+#line 332 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Percent; break; }
+#line 4883 "_devbuild/gen/osh-lex.h"
+yy409:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy465;
+		case '=': goto yy466;
+		default: goto yy410;
+	}
+yy410:
+#line 354 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Amp; break; }
+#line 4894 "_devbuild/gen/osh-lex.h"
+yy411:
+	++p;
+#line 316 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 4899 "_devbuild/gen/osh-lex.h"
+yy412:
+	++p;
+#line 336 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_LParen; break; }
+#line 4904 "_devbuild/gen/osh-lex.h"
+yy413:
+	++p;
+#line 337 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_RParen; break; }
+#line 4909 "_devbuild/gen/osh-lex.h"
+yy414:
+	yych = *++p;
+	switch (yych) {
+		case '*': goto yy467;
+		case '=': goto yy468;
+		default: goto yy415;
+	}
+yy415:
+#line 330 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Star; break; }
+#line 4920 "_devbuild/gen/osh-lex.h"
+yy416:
+	yych = *++p;
+	switch (yych) {
+		case '+': goto yy469;
+		case '=': goto yy470;
+		default: goto yy417;
+	}
+yy417:
+#line 328 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Plus; break; }
+#line 4931 "_devbuild/gen/osh-lex.h"
+yy418:
+	++p;
+#line 327 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Comma; break; }
+#line 4936 "_devbuild/gen/osh-lex.h"
+yy419:
+	yych = *++p;
+	switch (yych) {
+		case '-': goto yy471;
+		case '=': goto yy472;
+		default: goto yy420;
+	}
+yy420:
+#line 329 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Minus; break; }
+#line 4947 "_devbuild/gen/osh-lex.h"
+yy421:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy473;
+		default: goto yy422;
+	}
+yy422:
+#line 331 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Slash; break; }
+#line 4957 "_devbuild/gen/osh-lex.h"
+yy423:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy423;
+		default: goto yy424;
+	}
+yy424:
+#line 323 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Digits; break; }
+#line 4976 "_devbuild/gen/osh-lex.h"
+yy425:
+	++p;
+#line 342 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Colon; break; }
+#line 4981 "_devbuild/gen/osh-lex.h"
+yy426:
+	++p;
+#line 326 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Semi; break; }
+#line 4986 "_devbuild/gen/osh-lex.h"
+yy427:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy474;
+		case '<': goto yy475;
+		case '=': goto yy477;
+		default: goto yy428;
+	}
+yy428:
+#line 344 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Less; break; }
+#line 4998 "_devbuild/gen/osh-lex.h"
+yy429:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy478;
+		default: goto yy430;
+	}
+yy430:
+#line 358 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Equal; break; }
+#line 5008 "_devbuild/gen/osh-lex.h"
+yy431:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy479;
+		case '=': goto yy480;
+		case '>': goto yy481;
+		default: goto yy432;
+	}
+yy432:
+#line 346 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Great; break; }
+#line 5020 "_devbuild/gen/osh-lex.h"
+yy433:
+	++p;
+#line 341 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_QMark; break; }
+#line 5025 "_devbuild/gen/osh-lex.h"
+yy434:
+	++p;
+#line 324 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_At; break; }
+#line 5030 "_devbuild/gen/osh-lex.h"
+yy435:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy435;
+		default: goto yy436;
+	}
+yy436:
+#line 322 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_ArithVarLike; break; }
+#line 5102 "_devbuild/gen/osh-lex.h"
+yy437:
+	++p;
+#line 338 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_LBracket; break; }
+#line 5107 "_devbuild/gen/osh-lex.h"
+yy438:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy483;
+		default: goto yy399;
+	}
+yy439:
+	++p;
+#line 339 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_RBracket; break; }
+#line 5118 "_devbuild/gen/osh-lex.h"
+yy440:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy484;
+		default: goto yy441;
+	}
+yy441:
+#line 356 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Caret; break; }
+#line 5128 "_devbuild/gen/osh-lex.h"
+yy442:
+	++p;
+#line 301 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 5133 "_devbuild/gen/osh-lex.h"
+yy443:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy485;
+		case '|': goto yy486;
+		default: goto yy444;
+	}
+yy444:
+#line 355 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Pipe; break; }
+#line 5144 "_devbuild/gen/osh-lex.h"
+yy445:
+	++p;
+#line 340 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_RBrace; break; }
+#line 5149 "_devbuild/gen/osh-lex.h"
+yy446:
+	++p;
+#line 357 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Tilde; break; }
+#line 5154 "_devbuild/gen/osh-lex.h"
+yy447:
+	++p;
+#line 348 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_NEqual; break; }
+#line 5159 "_devbuild/gen/osh-lex.h"
+yy448:
+	++p;
+#line 308 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 5164 "_devbuild/gen/osh-lex.h"
+yy449:
+	++p;
+#line 317 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 5169 "_devbuild/gen/osh-lex.h"
+yy450:
+	++p;
+#line 310 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 5174 "_devbuild/gen/osh-lex.h"
+yy451:
+	++p;
+#line 311 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 5179 "_devbuild/gen/osh-lex.h"
+yy452:
+	++p;
+#line 318 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 5184 "_devbuild/gen/osh-lex.h"
+yy453:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy487;
+		default: goto yy454;
+	}
+yy454:
+#line 302 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 5194 "_devbuild/gen/osh-lex.h"
+yy455:
+	++p;
+#line 312 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 5199 "_devbuild/gen/osh-lex.h"
+yy456:
+	++p;
+#line 313 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 5204 "_devbuild/gen/osh-lex.h"
+yy457:
+	++p;
+#line 307 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 5209 "_devbuild/gen/osh-lex.h"
+yy458:
+	++p;
+#line 314 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 5214 "_devbuild/gen/osh-lex.h"
+yy459:
+	++p;
+#line 309 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 5219 "_devbuild/gen/osh-lex.h"
+yy460:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy460;
+		default: goto yy461;
+	}
+yy461:
+#line 306 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 5291 "_devbuild/gen/osh-lex.h"
+yy462:
+	++p;
+#line 305 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 5296 "_devbuild/gen/osh-lex.h"
+yy463:
+	++p;
+#line 303 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 5301 "_devbuild/gen/osh-lex.h"
+yy464:
+	++p;
+#line 363 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PercentEqual; break; }
+#line 5306 "_devbuild/gen/osh-lex.h"
+yy465:
+	++p;
+#line 349 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DAmp; break; }
+#line 5311 "_devbuild/gen/osh-lex.h"
+yy466:
+	++p;
+#line 366 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_AmpEqual; break; }
+#line 5316 "_devbuild/gen/osh-lex.h"
+yy467:
+	++p;
+#line 335 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DStar; break; }
+#line 5321 "_devbuild/gen/osh-lex.h"
+yy468:
+	++p;
+#line 361 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_StarEqual; break; }
+#line 5326 "_devbuild/gen/osh-lex.h"
+yy469:
+	++p;
+#line 333 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DPlus; break; }
+#line 5331 "_devbuild/gen/osh-lex.h"
+yy470:
+	++p;
+#line 359 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PlusEqual; break; }
+#line 5336 "_devbuild/gen/osh-lex.h"
+yy471:
+	++p;
+#line 334 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DMinus; break; }
+#line 5341 "_devbuild/gen/osh-lex.h"
+yy472:
+	++p;
+#line 360 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_MinusEqual; break; }
+#line 5346 "_devbuild/gen/osh-lex.h"
+yy473:
+	++p;
+#line 362 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_SlashEqual; break; }
+#line 5351 "_devbuild/gen/osh-lex.h"
+yy474:
+	++p;
+#line 319 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 5356 "_devbuild/gen/osh-lex.h"
+yy475:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy488;
+		default: goto yy476;
+	}
+yy476:
+#line 353 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLess; break; }
+#line 5366 "_devbuild/gen/osh-lex.h"
+yy477:
+	++p;
+#line 343 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_LessEqual; break; }
+#line 5371 "_devbuild/gen/osh-lex.h"
+yy478:
+	++p;
+#line 347 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DEqual; break; }
+#line 5376 "_devbuild/gen/osh-lex.h"
+yy479:
+	++p;
+#line 320 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 5381 "_devbuild/gen/osh-lex.h"
+yy480:
+	++p;
+#line 345 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_GreatEqual; break; }
+#line 5386 "_devbuild/gen/osh-lex.h"
+yy481:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy489;
+		default: goto yy482;
+	}
+yy482:
+#line 352 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreat; break; }
+#line 5396 "_devbuild/gen/osh-lex.h"
+yy483:
+	++p;
+#line 369 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 5401 "_devbuild/gen/osh-lex.h"
+yy484:
+	++p;
+#line 368 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_CaretEqual; break; }
+#line 5406 "_devbuild/gen/osh-lex.h"
+yy485:
+	++p;
+#line 367 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_PipeEqual; break; }
+#line 5411 "_devbuild/gen/osh-lex.h"
+yy486:
+	++p;
+#line 350 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DPipe; break; }
+#line 5416 "_devbuild/gen/osh-lex.h"
+yy487:
+	++p;
+#line 304 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 5421 "_devbuild/gen/osh-lex.h"
+yy488:
+	++p;
+#line 365 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DLessEqual; break; }
+#line 5426 "_devbuild/gen/osh-lex.h"
+yy489:
+	++p;
+#line 364 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_DGreatEqual; break; }
+#line 5431 "_devbuild/gen/osh-lex.h"
+}
+#line 372 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__SQ:
+    for (;;) {
+      
+#line 5441 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy491;
+		case '\'': goto yy494;
+		default: goto yy492;
+	}
+yy491:
+	++p;
+#line 381 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 5454 "_devbuild/gen/osh-lex.h"
+yy492:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\'': goto yy493;
+		default: goto yy492;
+	}
+yy493:
+#line 379 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 5465 "_devbuild/gen/osh-lex.h"
+yy494:
+	++p;
+#line 380 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_SingleQuote; break; }
+#line 5470 "_devbuild/gen/osh-lex.h"
+}
+#line 382 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__DQ:
+    for (;;) {
+      
+#line 5480 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy496;
+		case '"': goto yy499;
+		case '$': goto yy500;
+		case '\\': goto yy502;
+		case '`': goto yy503;
+		default: goto yy497;
+	}
+yy496:
+	++p;
+#line 408 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 5496 "_devbuild/gen/osh-lex.h"
+yy497:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '"':
+		case '$':
+		case '\\':
+		case '`': goto yy498;
+		default: goto yy497;
+	}
+yy498:
+#line 405 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 5510 "_devbuild/gen/osh-lex.h"
+yy499:
+	++p;
+#line 406 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DoubleQuote; break; }
+#line 5515 "_devbuild/gen/osh-lex.h"
+yy500:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy504;
+		case '#': goto yy505;
+		case '$': goto yy506;
+		case '(': goto yy507;
+		case '*': goto yy509;
+		case '-': goto yy510;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy511;
+		case '?': goto yy512;
+		case '@': goto yy513;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy514;
+		case '[': goto yy516;
+		case '{': goto yy517;
+		default: goto yy501;
+	}
+yy501:
+#line 407 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 5597 "_devbuild/gen/osh-lex.h"
+yy502:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy518;
+		case '"':
+		case '$':
+		case '\\':
+		case '`': goto yy519;
+		default: goto yy501;
+	}
+yy503:
+	++p;
+#line 391 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 5612 "_devbuild/gen/osh-lex.h"
+yy504:
+	++p;
+#line 398 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 5617 "_devbuild/gen/osh-lex.h"
+yy505:
+	++p;
+#line 400 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 5622 "_devbuild/gen/osh-lex.h"
+yy506:
+	++p;
+#line 401 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 5627 "_devbuild/gen/osh-lex.h"
+yy507:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy520;
+		default: goto yy508;
+	}
+yy508:
+#line 392 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 5637 "_devbuild/gen/osh-lex.h"
+yy509:
+	++p;
+#line 402 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 5642 "_devbuild/gen/osh-lex.h"
+yy510:
+	++p;
+#line 403 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 5647 "_devbuild/gen/osh-lex.h"
+yy511:
+	++p;
+#line 397 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 5652 "_devbuild/gen/osh-lex.h"
+yy512:
+	++p;
+#line 404 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 5657 "_devbuild/gen/osh-lex.h"
+yy513:
+	++p;
+#line 399 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 5662 "_devbuild/gen/osh-lex.h"
+yy514:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy514;
+		default: goto yy515;
+	}
+yy515:
+#line 396 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 5734 "_devbuild/gen/osh-lex.h"
+yy516:
+	++p;
+#line 395 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 5739 "_devbuild/gen/osh-lex.h"
+yy517:
+	++p;
+#line 393 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 5744 "_devbuild/gen/osh-lex.h"
+yy518:
+	++p;
+#line 390 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 5749 "_devbuild/gen/osh-lex.h"
+yy519:
+	++p;
+#line 389 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 5754 "_devbuild/gen/osh-lex.h"
+yy520:
+	++p;
+#line 394 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 5759 "_devbuild/gen/osh-lex.h"
+}
+#line 409 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__CharClass:
+    for (;;) {
+      
+#line 5769 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy522;
+		case '\t':
+		case '\r':
+		case ' ': goto yy524;
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy526;
+		case ']': goto yy528;
+		default: goto yy523;
+	}
+yy522:
+	++p;
+#line 420 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 5851 "_devbuild/gen/osh-lex.h"
+yy523:
+	++p;
+#line 419 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 5856 "_devbuild/gen/osh-lex.h"
+yy524:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy524;
+		default: goto yy525;
+	}
+yy525:
+#line 417 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 5868 "_devbuild/gen/osh-lex.h"
+yy526:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy526;
+		default: goto yy527;
+	}
+yy527:
+#line 416 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 5943 "_devbuild/gen/osh-lex.h"
+yy528:
+	++p;
+#line 418 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 5948 "_devbuild/gen/osh-lex.h"
+}
+#line 421 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Comment:
+    for (;;) {
+      
+#line 5958 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy531;
+		case '\n': goto yy530;
+		default: goto yy532;
+	}
+yy530:
+#line 428 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Comment; break; }
+#line 5970 "_devbuild/gen/osh-lex.h"
+yy531:
+	++p;
+#line 429 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 5975 "_devbuild/gen/osh-lex.h"
+yy532:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\n': goto yy530;
+		default: goto yy532;
+	}
+}
+#line 430 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__PrintfPercent:
+    for (;;) {
+      
+#line 5992 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy534;
+		case ' ':
+		case '#':
+		case '+':
+		case '-':
+		case '0': goto yy536;
+		case '.': goto yy537;
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy538;
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'X':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'i':
+		case 'o':
+		case 'q':
+		case 's':
+		case 'u':
+		case 'x': goto yy540;
+		default: goto yy535;
+	}
+yy534:
+	++p;
+#line 442 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 6035 "_devbuild/gen/osh-lex.h"
+yy535:
+	++p;
+#line 441 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 6040 "_devbuild/gen/osh-lex.h"
+yy536:
+	++p;
+#line 437 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_Flag; break; }
+#line 6045 "_devbuild/gen/osh-lex.h"
+yy537:
+	++p;
+#line 439 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_Dot; break; }
+#line 6050 "_devbuild/gen/osh-lex.h"
+yy538:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy538;
+		default: goto yy539;
+	}
+yy539:
+#line 438 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_Num; break; }
+#line 6069 "_devbuild/gen/osh-lex.h"
+yy540:
+	++p;
+#line 440 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_Type; break; }
+#line 6074 "_devbuild/gen/osh-lex.h"
+}
+#line 443 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__VSub_ArgDQ:
+    for (;;) {
+      
+#line 6084 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy542;
+		case '"': goto yy545;
+		case '#': goto yy546;
+		case '$': goto yy547;
+		case '%': goto yy549;
+		case '/': goto yy550;
+		case '\\': goto yy551;
+		case '`': goto yy552;
+		case '}': goto yy553;
+		default: goto yy543;
+	}
+yy542:
+	++p;
+#line 474 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 6104 "_devbuild/gen/osh-lex.h"
+yy543:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '"':
+		case '#':
+		case '$':
+		case '%':
+		case '/':
+		case '\\':
+		case '`':
+		case '}': goto yy544;
+		default: goto yy543;
+	}
+yy544:
+#line 470 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 6122 "_devbuild/gen/osh-lex.h"
+yy545:
+	++p;
+#line 471 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 6127 "_devbuild/gen/osh-lex.h"
+yy546:
+	++p;
+#line 453 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 6132 "_devbuild/gen/osh-lex.h"
+yy547:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy554;
+		case '#': goto yy555;
+		case '$': goto yy556;
+		case '\'': goto yy557;
+		case '(': goto yy558;
+		case '*': goto yy560;
+		case '-': goto yy561;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy562;
+		case '?': goto yy563;
+		case '@': goto yy564;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy565;
+		case '[': goto yy567;
+		case '{': goto yy568;
+		default: goto yy548;
+	}
+yy548:
+#line 473 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 6215 "_devbuild/gen/osh-lex.h"
+yy549:
+	++p;
+#line 454 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Percent; break; }
+#line 6220 "_devbuild/gen/osh-lex.h"
+yy550:
+	++p;
+#line 452 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Slash; break; }
+#line 6225 "_devbuild/gen/osh-lex.h"
+yy551:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy548;
+		case '\n': goto yy570;
+		default: goto yy569;
+	}
+yy552:
+	++p;
+#line 456 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 6237 "_devbuild/gen/osh-lex.h"
+yy553:
+	++p;
+#line 455 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DollarBrace; break; }
+#line 6242 "_devbuild/gen/osh-lex.h"
+yy554:
+	++p;
+#line 463 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 6247 "_devbuild/gen/osh-lex.h"
+yy555:
+	++p;
+#line 465 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 6252 "_devbuild/gen/osh-lex.h"
+yy556:
+	++p;
+#line 466 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 6257 "_devbuild/gen/osh-lex.h"
+yy557:
+	++p;
+#line 472 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 6262 "_devbuild/gen/osh-lex.h"
+yy558:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy571;
+		default: goto yy559;
+	}
+yy559:
+#line 457 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 6272 "_devbuild/gen/osh-lex.h"
+yy560:
+	++p;
+#line 467 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 6277 "_devbuild/gen/osh-lex.h"
+yy561:
+	++p;
+#line 468 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 6282 "_devbuild/gen/osh-lex.h"
+yy562:
+	++p;
+#line 462 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 6287 "_devbuild/gen/osh-lex.h"
+yy563:
+	++p;
+#line 469 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 6292 "_devbuild/gen/osh-lex.h"
+yy564:
+	++p;
+#line 464 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 6297 "_devbuild/gen/osh-lex.h"
+yy565:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy565;
+		default: goto yy566;
+	}
+yy566:
+#line 461 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 6369 "_devbuild/gen/osh-lex.h"
+yy567:
+	++p;
+#line 460 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 6374 "_devbuild/gen/osh-lex.h"
+yy568:
+	++p;
+#line 458 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 6379 "_devbuild/gen/osh-lex.h"
+yy569:
+	++p;
+#line 450 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 6384 "_devbuild/gen/osh-lex.h"
+yy570:
+	++p;
+#line 451 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 6389 "_devbuild/gen/osh-lex.h"
+yy571:
+	++p;
+#line 459 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 6394 "_devbuild/gen/osh-lex.h"
+}
+#line 475 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__DBracket:
+    for (;;) {
+      
+#line 6404 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy573;
+		case '\t':
+		case '\r':
+		case ' ': goto yy576;
+		case '\n': goto yy578;
+		case '!': goto yy579;
+		case '"': goto yy581;
+		case '#': goto yy582;
+		case '$': goto yy583;
+		case '&': goto yy584;
+		case '\'': goto yy586;
+		case '(': goto yy587;
+		case ')': goto yy588;
+		case '*': goto yy589;
+		case '+': goto yy590;
+		case '-': goto yy591;
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		case ';': goto yy595;
+		case '<': goto yy597;
+		case '=': goto yy599;
+		case '>': goto yy601;
+		case '?': goto yy603;
+		case '@': goto yy604;
+		case '\\': goto yy605;
+		case ']': goto yy606;
+		case '`': goto yy607;
+		case '|': goto yy608;
+		case '~': goto yy610;
+		default: goto yy574;
+	}
+yy573:
+	++p;
+#line 566 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 6507 "_devbuild/gen/osh-lex.h"
+yy574:
+	++p;
+yy575:
+#line 560 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 6513 "_devbuild/gen/osh-lex.h"
+yy576:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy576;
+		default: goto yy577;
+	}
+yy577:
+#line 549 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 6525 "_devbuild/gen/osh-lex.h"
+yy578:
+	++p;
+#line 550 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 6530 "_devbuild/gen/osh-lex.h"
+yy579:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy612;
+		case '=': goto yy613;
+		default: goto yy580;
+	}
+yy580:
+#line 483 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Bang; break; }
+#line 6541 "_devbuild/gen/osh-lex.h"
+yy581:
+	++p;
+#line 531 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 6546 "_devbuild/gen/osh-lex.h"
+yy582:
+	++p;
+#line 548 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 6551 "_devbuild/gen/osh-lex.h"
+yy583:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy614;
+		case '"': goto yy615;
+		case '#': goto yy616;
+		case '$': goto yy617;
+		case '\'': goto yy618;
+		case '(': goto yy619;
+		case '*': goto yy621;
+		case '-': goto yy622;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy623;
+		case '?': goto yy624;
+		case '@': goto yy625;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy626;
+		case '[': goto yy628;
+		case '{': goto yy629;
+		default: goto yy575;
+	}
+yy584:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy630;
+		default: goto yy585;
+	}
+yy585:
+#line 551 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Amp; break; }
+#line 6641 "_devbuild/gen/osh-lex.h"
+yy586:
+	++p;
+#line 532 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 6646 "_devbuild/gen/osh-lex.h"
+yy587:
+	++p;
+#line 558 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 6651 "_devbuild/gen/osh-lex.h"
+yy588:
+	++p;
+#line 559 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 6656 "_devbuild/gen/osh-lex.h"
+yy589:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy631;
+		default: goto yy575;
+	}
+yy590:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy632;
+		default: goto yy575;
+	}
+yy591:
+	yych = *++p;
+	switch (yych) {
+		case 'G': goto yy633;
+		case 'L': goto yy635;
+		case 'N': goto yy637;
+		case 'O': goto yy639;
+		case 'R': goto yy641;
+		case 'S': goto yy643;
+		case 'a': goto yy645;
+		case 'b': goto yy647;
+		case 'c': goto yy649;
+		case 'd': goto yy651;
+		case 'e': goto yy653;
+		case 'f': goto yy655;
+		case 'g': goto yy657;
+		case 'h': goto yy659;
+		case 'l': goto yy661;
+		case 'n': goto yy662;
+		case 'o': goto yy664;
+		case 'p': goto yy666;
+		case 'r': goto yy668;
+		case 's': goto yy670;
+		case 't': goto yy672;
+		case 'u': goto yy674;
+		case 'v': goto yy676;
+		case 'w': goto yy678;
+		case 'x': goto yy680;
+		case 'z': goto yy682;
+		default: goto yy594;
+	}
+yy592:
+#line 546 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 6703 "_devbuild/gen/osh-lex.h"
+yy593:
+	yych = *++p;
+yy594:
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy592;
+	}
+yy595:
+	yych = *++p;
+	switch (yych) {
+		case ';': goto yy684;
+		default: goto yy596;
+	}
+yy596:
+#line 556 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Semi; break; }
+#line 6785 "_devbuild/gen/osh-lex.h"
+yy597:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy685;
+		default: goto yy598;
+	}
+yy598:
+#line 484 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Less; break; }
+#line 6795 "_devbuild/gen/osh-lex.h"
+yy599:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy686;
+		case '~': goto yy687;
+		default: goto yy600;
+	}
+yy600:
+#line 511 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_GlobEqual; break; }
+#line 6806 "_devbuild/gen/osh-lex.h"
+yy601:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy688;
+		default: goto yy602;
+	}
+yy602:
+#line 485 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Great; break; }
+#line 6816 "_devbuild/gen/osh-lex.h"
+yy603:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy689;
+		default: goto yy575;
+	}
+yy604:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy690;
+		default: goto yy575;
+	}
+yy605:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy575;
+		case '\n': goto yy692;
+		default: goto yy691;
+	}
+yy606:
+	yych = *++p;
+	switch (yych) {
+		case ']': goto yy693;
+		default: goto yy575;
+	}
+yy607:
+	++p;
+#line 526 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 6846 "_devbuild/gen/osh-lex.h"
+yy608:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy694;
+		case '|': goto yy695;
+		default: goto yy609;
+	}
+yy609:
+#line 552 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Pipe; break; }
+#line 6857 "_devbuild/gen/osh-lex.h"
+yy610:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy610;
+		default: goto yy611;
+	}
+yy611:
+#line 547 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_TildeLike; break; }
+#line 6931 "_devbuild/gen/osh-lex.h"
+yy612:
+	++p;
+#line 565 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Bang; break; }
+#line 6936 "_devbuild/gen/osh-lex.h"
+yy613:
+	++p;
+#line 513 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_GlobNEqual; break; }
+#line 6941 "_devbuild/gen/osh-lex.h"
+yy614:
+	++p;
+#line 539 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 6946 "_devbuild/gen/osh-lex.h"
+yy615:
+	++p;
+#line 533 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 6951 "_devbuild/gen/osh-lex.h"
+yy616:
+	++p;
+#line 541 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 6956 "_devbuild/gen/osh-lex.h"
+yy617:
+	++p;
+#line 542 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 6961 "_devbuild/gen/osh-lex.h"
+yy618:
+	++p;
+#line 534 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 6966 "_devbuild/gen/osh-lex.h"
+yy619:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy696;
+		default: goto yy620;
+	}
+yy620:
+#line 527 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 6976 "_devbuild/gen/osh-lex.h"
+yy621:
+	++p;
+#line 543 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 6981 "_devbuild/gen/osh-lex.h"
+yy622:
+	++p;
+#line 544 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 6986 "_devbuild/gen/osh-lex.h"
+yy623:
+	++p;
+#line 538 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 6991 "_devbuild/gen/osh-lex.h"
+yy624:
+	++p;
+#line 545 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 6996 "_devbuild/gen/osh-lex.h"
+yy625:
+	++p;
+#line 540 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 7001 "_devbuild/gen/osh-lex.h"
+yy626:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy626;
+		default: goto yy627;
+	}
+yy627:
+#line 537 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 7073 "_devbuild/gen/osh-lex.h"
+yy628:
+	++p;
+#line 530 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 7078 "_devbuild/gen/osh-lex.h"
+yy629:
+	++p;
+#line 528 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 7083 "_devbuild/gen/osh-lex.h"
+yy630:
+	++p;
+#line 554 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DAmp; break; }
+#line 7088 "_devbuild/gen/osh-lex.h"
+yy631:
+	++p;
+#line 562 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Star; break; }
+#line 7093 "_devbuild/gen/osh-lex.h"
+yy632:
+	++p;
+#line 563 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Plus; break; }
+#line 7098 "_devbuild/gen/osh-lex.h"
+yy633:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy634;
+	}
+yy634:
+#line 509 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_G; break; }
+#line 7173 "_devbuild/gen/osh-lex.h"
+yy635:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy636;
+	}
+yy636:
+#line 500 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_L; break; }
+#line 7248 "_devbuild/gen/osh-lex.h"
+yy637:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy638;
+	}
+yy638:
+#line 510 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_N; break; }
+#line 7323 "_devbuild/gen/osh-lex.h"
+yy639:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy640;
+	}
+yy640:
+#line 508 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_O; break; }
+#line 7398 "_devbuild/gen/osh-lex.h"
+yy641:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy642;
+	}
+yy642:
+#line 491 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_R; break; }
+#line 7473 "_devbuild/gen/osh-lex.h"
+yy643:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy644;
+	}
+yy644:
+#line 504 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_S; break; }
+#line 7548 "_devbuild/gen/osh-lex.h"
+yy645:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy646;
+	}
+yy646:
+#line 492 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_a; break; }
+#line 7623 "_devbuild/gen/osh-lex.h"
+yy647:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy648;
+	}
+yy648:
+#line 493 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_b; break; }
+#line 7698 "_devbuild/gen/osh-lex.h"
+yy649:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy650;
+	}
+yy650:
+#line 494 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_c; break; }
+#line 7773 "_devbuild/gen/osh-lex.h"
+yy651:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy652;
+	}
+yy652:
+#line 495 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_d; break; }
+#line 7848 "_devbuild/gen/osh-lex.h"
+yy653:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		case 'f': goto yy697;
+		case 'q': goto yy699;
+		default: goto yy654;
+	}
+yy654:
+#line 496 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_e; break; }
+#line 7923 "_devbuild/gen/osh-lex.h"
+yy655:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy656;
+	}
+yy656:
+#line 497 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_f; break; }
+#line 7998 "_devbuild/gen/osh-lex.h"
+yy657:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		case 'e': goto yy701;
+		case 't': goto yy703;
+		default: goto yy658;
+	}
+yy658:
+#line 498 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_g; break; }
+#line 8073 "_devbuild/gen/osh-lex.h"
+yy659:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy660;
+	}
+yy660:
+#line 499 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_h; break; }
+#line 8148 "_devbuild/gen/osh-lex.h"
+yy661:
+	yych = *++p;
+	switch (yych) {
+		case 'e': goto yy705;
+		case 't': goto yy707;
+		default: goto yy594;
+	}
+yy662:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		case 'e': goto yy709;
+		case 't': goto yy711;
+		default: goto yy663;
+	}
+yy663:
+#line 487 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_n; break; }
+#line 8230 "_devbuild/gen/osh-lex.h"
+yy664:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		case 't': goto yy713;
+		default: goto yy665;
+	}
+yy665:
+#line 488 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_o; break; }
+#line 8305 "_devbuild/gen/osh-lex.h"
+yy666:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy667;
+	}
+yy667:
+#line 501 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_p; break; }
+#line 8380 "_devbuild/gen/osh-lex.h"
+yy668:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy669;
+	}
+yy669:
+#line 502 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_r; break; }
+#line 8455 "_devbuild/gen/osh-lex.h"
+yy670:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy671;
+	}
+yy671:
+#line 503 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_s; break; }
+#line 8530 "_devbuild/gen/osh-lex.h"
+yy672:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy673;
+	}
+yy673:
+#line 489 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_t; break; }
+#line 8605 "_devbuild/gen/osh-lex.h"
+yy674:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy675;
+	}
+yy675:
+#line 505 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_u; break; }
+#line 8680 "_devbuild/gen/osh-lex.h"
+yy676:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy677;
+	}
+yy677:
+#line 490 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_v; break; }
+#line 8755 "_devbuild/gen/osh-lex.h"
+yy678:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy679;
+	}
+yy679:
+#line 506 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_w; break; }
+#line 8830 "_devbuild/gen/osh-lex.h"
+yy680:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy681;
+	}
+yy681:
+#line 507 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_x; break; }
+#line 8905 "_devbuild/gen/osh-lex.h"
+yy682:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy683;
+	}
+yy683:
+#line 486 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolUnary_z; break; }
+#line 8980 "_devbuild/gen/osh-lex.h"
+yy684:
+	++p;
+#line 557 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DSemi; break; }
+#line 8985 "_devbuild/gen/osh-lex.h"
+yy685:
+	++p;
+#line 535 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 8990 "_devbuild/gen/osh-lex.h"
+yy686:
+	++p;
+#line 512 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_GlobDEqual; break; }
+#line 8995 "_devbuild/gen/osh-lex.h"
+yy687:
+	++p;
+#line 514 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_EqualTilde; break; }
+#line 9000 "_devbuild/gen/osh-lex.h"
+yy688:
+	++p;
+#line 536 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 9005 "_devbuild/gen/osh-lex.h"
+yy689:
+	++p;
+#line 564 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_QMark; break; }
+#line 9010 "_devbuild/gen/osh-lex.h"
+yy690:
+	++p;
+#line 561 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_At; break; }
+#line 9015 "_devbuild/gen/osh-lex.h"
+yy691:
+	++p;
+#line 524 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 9020 "_devbuild/gen/osh-lex.h"
+yy692:
+	++p;
+#line 525 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 9025 "_devbuild/gen/osh-lex.h"
+yy693:
+	++p;
+#line 482 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_DRightBracket; break; }
+#line 9030 "_devbuild/gen/osh-lex.h"
+yy694:
+	++p;
+#line 553 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_PipeAmp; break; }
+#line 9035 "_devbuild/gen/osh-lex.h"
+yy695:
+	++p;
+#line 555 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DPipe; break; }
+#line 9040 "_devbuild/gen/osh-lex.h"
+yy696:
+	++p;
+#line 529 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 9045 "_devbuild/gen/osh-lex.h"
+yy697:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy698;
+	}
+yy698:
+#line 515 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_ef; break; }
+#line 9120 "_devbuild/gen/osh-lex.h"
+yy699:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy700;
+	}
+yy700:
+#line 518 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_eq; break; }
+#line 9195 "_devbuild/gen/osh-lex.h"
+yy701:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy702;
+	}
+yy702:
+#line 521 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_ge; break; }
+#line 9270 "_devbuild/gen/osh-lex.h"
+yy703:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy704;
+	}
+yy704:
+#line 520 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_gt; break; }
+#line 9345 "_devbuild/gen/osh-lex.h"
+yy705:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy706;
+	}
+yy706:
+#line 523 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_le; break; }
+#line 9420 "_devbuild/gen/osh-lex.h"
+yy707:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy708;
+	}
+yy708:
+#line 522 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_lt; break; }
+#line 9495 "_devbuild/gen/osh-lex.h"
+yy709:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy710;
+	}
+yy710:
+#line 519 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_ne; break; }
+#line 9570 "_devbuild/gen/osh-lex.h"
+yy711:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy712;
+	}
+yy712:
+#line 516 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_nt; break; }
+#line 9645 "_devbuild/gen/osh-lex.h"
+yy713:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy593;
+		default: goto yy714;
+	}
+yy714:
+#line 517 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__BoolBinary_ot; break; }
+#line 9720 "_devbuild/gen/osh-lex.h"
+}
+#line 567 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__VSub_2:
+    for (;;) {
+      
+#line 9730 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy716;
+		case '\n': goto yy719;
+		case '#': goto yy720;
+		case '%': goto yy722;
+		case '+': goto yy724;
+		case ',': goto yy725;
+		case '-': goto yy727;
+		case '/': goto yy728;
+		case ':': goto yy729;
+		case '=': goto yy731;
+		case '?': goto yy732;
+		case '@': goto yy733;
+		case '[': goto yy734;
+		case '\\': goto yy735;
+		case ']': goto yy736;
+		case '^': goto yy737;
+		case '}': goto yy739;
+		default: goto yy717;
+	}
+yy716:
+	++p;
+#line 603 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 9758 "_devbuild/gen/osh-lex.h"
+yy717:
+	++p;
+yy718:
+#line 602 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 9764 "_devbuild/gen/osh-lex.h"
+yy719:
+	++p;
+#line 601 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 9769 "_devbuild/gen/osh-lex.h"
+yy720:
+	yych = *++p;
+	switch (yych) {
+		case '#': goto yy740;
+		default: goto yy721;
+	}
+yy721:
+#line 589 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_Pound; break; }
+#line 9779 "_devbuild/gen/osh-lex.h"
+yy722:
+	yych = *++p;
+	switch (yych) {
+		case '%': goto yy741;
+		default: goto yy723;
+	}
+yy723:
+#line 587 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_Percent; break; }
+#line 9789 "_devbuild/gen/osh-lex.h"
+yy724:
+	++p;
+#line 581 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_Plus; break; }
+#line 9794 "_devbuild/gen/osh-lex.h"
+yy725:
+	yych = *++p;
+	switch (yych) {
+		case ',': goto yy742;
+		default: goto yy726;
+	}
+yy726:
+#line 593 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_Comma; break; }
+#line 9804 "_devbuild/gen/osh-lex.h"
+yy727:
+	++p;
+#line 575 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_Hyphen; break; }
+#line 9809 "_devbuild/gen/osh-lex.h"
+yy728:
+	++p;
+#line 595 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp2_Slash; break; }
+#line 9814 "_devbuild/gen/osh-lex.h"
+yy729:
+	yych = *++p;
+	switch (yych) {
+		case '+': goto yy743;
+		case '-': goto yy744;
+		case '=': goto yy745;
+		case '?': goto yy746;
+		default: goto yy730;
+	}
+yy730:
+#line 596 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp2_Colon; break; }
+#line 9827 "_devbuild/gen/osh-lex.h"
+yy731:
+	++p;
+#line 577 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_Equals; break; }
+#line 9832 "_devbuild/gen/osh-lex.h"
+yy732:
+	++p;
+#line 579 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_QMark; break; }
+#line 9837 "_devbuild/gen/osh-lex.h"
+yy733:
+	yych = *++p;
+	switch (yych) {
+		case 'A': goto yy747;
+		case 'E': goto yy748;
+		case 'P': goto yy749;
+		case 'Q': goto yy750;
+		case 'a': goto yy751;
+		default: goto yy718;
+	}
+yy734:
+	++p;
+#line 597 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp2_LBracket; break; }
+#line 9852 "_devbuild/gen/osh-lex.h"
+yy735:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy752;
+		default: goto yy718;
+	}
+yy736:
+	++p;
+#line 598 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp2_RBracket; break; }
+#line 9863 "_devbuild/gen/osh-lex.h"
+yy737:
+	yych = *++p;
+	switch (yych) {
+		case '^': goto yy753;
+		default: goto yy738;
+	}
+yy738:
+#line 591 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_Caret; break; }
+#line 9873 "_devbuild/gen/osh-lex.h"
+yy739:
+	++p;
+#line 599 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DollarBrace; break; }
+#line 9878 "_devbuild/gen/osh-lex.h"
+yy740:
+	++p;
+#line 590 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_DPound; break; }
+#line 9883 "_devbuild/gen/osh-lex.h"
+yy741:
+	++p;
+#line 588 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_DPercent; break; }
+#line 9888 "_devbuild/gen/osh-lex.h"
+yy742:
+	++p;
+#line 594 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_DComma; break; }
+#line 9893 "_devbuild/gen/osh-lex.h"
+yy743:
+	++p;
+#line 580 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_ColonPlus; break; }
+#line 9898 "_devbuild/gen/osh-lex.h"
+yy744:
+	++p;
+#line 574 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_ColonHyphen; break; }
+#line 9903 "_devbuild/gen/osh-lex.h"
+yy745:
+	++p;
+#line 576 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_ColonEquals; break; }
+#line 9908 "_devbuild/gen/osh-lex.h"
+yy746:
+	++p;
+#line 578 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VTest_ColonQMark; break; }
+#line 9913 "_devbuild/gen/osh-lex.h"
+yy747:
+	++p;
+#line 585 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp0_A; break; }
+#line 9918 "_devbuild/gen/osh-lex.h"
+yy748:
+	++p;
+#line 583 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp0_E; break; }
+#line 9923 "_devbuild/gen/osh-lex.h"
+yy749:
+	++p;
+#line 584 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp0_P; break; }
+#line 9928 "_devbuild/gen/osh-lex.h"
+yy750:
+	++p;
+#line 582 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp0_Q; break; }
+#line 9933 "_devbuild/gen/osh-lex.h"
+yy751:
+	++p;
+#line 586 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp0_a; break; }
+#line 9938 "_devbuild/gen/osh-lex.h"
+yy752:
+	++p;
+#line 600 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 9943 "_devbuild/gen/osh-lex.h"
+yy753:
+	++p;
+#line 592 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VOp1_DCaret; break; }
+#line 9948 "_devbuild/gen/osh-lex.h"
+}
+#line 604 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__VSub_1:
+    for (;;) {
+      
+#line 9958 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy755;
+		case '\n': goto yy758;
+		case '!': goto yy759;
+		case '#': goto yy760;
+		case '$': goto yy761;
+		case '*': goto yy762;
+		case '-': goto yy763;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy764;
+		case '?': goto yy766;
+		case '@': goto yy767;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy768;
+		case '\\': goto yy770;
+		case '}': goto yy771;
+		default: goto yy756;
+	}
+yy755:
+	++p;
+#line 624 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 10043 "_devbuild/gen/osh-lex.h"
+yy756:
+	++p;
+yy757:
+#line 623 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 10049 "_devbuild/gen/osh-lex.h"
+yy758:
+	++p;
+#line 622 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 10054 "_devbuild/gen/osh-lex.h"
+yy759:
+	++p;
+#line 613 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 10059 "_devbuild/gen/osh-lex.h"
+yy760:
+	++p;
+#line 615 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 10064 "_devbuild/gen/osh-lex.h"
+yy761:
+	++p;
+#line 616 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 10069 "_devbuild/gen/osh-lex.h"
+yy762:
+	++p;
+#line 617 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 10074 "_devbuild/gen/osh-lex.h"
+yy763:
+	++p;
+#line 618 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 10079 "_devbuild/gen/osh-lex.h"
+yy764:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy764;
+		default: goto yy765;
+	}
+yy765:
+#line 612 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 10098 "_devbuild/gen/osh-lex.h"
+yy766:
+	++p;
+#line 619 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 10103 "_devbuild/gen/osh-lex.h"
+yy767:
+	++p;
+#line 614 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 10108 "_devbuild/gen/osh-lex.h"
+yy768:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy768;
+		default: goto yy769;
+	}
+yy769:
+#line 611 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Name; break; }
+#line 10180 "_devbuild/gen/osh-lex.h"
+yy770:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy772;
+		default: goto yy757;
+	}
+yy771:
+	++p;
+#line 620 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DollarBrace; break; }
+#line 10191 "_devbuild/gen/osh-lex.h"
+yy772:
+	++p;
+#line 621 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 10196 "_devbuild/gen/osh-lex.h"
+}
+#line 625 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__DQ_Oil:
+    for (;;) {
+      
+#line 10206 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy774;
+		case '"': goto yy777;
+		case '$': goto yy778;
+		case '\\': goto yy780;
+		default: goto yy775;
+	}
+yy774:
+	++p;
+#line 643 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 10221 "_devbuild/gen/osh-lex.h"
+yy775:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '"':
+		case '$':
+		case '\\': goto yy776;
+		default: goto yy775;
+	}
+yy776:
+#line 640 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 10234 "_devbuild/gen/osh-lex.h"
+yy777:
+	++p;
+#line 641 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Right_DoubleQuote; break; }
+#line 10239 "_devbuild/gen/osh-lex.h"
+yy778:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy781;
+		case '/': goto yy782;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy783;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy784;
+		case '[': goto yy786;
+		case '{': goto yy787;
+		default: goto yy779;
+	}
+yy779:
+#line 642 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 10315 "_devbuild/gen/osh-lex.h"
+yy780:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy788;
+		case '"':
+		case '$':
+		case '\\': goto yy789;
+		default: goto yy779;
+	}
+yy781:
+	++p;
+#line 634 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 10329 "_devbuild/gen/osh-lex.h"
+yy782:
+	++p;
+#line 637 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSlash; break; }
+#line 10334 "_devbuild/gen/osh-lex.h"
+yy783:
+	++p;
+#line 639 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 10339 "_devbuild/gen/osh-lex.h"
+yy784:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy784;
+		default: goto yy785;
+	}
+yy785:
+#line 638 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 10411 "_devbuild/gen/osh-lex.h"
+yy786:
+	++p;
+#line 636 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 10416 "_devbuild/gen/osh-lex.h"
+yy787:
+	++p;
+#line 635 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 10421 "_devbuild/gen/osh-lex.h"
+yy788:
+	++p;
+#line 633 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 10426 "_devbuild/gen/osh-lex.h"
+yy789:
+	++p;
+#line 632 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 10431 "_devbuild/gen/osh-lex.h"
+}
+#line 644 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__ShCommand:
+    for (;;) {
+      
+#line 10441 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	unsigned int yyaccept = 0;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy791;
+		case '\t':
+		case '\r':
+		case ' ': goto yy794;
+		case '\n': goto yy796;
+		case '!': goto yy797;
+		case '"': goto yy799;
+		case '#': goto yy800;
+		case '$': goto yy801;
+		case '&': goto yy802;
+		case '\'': goto yy804;
+		case '(': goto yy805;
+		case ')': goto yy807;
+		case '*': goto yy808;
+		case '+': goto yy810;
+		case ',': goto yy811;
+		case '-':
+		case '.':
+		case '/': goto yy812;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy815;
+		case ';': goto yy816;
+		case '<': goto yy818;
+		case '=': goto yy820;
+		case '>': goto yy821;
+		case '?': goto yy823;
+		case '@': goto yy825;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'q':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '[': goto yy828;
+		case '\\': goto yy830;
+		case ']': goto yy831;
+		case '`': goto yy833;
+		case 'b': goto yy834;
+		case 'c': goto yy835;
+		case 'd': goto yy836;
+		case 'e': goto yy837;
+		case 'f': goto yy838;
+		case 'i': goto yy839;
+		case 'p': goto yy840;
+		case 'r': goto yy841;
+		case 's': goto yy842;
+		case 't': goto yy843;
+		case 'u': goto yy844;
+		case 'v': goto yy845;
+		case 'w': goto yy846;
+		case '{': goto yy847;
+		case '|': goto yy848;
+		case '}': goto yy850;
+		case '~': goto yy851;
+		default: goto yy792;
+	}
+yy791:
+	++p;
+#line 744 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 10549 "_devbuild/gen/osh-lex.h"
+yy792:
+	++p;
+yy793:
+#line 738 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 10555 "_devbuild/gen/osh-lex.h"
+yy794:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy794;
+		default: goto yy795;
+	}
+yy795:
+#line 727 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 10567 "_devbuild/gen/osh-lex.h"
+yy796:
+	++p;
+#line 728 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 10572 "_devbuild/gen/osh-lex.h"
+yy797:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy853;
+		default: goto yy798;
+	}
+yy798:
+#line 677 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Bang; break; }
+#line 10582 "_devbuild/gen/osh-lex.h"
+yy799:
+	++p;
+#line 709 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 10587 "_devbuild/gen/osh-lex.h"
+yy800:
+	++p;
+#line 726 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Pound; break; }
+#line 10592 "_devbuild/gen/osh-lex.h"
+yy801:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy854;
+		case '"': goto yy855;
+		case '#': goto yy856;
+		case '$': goto yy857;
+		case '\'': goto yy858;
+		case '(': goto yy859;
+		case '*': goto yy861;
+		case '-': goto yy862;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy863;
+		case '?': goto yy864;
+		case '@': goto yy865;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy866;
+		case '[': goto yy868;
+		case '{': goto yy869;
+		default: goto yy793;
+	}
+yy802:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy870;
+		case '>': goto yy871;
+		default: goto yy803;
+	}
+yy803:
+#line 729 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Amp; break; }
+#line 10683 "_devbuild/gen/osh-lex.h"
+yy804:
+	++p;
+#line 710 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 10688 "_devbuild/gen/osh-lex.h"
+yy805:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy873;
+		default: goto yy806;
+	}
+yy806:
+#line 736 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 10698 "_devbuild/gen/osh-lex.h"
+yy807:
+	++p;
+#line 737 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 10703 "_devbuild/gen/osh-lex.h"
+yy808:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy874;
+		default: goto yy809;
+	}
+yy809:
+#line 657 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Star; break; }
+#line 10713 "_devbuild/gen/osh-lex.h"
+yy810:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy875;
+		default: goto yy793;
+	}
+yy811:
+	++p;
+#line 661 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Comma; break; }
+#line 10724 "_devbuild/gen/osh-lex.h"
+yy812:
+	yych = *++p;
+yy813:
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy812;
+		default: goto yy814;
+	}
+yy814:
+#line 724 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 10800 "_devbuild/gen/osh-lex.h"
+yy815:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy812;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy815;
+		case '<': goto yy876;
+		case '>': goto yy877;
+		default: goto yy814;
+	}
+yy816:
+	yych = *++p;
+	switch (yych) {
+		case ';': goto yy878;
+		default: goto yy817;
+	}
+yy817:
+#line 734 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Semi; break; }
+#line 10883 "_devbuild/gen/osh-lex.h"
+yy818:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy879;
+		case '(': goto yy880;
+		case '<': goto yy881;
+		case '>': goto yy883;
+		default: goto yy819;
+	}
+yy819:
+#line 664 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_Less; break; }
+#line 10896 "_devbuild/gen/osh-lex.h"
+yy820:
+	++p;
+#line 662 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Equals; break; }
+#line 10901 "_devbuild/gen/osh-lex.h"
+yy821:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy884;
+		case '(': goto yy885;
+		case '>': goto yy886;
+		case '|': goto yy887;
+		default: goto yy822;
+	}
+yy822:
+#line 665 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_Great; break; }
+#line 10914 "_devbuild/gen/osh-lex.h"
+yy823:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy888;
+		default: goto yy824;
+	}
+yy824:
+#line 658 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_QMark; break; }
+#line 10924 "_devbuild/gen/osh-lex.h"
+yy825:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy889;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy890;
+		default: goto yy793;
+	}
+yy826:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+yy827:
+	switch (yych) {
+		case '+': goto yy892;
+		case '-':
+		case '.':
+		case '/': goto yy812;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		default: goto yy814;
+	}
+yy828:
+	yych = *++p;
+	switch (yych) {
+		case '[': goto yy896;
+		default: goto yy829;
+	}
+yy829:
+#line 655 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_LBracket; break; }
+#line 11069 "_devbuild/gen/osh-lex.h"
+yy830:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy793;
+		case '\n': goto yy898;
+		default: goto yy897;
+	}
+yy831:
+	yyaccept = 1;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy899;
+		case '=': goto yy900;
+		default: goto yy832;
+	}
+yy832:
+#line 656 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_RBracket; break; }
+#line 11088 "_devbuild/gen/osh-lex.h"
+yy833:
+	++p;
+#line 704 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 11093 "_devbuild/gen/osh-lex.h"
+yy834:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy901;
+		default: goto yy813;
+	}
+yy835:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'a': goto yy902;
+		case 'o': goto yy903;
+		default: goto yy813;
+	}
+yy836:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'o': goto yy904;
+		default: goto yy813;
+	}
+yy837:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'l': goto yy906;
+		case 's': goto yy907;
+		case 'x': goto yy908;
+		default: goto yy813;
+	}
+yy838:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy909;
+		case 'o': goto yy911;
+		case 'u': goto yy912;
+		default: goto yy813;
+	}
+yy839:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'f': goto yy913;
+		case 'n': goto yy915;
+		default: goto yy813;
+	}
+yy840:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy917;
+		default: goto yy813;
+	}
+yy841:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy918;
+		default: goto yy813;
+	}
+yy842:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy919;
+		default: goto yy813;
+	}
+yy843:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'h': goto yy920;
+		case 'i': goto yy921;
+		default: goto yy813;
+	}
+yy844:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy922;
+		default: goto yy813;
+	}
+yy845:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'a': goto yy923;
+		default: goto yy813;
+	}
+yy846:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'h': goto yy924;
+		default: goto yy813;
+	}
+yy847:
+	++p;
+#line 659 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_LBrace; break; }
+#line 12034 "_devbuild/gen/osh-lex.h"
+yy848:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy925;
+		case '|': goto yy926;
+		default: goto yy849;
+	}
+yy849:
+#line 730 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Pipe; break; }
+#line 12045 "_devbuild/gen/osh-lex.h"
+yy850:
+	++p;
+#line 660 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_RBrace; break; }
+#line 12050 "_devbuild/gen/osh-lex.h"
+yy851:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy851;
+		default: goto yy852;
+	}
+yy852:
+#line 725 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_TildeLike; break; }
+#line 12124 "_devbuild/gen/osh-lex.h"
+yy853:
+	++p;
+#line 743 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Bang; break; }
+#line 12129 "_devbuild/gen/osh-lex.h"
+yy854:
+	++p;
+#line 717 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 12134 "_devbuild/gen/osh-lex.h"
+yy855:
+	++p;
+#line 711 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 12139 "_devbuild/gen/osh-lex.h"
+yy856:
+	++p;
+#line 719 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 12144 "_devbuild/gen/osh-lex.h"
+yy857:
+	++p;
+#line 720 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 12149 "_devbuild/gen/osh-lex.h"
+yy858:
+	++p;
+#line 712 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 12154 "_devbuild/gen/osh-lex.h"
+yy859:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy927;
+		default: goto yy860;
+	}
+yy860:
+#line 705 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 12164 "_devbuild/gen/osh-lex.h"
+yy861:
+	++p;
+#line 721 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 12169 "_devbuild/gen/osh-lex.h"
+yy862:
+	++p;
+#line 722 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 12174 "_devbuild/gen/osh-lex.h"
+yy863:
+	++p;
+#line 716 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 12179 "_devbuild/gen/osh-lex.h"
+yy864:
+	++p;
+#line 723 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 12184 "_devbuild/gen/osh-lex.h"
+yy865:
+	++p;
+#line 718 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 12189 "_devbuild/gen/osh-lex.h"
+yy866:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy866;
+		default: goto yy867;
+	}
+yy867:
+#line 715 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 12261 "_devbuild/gen/osh-lex.h"
+yy868:
+	++p;
+#line 708 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 12266 "_devbuild/gen/osh-lex.h"
+yy869:
+	++p;
+#line 706 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 12271 "_devbuild/gen/osh-lex.h"
+yy870:
+	++p;
+#line 732 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DAmp; break; }
+#line 12276 "_devbuild/gen/osh-lex.h"
+yy871:
+	yych = *++p;
+	switch (yych) {
+		case '>': goto yy928;
+		default: goto yy872;
+	}
+yy872:
+#line 674 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_AndGreat; break; }
+#line 12286 "_devbuild/gen/osh-lex.h"
+yy873:
+	++p;
+#line 654 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DLeftParen; break; }
+#line 12291 "_devbuild/gen/osh-lex.h"
+yy874:
+	++p;
+#line 740 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Star; break; }
+#line 12296 "_devbuild/gen/osh-lex.h"
+yy875:
+	++p;
+#line 741 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Plus; break; }
+#line 12301 "_devbuild/gen/osh-lex.h"
+yy876:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy879;
+		case '<': goto yy881;
+		case '>': goto yy883;
+		default: goto yy819;
+	}
+yy877:
+	yych = *++p;
+	switch (yych) {
+		case '&': goto yy884;
+		case '>': goto yy886;
+		case '|': goto yy887;
+		default: goto yy822;
+	}
+yy878:
+	++p;
+#line 735 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DSemi; break; }
+#line 12322 "_devbuild/gen/osh-lex.h"
+yy879:
+	++p;
+#line 671 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_LessAnd; break; }
+#line 12327 "_devbuild/gen/osh-lex.h"
+yy880:
+	++p;
+#line 713 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 12332 "_devbuild/gen/osh-lex.h"
+yy881:
+	yych = *++p;
+	switch (yych) {
+		case '-': goto yy929;
+		case '<': goto yy930;
+		default: goto yy882;
+	}
+yy882:
+#line 666 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DLess; break; }
+#line 12343 "_devbuild/gen/osh-lex.h"
+yy883:
+	++p;
+#line 672 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_LessGreat; break; }
+#line 12348 "_devbuild/gen/osh-lex.h"
+yy884:
+	++p;
+#line 670 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_GreatAnd; break; }
+#line 12353 "_devbuild/gen/osh-lex.h"
+yy885:
+	++p;
+#line 714 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 12358 "_devbuild/gen/osh-lex.h"
+yy886:
+	++p;
+#line 668 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DGreat; break; }
+#line 12363 "_devbuild/gen/osh-lex.h"
+yy887:
+	++p;
+#line 673 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_Clobber; break; }
+#line 12368 "_devbuild/gen/osh-lex.h"
+yy888:
+	++p;
+#line 742 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_QMark; break; }
+#line 12373 "_devbuild/gen/osh-lex.h"
+yy889:
+	++p;
+#line 739 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_At; break; }
+#line 12378 "_devbuild/gen/osh-lex.h"
+yy890:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy890;
+		default: goto yy891;
+	}
+yy891:
+#line 663 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Splice; break; }
+#line 12450 "_devbuild/gen/osh-lex.h"
+yy892:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy894;
+		default: goto yy893;
+	}
+yy893:
+	p = YYMARKER;
+	switch (yyaccept) {
+		case 0: goto yy814;
+		case 1: goto yy832;
+		case 2: goto yy905;
+		case 3: goto yy910;
+		case 4: goto yy914;
+		case 5: goto yy916;
+		case 6: goto yy940;
+		case 7: goto yy945;
+		case 8: goto yy950;
+		case 9: goto yy954;
+		case 10: goto yy957;
+		case 11: goto yy959;
+		case 12: goto yy961;
+		case 13: goto yy963;
+		case 14: goto yy965;
+		case 15: goto yy967;
+		case 16: goto yy969;
+		case 17: goto yy973;
+		case 18: goto yy975;
+		case 19: goto yy979;
+		case 20: goto yy985;
+		case 21: goto yy987;
+		case 22: goto yy991;
+		case 23: goto yy993;
+		case 24: goto yy997;
+		default: goto yy999;
+	}
+yy894:
+	++p;
+#line 651 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_VarLike; break; }
+#line 12491 "_devbuild/gen/osh-lex.h"
+yy895:
+	++p;
+#line 652 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_ArrayLhsOpen; break; }
+#line 12496 "_devbuild/gen/osh-lex.h"
+yy896:
+	++p;
+#line 676 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_DLeftBracket; break; }
+#line 12501 "_devbuild/gen/osh-lex.h"
+yy897:
+	++p;
+#line 702 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 12506 "_devbuild/gen/osh-lex.h"
+yy898:
+	++p;
+#line 703 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 12511 "_devbuild/gen/osh-lex.h"
+yy899:
+	yych = *++p;
+	switch (yych) {
+		case '=': goto yy900;
+		default: goto yy893;
+	}
+yy900:
+	++p;
+#line 653 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_ArrayLhsClose; break; }
+#line 12522 "_devbuild/gen/osh-lex.h"
+yy901:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy931;
+		default: goto yy813;
+	}
+yy902:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 's': goto yy932;
+		default: goto yy813;
+	}
+yy903:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy933;
+		default: goto yy813;
+	}
+yy904:
+	yyaccept = 2;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		case 'n': goto yy934;
+		default: goto yy905;
+	}
+yy905:
+#line 681 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Do; break; }
+#line 12817 "_devbuild/gen/osh-lex.h"
+yy906:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy935;
+		case 's': goto yy936;
+		default: goto yy813;
+	}
+yy907:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'a': goto yy937;
+		default: goto yy813;
+	}
+yy908:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy938;
+		default: goto yy813;
+	}
+yy909:
+	yyaccept = 3;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy910;
+	}
+yy910:
+#line 687 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Fi; break; }
+#line 13112 "_devbuild/gen/osh-lex.h"
+yy911:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy939;
+		default: goto yy813;
+	}
+yy912:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy941;
+		default: goto yy813;
+	}
+yy913:
+	yyaccept = 4;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy914;
+	}
+yy914:
+#line 686 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_If; break; }
+#line 13335 "_devbuild/gen/osh-lex.h"
+yy915:
+	yyaccept = 5;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy916;
+	}
+yy916:
+#line 683 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_In; break; }
+#line 13414 "_devbuild/gen/osh-lex.h"
+yy917:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'o': goto yy942;
+		default: goto yy813;
+	}
+yy918:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 't': goto yy943;
+		default: goto yy813;
+	}
+yy919:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 't': goto yy944;
+		default: goto yy813;
+	}
+yy920:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy946;
+		default: goto yy813;
+	}
+yy921:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'm': goto yy947;
+		default: goto yy813;
+	}
+yy922:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 't': goto yy948;
+		default: goto yy813;
+	}
+yy923:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy949;
+		default: goto yy813;
+	}
+yy924:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy951;
+		default: goto yy813;
+	}
+yy925:
+	++p;
+#line 731 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_PipeAmp; break; }
+#line 13995 "_devbuild/gen/osh-lex.h"
+yy926:
+	++p;
+#line 733 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_DPipe; break; }
+#line 14000 "_devbuild/gen/osh-lex.h"
+yy927:
+	++p;
+#line 707 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 14005 "_devbuild/gen/osh-lex.h"
+yy928:
+	++p;
+#line 675 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_AndDGreat; break; }
+#line 14010 "_devbuild/gen/osh-lex.h"
+yy929:
+	++p;
+#line 669 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_DLessDash; break; }
+#line 14015 "_devbuild/gen/osh-lex.h"
+yy930:
+	++p;
+#line 667 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Redir_TLess; break; }
+#line 14020 "_devbuild/gen/osh-lex.h"
+yy931:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'a': goto yy952;
+		default: goto yy813;
+	}
+yy932:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy953;
+		default: goto yy813;
+	}
+yy933:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 't': goto yy955;
+		default: goto yy813;
+	}
+yy934:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy956;
+		default: goto yy813;
+	}
+yy935:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'f': goto yy958;
+		default: goto yy813;
+	}
+yy936:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy960;
+		default: goto yy813;
+	}
+yy937:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'c': goto yy962;
+		default: goto yy813;
+	}
+yy938:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 't': goto yy964;
+		default: goto yy813;
+	}
+yy939:
+	yyaccept = 6;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy940;
+	}
+yy940:
+#line 678 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_For; break; }
+#line 14675 "_devbuild/gen/osh-lex.h"
+yy941:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'c': goto yy966;
+		default: goto yy813;
+	}
+yy942:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'c': goto yy968;
+		default: goto yy813;
+	}
+yy943:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'u': goto yy970;
+		default: goto yy813;
+	}
+yy944:
+	yyaccept = 7;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		case 'v': goto yy971;
+		default: goto yy945;
+	}
+yy945:
+#line 695 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Set; break; }
+#line 14970 "_devbuild/gen/osh-lex.h"
+yy946:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy972;
+		default: goto yy813;
+	}
+yy947:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy974;
+		default: goto yy813;
+	}
+yy948:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy976;
+		default: goto yy813;
+	}
+yy949:
+	yyaccept = 8;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy950;
+	}
+yy950:
+#line 693 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Var; break; }
+#line 15265 "_devbuild/gen/osh-lex.h"
+yy951:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'l': goto yy977;
+		default: goto yy813;
+	}
+yy952:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'k': goto yy978;
+		default: goto yy813;
+	}
+yy953:
+	yyaccept = 9;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy954;
+	}
+yy954:
+#line 684 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Case; break; }
+#line 15488 "_devbuild/gen/osh-lex.h"
+yy955:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy980;
+		default: goto yy813;
+	}
+yy956:
+	yyaccept = 10;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy957;
+	}
+yy957:
+#line 682 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Done; break; }
+#line 15639 "_devbuild/gen/osh-lex.h"
+yy958:
+	yyaccept = 11;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy959;
+	}
+yy959:
+#line 690 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Elif; break; }
+#line 15718 "_devbuild/gen/osh-lex.h"
+yy960:
+	yyaccept = 12;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy961;
+	}
+yy961:
+#line 689 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Else; break; }
+#line 15797 "_devbuild/gen/osh-lex.h"
+yy962:
+	yyaccept = 13;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy963;
+	}
+yy963:
+#line 685 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Esac; break; }
+#line 15876 "_devbuild/gen/osh-lex.h"
+yy964:
+	yyaccept = 14;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy965;
+	}
+yy965:
+#line 701 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ControlFlow_Exit; break; }
+#line 15955 "_devbuild/gen/osh-lex.h"
+yy966:
+	yyaccept = 15;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		case 't': goto yy981;
+		default: goto yy967;
+	}
+yy967:
+#line 696 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Func; break; }
+#line 16034 "_devbuild/gen/osh-lex.h"
+yy968:
+	yyaccept = 16;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy969;
+	}
+yy969:
+#line 697 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Proc; break; }
+#line 16113 "_devbuild/gen/osh-lex.h"
+yy970:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy982;
+		default: goto yy813;
+	}
+yy971:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'a': goto yy983;
+		default: goto yy813;
+	}
+yy972:
+	yyaccept = 17;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy973;
+	}
+yy973:
+#line 688 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Then; break; }
+#line 16336 "_devbuild/gen/osh-lex.h"
+yy974:
+	yyaccept = 18;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy975;
+	}
+yy975:
+#line 692 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Time; break; }
+#line 16415 "_devbuild/gen/osh-lex.h"
+yy976:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'l': goto yy984;
+		default: goto yy813;
+	}
+yy977:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy986;
+		default: goto yy813;
+	}
+yy978:
+	yyaccept = 19;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy979;
+	}
+yy979:
+#line 698 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ControlFlow_Break; break; }
+#line 16638 "_devbuild/gen/osh-lex.h"
+yy980:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy988;
+		default: goto yy813;
+	}
+yy981:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'i': goto yy989;
+		default: goto yy813;
+	}
+yy982:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy990;
+		default: goto yy813;
+	}
+yy983:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'r': goto yy992;
+		default: goto yy813;
+	}
+yy984:
+	yyaccept = 20;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy985;
+	}
+yy985:
+#line 680 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Until; break; }
+#line 17005 "_devbuild/gen/osh-lex.h"
+yy986:
+	yyaccept = 21;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy987;
+	}
+yy987:
+#line 679 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_While; break; }
+#line 17084 "_devbuild/gen/osh-lex.h"
+yy988:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'u': goto yy994;
+		default: goto yy813;
+	}
+yy989:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'o': goto yy995;
+		default: goto yy813;
+	}
+yy990:
+	yyaccept = 22;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy991;
+	}
+yy991:
+#line 700 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ControlFlow_Return; break; }
+#line 17307 "_devbuild/gen/osh-lex.h"
+yy992:
+	yyaccept = 23;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy993;
+	}
+yy993:
+#line 694 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_SetVar; break; }
+#line 17386 "_devbuild/gen/osh-lex.h"
+yy994:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'e': goto yy996;
+		default: goto yy813;
+	}
+yy995:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+': goto yy892;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy826;
+		case '=': goto yy894;
+		case '[': goto yy895;
+		case 'n': goto yy998;
+		default: goto yy813;
+	}
+yy996:
+	yyaccept = 24;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy997;
+	}
+yy997:
+#line 699 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ControlFlow_Continue; break; }
+#line 17609 "_devbuild/gen/osh-lex.h"
+yy998:
+	yyaccept = 25;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '+':
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case '=':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '[':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy827;
+		default: goto yy999;
+	}
+yy999:
+#line 691 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__KW_Function; break; }
+#line 17688 "_devbuild/gen/osh-lex.h"
+}
+#line 745 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Backtick:
+    for (;;) {
+      
+#line 17698 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1001;
+		case '\\': goto yy1004;
+		case '`': goto yy1006;
+		default: goto yy1002;
+	}
+yy1001:
+	++p;
+#line 756 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 17712 "_devbuild/gen/osh-lex.h"
+yy1002:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\\':
+		case '`': goto yy1003;
+		default: goto yy1002;
+	}
+yy1003:
+#line 754 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Backtick_Other; break; }
+#line 17724 "_devbuild/gen/osh-lex.h"
+yy1004:
+	yych = *++p;
+	switch (yych) {
+		case '"':
+		case '$':
+		case '\\':
+		case '`': goto yy1007;
+		default: goto yy1005;
+	}
+yy1005:
+#line 755 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Backtick_Other; break; }
+#line 17737 "_devbuild/gen/osh-lex.h"
+yy1006:
+	++p;
+#line 752 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Backtick_Right; break; }
+#line 17742 "_devbuild/gen/osh-lex.h"
+yy1007:
+	++p;
+#line 753 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Backtick_Quoted; break; }
+#line 17747 "_devbuild/gen/osh-lex.h"
+}
+#line 757 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__BashRegex:
+    for (;;) {
+      
+#line 17757 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1009;
+		case '\t':
+		case '\r':
+		case ' ': goto yy1012;
+		case '"': goto yy1014;
+		case '$': goto yy1015;
+		case '\'': goto yy1016;
+		case '-':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1017;
+		case '<': goto yy1019;
+		case '>': goto yy1020;
+		case '\\': goto yy1021;
+		case '`': goto yy1022;
+		default: goto yy1010;
+	}
+yy1009:
+	++p;
+#line 790 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 17844 "_devbuild/gen/osh-lex.h"
+yy1010:
+	++p;
+yy1011:
+#line 789 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 17850 "_devbuild/gen/osh-lex.h"
+yy1012:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy1012;
+		default: goto yy1013;
+	}
+yy1013:
+#line 785 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__WS_Space; break; }
+#line 17862 "_devbuild/gen/osh-lex.h"
+yy1014:
+	++p;
+#line 769 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 17867 "_devbuild/gen/osh-lex.h"
+yy1015:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy1023;
+		case '"': goto yy1024;
+		case '#': goto yy1025;
+		case '$': goto yy1026;
+		case '\'': goto yy1027;
+		case '(': goto yy1028;
+		case '*': goto yy1030;
+		case '-': goto yy1031;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1032;
+		case '?': goto yy1033;
+		case '@': goto yy1034;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1035;
+		case '[': goto yy1037;
+		case '{': goto yy1038;
+		default: goto yy1011;
+	}
+yy1016:
+	++p;
+#line 770 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 17952 "_devbuild/gen/osh-lex.h"
+yy1017:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1017;
+		default: goto yy1018;
+	}
+yy1018:
+#line 784 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 18026 "_devbuild/gen/osh-lex.h"
+yy1019:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1039;
+		default: goto yy1011;
+	}
+yy1020:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1040;
+		default: goto yy1011;
+	}
+yy1021:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy1011;
+		case '\n': goto yy1042;
+		case '$':
+		case '*':
+		case '+':
+		case '.':
+		case '?':
+		case '[':
+		case ']':
+		case '^': goto yy1043;
+		default: goto yy1041;
+	}
+yy1022:
+	++p;
+#line 764 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 18058 "_devbuild/gen/osh-lex.h"
+yy1023:
+	++p;
+#line 777 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 18063 "_devbuild/gen/osh-lex.h"
+yy1024:
+	++p;
+#line 771 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 18068 "_devbuild/gen/osh-lex.h"
+yy1025:
+	++p;
+#line 779 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 18073 "_devbuild/gen/osh-lex.h"
+yy1026:
+	++p;
+#line 780 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 18078 "_devbuild/gen/osh-lex.h"
+yy1027:
+	++p;
+#line 772 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 18083 "_devbuild/gen/osh-lex.h"
+yy1028:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1044;
+		default: goto yy1029;
+	}
+yy1029:
+#line 765 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 18093 "_devbuild/gen/osh-lex.h"
+yy1030:
+	++p;
+#line 781 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 18098 "_devbuild/gen/osh-lex.h"
+yy1031:
+	++p;
+#line 782 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 18103 "_devbuild/gen/osh-lex.h"
+yy1032:
+	++p;
+#line 776 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 18108 "_devbuild/gen/osh-lex.h"
+yy1033:
+	++p;
+#line 783 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 18113 "_devbuild/gen/osh-lex.h"
+yy1034:
+	++p;
+#line 778 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 18118 "_devbuild/gen/osh-lex.h"
+yy1035:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1035;
+		default: goto yy1036;
+	}
+yy1036:
+#line 775 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 18190 "_devbuild/gen/osh-lex.h"
+yy1037:
+	++p;
+#line 768 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 18195 "_devbuild/gen/osh-lex.h"
+yy1038:
+	++p;
+#line 766 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 18200 "_devbuild/gen/osh-lex.h"
+yy1039:
+	++p;
+#line 773 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 18205 "_devbuild/gen/osh-lex.h"
+yy1040:
+	++p;
+#line 774 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 18210 "_devbuild/gen/osh-lex.h"
+yy1041:
+	++p;
+#line 787 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 18215 "_devbuild/gen/osh-lex.h"
+yy1042:
+	++p;
+#line 788 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 18220 "_devbuild/gen/osh-lex.h"
+yy1043:
+	++p;
+#line 786 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_RegexMeta; break; }
+#line 18225 "_devbuild/gen/osh-lex.h"
+yy1044:
+	++p;
+#line 767 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 18230 "_devbuild/gen/osh-lex.h"
+}
+#line 791 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__Regex:
+    for (;;) {
+      
+#line 18240 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1046;
+		case '\t':
+		case '\r':
+		case ' ': goto yy1049;
+		case '\n': goto yy1051;
+		case '"': goto yy1052;
+		case '#': goto yy1053;
+		case '\'': goto yy1055;
+		case '(': goto yy1056;
+		case ')': goto yy1057;
+		case '*': goto yy1058;
+		case '+': goto yy1059;
+		case '/': goto yy1060;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1061;
+		case '?': goto yy1063;
+		case '@': goto yy1064;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1065;
+		case '[': goto yy1067;
+		case '\\': goto yy1068;
+		case ']': goto yy1069;
+		case '^': goto yy1070;
+		case '{': goto yy1071;
+		case '}': goto yy1072;
+		default: goto yy1047;
+	}
+yy1046:
+	++p;
+#line 820 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 18335 "_devbuild/gen/osh-lex.h"
+yy1047:
+	++p;
+yy1048:
+#line 819 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Unknown_Tok; break; }
+#line 18341 "_devbuild/gen/osh-lex.h"
+yy1049:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy1049;
+		default: goto yy1050;
+	}
+yy1050:
+#line 817 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Space; break; }
+#line 18353 "_devbuild/gen/osh-lex.h"
+yy1051:
+	++p;
+#line 815 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Newline; break; }
+#line 18358 "_devbuild/gen/osh-lex.h"
+yy1052:
+	++p;
+#line 798 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 18363 "_devbuild/gen/osh-lex.h"
+yy1053:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\n': goto yy1054;
+		default: goto yy1053;
+	}
+yy1054:
+#line 816 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_Comment; break; }
+#line 18374 "_devbuild/gen/osh-lex.h"
+yy1055:
+	++p;
+#line 799 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 18379 "_devbuild/gen/osh-lex.h"
+yy1056:
+	++p;
+#line 808 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LParen; break; }
+#line 18384 "_devbuild/gen/osh-lex.h"
+yy1057:
+	++p;
+#line 809 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 18389 "_devbuild/gen/osh-lex.h"
+yy1058:
+	++p;
+#line 806 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Star; break; }
+#line 18394 "_devbuild/gen/osh-lex.h"
+yy1059:
+	++p;
+#line 805 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Plus; break; }
+#line 18399 "_devbuild/gen/osh-lex.h"
+yy1060:
+	++p;
+#line 814 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Slash; break; }
+#line 18404 "_devbuild/gen/osh-lex.h"
+yy1061:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1061;
+		default: goto yy1062;
+	}
+yy1062:
+#line 803 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Digits; break; }
+#line 18423 "_devbuild/gen/osh-lex.h"
+yy1063:
+	++p;
+#line 804 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_QMark; break; }
+#line 18428 "_devbuild/gen/osh-lex.h"
+yy1064:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1073;
+		case '[': goto yy1074;
+		default: goto yy1048;
+	}
+yy1065:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1065;
+		default: goto yy1066;
+	}
+yy1066:
+#line 802 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Expr_Name; break; }
+#line 18507 "_devbuild/gen/osh-lex.h"
+yy1067:
+	++p;
+#line 810 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBracket; break; }
+#line 18512 "_devbuild/gen/osh-lex.h"
+yy1068:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy1075;
+		default: goto yy1048;
+	}
+yy1069:
+	++p;
+#line 811 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBracket; break; }
+#line 18523 "_devbuild/gen/osh-lex.h"
+yy1070:
+	++p;
+#line 807 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Arith_Caret; break; }
+#line 18528 "_devbuild/gen/osh-lex.h"
+yy1071:
+	++p;
+#line 812 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_LBrace; break; }
+#line 18533 "_devbuild/gen/osh-lex.h"
+yy1072:
+	++p;
+#line 813 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RBrace; break; }
+#line 18538 "_devbuild/gen/osh-lex.h"
+yy1073:
+	++p;
+#line 800 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtParen; break; }
+#line 18543 "_devbuild/gen/osh-lex.h"
+yy1074:
+	++p;
+#line 801 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_AtBracket; break; }
+#line 18548 "_devbuild/gen/osh-lex.h"
+yy1075:
+	++p;
+#line 818 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 18553 "_devbuild/gen/osh-lex.h"
+}
+#line 821 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__ExtGlob:
+    for (;;) {
+      
+#line 18563 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1077;
+		case '!': goto yy1081;
+		case '"': goto yy1083;
+		case '$': goto yy1084;
+		case '\'': goto yy1085;
+		case ')': goto yy1086;
+		case '*': goto yy1087;
+		case '+': goto yy1088;
+		case '<': goto yy1089;
+		case '>': goto yy1090;
+		case '?': goto yy1091;
+		case '@': goto yy1092;
+		case '\\': goto yy1093;
+		case '`': goto yy1094;
+		case '|': goto yy1095;
+		default: goto yy1078;
+	}
+yy1077:
+	++p;
+#line 859 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 18589 "_devbuild/gen/osh-lex.h"
+yy1078:
+	yych = *++p;
+yy1079:
+	switch (yych) {
+		case 0x00:
+		case '!':
+		case '"':
+		case '$':
+		case '\'':
+		case ')':
+		case '*':
+		case '+':
+		case '?':
+		case '@':
+		case '\\':
+		case '`':
+		case '|': goto yy1080;
+		default: goto yy1078;
+	}
+yy1080:
+#line 855 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Chars; break; }
+#line 18612 "_devbuild/gen/osh-lex.h"
+yy1081:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1096;
+		default: goto yy1082;
+	}
+yy1082:
+#line 858 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_Other; break; }
+#line 18622 "_devbuild/gen/osh-lex.h"
+yy1083:
+	++p;
+#line 835 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DoubleQuote; break; }
+#line 18627 "_devbuild/gen/osh-lex.h"
+yy1084:
+	yych = *++p;
+	switch (yych) {
+		case '!': goto yy1097;
+		case '"': goto yy1098;
+		case '#': goto yy1099;
+		case '$': goto yy1100;
+		case '\'': goto yy1101;
+		case '(': goto yy1102;
+		case '*': goto yy1104;
+		case '-': goto yy1105;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1106;
+		case '?': goto yy1107;
+		case '@': goto yy1108;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1109;
+		case '[': goto yy1111;
+		case '{': goto yy1112;
+		default: goto yy1082;
+	}
+yy1085:
+	++p;
+#line 836 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_SingleQuote; break; }
+#line 18712 "_devbuild/gen/osh-lex.h"
+yy1086:
+	++p;
+#line 857 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_RParen; break; }
+#line 18717 "_devbuild/gen/osh-lex.h"
+yy1087:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1113;
+		default: goto yy1082;
+	}
+yy1088:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1114;
+		default: goto yy1082;
+	}
+yy1089:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1115;
+		default: goto yy1079;
+	}
+yy1090:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1117;
+		default: goto yy1079;
+	}
+yy1091:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1119;
+		default: goto yy1082;
+	}
+yy1092:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1120;
+		default: goto yy1082;
+	}
+yy1093:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy1082;
+		case '\n': goto yy1122;
+		default: goto yy1121;
+	}
+yy1094:
+	++p;
+#line 830 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_Backtick; break; }
+#line 18765 "_devbuild/gen/osh-lex.h"
+yy1095:
+	++p;
+#line 856 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Op_Pipe; break; }
+#line 18770 "_devbuild/gen/osh-lex.h"
+yy1096:
+	++p;
+#line 854 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Bang; break; }
+#line 18775 "_devbuild/gen/osh-lex.h"
+yy1097:
+	++p;
+#line 843 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Bang; break; }
+#line 18780 "_devbuild/gen/osh-lex.h"
+yy1098:
+	++p;
+#line 837 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDoubleQuote; break; }
+#line 18785 "_devbuild/gen/osh-lex.h"
+yy1099:
+	++p;
+#line 845 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Pound; break; }
+#line 18790 "_devbuild/gen/osh-lex.h"
+yy1100:
+	++p;
+#line 846 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Dollar; break; }
+#line 18795 "_devbuild/gen/osh-lex.h"
+yy1101:
+	++p;
+#line 838 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarSingleQuote; break; }
+#line 18800 "_devbuild/gen/osh-lex.h"
+yy1102:
+	yych = *++p;
+	switch (yych) {
+		case '(': goto yy1123;
+		default: goto yy1103;
+	}
+yy1103:
+#line 831 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarParen; break; }
+#line 18810 "_devbuild/gen/osh-lex.h"
+yy1104:
+	++p;
+#line 847 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Star; break; }
+#line 18815 "_devbuild/gen/osh-lex.h"
+yy1105:
+	++p;
+#line 848 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Hyphen; break; }
+#line 18820 "_devbuild/gen/osh-lex.h"
+yy1106:
+	++p;
+#line 842 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_Number; break; }
+#line 18825 "_devbuild/gen/osh-lex.h"
+yy1107:
+	++p;
+#line 849 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_QMark; break; }
+#line 18830 "_devbuild/gen/osh-lex.h"
+yy1108:
+	++p;
+#line 844 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_At; break; }
+#line 18835 "_devbuild/gen/osh-lex.h"
+yy1109:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1109;
+		default: goto yy1110;
+	}
+yy1110:
+#line 841 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__VSub_DollarName; break; }
+#line 18907 "_devbuild/gen/osh-lex.h"
+yy1111:
+	++p;
+#line 834 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBracket; break; }
+#line 18912 "_devbuild/gen/osh-lex.h"
+yy1112:
+	++p;
+#line 832 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarBrace; break; }
+#line 18917 "_devbuild/gen/osh-lex.h"
+yy1113:
+	++p;
+#line 851 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Star; break; }
+#line 18922 "_devbuild/gen/osh-lex.h"
+yy1114:
+	++p;
+#line 852 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_Plus; break; }
+#line 18927 "_devbuild/gen/osh-lex.h"
+yy1115:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '!':
+		case '"':
+		case '$':
+		case '\'':
+		case ')':
+		case '*':
+		case '+':
+		case '?':
+		case '@':
+		case '\\':
+		case '`':
+		case '|': goto yy1116;
+		default: goto yy1078;
+	}
+yy1116:
+#line 839 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubIn; break; }
+#line 18949 "_devbuild/gen/osh-lex.h"
+yy1117:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '!':
+		case '"':
+		case '$':
+		case '\'':
+		case ')':
+		case '*':
+		case '+':
+		case '?':
+		case '@':
+		case '\\':
+		case '`':
+		case '|': goto yy1118;
+		default: goto yy1078;
+	}
+yy1118:
+#line 840 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_ProcSubOut; break; }
+#line 18971 "_devbuild/gen/osh-lex.h"
+yy1119:
+	++p;
+#line 853 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_QMark; break; }
+#line 18976 "_devbuild/gen/osh-lex.h"
+yy1120:
+	++p;
+#line 850 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__ExtGlob_At; break; }
+#line 18981 "_devbuild/gen/osh-lex.h"
+yy1121:
+	++p;
+#line 828 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Lit_EscapedChar; break; }
+#line 18986 "_devbuild/gen/osh-lex.h"
+yy1122:
+	++p;
+#line 829 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Ignored_LineCont; break; }
+#line 18991 "_devbuild/gen/osh-lex.h"
+yy1123:
+	++p;
+#line 833 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Left_DollarDParen; break; }
+#line 18996 "_devbuild/gen/osh-lex.h"
+}
+#line 860 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  case lex_mode__PrintfOuter:
+    for (;;) {
+      
+#line 19006 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1125;
+		case '%': goto yy1128;
+		case '\\': goto yy1130;
+		default: goto yy1126;
+	}
+yy1125:
+	++p;
+#line 877 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 19020 "_devbuild/gen/osh-lex.h"
+yy1126:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '%':
+		case '\\': goto yy1127;
+		default: goto yy1126;
+	}
+yy1127:
+#line 874 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 19032 "_devbuild/gen/osh-lex.h"
+yy1128:
+	yych = *++p;
+	switch (yych) {
+		case '%': goto yy1132;
+		default: goto yy1129;
+	}
+yy1129:
+#line 876 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_Percent; break; }
+#line 19042 "_devbuild/gen/osh-lex.h"
+yy1130:
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '\n': goto yy1133;
+		case '0': goto yy1134;
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1136;
+		case 'E':
+		case '\\':
+		case 'a':
+		case 'b':
+		case 'e':
+		case 'f':
+		case 'n':
+		case 'r':
+		case 't':
+		case 'v': goto yy1138;
+		case 'U': goto yy1139;
+		case 'u': goto yy1141;
+		case 'x': goto yy1142;
+		default: goto yy1131;
+	}
+yy1131:
+#line 872 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_BadBackslash; break; }
+#line 19073 "_devbuild/gen/osh-lex.h"
+yy1132:
+	++p;
+#line 875 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Format_EscapedPercent; break; }
+#line 19078 "_devbuild/gen/osh-lex.h"
+yy1133:
+	++p;
+#line 871 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 19083 "_devbuild/gen/osh-lex.h"
+yy1134:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1143;
+		default: goto yy1135;
+	}
+yy1135:
+#line 870 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_OneChar; break; }
+#line 19100 "_devbuild/gen/osh-lex.h"
+yy1136:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1143;
+		default: goto yy1137;
+	}
+yy1137:
+#line 873 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Octal3; break; }
+#line 19117 "_devbuild/gen/osh-lex.h"
+yy1138:
+	++p;
+	goto yy1135;
+yy1139:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1144;
+		default: goto yy1140;
+	}
+yy1140:
+	p = YYMARKER;
+	goto yy1131;
+yy1141:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1146;
+		default: goto yy1140;
+	}
+yy1142:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1148;
+		default: goto yy1140;
+	}
+yy1143:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1150;
+		default: goto yy1137;
+	}
+yy1144:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1151;
+		default: goto yy1145;
+	}
+yy1145:
+#line 869 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode8; break; }
+#line 19248 "_devbuild/gen/osh-lex.h"
+yy1146:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1152;
+		default: goto yy1147;
+	}
+yy1147:
+#line 868 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode4; break; }
+#line 19279 "_devbuild/gen/osh-lex.h"
+yy1148:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1153;
+		default: goto yy1149;
+	}
+yy1149:
+#line 867 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Hex; break; }
+#line 19310 "_devbuild/gen/osh-lex.h"
+yy1150:
+	++p;
+	goto yy1137;
+yy1151:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1154;
+		default: goto yy1145;
+	}
+yy1152:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1155;
+		default: goto yy1147;
+	}
+yy1153:
+	++p;
+	goto yy1149;
+yy1154:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1156;
+		default: goto yy1145;
+	}
+yy1155:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1157;
+		default: goto yy1147;
+	}
+yy1156:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1158;
+		default: goto yy1145;
+	}
+yy1157:
+	++p;
+	goto yy1147;
+yy1158:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1159;
+		default: goto yy1145;
+	}
+yy1159:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1160;
+		default: goto yy1145;
+	}
+yy1160:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1161;
+		default: goto yy1145;
+	}
+yy1161:
+	++p;
+	goto yy1145;
+}
+#line 878 "_devbuild/gen/osh-lex.re2c.h"
+
+    }
+    break;
+
+  default:
+    assert(0);
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline void MatchEchoToken(unsigned char* line, int line_len,
+                                  int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+
+  for (;;) {
+    
+#line 19563 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1163;
+		case '\\': goto yy1166;
+		default: goto yy1164;
+	}
+yy1163:
+	++p;
+#line 910 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 19576 "_devbuild/gen/osh-lex.h"
+yy1164:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\\': goto yy1165;
+		default: goto yy1164;
+	}
+yy1165:
+#line 909 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 19587 "_devbuild/gen/osh-lex.h"
+yy1166:
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '\n': goto yy1168;
+		case '0': goto yy1169;
+		case 'E':
+		case '\\':
+		case 'a':
+		case 'b':
+		case 'e':
+		case 'f':
+		case 'n':
+		case 'r':
+		case 't':
+		case 'v': goto yy1171;
+		case 'U': goto yy1172;
+		case 'c': goto yy1174;
+		case 'u': goto yy1175;
+		case 'x': goto yy1176;
+		default: goto yy1167;
+	}
+yy1167:
+#line 906 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_BadBackslash; break; }
+#line 19612 "_devbuild/gen/osh-lex.h"
+yy1168:
+	++p;
+#line 905 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Literals; break; }
+#line 19617 "_devbuild/gen/osh-lex.h"
+yy1169:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1177;
+		default: goto yy1170;
+	}
+yy1170:
+#line 904 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_OneChar; break; }
+#line 19634 "_devbuild/gen/osh-lex.h"
+yy1171:
+	++p;
+	goto yy1170;
+yy1172:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1179;
+		default: goto yy1173;
+	}
+yy1173:
+	p = YYMARKER;
+	goto yy1167;
+yy1174:
+	++p;
+#line 908 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Stop; break; }
+#line 19672 "_devbuild/gen/osh-lex.h"
+yy1175:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1181;
+		default: goto yy1173;
+	}
+yy1176:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1183;
+		default: goto yy1173;
+	}
+yy1177:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1185;
+		default: goto yy1178;
+	}
+yy1178:
+#line 907 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Octal4; break; }
+#line 19743 "_devbuild/gen/osh-lex.h"
+yy1179:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1186;
+		default: goto yy1180;
+	}
+yy1180:
+#line 903 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode8; break; }
+#line 19774 "_devbuild/gen/osh-lex.h"
+yy1181:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1187;
+		default: goto yy1182;
+	}
+yy1182:
+#line 902 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Unicode4; break; }
+#line 19805 "_devbuild/gen/osh-lex.h"
+yy1183:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1188;
+		default: goto yy1184;
+	}
+yy1184:
+#line 901 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Char_Hex; break; }
+#line 19836 "_devbuild/gen/osh-lex.h"
+yy1185:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1189;
+		default: goto yy1178;
+	}
+yy1186:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1190;
+		default: goto yy1180;
+	}
+yy1187:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1191;
+		default: goto yy1182;
+	}
+yy1188:
+	++p;
+	goto yy1184;
+yy1189:
+	++p;
+	goto yy1178;
+yy1190:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1192;
+		default: goto yy1180;
+	}
+yy1191:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1193;
+		default: goto yy1182;
+	}
+yy1192:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1194;
+		default: goto yy1180;
+	}
+yy1193:
+	++p;
+	goto yy1182;
+yy1194:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1195;
+		default: goto yy1180;
+	}
+yy1195:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1196;
+		default: goto yy1180;
+	}
+yy1196:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f': goto yy1197;
+		default: goto yy1180;
+	}
+yy1197:
+	++p;
+	goto yy1180;
+}
+#line 912 "_devbuild/gen/osh-lex.re2c.h"
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline void MatchGlobToken(unsigned char* line, int line_len,
+                                  int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+
+  for (;;) {
+    
+#line 20096 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1199;
+		case '!': goto yy1201;
+		case '*': goto yy1202;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1203;
+		case '?': goto yy1205;
+		case '[': goto yy1206;
+		case '\\': goto yy1207;
+		case ']': goto yy1208;
+		case '^': goto yy1209;
+		default: goto yy1200;
+	}
+yy1199:
+	++p;
+#line 939 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 20178 "_devbuild/gen/osh-lex.h"
+yy1200:
+	++p;
+#line 938 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_OtherLiteral; break; }
+#line 20183 "_devbuild/gen/osh-lex.h"
+yy1201:
+	++p;
+#line 931 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_Bang; break; }
+#line 20188 "_devbuild/gen/osh-lex.h"
+yy1202:
+	++p;
+#line 929 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_Star; break; }
+#line 20193 "_devbuild/gen/osh-lex.h"
+yy1203:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1203;
+		default: goto yy1204;
+	}
+yy1204:
+#line 937 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_CleanLiterals; break; }
+#line 20265 "_devbuild/gen/osh-lex.h"
+yy1205:
+	++p;
+#line 930 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_QMark; break; }
+#line 20270 "_devbuild/gen/osh-lex.h"
+yy1206:
+	++p;
+#line 933 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_LBracket; break; }
+#line 20275 "_devbuild/gen/osh-lex.h"
+yy1207:
+	yych = *++p;
+	if (yych >= 0x01) goto yy1210;
+#line 936 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_BadBackslash; break; }
+#line 20281 "_devbuild/gen/osh-lex.h"
+yy1208:
+	++p;
+#line 934 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_RBracket; break; }
+#line 20286 "_devbuild/gen/osh-lex.h"
+yy1209:
+	++p;
+#line 932 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_Caret; break; }
+#line 20291 "_devbuild/gen/osh-lex.h"
+yy1210:
+	++p;
+#line 935 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Glob_EscapedChar; break; }
+#line 20296 "_devbuild/gen/osh-lex.h"
+}
+#line 941 "_devbuild/gen/osh-lex.re2c.h"
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline void MatchPS1Token(unsigned char* line, int line_len,
+                                  int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+
+  for (;;) {
+    
+#line 20315 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1212;
+		case '\\': goto yy1215;
+		default: goto yy1213;
+	}
+yy1212:
+	++p;
+#line 964 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 20328 "_devbuild/gen/osh-lex.h"
+yy1213:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '\\': goto yy1214;
+		default: goto yy1213;
+	}
+yy1214:
+#line 962 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_Literals; break; }
+#line 20339 "_devbuild/gen/osh-lex.h"
+yy1215:
+	yych = *++p;
+	switch (yych) {
+		case '!':
+		case '#':
+		case '$':
+		case '@':
+		case 'A':
+		case 'H':
+		case 'T':
+		case 'V':
+		case 'W':
+		case '\\':
+		case 'a':
+		case 'd':
+		case 'e':
+		case 'h':
+		case 'j':
+		case 'l':
+		case 'n':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w': goto yy1217;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1218;
+		case '[': goto yy1220;
+		case ']': goto yy1221;
+		default: goto yy1216;
+	}
+yy1216:
+#line 963 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_BadBackslash; break; }
+#line 20381 "_devbuild/gen/osh-lex.h"
+yy1217:
+	++p;
+#line 959 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_Subst; break; }
+#line 20386 "_devbuild/gen/osh-lex.h"
+yy1218:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1222;
+		default: goto yy1219;
+	}
+yy1219:
+#line 958 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_Octal3; break; }
+#line 20403 "_devbuild/gen/osh-lex.h"
+yy1220:
+	++p;
+#line 960 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_LBrace; break; }
+#line 20408 "_devbuild/gen/osh-lex.h"
+yy1221:
+	++p;
+#line 961 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__PS_RBrace; break; }
+#line 20413 "_devbuild/gen/osh-lex.h"
+yy1222:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7': goto yy1223;
+		default: goto yy1219;
+	}
+yy1223:
+	++p;
+	goto yy1219;
+}
+#line 966 "_devbuild/gen/osh-lex.re2c.h"
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline void MatchHistoryToken(unsigned char* line, int line_len,
+                                  int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+
+  for (;;) {
+    
+#line 20448 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1225;
+		case '!': goto yy1228;
+		case '#': goto yy1230;
+		case '\'': goto yy1231;
+		case '\\': goto yy1233;
+		default: goto yy1226;
+	}
+yy1225:
+	++p;
+#line 991 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 20464 "_devbuild/gen/osh-lex.h"
+yy1226:
+	yych = *++p;
+	switch (yych) {
+		case 0x00:
+		case '!':
+		case '#':
+		case '\'':
+		case '\\': goto yy1227;
+		default: goto yy1226;
+	}
+yy1227:
+#line 988 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Other; break; }
+#line 20478 "_devbuild/gen/osh-lex.h"
+yy1228:
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '!':
+		case '$':
+		case '*':
+		case '^': goto yy1234;
+		case '-': goto yy1235;
+		case '.':
+		case '/':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1237;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1238;
+		case '?': goto yy1240;
+		default: goto yy1229;
+	}
+yy1229:
+#line 990 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Other; break; }
+#line 20558 "_devbuild/gen/osh-lex.h"
+yy1230:
+	yych = *++p;
+	if (yych >= 0x01) goto yy1230;
+#line 986 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Other; break; }
+#line 20564 "_devbuild/gen/osh-lex.h"
+yy1231:
+	yych = *++p;
+	switch (yych) {
+		case 0x00: goto yy1232;
+		case '\'': goto yy1241;
+		default: goto yy1231;
+	}
+yy1232:
+#line 987 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Other; break; }
+#line 20575 "_devbuild/gen/osh-lex.h"
+yy1233:
+	yych = *++p;
+	if (yych <= 0x00) goto yy1229;
+	goto yy1242;
+yy1234:
+	++p;
+#line 983 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Op; break; }
+#line 20584 "_devbuild/gen/osh-lex.h"
+yy1235:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1238;
+		default: goto yy1236;
+	}
+yy1236:
+	p = YYMARKER;
+	goto yy1229;
+yy1237:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\n':
+		case '\r':
+		case ' ': goto yy1236;
+		default: goto yy1244;
+	}
+yy1238:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1238;
+		default: goto yy1239;
+	}
+yy1239:
+#line 984 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Num; break; }
+#line 20630 "_devbuild/gen/osh-lex.h"
+yy1240:
+	yych = *++p;
+	switch (yych) {
+		case '.':
+		case '/':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1237;
+		default: goto yy1236;
+	}
+yy1241:
+	++p;
+	goto yy1232;
+yy1242:
+	++p;
+#line 989 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Other; break; }
+#line 20698 "_devbuild/gen/osh-lex.h"
+yy1243:
+	yych = *++p;
+yy1244:
+	switch (yych) {
+		case '\t':
+		case '\n':
+		case '\r':
+		case ' ': goto yy1245;
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1243;
+		default: goto yy1236;
+	}
+yy1245:
+	++p;
+#line 985 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__History_Search; break; }
+#line 20778 "_devbuild/gen/osh-lex.h"
+}
+#line 993 "_devbuild/gen/osh-lex.re2c.h"
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline void MatchBraceRangeToken(unsigned char* line, int line_len,
+                                  int start_pos, int* id, int* end_pos) {
+  assert(start_pos <= line_len);  /* caller should have checked */
+
+  unsigned char* p = line + start_pos;  /* modified by re2c */
+
+  unsigned char* YYMARKER;  /* why do we need this? */
+
+  for (;;) {
+    
+#line 20797 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 0x00: goto yy1247;
+		case '-': goto yy1250;
+		case '.': goto yy1251;
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1252;
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1254;
+		default: goto yy1248;
+	}
+yy1247:
+	++p;
+#line 1014 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Eol_Tok; *end_pos = start_pos; return; }
+#line 20873 "_devbuild/gen/osh-lex.h"
+yy1248:
+	++p;
+yy1249:
+#line 1013 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Range_Other; break; }
+#line 20879 "_devbuild/gen/osh-lex.h"
+yy1250:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1252;
+		default: goto yy1249;
+	}
+yy1251:
+	yych = *++p;
+	switch (yych) {
+		case '.': goto yy1255;
+		default: goto yy1249;
+	}
+yy1252:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9': goto yy1252;
+		default: goto yy1253;
+	}
+yy1253:
+#line 1010 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Range_Int; break; }
+#line 20919 "_devbuild/gen/osh-lex.h"
+yy1254:
+	++p;
+#line 1011 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Range_Char; break; }
+#line 20924 "_devbuild/gen/osh-lex.h"
+yy1255:
+	++p;
+#line 1012 "_devbuild/gen/osh-lex.re2c.h"
+	{ *id = id__Range_Dots; break; }
+#line 20929 "_devbuild/gen/osh-lex.h"
+}
+#line 1016 "_devbuild/gen/osh-lex.re2c.h"
+
+  }
+  *end_pos = p - line;  /* relative */
+}
+
+
+static inline int IsValidVarName(const char* s, int len) {
+  const char* p = s;  /* modified by re2c */
+  const char* end = s + len;
+
+  unsigned char* YYMARKER;  /* why do we need this? For SHOULD_HIJACK_RE */
+
+  
+#line 20945 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1258;
+		default: goto yy1257;
+	}
+yy1257:
+	++p;
+#line 1031 "_devbuild/gen/osh-lex.re2c.h"
+	{ return 0; }
+#line 21009 "_devbuild/gen/osh-lex.h"
+yy1258:
+	yych = *++p;
+	switch (yych) {
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1258;
+		default: goto yy1259;
+	}
+yy1259:
+#line 1030 "_devbuild/gen/osh-lex.re2c.h"
+	{ return p == end; }
+#line 21081 "_devbuild/gen/osh-lex.h"
+}
+#line 1032 "_devbuild/gen/osh-lex.re2c.h"
+
+}
+
+
+static inline int IsPlainWord(const char* s, int len) {
+  const char* p = s;  /* modified by re2c */
+  const char* end = s + len;
+
+  unsigned char* YYMARKER;  /* why do we need this? For SHOULD_HIJACK_RE */
+
+  
+#line 21095 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	yych = *p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1262;
+		default: goto yy1261;
+	}
+yy1261:
+	++p;
+#line 1045 "_devbuild/gen/osh-lex.re2c.h"
+	{ return 0; }
+#line 21172 "_devbuild/gen/osh-lex.h"
+yy1262:
+	yych = *++p;
+	switch (yych) {
+		case '-':
+		case '.':
+		case '/':
+		case '0':
+		case '1':
+		case '2':
+		case '3':
+		case '4':
+		case '5':
+		case '6':
+		case '7':
+		case '8':
+		case '9':
+		case 'A':
+		case 'B':
+		case 'C':
+		case 'D':
+		case 'E':
+		case 'F':
+		case 'G':
+		case 'H':
+		case 'I':
+		case 'J':
+		case 'K':
+		case 'L':
+		case 'M':
+		case 'N':
+		case 'O':
+		case 'P':
+		case 'Q':
+		case 'R':
+		case 'S':
+		case 'T':
+		case 'U':
+		case 'V':
+		case 'W':
+		case 'X':
+		case 'Y':
+		case 'Z':
+		case '_':
+		case 'a':
+		case 'b':
+		case 'c':
+		case 'd':
+		case 'e':
+		case 'f':
+		case 'g':
+		case 'h':
+		case 'i':
+		case 'j':
+		case 'k':
+		case 'l':
+		case 'm':
+		case 'n':
+		case 'o':
+		case 'p':
+		case 'q':
+		case 'r':
+		case 's':
+		case 't':
+		case 'u':
+		case 'v':
+		case 'w':
+		case 'x':
+		case 'y':
+		case 'z': goto yy1262;
+		default: goto yy1263;
+	}
+yy1263:
+#line 1044 "_devbuild/gen/osh-lex.re2c.h"
+	{ return p == end; }
+#line 21247 "_devbuild/gen/osh-lex.h"
+}
+#line 1046 "_devbuild/gen/osh-lex.re2c.h"
+
+}
+
+
+static inline int ShouldHijack(const char* s, int len) {
+  const char* p = s;  /* modified by re2c */
+  const char* end = s + len;
+
+  unsigned char* YYMARKER;  /* why do we need this? For SHOULD_HIJACK_RE */
+
+  
+#line 21261 "_devbuild/gen/osh-lex.h"
+{
+	unsigned char yych;
+	unsigned int yyaccept = 0;
+	yych = *p;
+	switch (yych) {
+		case '#': goto yy1267;
+		default: goto yy1265;
+	}
+yy1265:
+	++p;
+yy1266:
+#line 1059 "_devbuild/gen/osh-lex.re2c.h"
+	{ return 0; }
+#line 21275 "_devbuild/gen/osh-lex.h"
+yy1267:
+	yyaccept = 0;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case '!': goto yy1268;
+		default: goto yy1266;
+	}
+yy1268:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy1269;
+		case 's': goto yy1270;
+		default: goto yy1268;
+	}
+yy1269:
+	p = YYMARKER;
+	if (yyaccept == 0) goto yy1266;
+	else goto yy1273;
+yy1270:
+	yych = *++p;
+	switch (yych) {
+		case '\n': goto yy1269;
+		case 'h': goto yy1271;
+		case 's': goto yy1270;
+		default: goto yy1268;
+	}
+yy1271:
+	yych = *++p;
+	switch (yych) {
+		case '\t':
+		case '\r':
+		case ' ': goto yy1272;
+		case '\n': goto yy1274;
+		case 's': goto yy1270;
+		default: goto yy1268;
+	}
+yy1272:
+	yyaccept = 1;
+	yych = *(YYMARKER = ++p);
+	switch (yych) {
+		case 0x00: goto yy1268;
+		case '\n': goto yy1274;
+		default: goto yy1272;
+	}
+yy1273:
+#line 1058 "_devbuild/gen/osh-lex.re2c.h"
+	{ return p == end; }
+#line 21323 "_devbuild/gen/osh-lex.h"
+yy1274:
+	yych = *++p;
+	if (yych <= 0x00) goto yy1273;
+	goto yy1274;
+}
+#line 1060 "_devbuild/gen/osh-lex.re2c.h"
+
+}
+
@@ -0,0 +1,39 @@
+#define bool_arg_type__Undefined 1
+#define bool_arg_type__Path 2
+#define bool_arg_type__Int 3
+#define bool_arg_type__Str 4
+#define bool_arg_type__Other 5
+
+#define redir_arg_type__Path 1
+#define redir_arg_type__Desc 2
+#define redir_arg_type__Here 3
+
+#define lex_mode__Undefined 1
+#define lex_mode__Comment 2
+#define lex_mode__ShCommand 3
+#define lex_mode__Backtick 4
+#define lex_mode__DBracket 5
+#define lex_mode__SQ 6
+#define lex_mode__DQ 7
+#define lex_mode__DollarSQ 8
+#define lex_mode__Arith 9
+#define lex_mode__ExtGlob 10
+#define lex_mode__VSub_1 11
+#define lex_mode__VSub_2 12
+#define lex_mode__VSub_ArgUnquoted 13
+#define lex_mode__VSub_ArgDQ 14
+#define lex_mode__BashRegex 15
+#define lex_mode__BashRegexChars 16
+#define lex_mode__PrintfOuter 17
+#define lex_mode__PrintfPercent 18
+#define lex_mode__Command 19
+#define lex_mode__Array 20
+#define lex_mode__Expr 21
+#define lex_mode__VSub_Oil 22
+#define lex_mode__SQ_Oil 23
+#define lex_mode__DQ_Oil 24
+#define lex_mode__SQ_Raw 25
+#define lex_mode__DQ_Raw 26
+#define lex_mode__Regex 27
+#define lex_mode__CharClass 28
+
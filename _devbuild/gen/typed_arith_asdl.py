@@ -0,0 +1,554 @@
+from asdl import const  # For const.NO_INTEGER
+from asdl import runtime
+from asdl.runtime import (
+  PrettyLeaf, PrettyArray, PrettyNode,
+  Color_TypeName, Color_StringConst, Color_OtherConst, Color_UserType,
+)
+
+from typing import Optional, List, Tuple, Dict, Any
+
+class pipeline(runtime.CompoundObj):
+  __slots__ = ('negated',)
+
+  def __init__(self, negated=None):
+    # type: (Optional[bool]) -> None
+    self.negated = negated
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('pipeline')
+    L = out_node.fields
+
+    x0 = PrettyLeaf('T' if self.negated else 'F', Color_OtherConst)
+    L.append(('negated', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('pipeline')
+    L = out_node.fields
+    x0 = PrettyLeaf('T' if self.negated else 'F', Color_OtherConst)
+    L.append(('negated', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr_e(object):
+  NoOp = 1
+  Const = 2
+  Var = 3
+  Unary = 4
+  Binary = 5
+  Ternary = 6
+  FuncCall = 7
+  Index = 8
+  Slice = 9
+
+class arith_expr_t(runtime.CompoundObj):
+  pass
+
+class arith_expr__NoOp(arith_expr_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.NoOp')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.NoOp')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr__Const(arith_expr_t):
+  tag = 2
+  __slots__ = ('i', 'spids')
+
+  def __init__(self, i=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.i = i
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Const')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(str(self.i), Color_OtherConst)
+    L.append(('i', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Const')
+    L = out_node.fields
+    x0 = PrettyLeaf(str(self.i), Color_OtherConst)
+    L.append(('i', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    p = _arith_expr__Const(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Var(arith_expr_t):
+  tag = 3
+  __slots__ = ('name', 'spids')
+
+  def __init__(self, name=None, spids=None):
+    # type: (Optional[str], Optional[List[int]]) -> None
+    self.name = name
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Var')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Var')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    p = _arith_expr__Var(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Unary(arith_expr_t):
+  tag = 4
+  __slots__ = ('op', 'a', 'spids')
+
+  def __init__(self, op=None, a=None, spids=None):
+    # type: (Optional[str], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.a = a
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Unary')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.op, Color_StringConst)
+    L.append(('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.PrettyTree()
+    L.append(('a', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Unary')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.op, Color_StringConst)
+    L.append(('op', x0))
+
+    assert self.a is not None
+    x1 = self.a.AbbreviatedTree()
+    L.append(('a', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    p = _arith_expr__Unary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Binary(arith_expr_t):
+  tag = 5
+  __slots__ = ('op', 'left', 'right', 'spids')
+
+  def __init__(self, op=None, left=None, right=None, spids=None):
+    # type: (Optional[str], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Binary')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.op, Color_StringConst)
+    L.append(('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(('right', x2))
+
+    if self.spids:  # ArrayType
+      x3 = PrettyArray()
+      for i3 in self.spids:
+        x3.children.append(PrettyLeaf(str(i3), Color_OtherConst))
+      L.append(('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Binary')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.op, Color_StringConst)
+    L.append(('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    p = _arith_expr__Binary(self)
+    return p if p else self._AbbreviatedTree()
+
+class arith_expr__Ternary(arith_expr_t):
+  tag = 6
+  __slots__ = ('cond', 'true_expr', 'false_expr', 'spids')
+
+  def __init__(self, cond=None, true_expr=None, false_expr=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.cond = cond
+    self.true_expr = true_expr
+    self.false_expr = false_expr
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Ternary')
+    L = out_node.fields
+
+    assert self.cond is not None
+    x0 = self.cond.PrettyTree()
+    L.append(('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.PrettyTree()
+    L.append(('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.PrettyTree()
+    L.append(('false_expr', x2))
+
+    if self.spids:  # ArrayType
+      x3 = PrettyArray()
+      for i3 in self.spids:
+        x3.children.append(PrettyLeaf(str(i3), Color_OtherConst))
+      L.append(('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Ternary')
+    L = out_node.fields
+    assert self.cond is not None
+    x0 = self.cond.AbbreviatedTree()
+    L.append(('cond', x0))
+
+    assert self.true_expr is not None
+    x1 = self.true_expr.AbbreviatedTree()
+    L.append(('true_expr', x1))
+
+    assert self.false_expr is not None
+    x2 = self.false_expr.AbbreviatedTree()
+    L.append(('false_expr', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr__FuncCall(arith_expr_t):
+  tag = 7
+  __slots__ = ('name', 'args', 'spids')
+
+  def __init__(self, name=None, args=None, spids=None):
+    # type: (Optional[str], Optional[List[arith_expr_t]], Optional[List[int]]) -> None
+    self.name = name
+    self.args = args or []
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.FuncCall')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    if self.args:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.args:
+        x1.children.append(i1.PrettyTree())
+      L.append(('args', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.FuncCall')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    if self.args:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.args:
+        x1.children.append(i1.AbbreviatedTree())
+      L.append(('args', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr__Index(arith_expr_t):
+  tag = 8
+  __slots__ = ('a', 'index', 'spids')
+
+  def __init__(self, a=None, index=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.a = a
+    self.index = index
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Index')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.PrettyTree()
+    L.append(('index', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Index')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(('a', x0))
+
+    assert self.index is not None
+    x1 = self.index.AbbreviatedTree()
+    L.append(('index', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr__Slice(arith_expr_t):
+  tag = 9
+  __slots__ = ('a', 'begin', 'end', 'stride', 'spids')
+
+  def __init__(self, a=None, begin=None, end=None, stride=None, spids=None):
+    # type: (Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[arith_expr_t], Optional[List[int]]) -> None
+    self.a = a
+    self.begin = begin or None
+    self.end = end or None
+    self.stride = stride or None
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Slice')
+    L = out_node.fields
+
+    assert self.a is not None
+    x0 = self.a.PrettyTree()
+    L.append(('a', x0))
+
+    if self.begin is not None:  # MaybeType
+      x1 = self.begin.PrettyTree()
+      L.append(('begin', x1))
+
+    if self.end is not None:  # MaybeType
+      x2 = self.end.PrettyTree()
+      L.append(('end', x2))
+
+    if self.stride is not None:  # MaybeType
+      x3 = self.stride.PrettyTree()
+      L.append(('stride', x3))
+
+    if self.spids:  # ArrayType
+      x4 = PrettyArray()
+      for i4 in self.spids:
+        x4.children.append(PrettyLeaf(str(i4), Color_OtherConst))
+      L.append(('spids', x4))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('arith_expr.Slice')
+    L = out_node.fields
+    assert self.a is not None
+    x0 = self.a.AbbreviatedTree()
+    L.append(('a', x0))
+
+    if self.begin is not None:  # MaybeType
+      x1 = self.begin.AbbreviatedTree()
+      L.append(('begin', x1))
+
+    if self.end is not None:  # MaybeType
+      x2 = self.end.AbbreviatedTree()
+      L.append(('end', x2))
+
+    if self.stride is not None:  # MaybeType
+      x3 = self.stride.AbbreviatedTree()
+      L.append(('stride', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class arith_expr(object):
+  NoOp = arith_expr__NoOp
+  Const = arith_expr__Const
+  Var = arith_expr__Var
+  Unary = arith_expr__Unary
+  Binary = arith_expr__Binary
+  Ternary = arith_expr__Ternary
+  FuncCall = arith_expr__FuncCall
+  Index = arith_expr__Index
+  Slice = arith_expr__Slice
+
+#
+# CONCATENATED FILE
+#
+
+"""
+typed_arith_abbrev.py - Abbreviations for pretty-printing typed_arith.asdl.
+"""
+
+from asdl import runtime
+
+def _arith_expr__Unary(obj):
+  # type: (arith_expr__Unary) -> Optional[runtime.PrettyNode]
+
+  p_node = runtime.PrettyNode()
+  p_node.abbrev = True
+  p_node.node_type = 'U'
+  n = runtime.PrettyLeaf(str(obj.op), runtime.Color_StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.a.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Binary(obj):
+  # type: (arith_expr__Binary) -> Optional[runtime.PrettyNode]
+
+  if obj.op == '=':  # test for fallback
+    return None
+
+  p_node = runtime.PrettyNode()
+  p_node.abbrev = True
+  p_node.node_type = 'B'
+  n = runtime.PrettyLeaf(str(obj.op), runtime.Color_StringConst)
+  p_node.unnamed_fields.append(n)
+  p_node.unnamed_fields.append(obj.left.AbbreviatedTree())  # type: ignore
+  p_node.unnamed_fields.append(obj.right.AbbreviatedTree())  # type: ignore
+  return p_node
+
+
+def _arith_expr__Const(obj):
+  # type: (arith_expr__Const) -> Optional[runtime.PrettyNode]
+  p_node = runtime.PrettyNode()
+  p_node.abbrev = True
+  p_node.node_type = ''  # omit it
+  n = runtime.PrettyLeaf(str(obj.i), runtime.Color_OtherConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
+
+def _arith_expr__Var(obj):
+  # type: (arith_expr__Var) -> Optional[runtime.PrettyNode]
+  p_node = runtime.PrettyNode()
+  p_node.abbrev = True
+  p_node.node_type = '$'
+  n = runtime.PrettyLeaf(str(obj.name), runtime.Color_StringConst)
+  p_node.unnamed_fields.append(n)
+  return p_node
+
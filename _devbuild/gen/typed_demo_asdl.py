@@ -0,0 +1,480 @@
+from asdl import const  # For const.NO_INTEGER
+from asdl import runtime
+from asdl.runtime import (
+  PrettyLeaf, PrettyArray, PrettyNode,
+  Color_TypeName, Color_StringConst, Color_OtherConst, Color_UserType,
+)
+
+from typing import Optional, List, Tuple, Dict, Any
+
+class op_id_t(runtime.SimpleObj):
+  pass
+
+class op_id_e(object):
+  Plus = op_id_t(1, 'Plus')
+  Minus = op_id_t(2, 'Minus')
+  Star = op_id_t(3, 'Star')
+
+class op_array(runtime.CompoundObj):
+  __slots__ = ('ops',)
+
+  def __init__(self, ops=None):
+    # type: (Optional[List[op_id_t]]) -> None
+    self.ops = ops or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('op_array')
+    L = out_node.fields
+
+    if self.ops:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.ops:
+        x0.children.append(PrettyLeaf(i0.name, Color_TypeName))
+      L.append(('ops', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('op_array')
+    L = out_node.fields
+    if self.ops:  # ArrayType
+      x0 = PrettyArray()
+      for i0 in self.ops:
+        x0.children.append(PrettyLeaf(i0.name, Color_TypeName))
+      L.append(('ops', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class assign(runtime.CompoundObj):
+  __slots__ = ('name', 'flags')
+
+  def __init__(self, name=None, flags=None):
+    # type: (Optional[str], Optional[List[str]]) -> None
+    self.name = name
+    self.flags = flags or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('assign')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    if self.flags:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.flags:
+        x1.children.append(PrettyLeaf(i1, Color_StringConst))
+      L.append(('flags', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('assign')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.name, Color_StringConst)
+    L.append(('name', x0))
+
+    if self.flags:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.flags:
+        x1.children.append(PrettyLeaf(i1, Color_StringConst))
+      L.append(('flags', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class cflow_e(object):
+  Break = 1
+  Continue = 2
+  Return = 3
+
+class cflow_t(runtime.CompoundObj):
+  pass
+
+class cflow__Break(cflow_t):
+  tag = 1
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Break')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Break')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class cflow__Continue(cflow_t):
+  tag = 2
+  __slots__ = ()
+
+  def __init__(self, ):
+    # type: () -> None
+    pass
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Continue')
+    L = out_node.fields
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Continue')
+    L = out_node.fields
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class cflow__Return(cflow_t):
+  tag = 3
+  __slots__ = ('status', 'spids')
+
+  def __init__(self, status=None, spids=None):
+    # type: (Optional[int], Optional[List[int]]) -> None
+    self.status = status
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Return')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(str(self.status), Color_OtherConst)
+    L.append(('status', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('cflow.Return')
+    L = out_node.fields
+    x0 = PrettyLeaf(str(self.status), Color_OtherConst)
+    L.append(('status', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class cflow(object):
+  Break = cflow__Break
+  Continue = cflow__Continue
+  Return = cflow__Return
+
+class source_location(runtime.CompoundObj):
+  __slots__ = ('path', 'line', 'col', 'length')
+
+  def __init__(self, path=None, line=None, col=None, length=None):
+    # type: (Optional[str], Optional[int], Optional[int], Optional[int]) -> None
+    self.path = path
+    self.line = line
+    self.col = col
+    self.length = length
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('source_location')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.path, Color_StringConst)
+    L.append(('path', x0))
+
+    x1 = PrettyLeaf(str(self.line), Color_OtherConst)
+    L.append(('line', x1))
+
+    x2 = PrettyLeaf(str(self.col), Color_OtherConst)
+    L.append(('col', x2))
+
+    x3 = PrettyLeaf(str(self.length), Color_OtherConst)
+    L.append(('length', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('source_location')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.path, Color_StringConst)
+    L.append(('path', x0))
+
+    x1 = PrettyLeaf(str(self.line), Color_OtherConst)
+    L.append(('line', x1))
+
+    x2 = PrettyLeaf(str(self.col), Color_OtherConst)
+    L.append(('col', x2))
+
+    x3 = PrettyLeaf(str(self.length), Color_OtherConst)
+    L.append(('length', x3))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class word(runtime.CompoundObj):
+  __slots__ = ('value',)
+
+  def __init__(self, value=None):
+    # type: (Optional[str]) -> None
+    self.value = value
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('word')
+    L = out_node.fields
+
+    x0 = PrettyLeaf(self.value, Color_StringConst)
+    L.append(('value', x0))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('word')
+    L = out_node.fields
+    x0 = PrettyLeaf(self.value, Color_StringConst)
+    L.append(('value', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class bool_expr_e(object):
+  Binary = 1
+  Unary = 2
+  LogicalNot = 3
+  LogicalBinary = 4
+
+class bool_expr_t(runtime.CompoundObj):
+  pass
+
+class bool_expr__Binary(bool_expr_t):
+  tag = 1
+  __slots__ = ('left', 'right', 'spids')
+
+  def __init__(self, left=None, right=None, spids=None):
+    # type: (Optional[word], Optional[word], Optional[List[int]]) -> None
+    self.left = left
+    self.right = right
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.Binary')
+    L = out_node.fields
+
+    assert self.left is not None
+    x0 = self.left.PrettyTree()
+    L.append(('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.PrettyTree()
+    L.append(('right', x1))
+
+    if self.spids:  # ArrayType
+      x2 = PrettyArray()
+      for i2 in self.spids:
+        x2.children.append(PrettyLeaf(str(i2), Color_OtherConst))
+      L.append(('spids', x2))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.Binary')
+    L = out_node.fields
+    assert self.left is not None
+    x0 = self.left.AbbreviatedTree()
+    L.append(('left', x0))
+
+    assert self.right is not None
+    x1 = self.right.AbbreviatedTree()
+    L.append(('right', x1))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class bool_expr__Unary(bool_expr_t):
+  tag = 2
+  __slots__ = ('child', 'spids')
+
+  def __init__(self, child=None, spids=None):
+    # type: (Optional[word], Optional[List[int]]) -> None
+    self.child = child
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.Unary')
+    L = out_node.fields
+
+    assert self.child is not None
+    x0 = self.child.PrettyTree()
+    L.append(('child', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.Unary')
+    L = out_node.fields
+    assert self.child is not None
+    x0 = self.child.AbbreviatedTree()
+    L.append(('child', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalNot(bool_expr_t):
+  tag = 3
+  __slots__ = ('b', 'spids')
+
+  def __init__(self, b=None, spids=None):
+    # type: (Optional[bool_expr_t], Optional[List[int]]) -> None
+    self.b = b
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.LogicalNot')
+    L = out_node.fields
+
+    assert self.b is not None
+    x0 = self.b.PrettyTree()
+    L.append(('b', x0))
+
+    if self.spids:  # ArrayType
+      x1 = PrettyArray()
+      for i1 in self.spids:
+        x1.children.append(PrettyLeaf(str(i1), Color_OtherConst))
+      L.append(('spids', x1))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.LogicalNot')
+    L = out_node.fields
+    assert self.b is not None
+    x0 = self.b.AbbreviatedTree()
+    L.append(('b', x0))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class bool_expr__LogicalBinary(bool_expr_t):
+  tag = 4
+  __slots__ = ('op', 'left', 'right', 'spids')
+
+  def __init__(self, op=None, left=None, right=None, spids=None):
+    # type: (Optional[op_id_t], Optional[bool_expr_t], Optional[bool_expr_t], Optional[List[int]]) -> None
+    self.op = op
+    self.left = left
+    self.right = right
+    self.spids = spids or []
+
+  def PrettyTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.LogicalBinary')
+    L = out_node.fields
+
+    assert self.op is not None
+    x0 = PrettyLeaf(self.op.name, Color_TypeName)
+    L.append(('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.PrettyTree()
+    L.append(('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.PrettyTree()
+    L.append(('right', x2))
+
+    if self.spids:  # ArrayType
+      x3 = PrettyArray()
+      for i3 in self.spids:
+        x3.children.append(PrettyLeaf(str(i3), Color_OtherConst))
+      L.append(('spids', x3))
+
+    return out_node
+
+  def _AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    out_node = PrettyNode('bool_expr.LogicalBinary')
+    L = out_node.fields
+    assert self.op is not None
+    x0 = PrettyLeaf(self.op.name, Color_TypeName)
+    L.append(('op', x0))
+
+    assert self.left is not None
+    x1 = self.left.AbbreviatedTree()
+    L.append(('left', x1))
+
+    assert self.right is not None
+    x2 = self.right.AbbreviatedTree()
+    L.append(('right', x2))
+
+    return out_node
+
+  def AbbreviatedTree(self):
+    # type: () -> PrettyNode
+    return self._AbbreviatedTree()
+
+class bool_expr(object):
+  Binary = bool_expr__Binary
+  Unary = bool_expr__Unary
+  LogicalNot = bool_expr__LogicalNot
+  LogicalBinary = bool_expr__LogicalBinary
+
@@ -0,0 +1,60 @@
+from asdl import const  # For const.NO_INTEGER
+from asdl import runtime
+from asdl.runtime import (
+  PrettyLeaf, PrettyArray, PrettyNode,
+  Color_TypeName, Color_StringConst, Color_OtherConst, Color_UserType,
+)
+
+from typing import Optional, List, Tuple, Dict, Any
+
+class bool_arg_type_t(runtime.SimpleObj):
+  pass
+
+class bool_arg_type_e(object):
+  Undefined = bool_arg_type_t(1, 'Undefined')
+  Path = bool_arg_type_t(2, 'Path')
+  Int = bool_arg_type_t(3, 'Int')
+  Str = bool_arg_type_t(4, 'Str')
+  Other = bool_arg_type_t(5, 'Other')
+
+class redir_arg_type_t(runtime.SimpleObj):
+  pass
+
+class redir_arg_type_e(object):
+  Path = redir_arg_type_t(1, 'Path')
+  Desc = redir_arg_type_t(2, 'Desc')
+  Here = redir_arg_type_t(3, 'Here')
+
+class lex_mode_t(runtime.SimpleObj):
+  pass
+
+class lex_mode_e(object):
+  Undefined = lex_mode_t(1, 'Undefined')
+  Comment = lex_mode_t(2, 'Comment')
+  ShCommand = lex_mode_t(3, 'ShCommand')
+  Backtick = lex_mode_t(4, 'Backtick')
+  DBracket = lex_mode_t(5, 'DBracket')
+  SQ = lex_mode_t(6, 'SQ')
+  DQ = lex_mode_t(7, 'DQ')
+  DollarSQ = lex_mode_t(8, 'DollarSQ')
+  Arith = lex_mode_t(9, 'Arith')
+  ExtGlob = lex_mode_t(10, 'ExtGlob')
+  VSub_1 = lex_mode_t(11, 'VSub_1')
+  VSub_2 = lex_mode_t(12, 'VSub_2')
+  VSub_ArgUnquoted = lex_mode_t(13, 'VSub_ArgUnquoted')
+  VSub_ArgDQ = lex_mode_t(14, 'VSub_ArgDQ')
+  BashRegex = lex_mode_t(15, 'BashRegex')
+  BashRegexChars = lex_mode_t(16, 'BashRegexChars')
+  PrintfOuter = lex_mode_t(17, 'PrintfOuter')
+  PrintfPercent = lex_mode_t(18, 'PrintfPercent')
+  Command = lex_mode_t(19, 'Command')
+  Array = lex_mode_t(20, 'Array')
+  Expr = lex_mode_t(21, 'Expr')
+  VSub_Oil = lex_mode_t(22, 'VSub_Oil')
+  SQ_Oil = lex_mode_t(23, 'SQ_Oil')
+  DQ_Oil = lex_mode_t(24, 'DQ_Oil')
+  SQ_Raw = lex_mode_t(25, 'SQ_Raw')
+  DQ_Raw = lex_mode_t(26, 'DQ_Raw')
+  Regex = lex_mode_t(27, 'Regex')
+  CharClass = lex_mode_t(28, 'CharClass')
+
@@ -0,0 +1,12 @@
+echo hi
+
+func() {
+  echo "inside func"
+}
+func 1 2 3
+
+# TODO: Test vars don't persist.
+(echo "in subshell"; echo "another")
+
+echo $(echo ComSub)
+
@@ -0,0 +1,8 @@
+shopt -s expand_aliases  # bash
+hi() { echo FUNC "$@"; }
+. ./alias-lib.sh
+X=1
+. ./alias-lib.sh
+unalias hi
+X=
+. ./alias-lib.sh
@@ -0,0 +1,2 @@
+if test -n "$X"; then alias hi='echo ALIAS'; fi
+hi there
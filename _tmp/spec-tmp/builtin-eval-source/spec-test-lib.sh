@@ -0,0 +1 @@
+LIBVAR=libvar
@@ -42,4 +42,167 @@ printf-loop-complex() {
   done | wc -l
 }
 
+# Variable lookup at the bottom of a deep call stack.  This microbenchmark
+# justifies the var_index member in osh/state.py:Mem.
+#
+# With the index, it runs in ~150 ms at any depth.
+# Without, it runs in ~205 ms at depth 40, and ~230 ms at depth 60.
+
+_recurse() {
+  local depth=$1
+  if test $depth -eq 0; then
+    local x
+    for i in $(seq 2000); do
+      x=$g$g$g$g$g
+    done
+  else
+    _recurse $((depth - 1))
+  fi
+}
+
+deep-lookup() {
+  local depth=${1:-60}
+  g=global
+  time _recurse $depth
+}
+
+# A here doc in a loop.  Bodies that fit in the pipe are written by the shell
+# itself, instead of a writer process (see FdState in core/process.py).
+#
+# With a writer process for each one, it runs in ~10 s.
+# Without, it runs in ~140 ms.
+
+here-doc-loop() {
+  time for i in $(seq 500); do
+    read line <<EOF
+line $i
+EOF
+  done
+}
+
+# Redirects to a function when the shell inherited many open descriptors.
+# FdState in core/process.py saves each redirected descriptor at the lowest
+# free one above 10.
+#
+# Probing for it with fcntl(F_GETFD) from 10 up, it runs in ~3.2 s.
+# With fcntl(F_DUPFD), it runs in ~530 ms.
+
+redirect-many-fds() {
+  local sh=${1:-bin/osh}
+  python2 -c '
+import os, sys
+fds = [os.open("/dev/null", os.O_RDONLY) for _ in range(990)]
+os.execvp(sys.argv[1], sys.argv[1:])
+' $sh -c '
+f() { echo in-f; }
+time for i in $(seq 2000); do f > /dev/null; done
+'
+}
+
+# A loop of compound commands, which measures the interpreter's overhead per
+# node.  This microbenchmark justifies the dispatch table and _COMMAND_FLAGS
+# in osh/cmd_exec.py.
+#
+# With an if/elif chain on node.tag, it runs in ~1.55 s of user time.
+# With the table, it runs in ~1.1 s.
+
+compound-loop() {
+  local i=0
+  time while (( i < 20000 )); do
+    if [[ -n $i ]]; then
+      (( ++i ))
+    fi
+  done
+}
+
+# Option parsing with a big 'case' statement.  This microbenchmark justifies
+# _CaseMatcher in osh/cmd_exec.py.
+#
+# Evaluating each pattern and calling fnmatch(), it runs in ~2.1 s of user
+# time.  With the compiled patterns, it runs in ~1.1 s.
+
+_parse-opt() {
+  case $1 in
+    -a|--all) ;; -b|--brief) ;; -c|--count) ;; -d|--debug) ;;
+    -e|--echo) ;; -f|--force) ;; -g|--global) ;; -h|--help) ;;
+    -i|--ignore) ;; -j|--jobs) ;; -k|--keep) ;; -l|--long) ;;
+    -m|--mode) ;; -n|--dry-run) ;; -o|--output) ;; -p|--prefix) ;;
+    -q|--quiet) ;; -r|--recursive) ;; -s|--silent) ;; -t|--tag) ;;
+    -u|--user) ;; -v|--verbose) ;; -w|--width) ;; -x|--exclude) ;;
+    --color=*) ;; --format=*) ;; --*) ;;
+    -*) ;;
+    *.sh) ;;
+    *) ;;
+  esac
+}
+
+case-loop() {
+  local args='-a --verbose --color=auto -z foo.sh bar --exclude -x --nothing'
+  time for i in $(seq 1000); do
+    for arg in $args; do
+      _parse-opt $arg
+    done
+  done
+}
+
+# Stripping glob prefixes and suffixes from a long string.  This
+# microbenchmark justifies _StripGlob in osh/string_ops.py.
+#
+# Calling fnmatch() on each prefix or suffix, it runs in ~4.5 s.
+# Matching the segments of the glob in one pass, it runs in ~400 ms.
+
+strip-glob() {
+  local s=$(seq 20000)
+  time for i in 1 2 3 4 5; do
+    a=${s#*5000}
+    b=${s%%[0-9]0000*}
+    c=${s##*1}
+    d=${s%$'\n'*}
+  done
+}
+
+# Splitting a long unquoted expansion into words.  This microbenchmark
+# justifies libc.ifs_split(), which osh/split.py uses for word evaluation.
+#
+# With the Python state machine, it runs in ~3.6 s of user time.  With
+# ifs_split(), it runs in ~0.8 s.
+
+split-words() {
+  local s=$(seq 50000)
+  time for i in 1 2 3 4 5; do
+    set -- $s
+  done
+  echo $#
+}
+
+# Unquoted expansions and "$*" look at IFS.  This microbenchmark justifies
+# caching the splitter and join char in SplitContext until IFS changes.
+#
+# It runs in ~3 s of user time either way, since GetVar() is cheap.  But
+# under cProfile with 5000 iterations, GetVar() is called 60,147 times when we
+# look up IFS for every word, and 20,061 times with the cache.
+
+ifs-words() {
+  set -- a b c
+  local x=1 y='2 3'
+  time for i in $(seq 20000); do
+    : $x $y $x $y "$*" "$*"
+  done
+}
+
+# A 'for' loop over a big brace range that exits early.  This microbenchmark
+# justifies braces.BraceExpandStatic(), which generates the strings as the
+# loop consumes them.
+#
+# Expanding the whole range first, it takes ~17 s and ~690 MB of memory.
+# Generating the strings, it takes ~0.1 s and ~15 MB.
+
+brace-range-loop() {
+  time for i in {1..1000000}; do
+    if test $i = 10; then
+      break
+    fi
+  done
+}
+
 "$@"
@@ -331,6 +331,131 @@ abuild-h() {
   done
 }
 
+#
+# Process creation
+#
+
+# Compare fork() and posix_spawn() for external commands.  The shell's heap
+# is made bigger by parsing a large script, since fork() has to copy the page
+# tables.  With N=1000: fork 5.0 s, spawn 1.1 s.
+#
+# Usage:
+#   benchmarks/osh-runtime.sh fork-vs-spawn [N]
+
+fork-vs-spawn() {
+  local n=${1:-2000}
+  local big=benchmarks/testdata/configure-coreutils
+
+  for spawn in 0 1; do
+    echo "OSH_SPAWN=$spawn"
+    OSH_SPAWN=$spawn bin/osh -c '
+      eval "big() { $(cat '$big') ; }"  # parse it to grow the heap
+      time for i in $(seq '$n'); do
+        /bin/true
+      done
+    '
+  done
+}
+
+# Compare reading a command sub's output with posix.read() in a loop, and with
+# posix.read_all().  Each size is read from a pipe N times.  With N=3: 1 MB
+# takes 14 ms vs. 8 ms, and 100 MB takes 1.3 s vs. 0.6 s.
+#
+# Usage:
+#   benchmarks/osh-runtime.sh read-all-vs-loop [N]
+
+read-all-vs-loop() {
+  local n=${1:-3}
+  PYTHONPATH=.:vendor python2 - $n <<'EOF'
+import sys, time
+import posix_ as posix
+
+def Loop(r):
+  chunks = []
+  while True:
+    byte_str = posix.read(r, 4096)
+    if not byte_str:
+      break
+    chunks.append(byte_str)
+  return ''.join(chunks).rstrip('\n')
+
+def ReadAll(r):
+  return posix.read_all(r, True)
+
+n = int(sys.argv[1])
+for size in (1000, 1000000, 100000000):
+  data = 'x' * (size - 1) + '\n'
+  for func in (Loop, ReadAll):
+    start = time.time()
+    for i in xrange(n):
+      r, w = posix.pipe()
+      pid = posix.fork()
+      if pid == 0:
+        posix.close(r)
+        posix.write(w, data)
+        posix._exit(0)
+      posix.close(w)
+      s = func(r)
+      posix.close(r)
+      posix.waitpid(pid, 0)
+      assert len(s) == size - 1
+    print('%10d bytes  %-8s %.4f s' % (size, func.__name__, time.time() - start))
+EOF
+}
+
+# Read a file line by line with 'while read', from a regular file and from a
+# pipe.  posix.read_line() reads blocks from a regular file and seeks back,
+# and reads a byte at a time from a pipe.  With 10 MB, both take ~58 s instead
+# of ~66 s with the byte-at-a-time Python loop.  The rest is the interpreter.
+#
+# Usage:
+#   benchmarks/osh-runtime.sh read-lines [MB] [SHELL]
+
+lines-file() {
+  local mb=$1
+  local file=_tmp/read-lines-$mb.txt
+  if ! test -f $file; then
+    mkdir -p _tmp
+    # Not a pipeline, since yes fails with SIGPIPE.
+    head -c ${mb}M > $file \
+      < <(yes 'Oct 17 09:30:00 host sshd[1234]: Accepted publickey for user')
+  fi
+  echo $file
+}
+
+read-lines() {
+  local mb=${1:-100}
+  local sh=${2:-bin/osh}
+  local file
+  file=$(lines-file $mb)
+
+  local code='n=0; while read -r line; do n=$((n + 1)); done; echo "$n lines"'
+  echo "$sh < $file"
+  time $sh -c "$code" < $file
+  echo "cat $file | $sh"
+  time cat $file | $sh -c "$code"
+}
+
+# Load the same file into an array with mapfile.  posix.read_lines() reads big
+# blocks and splits them in C.  With 10 MB, it takes ~0.15 s, compared with
+# ~58 s for the 'read' loop above.
+#
+# Usage:
+#   benchmarks/osh-runtime.sh mapfile-lines [MB] [SHELL]
+
+mapfile-lines() {
+  local mb=${1:-100}
+  local sh=${2:-bin/osh}
+  local file
+  file=$(lines-file $mb)
+
+  local code='mapfile -t lines; echo "${#lines[@]} lines"'
+  echo "$sh < $file"
+  time $sh -c "$code" < $file
+  echo "cat $file | $sh"
+  time cat $file | $sh -c "$code"
+}
+
 #
 # Misc
 #
@@ -152,6 +152,69 @@ EOF
   popd
 }
 
+# OSH startup.  bin/oil.py imports modules for completion, history, Oil, and
+# oshc where they're used, so 'osh -c true' only pays for what it runs.
+#
+# With the imports at the top, 'osh -c true' imported 102 modules beyond
+# Python's own startup.  Importing them lazily, it imports 91, and takes ~3-5
+# ms less CPU time.
+
+# Fail if this count goes up.  Move new interactive-only or Oil-only imports
+# into the functions that need them.
+readonly OSH_TRUE_IMPORT_BUDGET=91
+
+_import-count() {
+  python -v "$@" 2>&1 | grep -c '^import '
+}
+
+# Number of modules imported by 'osh -c true', not counting Python's own.
+osh-true-imports() {
+  local py=$(_import-count -c pass)
+  local osh=$(PYTHONPATH=.:vendor _import-count bin/oil.py osh -c true)
+  echo $(( osh - py ))
+}
+
+osh-true-syscalls() {
+  strace-callback bin/osh -c true
+}
+
+osh-true-time() {
+  time for i in $(seq 100); do
+    bin/osh -c true
+  done
+}
+
+import-budget() {
+  local n=$(osh-true-imports)
+  echo "osh -c true imports $n modules (budget $OSH_TRUE_IMPORT_BUDGET)"
+  if test $n -gt $OSH_TRUE_IMPORT_BUDGET; then
+    echo 'FAIL: over budget'
+    return 1
+  fi
+}
+
+# 'osh --server' imports and initializes once, and forks for each request from
+# bin/osh-client.  See core/zygote.py.
+#
+# 100 runs of 'bin/osh -c true' take ~5-6.5 s.  With a server, 100 runs of
+# 'bin/osh-client SOCK -c true' take ~1.8-2.1 s.  Most of that is starting
+# 'python -S' for the client; the request itself takes ~3 ms.  (Letting the
+# runner tear down the interpreter made it ~18 ms.)
+
+osh-server-time() {
+  local sock=_tmp/osh-server.$$.sock
+  bin/osh --server $sock &
+  local pid=$!
+  sleep 0.5  # wait for it to listen
+
+  time for i in $(seq 100); do
+    bin/osh-client $sock -c true
+  done
+
+  kill $pid
+  rm -f $sock
+}
+
 # Can get this down to 5 ms, 593 syscalls.  Needs to be much less.
 test-zip() {
   python -S _tmp/app.zip
@@ -54,9 +54,7 @@ from _devbuild.gen.syntax_asdl import source
 from asdl import const
 
 from core import alloc
-from core import comp_ui
 from core import dev
-from core import completion
 from core import main_loop
 from core import meta
 from core import process
@@ -69,7 +67,6 @@ from frontend import args
 from frontend import reader
 from frontend import parse_lib
 
-from oil_lang import cmd_exec as oil_cmd_exec
 from oil_lang import expr_eval
 from oil_lang import builtin_oil
 from oil_lang import builtin_funcs
@@ -77,13 +74,11 @@ from oil_lang import builtin_funcs
 from osh import builtin
 from osh import builtin_assign
 from osh import builtin_bracket
-from osh import builtin_comp
 from osh import builtin_printf
 from osh import builtin_process
 from osh import builtin_pure
 from osh import cmd_exec
 from osh import expr_eval as osh_expr_eval
-from osh import history
 from osh import prompt
 from osh import split
 from osh import state
@@ -91,10 +86,6 @@ from osh import word_eval
 
 from pylib import os_path
 
-from tools import deps
-from tools import osh2oil
-from tools import readlink
-
 import libc
 
 try:
@@ -105,6 +96,21 @@ except ImportError:
 
 _tlog('after imports')
 
+# NOTE: Modules that are only used by the interactive shell, completion, Oil,
+# or the oshc tools are imported where they're used.  See
+# benchmarks/startup.sh import-budget.
+_LAZY_MODULES = [
+    'core.comp_ui', 'core.completion', 'core.source_cache',
+    'oil_lang.cmd_exec', 'osh.builtin_comp', 'osh.history',
+    'tools.deps', 'tools.osh2oil', 'tools.readlink', 'core.zygote',
+]
+
+# build/app_deps.py finds the modules for the app bundle by importing this one,
+# so it needs to see them.
+if posix.environ.get('_OVM_DEPS') == '1':
+  for _name in _LAZY_MODULES:
+    __import__(_name)
+
 
 def DefineCommonFlags(spec):
   """Common flags between OSH and Oil."""
@@ -133,6 +139,8 @@ OSH_SPEC.LongFlag('--completion-display', ['minimal', 'nice'], default='nice')
 OSH_SPEC.LongFlag('--one-pass-parse')
 
 OSH_SPEC.LongFlag('--print-status')  # TODO: Replace with a shell hook
+# Free the LST of top-level commands after they run.  See core/alloc.py.
+OSH_SPEC.LongFlag('--discard-arena')
 OSH_SPEC.LongFlag('--debug-file', args.Str)
 OSH_SPEC.LongFlag('--xtrace-to-debug-file')
 
@@ -144,6 +152,9 @@ OSH_SPEC.LongFlag('--runtime-mem-dump', args.Str)
 # it can simply by --rcfile /dev/null.
 OSH_SPEC.LongFlag('--rcfile', args.Str)
 
+# Run scripts for bin/osh-client.  See core/zygote.py.
+OSH_SPEC.LongFlag('--server', args.Str)
+
 builtin_pure.AddOptionsToArgSpec(OSH_SPEC)
 
 
@@ -153,7 +164,69 @@ def _MakeArgVector(argv):
   return arg_vector(argv, [const.NO_INTEGER] * len(argv))
 
 
+class _CompletionDeps(object):
+  """State shared by the completion builtins and the interactive completer.
+
+  Most scripts don't use completion, so we import core/completion.py and build
+  this state the first time a completion builtin runs, or when the shell is
+  interactive.
+  """
+
+  def __init__(self, mem, ex, parse_ctx, word_ev, splitter, errfmt):
+    self.mem = mem
+    self.ex = ex
+    self.parse_ctx = parse_ctx
+    self.word_ev = word_ev
+    self.splitter = splitter
+    self.errfmt = errfmt
+
+    # Set by Init()
+    self.comp_lookup = None
+    self.compopt_state = None
+    self.builtins = None
+
+  def Init(self):
+    if self.builtins is not None:
+      return
+
+    from core import completion
+    from osh import builtin_comp
+
+    self.comp_lookup = completion.Lookup()
+    # Global state to work around readline interfaces
+    self.compopt_state = completion.OptionState()
+
+    spec_builder = builtin_comp.SpecBuilder(self.ex, self.parse_ctx,
+                                            self.word_ev, self.splitter,
+                                            self.comp_lookup)
+    self.builtins = {
+        builtin_e.COMPLETE: builtin_comp.Complete(spec_builder,
+                                                  self.comp_lookup),
+        builtin_e.COMPGEN: builtin_comp.CompGen(spec_builder),
+        builtin_e.COMPOPT: builtin_comp.CompOpt(self.compopt_state,
+                                                self.errfmt),
+        builtin_e.COMPADJUST: builtin_comp.CompAdjust(self.mem),
+    }
+
+  def Builtin(self, builtin_id):
+    self.Init()
+    return self.builtins[builtin_id]
+
+
+class _LazyCompletionBuiltin(object):
+  """Stands in for a completion builtin until it's first run."""
+
+  def __init__(self, comp_deps, builtin_id):
+    self.comp_deps = comp_deps
+    self.builtin_id = builtin_id
+
+  def __call__(self, arg_vec):
+    return self.comp_deps.Builtin(self.builtin_id)(arg_vec)
+
+
 def _InitDefaultCompletions(ex, complete_builtin, comp_lookup):
+  from core import completion
+
   # register builtins and words
   complete_builtin(_MakeArgVector(['-E', '-A', 'command']))
   # register path completion
@@ -180,6 +253,8 @@ def _MaybeWriteHistoryFile(history_filename):
 
 
 def _InitReadline(readline_mod, history_filename, root_comp, display, debug_f):
+  from core import completion
+
   assert readline_mod
 
   try:
@@ -294,6 +369,11 @@ def ShellMain(lang, argv0, argv, login_shell):
     _ShowVersion()
     return 0
 
+  if opts.server:
+    # Each request runs main() in a forked child, which parses its own argv.
+    from core import zygote
+    return zygote.Serve(opts.server, lambda argv: main([argv0] + argv))
+
   if arg_r.AtEnd():
     dollar0 = argv0
     has_main = False
@@ -301,7 +381,8 @@ def ShellMain(lang, argv0, argv, login_shell):
     dollar0 = arg_r.Peek()  # the script name, or the arg after -c
     has_main = True
 
-  arena = alloc.Arena()
+  arena = alloc.CompactArena()
+  arena.discard = bool(opts.discard_arena)
   errfmt = ui.ErrorFormatter(arena)
 
   # NOTE: has_main is only for ${BASH_SOURCE[@} and family.  Could be a
@@ -324,30 +405,16 @@ def ShellMain(lang, argv0, argv, login_shell):
   builtin_pure.SetExecOpts(exec_opts, opts.opt_changes, opts.shopt_changes)
   aliases = {}  # feedback between runtime and parser
 
-  oil_grammar = meta.LoadOilGrammar(loader)
+  # Only loaded if we parse an Oil expression.
+  oil_grammar = meta.LazyOilGrammar(loader)
 
   if opts.one_pass_parse and not exec_opts.noexec:
     raise args.UsageError('--one-pass-parse requires noexec (-n)')
   parse_ctx = parse_lib.ParseContext(arena, parse_opts, aliases, oil_grammar,
                                      one_pass_parse=opts.one_pass_parse)
 
-  # Three ParseContext instances SHARE aliases.
-  comp_arena = alloc.Arena()
-  comp_arena.PushSource(source.Unused('completion'))
-  trail1 = parse_lib.Trail()
-  # one_pass_parse needs to be turned on to complete inside backticks.  TODO:
-  # fix the issue where ` gets erased because it's not part of
-  # set_completer_delims().
-  comp_ctx = parse_lib.ParseContext(comp_arena, parse_opts, aliases,
-                                    oil_grammar, trail=trail1,
-                                    one_pass_parse=True)
-
-  hist_arena = alloc.Arena()
-  hist_arena.PushSource(source.Unused('history'))
-  trail2 = parse_lib.Trail()
-  hist_ctx = parse_lib.ParseContext(hist_arena, parse_opts, aliases,
-                                    oil_grammar, 
-                                    trail=trail2)
+  # The interactive shell makes two more ParseContext instances, for
+  # completion and history.  All three SHARE aliases.
 
   # Deps helps manages dependencies.  These dependencies are circular:
   # - ex and word_ev, arith_ev -- for command sub, arith sub
@@ -404,6 +471,18 @@ def ShellMain(lang, argv0, argv, login_shell):
   exec_deps.ext_prog = process.ExternalProgram(interp, fd_state,
                                                exec_deps.search_path,
                                                errfmt, debug_f)
+  # OSH_SPAWN=0 uses fork() for every external command, for benchmarks.
+  exec_deps.ext_prog.use_spawn = posix.environ.get('OSH_SPAWN') != '0'
+
+  # Opt-in cache of parsed files for the 'source' builtin.
+  if posix.environ.get('OSH_SOURCE_CACHE') == '1':
+    cache_dir = posix.environ.get('OSH_SOURCE_CACHE_DIR')
+    if cache_dir is None:
+      home_dir = process.GetHomeDir()
+      cache_dir = os_path.join(home_dir, '.cache/oil/source') if home_dir else ''
+    from core import source_cache
+    exec_deps.source_cache = source_cache.SourceCache(arena, parse_ctx,
+                                                      cache_dir)
 
   splitter = split.SplitContext(mem)
   exec_deps.splitter = splitter
@@ -423,13 +502,6 @@ def ShellMain(lang, argv0, argv, login_shell):
     trace_f = util.DebugFile(sys.stderr)
   exec_deps.trace_f = trace_f
 
-  comp_lookup = completion.Lookup()
-
-  # Various Global State objects to work around readline interfaces
-  compopt_state = completion.OptionState()
-  comp_ui_state = comp_ui.State()
-  prompt_state = comp_ui.PromptState()
-
   dir_stack = state.DirStack()
 
   new_var = builtin_assign.NewVar(mem, procs, errfmt)
@@ -444,13 +516,10 @@ def ShellMain(lang, argv0, argv, login_shell):
       builtin_e.PWD: builtin.Pwd(mem, errfmt),
 
       builtin_e.READ: builtin.Read(splitter, mem),
+      builtin_e.MAPFILE: builtin.MapFile(mem, errfmt),
       builtin_e.HELP: builtin.Help(loader, errfmt),
       builtin_e.HISTORY: builtin.History(line_input),
 
-      # Completion (more added below)
-      builtin_e.COMPOPT: builtin_comp.CompOpt(compopt_state, errfmt),
-      builtin_e.COMPADJUST: builtin_comp.CompAdjust(mem),
-
       # test / [ differ by need_right_bracket
       builtin_e.TEST: builtin_bracket.Test(False, errfmt),
       builtin_e.BRACKET: builtin_bracket.Test(True, errfmt),
@@ -524,13 +593,12 @@ def ShellMain(lang, argv0, argv, login_shell):
 
   word_ev.expr_ev = expr_ev
 
-  spec_builder = builtin_comp.SpecBuilder(ex, parse_ctx, word_ev, splitter,
-                                          comp_lookup)
-
   # Add some builtins that depend on the executor!
-  complete_builtin = builtin_comp.Complete(spec_builder, comp_lookup)
-  builtins[builtin_e.COMPLETE] = complete_builtin
-  builtins[builtin_e.COMPGEN] = builtin_comp.CompGen(spec_builder)
+  comp_deps = _CompletionDeps(mem, ex, parse_ctx, word_ev, splitter, errfmt)
+  for builtin_id in (builtin_e.COMPLETE, builtin_e.COMPGEN, builtin_e.COMPOPT,
+                     builtin_e.COMPADJUST):
+    builtins[builtin_id] = _LazyCompletionBuiltin(comp_deps, builtin_id)
+
   builtins[builtin_e.CD] = builtin.Cd(mem, dir_stack, ex, errfmt)
   builtins[builtin_e.JSON] = builtin_oil.Json(mem, ex, errfmt)
 
@@ -544,6 +612,7 @@ def ShellMain(lang, argv0, argv, login_shell):
   if lang == 'oil':
     # The Oil executor wraps an OSH executor?  It needs to be able to source
     # it.
+    from oil_lang import cmd_exec as oil_cmd_exec
     ex = oil_cmd_exec.OilExecutor(ex)
 
   # PromptEvaluator rendering is needed in non-interactive shells for @P.
@@ -551,9 +620,6 @@ def ShellMain(lang, argv0, argv, login_shell):
   exec_deps.prompt_ev = prompt_ev
   word_ev.prompt_ev = prompt_ev  # HACK for circular deps
 
-  # History evaluation is a no-op if line_input is None.
-  hist_ev = history.Evaluator(line_input, hist_ctx, debug_f)
-
   if opts.c is not None:
     arena.PushSource(source.CFlag())
     line_reader = reader.StringLineReader(opts.c, arena)
@@ -562,9 +628,7 @@ def ShellMain(lang, argv0, argv, login_shell):
 
   elif opts.i:  # force interactive
     arena.PushSource(source.Stdin(' -i'))
-    line_reader = reader.InteractiveLineReader(arena, prompt_ev, hist_ev,
-                                               line_input, prompt_state,
-                                               sig_state)
+    line_reader = None  # InteractiveLineReader created below
     exec_opts.interactive = True
 
   else:
@@ -573,9 +637,7 @@ def ShellMain(lang, argv0, argv, login_shell):
     except IndexError:
       if sys.stdin.isatty():
         arena.PushSource(source.Interactive())
-        line_reader = reader.InteractiveLineReader(arena, prompt_ev, hist_ev,
-                                                   line_input, prompt_state,
-                                                   sig_state)
+        line_reader = None  # InteractiveLineReader created below
         exec_opts.interactive = True
       else:
         arena.PushSource(source.Stdin(''))
@@ -590,6 +652,28 @@ def ShellMain(lang, argv0, argv, login_shell):
         return 1
       line_reader = reader.FileLineReader(f, arena)
 
+  if exec_opts.interactive:
+    from core import comp_ui
+
+    # Various Global State objects to work around readline interfaces
+    comp_ui_state = comp_ui.State()
+    prompt_state = comp_ui.PromptState()
+
+    if line_reader is None:
+      from osh import history
+
+      hist_arena = alloc.Arena()
+      hist_arena.PushSource(source.Unused('history'))
+      trail2 = parse_lib.Trail()
+      hist_ctx = parse_lib.ParseContext(hist_arena, parse_opts, aliases,
+                                        oil_grammar, trail=trail2)
+
+      # History evaluation is a no-op if line_input is None.
+      hist_ev = history.Evaluator(line_input, hist_ctx, debug_f)
+      line_reader = reader.InteractiveLineReader(arena, prompt_ev, hist_ev,
+                                                 line_input, prompt_state,
+                                                 sig_state)
+
   # TODO: assert arena.NumSourcePaths() == 1
   # TODO: .rc file needs its own arena.
   if lang == 'osh':
@@ -610,9 +694,23 @@ def ShellMain(lang, argv0, argv, login_shell):
     history_filename = os_path.join(home_dir, '.config/oil', 'history_' + lang)
 
     if line_input:
+      from core import completion
+
+      comp_arena = alloc.Arena()
+      comp_arena.PushSource(source.Unused('completion'))
+      trail1 = parse_lib.Trail()
+      # one_pass_parse needs to be turned on to complete inside backticks.
+      # TODO: fix the issue where ` gets erased because it's not part of
+      # set_completer_delims().
+      comp_ctx = parse_lib.ParseContext(comp_arena, parse_opts, aliases,
+                                        oil_grammar, trail=trail1,
+                                        one_pass_parse=True)
+
       # NOTE: We're using a different WordEvaluator here.
       ev = word_eval.CompletionWordEvaluator(mem, exec_opts, exec_deps, arena)
-      root_comp = completion.RootCompleter(ev, mem, comp_lookup, compopt_state,
+      comp_deps.Init()
+      root_comp = completion.RootCompleter(ev, mem, comp_deps.comp_lookup,
+                                           comp_deps.compopt_state,
                                            comp_ui_state, comp_ctx, debug_f)
 
       term_width = 0
@@ -629,7 +727,8 @@ def ShellMain(lang, argv0, argv, login_shell):
         display = comp_ui.MinimalDisplay(comp_ui_state, prompt_state, debug_f)
 
       _InitReadline(line_input, history_filename, root_comp, display, debug_f)
-      _InitDefaultCompletions(ex, complete_builtin, comp_lookup)
+      _InitDefaultCompletions(ex, comp_deps.Builtin(builtin_e.COMPLETE),
+                              comp_deps.comp_lookup)
 
     else:  # Without readline module
       display = comp_ui.MinimalDisplay(comp_ui_state, prompt_state, debug_f)
@@ -737,7 +836,7 @@ def OshCommandMain(argv):
   if action not in SUBCOMMANDS:
     raise args.UsageError('Invalid subcommand %r.' % action)
 
-  arena = alloc.Arena()
+  arena = alloc.CompactArena()
   try:
     script_name = argv[1]
     arena.PushSource(source.MainFile(script_name))
@@ -787,6 +886,9 @@ def OshCommandMain(argv):
 
   # stderr: show how we're following imports?
 
+  from tools import deps
+  from tools import osh2oil
+
   if action == 'translate':
     osh2oil.PrintAsOil(arena, node)
 
@@ -874,6 +976,7 @@ def AppBundleMain(argv):
   elif main_name == 'false':
     return 1
   elif main_name == 'readlink':
+    from tools import readlink
     return readlink.main(main_argv)
   else:
     raise args.UsageError('Invalid applet name %r.' % main_name)
@@ -9,15 +9,40 @@ have already executed.  Each statement/function can be parsed into a separate
 Arena, and the entire Arena can be discarded at once.
 
 Also, we don't want to save comment lines.
+
+What's implemented is a variant of that in a single Arena.  When 'discard' is
+set, main_loop wraps each top-level command in a "generation": the lines and
+spans added while it's parsed and run.  Things that outlive the command, like
+function bodies and traps, Pin() the open generations.  An unpinned generation
+is always at the end of the Arena when it ends, so we truncate it, and the
+span IDs are reused.
+
+A generation that's unpinned after it ends (e.g. a function is redefined) is
+usually in the middle of the Arena.  Its line strings are freed, but the IDs
+aren't reused.  CompactArena frees whole pages of them.
 """
 
+import array
+
 from _devbuild.gen.syntax_asdl import (
     line_span, source_t, source__CFlag, source__MainFile, source__SourcedFile
 )
 from asdl import const
 from core.util import log
 
-from typing import List, Dict
+from typing import List, Dict, Tuple, Callable, Any
+
+
+class _Generation(object):
+  """The lines and spans added while one command is parsed and run."""
+
+  def __init__(self, line_begin, span_begin):
+    # type: (int, int) -> None
+    self.line_begin = line_begin
+    self.span_begin = span_begin
+    self.line_end = -1  # -1 while it's open
+    self.span_end = -1
+    self.num_pins = 0
 
 
 class Arena(object):
@@ -42,6 +67,14 @@ class Arena(object):
     # reuse these instances in many line_span instances
     self.source_instances = []  # type: List[source_t]
 
+    self._InitDiscard()
+
+  def _InitDiscard(self):
+    # type: () -> None
+    self.discard = False  # set by bin/oil.py
+    self.generations = []  # type: List[_Generation]  # the open ones
+    self.pins = {}  # type: Dict[Any, List[_Generation]]
+
   def PushSource(self, src):
     # type: (source_t) -> None
     self.source_instances.append(src)
@@ -62,6 +95,11 @@ class Arena(object):
     self.line_srcs.append(self.source_instances[-1])
     return line_id
 
+  def LastLineId(self):
+    # type: () -> int
+    """Return one past the last line ID."""
+    return len(self.line_vals)
+
   def GetLine(self, line_id):
     # type: (int) -> str
     assert line_id >= 0, line_id
@@ -78,7 +116,7 @@ class Arena(object):
   # iterations.
   def GetLineNumStr(self, line_id):
     # type: (int) -> str
-    line_num = self.line_nums[line_id]
+    line_num = self.GetLineNumber(line_id)
     try:
       return self.line_num_strs[line_num]
     except KeyError:
@@ -93,7 +131,7 @@ class Arena(object):
   def GetLineSourceString(self, line_id):
     # type: (int) -> str
     """Returns a human-readable string for dev tools."""
-    src = self.line_srcs[line_id]
+    src = self.GetLineSource(line_id)
 
     # TODO: Make it look nicer, like core/ui.py.
     if isinstance(src, source__CFlag):
@@ -126,3 +164,296 @@ class Arena(object):
     # type: () -> int
     """Return one past the last span ID."""
     return len(self.spans)
+
+  def _Truncate(self, line_id, span_id):
+    # type: (int, int) -> None
+    del self.line_vals[line_id:]
+    del self.line_nums[line_id:]
+    del self.line_srcs[line_id:]
+    del self.spans[span_id:]
+
+  def _Clear(self, g):
+    # type: (_Generation) -> None
+    """Free what we can without changing any IDs."""
+    for line_id in xrange(g.line_begin, g.line_end):
+      self.line_vals[line_id] = ''
+      self.line_srcs[line_id] = None  # type: ignore
+    for span_id in xrange(g.span_begin, g.span_end):
+      self.spans[span_id] = None  # type: ignore
+
+  def BeginGeneration(self):
+    # type: () -> None
+    """Called before a top-level command is parsed.  No-op unless discarding."""
+    if self.discard:
+      self.generations.append(
+          _Generation(self.LastLineId(), self.LastSpanId()))
+
+  def EndGeneration(self):
+    # type: () -> None
+    """Called after it's run.  Truncates the Arena unless it was pinned."""
+    if not self.discard:
+      return
+    g = self.generations.pop()
+    g.line_end = self.LastLineId()
+    g.span_end = self.LastSpanId()
+    if g.num_pins == 0:
+      self._Truncate(g.line_begin, g.span_begin)
+
+  def Pin(self, key):
+    # type: (Any) -> None
+    """Keep the lines and spans of the open generations.
+
+    Call this when a node is saved past the end of the command, e.g. a
+    function body.  Pinning the same key again releases the old generations,
+    e.g. when the function is redefined.
+    """
+    if not self.generations:
+      return
+    gens = list(self.generations)
+    for g in gens:
+      g.num_pins += 1
+    old = self.pins.get(key)
+    self.pins[key] = gens
+    if old is not None:
+      self._Unpin(old)
+
+  def _Unpin(self, gens):
+    # type: (List[_Generation]) -> None
+    # Outermost first, so an inner generation is already gone when we get to
+    # it.
+    for g in gens:
+      g.num_pins -= 1
+      if g.num_pins != 0 or g.line_end == -1:  # still pinned, or open
+        continue
+
+      last_line_id = self.LastLineId()
+      last_span_id = self.LastSpanId()
+      if g.line_begin >= last_line_id and g.span_begin >= last_span_id:
+        continue  # an enclosing generation was truncated
+      if g.line_end == last_line_id and g.span_end == last_span_id:
+        self._Truncate(g.line_begin, g.span_begin)
+      else:
+        self._Clear(g)
+
+
+_PAGE_BITS = 10
+_PAGE_SIZE = 1 << _PAGE_BITS
+_PAGE_MASK = _PAGE_SIZE - 1
+
+
+def _TruncatePages(pages, num_cleared, new_len, empty_page):
+  # type: (List[Any], List[int], int, Callable[[int], Any]) -> Any
+  """Remove the entries at new_len and after.
+
+  Column 1 of each page is an array('i') where -1 marks a cleared entry.
+
+  Returns:
+    The last page, or None.
+  """
+  n = new_len >> _PAGE_BITS
+  i = new_len & _PAGE_MASK
+  if i == 0:
+    del pages[n:]
+    del num_cleared[n:]
+    return pages[-1] if pages else None
+
+  del pages[n+1:]
+  del num_cleared[n+1:]
+  page = pages[n]
+  if page is None:
+    # The page was freed, so everything before new_len in it is cleared.
+    page = empty_page(i)
+    pages[n] = page
+    num_cleared[n] = i
+  else:
+    num_cleared[n] -= page[1][i:].count(-1)
+    for col in page:
+      del col[i:]
+  return page
+
+
+def _EmptyLinePage(n):
+  # type: (int) -> Tuple[List[str], array.array, List[source_t]]
+  return [''] * n, array.array('i', [-1] * n), [None] * n  # type: ignore
+
+
+def _EmptySpanPage(n):
+  # type: (int) -> Tuple[array.array, array.array, array.array]
+  return (array.array('i', [0] * n), array.array('i', [-1] * n),
+          array.array('i', [0] * n))
+
+
+class CompactArena(Arena):
+  """An Arena that stores spans in array('i') columns.
+
+  A line_span object costs about 80 bytes, and there's one for every token.
+  This stores 12 bytes per span, and creates line_span objects on demand in
+  GetLineSpan().  The line numbers are also stored in an array.
+
+  Lines and spans are stored in pages of 1024, so that with 'discard', a
+  generation that's released in the middle of the Arena frees its pages.
+
+  It has the same API as Arena, except that there's no 'spans' list.
+  """
+  def __init__(self):
+    # type: () -> None
+    self.line_num_strs = {}  # type: Dict[int, str]  # an INTERN table
+    self.source_instances = []  # type: List[source_t]
+
+    # Each page is a tuple of parallel columns, or None if it was freed.
+    # Lines: (line_vals, line_nums, line_srcs)
+    self.line_pages = []  # type: List[Any]
+    self.line_pages_cleared = []  # type: List[int]
+    self.num_lines = 0
+
+    # Spans: (cols, line_ids, lengths)
+    self.span_pages = []  # type: List[Any]
+    self.span_pages_cleared = []  # type: List[int]
+    self.num_spans = 0
+
+    # The columns of the last page, which we append to.
+    self.line_vals = None  # type: List[str]
+    self.line_nums = None  # type: array.array
+    self.line_srcs = None  # type: List[source_t]
+    self.span_cols = None  # type: array.array
+    self.span_line_ids = None  # type: array.array
+    self.span_lengths = None  # type: array.array
+
+    self._InitDiscard()
+
+  def _SetLinePage(self, page):
+    # type: (Any) -> None
+    if page is None:
+      self.line_vals = self.line_nums = self.line_srcs = None
+    else:
+      self.line_vals, self.line_nums, self.line_srcs = page
+
+  def _SetSpanPage(self, page):
+    # type: (Any) -> None
+    if page is None:
+      self.span_cols = self.span_line_ids = self.span_lengths = None
+    else:
+      self.span_cols, self.span_line_ids, self.span_lengths = page
+
+  def AddLine(self, line, line_num):
+    # type: (str, int) -> int
+    """Save a physical line and return a line_id for later retrieval.
+
+    The line number is 1-based.
+    """
+    line_id = self.num_lines
+    if line_id & _PAGE_MASK == 0:
+      page = _EmptyLinePage(0)
+      self.line_pages.append(page)
+      self.line_pages_cleared.append(0)
+      self._SetLinePage(page)
+
+    self.line_vals.append(line)
+    self.line_nums.append(line_num)
+    self.line_srcs.append(self.source_instances[-1])
+    self.num_lines = line_id + 1
+    return line_id
+
+  def LastLineId(self):
+    # type: () -> int
+    """Return one past the last line ID."""
+    return self.num_lines
+
+  def _LinePage(self, line_id):
+    # type: (int) -> Any
+    assert line_id >= 0, line_id
+    page = self.line_pages[line_id >> _PAGE_BITS]
+    assert page is not None, 'Line %d was discarded' % line_id
+    return page
+
+  def GetLine(self, line_id):
+    # type: (int) -> str
+    return self._LinePage(line_id)[0][line_id & _PAGE_MASK]
+
+  def GetLineNumber(self, line_id):
+    # type: (int) -> int
+    return self._LinePage(line_id)[1][line_id & _PAGE_MASK]
+
+  def GetLineSource(self, line_id):
+    # type: (int) -> source_t
+    return self._LinePage(line_id)[2][line_id & _PAGE_MASK]
+
+  def AddLineSpan(self, line_id, col, length):
+    # type: (int, int, int) -> int
+    """Save a line_span and return a new span ID for later retrieval."""
+    span_id = self.num_spans
+    if span_id & _PAGE_MASK == 0:
+      page = _EmptySpanPage(0)
+      self.span_pages.append(page)
+      self.span_pages_cleared.append(0)
+      self._SetSpanPage(page)
+
+    self.span_cols.append(col)
+    self.span_line_ids.append(line_id)
+    self.span_lengths.append(length)
+    self.num_spans = span_id + 1
+    return span_id
+
+  def GetLineSpan(self, span_id):
+    # type: (int) -> line_span
+    assert span_id != const.NO_INTEGER, span_id
+    if span_id >= self.num_spans:
+      log('Span ID out of range: %d is greater than %d', span_id,
+          self.num_spans)
+      raise IndexError(span_id)
+    page = self.span_pages[span_id >> _PAGE_BITS]
+    assert page is not None, 'Span %d was discarded' % span_id
+    i = span_id & _PAGE_MASK
+    return line_span(page[1][i], page[0][i], page[2][i])
+
+  def LastSpanId(self):
+    # type: () -> int
+    """Return one past the last span ID."""
+    return self.num_spans
+
+  def _Truncate(self, line_id, span_id):
+    # type: (int, int) -> None
+    page = _TruncatePages(self.line_pages, self.line_pages_cleared, line_id,
+                          _EmptyLinePage)
+    self._SetLinePage(page)
+    self.num_lines = line_id
+
+    page = _TruncatePages(self.span_pages, self.span_pages_cleared, span_id,
+                          _EmptySpanPage)
+    self._SetSpanPage(page)
+    self.num_spans = span_id
+
+  def _Clear(self, g):
+    # type: (_Generation) -> None
+    """Mark the entries as cleared, and free pages that are all cleared."""
+    pages = self.line_pages
+    num_cleared = self.line_pages_cleared
+    for line_id in xrange(g.line_begin, g.line_end):
+      n = line_id >> _PAGE_BITS
+      page = pages[n]
+      if page is None:
+        continue
+      i = line_id & _PAGE_MASK
+      if page[1][i] == -1:
+        continue  # an inner generation was cleared
+      page[0][i] = ''
+      page[1][i] = -1
+      page[2][i] = None
+      num_cleared[n] += 1
+      if num_cleared[n] == _PAGE_SIZE:
+        pages[n] = None
+
+    pages = self.span_pages
+    num_cleared = self.span_pages_cleared
+    for span_id in xrange(g.span_begin, g.span_end):
+      n = span_id >> _PAGE_BITS
+      page = pages[n]
+      if page is None:
+        continue
+      i = span_id & _PAGE_MASK
+      if page[1][i] == -1:
+        continue
+      page[1][i] = -1
+      num_cleared[n] += 1
+      if num_cleared[n] == _PAGE_SIZE:
+        pages[n] = None
@@ -55,6 +55,141 @@ class AllocTest(unittest.TestCase):
     self.assertEqual('one.oil', arena.GetLineSource(id3).path)
     self.assertEqual(3, arena.GetLineNumber(id3))
 
+  def _AddCommand(self, line):
+    """Add a line with one span, like parsing a top-level command."""
+    arena = self.arena
+    line_id = arena.AddLine(line, 1)
+    arena.AddLineSpan(line_id, 0, len(line))
+
+  def testGenerations(self):
+    arena = self.arena
+    arena.PushSource(source.MainFile('one.oil'))
+    self._AddCommand('echo first')
+
+    # Not discarding
+    arena.BeginGeneration()
+    self._AddCommand('echo 1')
+    arena.EndGeneration()
+    self.assertEqual(2, arena.LastSpanId())
+
+    arena.discard = True
+
+    # An unpinned generation is truncated, and the IDs are reused.
+    arena.BeginGeneration()
+    self._AddCommand('echo 2')
+    arena.EndGeneration()
+    self.assertEqual(2, arena.LastLineId())
+    self.assertEqual(2, arena.LastSpanId())
+
+    # f() { echo f1; } is pinned.
+    arena.BeginGeneration()
+    self._AddCommand('f() { echo f1; }')
+    arena.Pin(('proc', 'f'))
+    arena.EndGeneration()
+    self.assertEqual(3, arena.LastSpanId())
+    self.assertEqual('f() { echo f1; }', arena.GetLine(2))
+
+    # Pinning outside a generation does nothing.
+    arena.Pin(('proc', 'f'))
+
+    arena.BeginGeneration()
+    self._AddCommand('g() { echo g; }')
+    arena.Pin(('proc', 'g'))
+    arena.EndGeneration()
+
+    # Redefining f releases the first definition, in the middle of the Arena.
+    arena.BeginGeneration()
+    self._AddCommand('f() { echo f2; }')
+    arena.Pin(('proc', 'f'))
+    arena.EndGeneration()
+    self.assertEqual(5, arena.LastSpanId())
+    self.assertEqual('', arena.GetLine(2))
+    self.assertEqual('g() { echo g; }', arena.GetLine(3))
+
+    # Redefining g in a nested generation releases everything at the end.
+    arena.BeginGeneration()
+    self._AddCommand('g() { echo g2; }')
+    arena.BeginGeneration()
+    self._AddCommand('echo nested')
+    arena.Pin(('proc', 'g'))
+    arena.EndGeneration()
+    self.assertEqual(7, arena.LastSpanId())
+    arena.EndGeneration()
+    self.assertEqual(7, arena.LastSpanId())
+
+    arena.BeginGeneration()
+    self._AddCommand('g() { echo g3; }')
+    arena.Pin(('proc', 'g'))
+    arena.EndGeneration()
+    self.assertEqual(8, arena.LastSpanId())
+    self.assertEqual('g() { echo g3; }', arena.GetLine(7))
+
+    arena.PopSource()
+
+
+class CompactArenaTest(AllocTest):
+  """Run the same tests on CompactArena."""
+
+  def setUp(self):
+    self.arena = alloc.CompactArena()
+
+  def testLineSpans(self):
+    arena = self.arena
+    arena.PushSource(source.MainFile('one.oil'))
+    arena.AddLine('echo hi', 1)
+    arena.PopSource()
+
+    self.assertEqual(0, arena.LastSpanId())
+    self.assertEqual(0, arena.AddLineSpan(0, 0, 4))
+    self.assertEqual(1, arena.AddLineSpan(0, 5, 2))
+    self.assertEqual(2, arena.LastSpanId())
+
+    span = arena.GetLineSpan(1)
+    self.assertEqual((0, 5, 2), (span.line_id, span.col, span.length))
+    self.assertRaises(IndexError, arena.GetLineSpan, 2)
+
+  def testPages(self):
+    arena = self.arena
+    arena.discard = True
+    arena.PushSource(source.MainFile('one.oil'))
+    n = alloc._PAGE_SIZE
+
+    # Three pages of a pinned function
+    arena.BeginGeneration()
+    for i in xrange(n * 3):
+      self._AddCommand('echo %d' % i)
+    arena.Pin(('proc', 'f'))
+    arena.EndGeneration()
+
+    arena.BeginGeneration()
+    self._AddCommand('g() { echo g; }')
+    arena.Pin(('proc', 'g'))
+    arena.EndGeneration()
+
+    # Redefining f frees its pages.
+    arena.BeginGeneration()
+    self._AddCommand('f() { echo f2; }')
+    arena.Pin(('proc', 'f'))
+    arena.EndGeneration()
+    self.assertEqual([None, None, None], arena.span_pages[:3])
+    self.assertEqual([None, None, None], arena.line_pages[:3])
+    self.assertRaises(AssertionError, arena.GetLineSpan, 0)
+
+    span = arena.GetLineSpan(n * 3 + 1)
+    self.assertEqual('f() { echo f2; }', arena.GetLine(span.line_id))
+    self.assertEqual(n * 3 + 2, arena.LastSpanId())
+
+    # Truncating into a freed page.
+    arena._Truncate(n * 2 + 5, n * 2 + 5)
+    self.assertEqual(n * 2 + 5, arena.LastSpanId())
+    self.assertEqual(n * 2 + 5, arena.LastLineId())
+    self.assertEqual(n * 2 + 5, arena.AddLine('echo new', 1))
+    self.assertEqual(n * 2 + 5, arena.AddLineSpan(n * 2 + 5, 0, 4))
+    self.assertEqual('echo new', arena.GetLine(n * 2 + 5))
+    self.assertEqual(4, arena.GetLineSpan(n * 2 + 5).length)
+
+    arena.PopSource()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -116,7 +116,7 @@ class CompletionTest(unittest.TestCase):
 
   def testExternalCommandAction(self):
     mem = state.Mem('dummy', [], {}, None)
-    a = completion.ExternalCommandAction(mem)
+    a = completion.ExternalCommandAction(state.SearchPath(mem))
     comp = self._CompApi([], 0, 'f')
     print(list(a.Matches(comp)))
 
@@ -193,6 +193,7 @@ class Tracer(object):
       except util.ParseError as e:
         ps4_word = word_.ErrorWord("<ERROR: Can't parse PS4: %s>", e)
       self.parse_cache[ps4] = ps4_word
+      self.parse_ctx.arena.Pin(('PS4', ps4))
 
     #print(ps4_word)
 
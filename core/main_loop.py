@@ -6,8 +6,14 @@ Two variants:
 main_loop.Interactive()
 main_loop.Batch()
 
+BatchAndRecord() and BatchFromNodes() are variants of Batch() for the 'source'
+cache.
+
 They call CommandParser.ParseLogicalLine() and Executor.ExecuteAndCatch().
 
+With --discard-arena, Interactive() and Batch() wrap each command in an Arena
+generation, so the lines and spans are freed after it runs.
+
 Get rid of:
 
 ParseWholeFile() -- needs to check the here doc.
@@ -21,9 +27,10 @@ from _devbuild.gen.syntax_asdl import (
 from core import ui
 from core import util
 
-from typing import Any, Optional, List, TYPE_CHECKING
+from typing import Any, Optional, List, Tuple, Callable, TYPE_CHECKING
 if TYPE_CHECKING:
   from core.alloc import Arena
+  from frontend.reader import FileLineReader
   from core.ui import ErrorFormatter
   from osh.cmd_parse import CommandParser
   # commented out so --strict doesn't follow all
@@ -31,6 +38,16 @@ if TYPE_CHECKING:
   #from osh.cmd_exec import Executor
 
 
+def _EndGeneration(ex, arena):
+  # type: (Any, Arena) -> None
+  if not arena.discard:
+    return
+  arena.EndGeneration()
+  # Don't let $LINENO refer to a discarded span.
+  if ex.mem.CurrentSpanId() >= arena.LastSpanId():
+    ex.mem.ClearCurrentSpanId()
+
+
 def Interactive(opts, ex, c_parser, display, prompt_plugin, errfmt):
   # type: (Any, Any, CommandParser, Any, Any, ErrorFormatter) -> Any
   status = 0
@@ -41,6 +58,7 @@ def Interactive(opts, ex, c_parser, display, prompt_plugin, errfmt):
     # - display.EraseLines() needs to be called BEFORE displaying anything, so
     # it appears in all branches.
 
+    ex.arena.BeginGeneration()  # includes the prompt
     while True:  # ONLY EXECUTES ONCE
       prompt_plugin.Run()
       try:
@@ -105,6 +123,8 @@ def Interactive(opts, ex, c_parser, display, prompt_plugin, errfmt):
 
     display.Reset()  # clears dupes and number of lines last displayed
 
+    _EndGeneration(ex, ex.arena)
+
     # TODO: Replace this with a shell hook?  with 'trap', or it could be just
     # like command_not_found.  The hook can be 'echo $?' or something more
     # complicated, i.e. with timetamps.
@@ -142,6 +162,60 @@ def Batch(ex, c_parser, arena, nodes_out=None):
   - What about $() ?
   """
   status = 0
+  # 'sh -n' keeps the nodes.
+  discard = arena.discard and nodes_out is None
+  while True:
+    if discard:
+      arena.BeginGeneration()
+    try:
+      try:
+        node = c_parser.ParseLogicalLine()  # can raise ParseError
+        if node is None:  # EOF
+          c_parser.CheckForPendingHereDocs()  # can raise ParseError
+          break
+      except util.ParseError as e:
+        ui.PrettyPrintError(e, arena)
+        status = 2
+        break
+
+      if nodes_out is not None:
+        nodes_out.append(node)
+        continue
+
+      #log('parsed %s', node)
+
+      is_return, is_fatal = ex.ExecuteAndCatch(node)
+      status = ex.LastStatus()
+      # e.g. 'return' in middle of script, or divide by zero
+      if is_return or is_fatal:
+        break
+    finally:
+      if discard:
+        _EndGeneration(ex, arena)
+
+  return status
+
+
+def BatchAndRecord(ex, c_parser, line_reader, arena, parse_state_func):
+  # type: (Any, CommandParser, FileLineReader, Arena, Callable[[], Any]) -> Tuple[int, Optional[List[command_t]], List[int]]
+  """Like Batch(), but also return the nodes that were executed.
+
+  For filling the 'source' cache.  The list is None unless the parser reached
+  EOF, since a parse error, 'return', or fatal error leaves it incomplete.
+  It's also None if a command changed what parsing depends on, e.g. with
+  'alias'.  The nodes after it would be wrong when that doesn't happen.
+
+  Args:
+    parse_state_func: returns the aliases and parse options, for comparison.
+
+  Returns:
+    status, nodes, and the line number after each node
+  """
+  status = 0
+  nodes = []  # type: List[command_t]
+  line_nums = []  # type: List[int]
+  parse_state = parse_state_func()
+  recording = True
   while True:
     try:
       node = c_parser.ParseLogicalLine()  # can raise ParseError
@@ -150,22 +224,46 @@ def Batch(ex, c_parser, arena, nodes_out=None):
         break
     except util.ParseError as e:
       ui.PrettyPrintError(e, arena)
-      status = 2
-      break
+      return 2, None, line_nums
+
+    nodes.append(node)
+    line_nums.append(line_reader.line_num)
 
-    if nodes_out is not None:
-      nodes_out.append(node)
-      continue
+    is_return, is_fatal = ex.ExecuteAndCatch(node)
+    status = ex.LastStatus()
+    if is_return or is_fatal:
+      return status, None, line_nums
+    if recording and parse_state_func() != parse_state:
+      recording = False
 
-    #log('parsed %s', node)
+  return status, (nodes if recording else None), line_nums
 
+
+def BatchFromNodes(ex, nodes, line_nums, parse_state_func):
+  # type: (Any, List[command_t], List[int], Callable[[], Any]) -> Tuple[int, int]
+  """Execute nodes that were already parsed, e.g. by a 'source' cache hit.
+
+  Stops for the same reasons that Batch() does.  It also stops if a command
+  changes what parsing depends on, since the rest of the nodes may be wrong.
+
+  Args:
+    line_nums: the line number after each node, from BatchAndRecord()
+    parse_state_func: returns the aliases and parse options, for comparison.
+
+  Returns:
+    status, and the line number to parse the rest of the file from, or -1
+  """
+  status = 0
+  parse_state = parse_state_func()
+  last = len(nodes) - 1
+  for i, node in enumerate(nodes):
     is_return, is_fatal = ex.ExecuteAndCatch(node)
     status = ex.LastStatus()
-    # e.g. 'return' in middle of script, or divide by zero
     if is_return or is_fatal:
       break
-
-  return status
+    if i != last and parse_state_func() != parse_state:
+      return status, line_nums[i]
+  return status, -1
 
 
 def ParseWholeFile(c_parser):
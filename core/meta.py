@@ -117,3 +117,23 @@ def LoadOilGrammar(loader):
   f.close()
   oil_grammar.loads(contents)
   return oil_grammar
+
+
+class LazyOilGrammar(object):
+  """Loads the Oil grammar the first time an Oil expression is parsed.
+
+  Most OSH scripts never parse one, so the shell shouldn't read and unmarshal
+  the tables at startup.  One instance can be shared by several ParseContext
+  instances.
+  """
+
+  def __init__(self, loader):
+    # type: (_ResourceLoader) -> None
+    self.loader = loader
+    self.oil_grammar = None  # type: grammar.Grammar
+
+  def Get(self):
+    # type: () -> grammar.Grammar
+    if self.oil_grammar is None:
+      self.oil_grammar = LoadOilGrammar(self.loader)
+    return self.oil_grammar
@@ -44,6 +44,23 @@ def GetHomeDir():
     return e.pw_dir
 
 
+# The signals that SignalState_AfterForkingChild() resets, for posix_spawn().
+_SPAWN_SIGDEFAULT = [signal.SIGQUIT, signal.SIGPIPE, signal.SIGTSTP]
+
+
+def _FlushStdout():
+  # type: () -> None
+  """Write out Python's stdout buffer before we fork or exec.
+
+  Otherwise the child would inherit the buffer and write it again, or exec()
+  would discard it.
+  """
+  try:
+    sys.stdout.flush()
+  except IOError:
+    pass
+
+
 def SignalState_AfterForkingChild():
   """Not a member of SignalState since we didn't do dependency injection."""
   # Respond to Ctrl-\ (core dump)
@@ -93,6 +110,47 @@ class SignalState(object):
     signal.signal(sig_num, signal.SIG_DFL)
 
 
+# A write of this many bytes to an empty pipe never blocks.  POSIX only
+# guarantees 512, but every Unix we run on has at least a page.
+_PIPE_BUF = 4096
+
+# Linux lets us query and grow the capacity of a pipe.  The fcntl module in
+# Python 2 doesn't have these constants.
+_F_SETPIPE_SZ = 1031
+_F_GETPIPE_SZ = 1032
+
+# Like F_DUPFD, but atomically sets FD_CLOEXEC on the new descriptor.  It's
+# also missing from Python 2.  None means we need F_SETFD.
+_F_DUPFD_CLOEXEC = getattr(
+    fcntl, 'F_DUPFD_CLOEXEC',
+    1030 if sys.platform.startswith('linux') else None)
+
+# The shell's own descriptors start here, above the 0-9 range that users can
+# name in redirects.
+_FIRST_SHELL_FD = 10
+
+
+def _PipeCapacity(fd, want):
+  # type: (int, int) -> int
+  """How many bytes can be written to the empty pipe fd without blocking.
+
+  Tries to grow it to 'want' bytes.  Unprivileged processes can grow a pipe to
+  /proc/sys/fs/pipe-max-size, which is 1 MiB by default.
+  """
+  if want <= _PIPE_BUF or not sys.platform.startswith('linux'):
+    return _PIPE_BUF
+  try:
+    size = fcntl.fcntl(fd, _F_GETPIPE_SZ)
+  except IOError:
+    return _PIPE_BUF
+  if size < want:
+    try:
+      size = fcntl.fcntl(fd, _F_SETPIPE_SZ, want)
+    except IOError:  # EPERM when it's over the limit
+      pass
+  return size
+
+
 class _FdFrame(object):
   def __init__(self):
     self.saved = []
@@ -125,21 +183,23 @@ class FdState(object):
     self.cur_frame = _FdFrame()  # for the top level
     self.stack = [self.cur_frame]
 
-  # TODO: Use fcntl(F_DUPFD) and look at the return value!  I didn't understand
-  # the difference.
+  def _DupHigh(self, fd, cloexec=False):
+    # type: (int, bool) -> int
+    """Copy fd to the lowest free descriptor that's 10 or above.
 
-  def _GetFreeDescriptor(self):
-    """Return a free file descriptor above 10 that isn't used."""
-    fd = 10
-    while True:
-      try:
-        fcntl.fcntl(fd, fcntl.F_GETFD)
-      except IOError as e:
-        if e.errno == errno.EBADF:
-          break
-      fd += 1
+    The kernel finds the free descriptor, so this is one syscall no matter how
+    many descriptors are open.
+
+    Raises:
+      IOError, e.g. EBADF if fd isn't open.
+    """
+    if cloexec and _F_DUPFD_CLOEXEC is not None:
+      return fcntl.fcntl(fd, _F_DUPFD_CLOEXEC, _FIRST_SHELL_FD)
 
-    return fd
+    new_fd = fcntl.fcntl(fd, fcntl.F_DUPFD, _FIRST_SHELL_FD)
+    if cloexec:
+      fcntl.fcntl(new_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
+    return new_fd
 
   def Open(self, path, mode='r'):
     """Opens a path for read, but moves it out of the reserved 3-9 fd range.
@@ -158,8 +218,7 @@ class FdState(object):
       raise AssertionError(mode)
 
     fd = posix.open(path, fd_mode, 0o666)  # may raise OSError
-    new_fd = self._GetFreeDescriptor()
-    posix.dup2(fd, new_fd)
+    new_fd = self._DupHigh(fd)
     posix.close(fd)
     try:
       f = posix.fdopen(new_fd, mode)  # Might raise IOError
@@ -175,11 +234,10 @@ class FdState(object):
     Returns:
       success Bool
     """
-    new_fd = self._GetFreeDescriptor()
     #log('---- _PushDup %s %s', fd1, fd2)
     need_restore = True
     try:
-      fcntl.fcntl(fd2, fcntl.F_DUPFD, new_fd)
+      new_fd = self._DupHigh(fd2, cloexec=True)
     except IOError as e:
       # Example program that causes this error: exec 4>&1.  Descriptor 4 isn't
       # open.
@@ -191,7 +249,6 @@ class FdState(object):
         raise
     else:
       posix.close(fd2)
-      fcntl.fcntl(new_fd, fcntl.F_SETFD, fcntl.FD_CLOEXEC)
 
     #log('==== dup %s %s\n' % (fd1, fd2))
     try:
@@ -201,8 +258,9 @@ class FdState(object):
       self.errfmt.Print('%d: %s', fd1, posix.strerror(e.errno))
 
       # Restore and return error
-      posix.dup2(new_fd, fd2)
-      posix.close(new_fd)
+      if need_restore:
+        posix.dup2(new_fd, fd2)
+        posix.close(new_fd)
       # Undo it
       return False
 
@@ -242,6 +300,14 @@ class FdState(object):
             span_id=r.op_spid)
         return False
 
+      # open() returns the lowest free descriptor, which can be the one we're
+      # redirecting, e.g. 'exec 3>out.txt' when 3 isn't open.  Move it out of
+      # the way so we can dup it onto r.fd.
+      if target_fd == r.fd:
+        fd = target_fd
+        target_fd = self._DupHigh(fd)
+        posix.close(fd)
+
       # Apply redirect
       if not self._PushDup(target_fd, r.fd):
         ok = False
@@ -294,14 +360,15 @@ class FdState(object):
       # get a "broken pipe".
       self._PushClose(read_fd)
 
-      thunk = _HereDocWriterThunk(write_fd, r.body)
-
-      # TODO: Use PIPE_SIZE to save a process in the case of small here docs,
-      # which are the common case.  (dash does this.)
-      start_process = True
-      #start_process = False
+      # Like dash, write a body that fits in the pipe ourselves.  It's the
+      # common case, and saves a process.  Writing a bigger body would block
+      # until the command reads it, so it needs a writer process.
+      if len(r.body) <= _PipeCapacity(write_fd, len(r.body)):
+        posix.write(write_fd, r.body)  # can't block
+        posix.close(write_fd)
 
-      if start_process:
+      else:
+        thunk = _HereDocWriterThunk(write_fd, r.body, [read_fd, r.fd])
         here_proc = Process(thunk, self.job_state)
 
         # NOTE: we could close the read pipe here, but it doesn't really
@@ -313,10 +380,6 @@ class FdState(object):
         # Now that we've started the child, close it in the parent.
         posix.close(write_fd)
 
-      else:
-        posix.write(write_fd, r.body)
-        posix.close(write_fd)
-
     return ok
 
   def Push(self, redirects, waiter):
@@ -429,6 +492,24 @@ class ExternalProgram(object):
     self.search_path = search_path
     self.errfmt = errfmt
     self.debug_f = debug_f
+    self.use_spawn = True  # set by bin/oil.py
+
+  def Spawn(self, argv0_path, arg_vec, environ):
+    """Start a process with posix_spawn(), instead of fork() and exec().
+
+    Returns:
+      The PID, or -1 on failure.  The caller then uses fork(), and Exec()
+      handles the error, e.g. ENOEXEC or EACCES.
+    """
+    if not self.use_spawn:
+      return -1
+    argv = arg_vec.strs
+    if self.hijack_shebang:
+      argv0_path, argv = self._MaybeHijack(argv0_path, argv)
+    try:
+      return posix.spawn(argv0_path, argv, environ, _SPAWN_SIGDEFAULT)
+    except OSError:
+      return -1
 
   def Exec(self, argv0_path, arg_vec, environ):
     """Execute a program and exit this process.
@@ -441,30 +522,35 @@ class ExternalProgram(object):
     self._Exec(argv0_path, arg_vec.strs, arg_vec.spids[0], environ, True)
     # NO RETURN
 
+  def _MaybeHijack(self, argv0_path, argv):
+    try:
+      f = self.fd_state.Open(argv0_path)
+    except OSError as e:
+      pass
+    else:
+      try:
+        # Test if the shebang looks like a shell.  The file might be binary
+        # with no newlines, so read 80 bytes instead of readline().
+        line = f.read(80)
+        if match.ShouldHijack(line):
+          argv = [self.hijack_shebang, argv0_path] + argv[1:]
+          argv0_path = self.hijack_shebang
+          self.debug_f.log('Hijacked: %s', argv)
+        else:
+          #self.debug_f.log('Not hijacking %s (%r)', argv, line)
+          pass
+      finally:
+        f.close()
+    return argv0_path, argv
+
   def _Exec(self, argv0_path, argv, argv0_spid, environ, should_retry):
     if self.hijack_shebang:
-      try:
-        f = self.fd_state.Open(argv0_path)
-      except OSError as e:
-        pass
-      else:
-        try:
-          # Test if the shebang looks like a shell.  The file might be binary
-          # with no newlines, so read 80 bytes instead of readline().
-          line = f.read(80)
-          if match.ShouldHijack(line):
-            argv = [self.hijack_shebang, argv0_path] + argv[1:]
-            argv0_path = self.hijack_shebang
-            self.debug_f.log('Hijacked: %s', argv)
-          else:
-            #self.debug_f.log('Not hijacking %s (%r)', argv, line)
-            pass
-        finally:
-          f.close()
+      argv0_path, argv = self._MaybeHijack(argv0_path, argv)
 
     # TODO: If there is an error, like the file isn't executable, then we should
     # exit, and the parent will reap it.  Should it capture stderr?
 
+    _FlushStdout()
     try:
       posix.execve(argv0_path, argv, environ)
     except OSError as e:
@@ -513,6 +599,14 @@ class Thunk(object):
     """Display for the 'jobs' list."""
     pass
 
+  def Spawn(self):
+    """Start a process without fork(), if possible.
+
+    Returns:
+      The PID, or -1 if the caller should fork() and call Run().
+    """
+    return -1
+
   def __str__(self):
     # For debugging
     return self.DisplayLine()
@@ -535,6 +629,9 @@ class ExternalThunk(Thunk):
     # We could switch the former but I'm not sure it's necessary.
     return '[process] %s' % ' '.join(pretty.Str(a) for a in self.arg_vec.strs)
 
+  def Spawn(self):
+    return self.ext_prog.Spawn(self.argv0_path, self.arg_vec, self.environ)
+
   def Run(self):
     """
     An ExternalThunk is run in parent for the exec builtin.
@@ -582,13 +679,17 @@ class SubProgramThunk(Thunk):
 
 
 class _HereDocWriterThunk(Thunk):
-  """Write a here doc to one end of a pipe.
-
-  May be be executed in either a child process or the main shell process.
-  """
-  def __init__(self, w, body_str):
+  """Write a here doc that doesn't fit in the pipe to one end of it."""
+  def __init__(self, w, body_str, read_fds):
+    """
+    Args:
+      read_fds: Descriptors for the read end, which the child closes.  If it
+        kept them open, it would block forever when the command doesn't read
+        the whole body.
+    """
     self.w = w
     self.body_str = body_str
+    self.read_fds = read_fds
 
   def DisplayLine(self):
     # You can hit Ctrl-Z and the here doc writer will be suspended!  Other
@@ -600,6 +701,9 @@ class _HereDocWriterThunk(Thunk):
     """
     do_exit: For small pipelines
     """
+    for fd in self.read_fds:
+      posix.close(fd)
+
     #log('Writing %r', self.body_str)
     posix.write(self.w, self.body_str)
     #log('Wrote %r', self.body_str)
@@ -695,6 +799,8 @@ class Process(Job):
 
   def Start(self):
     """Start this process with fork(), handling redirects."""
+    _FlushStdout()
+
     # TODO: If OSH were a job control shell, we might need to call some of
     # these here.  They control the distribution of signals, some of which
     # originate from a terminal.  All the processes in a pipeline should be in
@@ -709,6 +815,15 @@ class Process(Job):
     #
     # The whole job control mechanism is complicated and hacky.
 
+    # Fast path for external commands: the redirects were already applied in
+    # the shell, so there's nothing to do in the child.
+    if not self.state_changes:
+      pid = self.thunk.Spawn()
+      if pid != -1:
+        self.pid = pid
+        self.job_state.AddChildProcess(pid, self)
+        return pid
+
     pid = posix.fork()
     if pid < 0:
       # When does this happen?
@@ -939,6 +1054,8 @@ class JobState(object):
     self.last_stopped_pid = None  # for basic 'fg' implementation
     self.job_id = 1  # Strictly increasing
 
+    self.num_started = 0  # for tests and debugging
+
   # TODO: This isn't a PID.  This is a process group ID?
   #
   # What should the table look like?
@@ -989,6 +1106,7 @@ class JobState(object):
     about it so 'jobs' can work.
     """
     self.child_procs[pid] = proc
+    self.num_started += 1
 
   def JobFromPid(self, pid):
     """For wait $PID.
@@ -3,6 +3,7 @@
 process_test.py: Tests for process.py
 """
 
+import fcntl
 import os
 import unittest
 
@@ -84,6 +85,44 @@ class ProcessTest(unittest.TestCase):
     self.assertEqual('one\n', line1)
     self.assertEqual('one\n', line2)
 
+  def testHereDoc(self):
+    waiter = process.Waiter(_JOB_STATE, _EXEC_OPTS)
+    fd_state = process.FdState(_ERRFMT, _JOB_STATE)
+
+    # A small body is written by the shell, and a big one by a process.  The
+    # process must exit even though we only read the first line.
+    big = 'x' * (2 << 20)
+    for body, num_procs in [('small\n', 0), ('big\n' + big, 1)]:
+      num_started = _JOB_STATE.num_started
+      r = redirect.HereDoc(0, body, 0)
+      fd_state.Push([r], waiter)
+      line = builtin.ReadLineFromStdin()
+      fd_state.Pop()
+
+      self.assertEqual(body.splitlines(True)[0], line)
+      self.assertEqual(num_procs, _JOB_STATE.num_started - num_started)
+
+  def testSavedDescriptor(self):
+    waiter = process.Waiter(_JOB_STATE, _EXEC_OPTS)
+    fd_state = process.FdState(_ERRFMT, _JOB_STATE)
+
+    # stdin is saved above the user's range, and closed in children.
+    before = set(os.listdir('/dev/fd'))
+    fd_state.Push([redirect.Path(Id.Redir_Less, 0, '/dev/null')], waiter)
+    saved_fd, fd = fd_state.cur_frame.saved[0]
+    self.assertEqual(0, fd)
+    self.assertGreaterEqual(saved_fd, 10)
+    self.assertTrue(fcntl.fcntl(saved_fd, fcntl.F_GETFD) & fcntl.FD_CLOEXEC)
+    fd_state.Pop()
+    self.assertEqual(before, set(os.listdir('/dev/fd')))
+
+    # open() returns the descriptor we're redirecting when it isn't open.
+    fd = os.open('/dev/null', os.O_RDONLY)  # lowest free descriptor
+    os.close(fd)
+    fd_state.Push([redirect.Path(Id.Redir_Less, fd, '/dev/null')], waiter)
+    self.assertEqual('', os.read(fd, 1))
+    fd_state.Pop()
+
   def testProcess(self):
 
     # 3 fds.  Does Python open it?  Shell seems to have it too.  Maybe it
@@ -0,0 +1,364 @@
+"""
+source_cache.py - Cache the LST of files run with the 'source' builtin.
+
+Scripts often 'source' the same library files over and over, and lexing and
+parsing them dominates the time.  When the cache is enabled, we save the
+top-level command_t nodes of each sourced file, along with the Arena lines and
+spans they refer to.
+
+- In-process: a hit reuses the nodes as is.  Their span IDs are still valid
+  because the file's generation of the Arena is pinned.
+- On disk: a hit appends the saved lines and spans to the current Arena, and
+  relocates the span IDs in the decoded nodes.  Error messages still point to
+  the right file and line.
+
+An entry is only valid for the same (path, mtime, ctime, size, inode, parse
+options, aliases).  We only record files that were parsed all the way to EOF,
+since a parse error or an early 'return' leaves the node list incomplete.
+
+A file can change the aliases or parse options while it runs, and that
+affects how the rest of it is parsed.  So we don't record a file when that
+happens, and when it happens while running cached nodes, the rest of the file
+is parsed again.  Entries store the line after each node for that.
+
+Enable it with OSH_SOURCE_CACHE=1.  The disk store defaults to
+~/.cache/oil/source, and can be changed with OSH_SOURCE_CACHE_DIR.
+"""
+from __future__ import print_function
+
+import marshal
+
+from _devbuild.gen import id_kind_asdl
+from _devbuild.gen import syntax_asdl
+from asdl import const
+from asdl import runtime
+from pylib import os_path
+from pylib import path_stat
+
+import libc
+import posix_ as posix
+
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+if TYPE_CHECKING:
+  from _devbuild.gen.syntax_asdl import command_t, source_t
+  from core.alloc import Arena
+  from frontend.parse_lib import ParseContext
+
+
+# Bump this when the encoding below changes.  Changes to the LST schema are
+# detected by _SchemaFingerprint().
+_FORMAT_VERSION = 2
+
+# Integer fields of syntax_asdl types that hold span IDs, and must be
+# relocated when we decode nodes into a different Arena.
+_SPID_FIELDS = frozenset([
+    'span_id', 'here_end_span_id', 'spid', 'word_spid', 'first_spid',
+    'eval_spid', 'argv0_spid', 'left_spid', 'right_spid',
+])
+_SPID_LIST_FIELDS = frozenset(['spids'])
+
+# Tags for encoded objects.  Lists are encoded as lists, so they don't need
+# one.
+_COMPOUND = 0
+_SIMPLE = 1
+
+
+class _NotCacheable(Exception):
+  """The nodes refer to something we can't save, like a span outside the
+  file."""
+  pass
+
+
+def _SchemaFingerprint():
+  # type: () -> int
+  """A number that changes when the syntax_asdl classes change."""
+  parts = []
+  for name in sorted(dir(syntax_asdl)):
+    cls = getattr(syntax_asdl, name)
+    slots = getattr(cls, '__slots__', None)
+    if isinstance(cls, type) and slots is not None:
+      parts.append((name, tuple(slots)))
+  parts.append(len(id_kind_asdl.Id.__dict__))
+  return hash(tuple(parts))
+
+
+class _Encoder(object):
+  """Turn LST nodes into nested lists and tuples that marshal can save.
+
+  Span IDs are made relative to the first span of the file.
+  """
+
+  def __init__(self, span_begin, span_end):
+    # type: (int, int) -> None
+    self.span_begin = span_begin
+    self.span_end = span_end
+
+  def _Spid(self, spid):
+    # type: (Optional[int]) -> Optional[int]
+    if spid is None or spid == const.NO_INTEGER:
+      return spid
+    if not (self.span_begin <= spid < self.span_end):
+      raise _NotCacheable('span %d is outside the file' % spid)
+    return spid - self.span_begin
+
+  def Encode(self, obj):
+    # type: (Any) -> Any
+    if obj is None or isinstance(obj, (bool, int, long, float, str)):
+      return obj
+
+    if isinstance(obj, list):
+      return [self.Encode(item) for item in obj]
+
+    if isinstance(obj, runtime.SimpleObj):
+      return (_SIMPLE, obj.__class__.__name__, obj.name)
+
+    if isinstance(obj, runtime.CompoundObj):
+      cls_name = obj.__class__.__name__
+      if getattr(syntax_asdl, cls_name, None) is not obj.__class__:
+        raise _NotCacheable('unknown class %s' % cls_name)
+
+      fields = [_COMPOUND, cls_name]
+      for name in obj.__slots__:
+        val = getattr(obj, name)
+        if name in _SPID_FIELDS:
+          fields.append(self._Spid(val))
+        elif name in _SPID_LIST_FIELDS:
+          fields.append([self._Spid(spid) for spid in val])
+        else:
+          fields.append(self.Encode(val))
+      return tuple(fields)
+
+    raise _NotCacheable('unknown object %r' % obj)
+
+
+class _Decoder(object):
+  """The inverse of _Encoder.  Relocates span IDs to the current Arena."""
+
+  def __init__(self, span_base):
+    # type: (int) -> None
+    self.span_base = span_base
+
+  def _Spid(self, spid):
+    # type: (Optional[int]) -> Optional[int]
+    if spid is None or spid == const.NO_INTEGER:
+      return spid
+    return spid + self.span_base
+
+  def Decode(self, obj):
+    # type: (Any) -> Any
+    if isinstance(obj, list):
+      return [self.Decode(item) for item in obj]
+
+    if isinstance(obj, tuple):
+      if obj[0] == _SIMPLE:
+        type_name, name = obj[1], obj[2]
+        if type_name == 'Id_t':
+          return getattr(id_kind_asdl.Id, name)
+        # e.g. assign_op_t instances live in assign_op_e
+        return getattr(getattr(syntax_asdl, type_name[:-2] + '_e'), name)
+
+      cls = getattr(syntax_asdl, obj[1])
+      node = cls.__new__(cls)
+      for i, name in enumerate(cls.__slots__):
+        val = obj[i + 2]
+        if name in _SPID_FIELDS:
+          val = self._Spid(val)
+        elif name in _SPID_LIST_FIELDS:
+          val = [self._Spid(spid) for spid in val]
+        else:
+          val = self.Decode(val)
+        setattr(node, name, val)
+      return node
+
+    return obj
+
+
+def _CachePath(cache_dir, path):
+  # type: (str, str) -> str
+  """One cache file per sourced file.  The name is the escaped path."""
+  name = path.replace('%', '%25').replace('/', '%2F')
+  return os_path.join(cache_dir, name + '.lst')
+
+
+def _MakeDirs(dir_path):
+  # type: (str) -> None
+  """Like mkdir -p.  Errors show up later when we write the file."""
+  if not dir_path or path_stat.isdir(dir_path):
+    return
+  _MakeDirs(os_path.dirname(dir_path))
+  try:
+    posix.mkdir(dir_path, 0o700)
+  except OSError:
+    pass
+
+
+class SourceCache(object):
+  """Maps a sourced file to its parsed top-level nodes."""
+
+  def __init__(self, arena, parse_ctx, cache_dir):
+    # type: (Arena, ParseContext, str) -> None
+    """
+    Args:
+      cache_dir: directory for the disk store, or '' for in-process only.
+    """
+    self.arena = arena
+    self.parse_ctx = parse_ctx
+    self.cache_dir = cache_dir
+
+    # abs path -> (key, nodes, line number after each node)
+    self.entries = {}  # type: Dict[str, Tuple[Tuple, List[command_t], List[int]]]
+    self.schema = None  # type: Optional[int]  # computed lazily
+
+    self.num_hits = 0  # for tests and debugging
+    self.num_disk_hits = 0
+
+  def _Schema(self):
+    # type: () -> int
+    if self.schema is None:
+      self.schema = _SchemaFingerprint()
+    return self.schema
+
+  def ParseState(self):
+    # type: () -> Tuple
+    """What parsing depends on, besides the file: options and aliases."""
+    opts = self.parse_ctx.parse_opts
+    return (
+        opts.at, opts.brace, opts.paren, opts.equals, opts.set,
+        self.parse_ctx.one_pass_parse,
+        tuple(sorted(self.parse_ctx.aliases.iteritems())),
+    )
+
+  def MakeKey(self, path):
+    # type: (str) -> Optional[Tuple]
+    """Return a key that identifies this version of the file, or None."""
+    abs_path = libc.realpath(path)
+    if abs_path is None:
+      return None
+    try:
+      st = posix.stat(abs_path)
+    except OSError:
+      return None
+
+    return (
+        abs_path, st.st_mtime, st.st_ctime, st.st_size, st.st_ino, st.st_dev,
+    ) + self.ParseState()
+
+  def Get(self, key, src):
+    # type: (Tuple, source_t) -> Optional[Tuple[List[command_t], List[int]]]
+    """Return the nodes for key and the line number after each one, or None.
+
+    Args:
+      src: The source of the file's lines.  Lines read from disk are added
+        to the Arena under it.
+    """
+    abs_path = key[0]
+    entry = self.entries.get(abs_path)
+    if entry is not None and entry[0] == key:
+      self.num_hits += 1
+      return entry[1], entry[2]
+
+    if not self.cache_dir:
+      return None
+
+    loaded = self._Load(key, src)
+    if loaded is not None:
+      self.entries[abs_path] = (key, loaded[0], loaded[1])
+      self.arena.Pin(('source', abs_path))
+      self.num_disk_hits += 1
+    return loaded
+
+  def Put(self, key, nodes, line_nums, src, line_begin, span_begin):
+    # type: (Tuple, List[command_t], List[int], source_t, int, int) -> None
+    """Save the nodes of a file that was parsed to EOF.
+
+    Args:
+      line_nums: The line number after each node.
+      src: The source the file's own lines were added under.
+      line_begin, span_begin: The first line and span ID of the file in the
+        Arena.
+    """
+    self.entries[key[0]] = (key, nodes, line_nums)
+    self.arena.Pin(('source', key[0]))
+
+    if not self.cache_dir:
+      return
+    try:
+      self._Save(key, nodes, line_nums, src, line_begin, span_begin)
+    except (_NotCacheable, IOError, OSError, ValueError):
+      pass  # The in-process entry is still good.
+
+  def _Load(self, key, src):
+    # type: (Tuple, source_t) -> Optional[Tuple[List[command_t], List[int]]]
+    try:
+      with open(_CachePath(self.cache_dir, key[0]), 'rb') as f:
+        d = marshal.load(f)
+    except (IOError, EOFError, ValueError, TypeError):
+      return None
+
+    if (not isinstance(d, dict) or
+        d.get('version') != _FORMAT_VERSION or
+        d.get('schema') != self._Schema() or
+        d.get('key') != key):
+      return None
+
+    arena = self.arena
+
+    # Add the lines under their original source.  None means the file itself.
+    line_base = arena.LastLineId()
+    decoder = _Decoder(arena.LastSpanId())
+    for line, line_num, enc_src in d['lines']:
+      if enc_src is None:
+        arena.PushSource(src)
+      else:
+        arena.PushSource(decoder.Decode(enc_src))
+      try:
+        arena.AddLine(line, line_num)
+      finally:
+        arena.PopSource()
+
+    spans = d['spans']
+    for i in xrange(0, len(spans), 3):
+      arena.AddLineSpan(line_base + spans[i], spans[i+1], spans[i+2])
+
+    return decoder.Decode(d['nodes']), d['line_nums']
+
+  def _Save(self, key, nodes, line_nums, src, line_begin, span_begin):
+    # type: (Tuple, List[command_t], List[int], source_t, int, int) -> None
+    arena = self.arena
+    line_end = arena.LastLineId()
+    span_end = arena.LastSpanId()
+    encoder = _Encoder(span_begin, span_end)
+
+    lines = []
+    for line_id in xrange(line_begin, line_end):
+      line_src = arena.GetLineSource(line_id)
+      enc_src = None if line_src is src else encoder.Encode(line_src)
+      lines.append(
+          (arena.GetLine(line_id), arena.GetLineNumber(line_id), enc_src))
+
+    spans = []
+    for span_id in xrange(span_begin, span_end):
+      span = arena.GetLineSpan(span_id)
+      if span.line_id < line_begin:
+        raise _NotCacheable('span %d refers to an earlier line' % span_id)
+      spans.extend((span.line_id - line_begin, span.col, span.length))
+
+    d = {
+        'version': _FORMAT_VERSION,
+        'schema': self._Schema(),
+        'key': key,
+        'lines': lines,
+        'spans': spans,
+        'nodes': encoder.Encode(nodes),
+        'line_nums': line_nums,
+    }
+
+    _MakeDirs(self.cache_dir)
+
+    # Write to a temp file and rename, so concurrent shells never see a
+    # partial file.
+    path = _CachePath(self.cache_dir, key[0])
+    tmp_path = '%s.%d' % (path, posix.getpid())
+    with open(tmp_path, 'wb') as f:
+      marshal.dump(d, f)
+    posix.rename(tmp_path, path)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python2
+"""
+source_cache_test.py: Tests for source_cache.py
+"""
+
+import unittest
+
+from _devbuild.gen.syntax_asdl import source
+from core import alloc
+from core import test_lib
+from core import source_cache  # module under test
+from frontend import parse_lib
+
+import posix_ as posix
+
+CODE = """\
+f() {
+  echo "hi $1" > /dev/null
+}
+cat <<EOF
+${x:-default}
+EOF
+"""
+
+
+def _ParseFile(parse_ctx, code_str):
+  """Parse code_str into a list of top-level nodes."""
+  line_reader, _ = test_lib.InitLexer(code_str, parse_ctx.arena)
+  c_parser = parse_ctx.MakeOshParser(line_reader)
+  nodes = []
+  while True:
+    node = c_parser.ParseLogicalLine()
+    if node is None:
+      break
+    nodes.append(node)
+  return nodes
+
+
+class SourceCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.arena = alloc.Arena()
+    self.parse_ctx = parse_lib.ParseContext(
+        self.arena, parse_lib.OilParseOptions(), {}, None)
+
+  def testEncodeDecode(self):
+    arena = self.arena
+    arena.PushSource(source.MainFile('lib.sh'))
+    span_begin = arena.LastSpanId()
+    nodes = _ParseFile(self.parse_ctx, CODE)
+    span_end = arena.LastSpanId()
+    arena.PopSource()
+
+    enc = source_cache._Encoder(span_begin, span_end).Encode(nodes)
+    decoded = source_cache._Decoder(span_begin).Decode(enc)
+    self.assertEqual(str(nodes), str(decoded))
+
+    # Relocated span IDs
+    decoded = source_cache._Decoder(span_begin + 10).Decode(enc)
+    self.assertEqual([spid + 10 for spid in nodes[0].spids], decoded[0].spids)
+
+    # A span from outside the file can't be saved
+    encoder = source_cache._Encoder(span_begin + 1, span_end)
+    self.assertRaises(source_cache._NotCacheable, encoder.Encode, nodes)
+
+  def testDiskRoundTrip(self):
+    tmp_dir = '/tmp/source_cache_test.%d' % posix.getpid()
+    path = tmp_dir + '/lib.sh'
+    source_cache._MakeDirs(tmp_dir)
+    with open(path, 'w') as f:
+      f.write(CODE)
+
+    arena = self.arena
+    cache = source_cache.SourceCache(arena, self.parse_ctx, tmp_dir + '/cache')
+    key = cache.MakeKey(path)
+    self.assertEqual(None, cache.MakeKey(tmp_dir + '/nonexistent'))
+
+    src = source.SourcedFile(path, 0)
+    self.assertEqual(None, cache.Get(key, src))
+
+    arena.PushSource(src)
+    line_begin = arena.LastLineId()
+    span_begin = arena.LastSpanId()
+    nodes = _ParseFile(self.parse_ctx, CODE)
+    arena.PopSource()
+    span_end = arena.LastSpanId()
+    line_nums = [4, 7]  # after the function and the here doc
+    cache.Put(key, nodes, line_nums, src, line_begin, span_begin)
+
+    self.assertEqual((nodes, line_nums), cache.Get(key, src))
+    self.assertIs(nodes, cache.Get(key, src)[0])
+    self.assertEqual(2, cache.num_hits)
+
+    # A new process only has the disk store, and its Arena already has a line.
+    arena2 = alloc.Arena()
+    arena2.PushSource(source.MainFile('main.sh'))
+    arena2.AddLine('echo first', 1)
+    arena2.AddLineSpan(0, 0, 4)
+    arena2.PopSource()
+
+    parse_ctx2 = parse_lib.ParseContext(
+        arena2, parse_lib.OilParseOptions(), {}, None)
+    cache2 = source_cache.SourceCache(arena2, parse_ctx2, tmp_dir + '/cache')
+    span_base = arena2.LastSpanId()
+    nodes2, line_nums2 = cache2.Get(key, src)
+    self.assertEqual(1, cache2.num_disk_hits)
+    self.assertEqual(line_nums, line_nums2)
+    self.assertEqual(
+        source_cache._Encoder(span_begin, span_end).Encode(nodes),
+        source_cache._Encoder(span_base, arena2.LastSpanId()).Encode(nodes2))
+
+    # Error locations still point into the file.
+    span = arena2.GetLineSpan(nodes2[0].spids[0])
+    self.assertEqual(src, arena2.GetLineSource(span.line_id))
+    self.assertEqual(CODE.splitlines(True)[0], arena2.GetLine(span.line_id))
+
+    # Changing the parse options or aliases changes the key.
+    state = cache2.ParseState()
+    parse_ctx2.parse_opts.at = True
+    self.assertNotEqual(key, cache2.MakeKey(path))
+    self.assertNotEqual(state, cache2.ParseState())
+    parse_ctx2.parse_opts.at = False
+    parse_ctx2.aliases['hi'] = 'echo hi'
+    self.assertNotEqual(key, cache2.MakeKey(path))
+    self.assertNotEqual(state, cache2.ParseState())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -29,6 +29,7 @@ from frontend import parse_lib
 from frontend import reader
 from osh import builtin
 from osh import builtin_assign
+from osh import builtin_bracket
 from osh import builtin_comp
 from osh import builtin_pure
 from osh import cmd_exec
@@ -104,7 +105,8 @@ def MakeArena(source_name):
 
 def InitLexer(s, arena):
   """For tests only."""
-  line_lexer = lexer.LineLexer(match.MATCHER, '', arena)
+  line_lexer = lexer.LineLexer(match.MATCHER, '', arena,
+                               batch_func=match.BATCH_MATCHER)
   line_reader = reader.StringLineReader(s, arena)
   lx = lexer.Lexer(line_lexer, line_reader)
   return line_reader, lx
@@ -148,6 +150,7 @@ def InitExecutor(parse_ctx=None, comp_lookup=None, arena=None, mem=None,
   new_var = builtin_assign.NewVar(mem, funcs, errfmt)
   builtins = {  # Lookup
       builtin_e.ECHO: builtin_pure.Echo(exec_opts),
+      builtin_e.TEST: builtin_bracket.Test(False, errfmt),
       builtin_e.SHIFT: builtin_assign.Shift(mem),
 
       builtin_e.HISTORY: builtin.History(readline),
@@ -204,6 +207,7 @@ def InitExecutor(parse_ctx=None, comp_lookup=None, arena=None, mem=None,
 
   ex = cmd_exec.Executor(mem, fd_state, funcs, builtins, exec_opts,
                          parse_ctx, exec_deps)
+  word_ev.ex = ex  # Circular, for command subs
 
   spec_builder = builtin_comp.SpecBuilder(ex, parse_ctx, word_ev, splitter,
                                           comp_lookup)
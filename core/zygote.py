@@ -0,0 +1,319 @@
+#!/usr/bin/env python2
+"""
+zygote.py - Run many short shell scripts from one initialized process.
+
+'osh --server SOCKET' imports and initializes the shell once, and then listens
+on a Unix socket.  For each connection, the server forks a monitor process,
+which:
+
+1. Receives the client's argv, environment, and working directory, along with
+   its stdin, stdout, and stderr (passed with SCM_RIGHTS).
+2. Forks a runner process, which makes the passed descriptors its own 0, 1,
+   and 2, changes to the directory, replaces its environment, and runs the
+   argv like 'osh ARGV...' would.
+3. Waits for the runner, and sends its exit status to the client.
+
+The runner never touches the socket, so the script can't clobber it, and a
+runner killed by a signal is reported like a shell would, as 128 + the signal.
+
+The client is ClientMain() below.  bin/osh-client runs this file directly with
+'python -S', so it doesn't pay for importing the shell.
+
+Protocol: the client sends '<length>\\n' and then a marshalled (argv, environ,
+cwd) tuple.  The descriptors are attached to the first byte.  The server sends
+back '<status>\\n'.
+
+NOTE: The socket is created with mode 0700, since anyone who can connect can
+run code as the server's user.
+"""
+from __future__ import print_function
+
+import fcntl
+import marshal
+import sys
+
+import posix_ as posix
+
+from typing import List, Dict, Tuple, Callable
+
+# The client's stdin, stdout, and stderr.
+_NUM_FDS = 3
+
+_RECV_SIZE = 65536
+_BACKLOG = 128
+
+# Where the runner moves passed descriptors before putting them at 0-2, so
+# they can't collide.
+_FIRST_HIGH_FD = 10
+
+
+def _WriteAll(fd, s):
+  # type: (int, str) -> None
+  while s:
+    n = posix.write(fd, s)
+    s = s[n:]
+
+
+def _EncodeRequest(argv, environ, cwd):
+  # type: (List[str], Dict[str, str], str) -> str
+  payload = marshal.dumps((argv, environ, cwd))
+  return '%d\n%s' % (len(payload), payload)
+
+
+def _ReadRequest(fd, data):
+  # type: (int, str) -> Tuple[List[str], Dict[str, str], str]
+  """Read the rest of a request, given the first chunk of it.
+
+  Raises:
+    ValueError if the client hung up early or sent garbage.
+  """
+  while '\n' not in data:
+    chunk = posix.read(fd, _RECV_SIZE)
+    if not chunk:
+      raise ValueError('EOF in request header')
+    data += chunk
+
+  header, payload = data.split('\n', 1)
+  length = int(header)  # may raise ValueError
+  chunks = [payload]
+  n = len(payload)
+  while n < length:
+    chunk = posix.read(fd, min(_RECV_SIZE, length - n))
+    if not chunk:
+      raise ValueError('EOF in request')
+    chunks.append(chunk)
+    n += len(chunk)
+
+  try:
+    argv, environ, cwd = marshal.loads(''.join(chunks))
+  except (EOFError, TypeError) as e:
+    raise ValueError('Invalid request: %s' % e)
+  return argv, environ, cwd
+
+
+def _ExitStatus(wait_status):
+  # type: (int) -> int
+  """Like $? after waiting for a process."""
+  if posix.WIFSIGNALED(wait_status):
+    return 128 + posix.WTERMSIG(wait_status)
+  return posix.WEXITSTATUS(wait_status)
+
+
+def _SystemExitStatus(e):
+  # type: (SystemExit) -> int
+  """The status that Python would exit with."""
+  if e.code is None:
+    return 0
+  if isinstance(e.code, int):
+    return e.code & 0xff
+  print(e.code, file=sys.stderr)
+  return 1
+
+
+class Server(object):
+  """Forks a process to run each request."""
+
+  def __init__(self, sock_path, run_func):
+    # type: (str, Callable[[List[str]], int]) -> None
+    """
+    Args:
+      run_func: Called in the runner process with the client's argv, like
+        main().  Returns an exit status.  Processes it forks must exit with
+        SystemExit, not by returning.
+    """
+    self.sock_path = sock_path
+    self.run_func = run_func
+    self.listen_fd = -1
+
+  def Listen(self):
+    # type: () -> None
+    """Create the socket.  A stale one from a dead server is replaced.
+
+    Raises:
+      OSError, e.g. if another server is listening on the path.
+    """
+    old_umask = posix.umask(0o077)
+    try:
+      try:
+        self.listen_fd = posix.unix_listen(self.sock_path, _BACKLOG)
+      except OSError:
+        try:
+          posix.close(posix.unix_connect(self.sock_path))
+        except OSError:  # Nobody is listening
+          posix.unlink(self.sock_path)
+          self.listen_fd = posix.unix_listen(self.sock_path, _BACKLOG)
+        else:
+          raise
+    finally:
+      posix.umask(old_umask)
+
+  def _Reap(self):
+    # type: () -> None
+    """Collect exited monitor processes without blocking."""
+    while True:
+      try:
+        pid, _ = posix.waitpid(-1, posix.WNOHANG)
+      except OSError:  # ECHILD
+        break
+      if pid == 0:
+        break
+
+  def Serve(self):
+    # type: () -> None
+    """Accept connections forever."""
+    while True:
+      self._Reap()
+      try:
+        conn = posix.unix_accept(self.listen_fd)
+      except OSError as e:  # e.g. EMFILE.  Keep serving.
+        print('osh --server: accept: %s' % posix.strerror(e.errno),
+              file=sys.stderr)
+        continue
+
+      sys.stdout.flush()  # Don't let children inherit a buffer
+      try:
+        pid = posix.fork()
+      except OSError as e:  # The client sees EOF
+        print('osh --server: fork: %s' % posix.strerror(e.errno),
+              file=sys.stderr)
+        pid = -1
+
+      if pid == 0:
+        posix.close(self.listen_fd)
+        self._Monitor(conn)  # never returns
+      posix.close(conn)
+
+  def _Monitor(self, conn):
+    # type: (int) -> None
+    """Receive one request, run it in a child, and report its status."""
+    try:
+      data, fds = posix.recv_fds(conn, _RECV_SIZE)
+      if not data and not fds:  # e.g. Listen() checking for a live server
+        posix._exit(0)
+      argv, environ, cwd = _ReadRequest(conn, data)
+      if len(fds) != _NUM_FDS:
+        raise ValueError('Expected %d descriptors, got %d' %
+                         (_NUM_FDS, len(fds)))
+    except (OSError, ValueError) as e:
+      print('osh --server: bad request: %s' % e, file=sys.stderr)
+      posix._exit(1)
+
+    pid = posix.fork()
+    if pid == 0:
+      posix.close(conn)
+      self._Run(argv, environ, cwd, fds)  # never returns
+
+    for fd in fds:
+      posix.close(fd)
+    _, wait_status = posix.waitpid(pid, 0)
+    try:
+      _WriteAll(conn, '%d\n' % _ExitStatus(wait_status))
+    except OSError:  # The client went away
+      pass
+    posix._exit(0)
+
+  def _Run(self, argv, environ, cwd, fds):
+    # type: (List[str], Dict[str, str], str, List[int]) -> None
+    """Become the client's shell."""
+    # Any of the passed descriptors might already be 0-2, so move them out of
+    # the way first.
+    high_fds = []
+    for fd in fds:
+      high_fds.append(fcntl.fcntl(fd, fcntl.F_DUPFD, _FIRST_HIGH_FD))
+      posix.close(fd)
+    for i, fd in enumerate(high_fds):
+      posix.dup2(fd, i)
+      posix.close(fd)
+
+    try:
+      posix.chdir(cwd)
+    except OSError as e:
+      print("osh: Couldn't change to %r: %s" % (cwd, posix.strerror(e.errno)),
+            file=sys.stderr)
+      posix._exit(2)
+
+    posix.environ.clear()
+    posix.environ.update(environ)
+
+    pid = posix.getpid()
+    try:
+      status = self.run_func(argv)
+    except SystemExit as e:
+      if posix.getpid() != pid:  # A process the script forked, e.g. a subshell
+        raise
+      status = _SystemExitStatus(e)
+
+    # Don't tear down the interpreter.  Freeing every object writes to pages
+    # we share with the server, so the kernel copies them, and that made each
+    # request take ~18 ms instead of ~3 ms.
+    exitfunc = getattr(sys, 'exitfunc', None)  # atexit handlers
+    if exitfunc:
+      exitfunc()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    posix._exit(status)
+
+
+def Serve(sock_path, run_func):
+  # type: (str, Callable[[List[str]], int]) -> int
+  """For 'osh --server SOCKET'."""
+  server = Server(sock_path, run_func)
+  try:
+    server.Listen()
+  except OSError as e:
+    print("osh --server: Couldn't listen on %r: %s" %
+          (sock_path, posix.strerror(e.errno)), file=sys.stderr)
+    return 2
+  server.Serve()
+  return 0  # not reached
+
+
+def Request(sock_path, argv, environ, cwd, fds):
+  # type: (str, List[str], Dict[str, str], str, List[int]) -> int
+  """Run argv on the server, and return its exit status.
+
+  Raises:
+    OSError if the server can't be reached.
+    ValueError if it hangs up without a status.
+  """
+  sock = posix.unix_connect(sock_path)
+  try:
+    msg = _EncodeRequest(argv, environ, cwd)
+    n = posix.send_fds(sock, msg, fds)
+    _WriteAll(sock, msg[n:])
+
+    reply = ''
+    while not reply.endswith('\n'):
+      chunk = posix.read(sock, 64)
+      if not chunk:
+        raise ValueError('server closed the connection')
+      reply += chunk
+    return int(reply)
+  finally:
+    posix.close(sock)
+
+
+def ClientMain(argv):
+  # type: (List[str]) -> int
+  """Usage: osh-client SOCKET [ARG...]
+
+  Runs 'osh ARG...' on the server listening at SOCKET.
+  """
+  if not argv:
+    print('Usage: osh-client SOCKET [ARG...]', file=sys.stderr)
+    return 2
+
+  try:
+    return Request(argv[0], argv[1:], dict(posix.environ), posix.getcwd(),
+                   range(_NUM_FDS))
+  except OSError as e:
+    print("osh-client: Couldn't run on %r: %s" %
+          (argv[0], posix.strerror(e.errno)), file=sys.stderr)
+    return 2
+  except ValueError as e:
+    print('osh-client: %s' % e, file=sys.stderr)
+    return 2
+
+
+if __name__ == '__main__':
+  sys.exit(ClientMain(sys.argv[1:]))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python2
+"""
+zygote_test.py: Tests for zygote.py
+"""
+from __future__ import print_function
+
+import signal
+import sys
+import time
+import unittest
+
+from core import zygote  # module under test
+
+import posix_ as posix
+
+
+def _FakeShell(argv):
+  """Stands in for ShellMain()."""
+  if argv == ['kill']:
+    posix.kill(posix.getpid(), signal.SIGKILL)
+
+  line = sys.stdin.readline()
+  print('%s %s %s %s' % (' '.join(argv), posix.environ.get('FOO'),
+                         posix.getcwd(), line.strip()))
+  return 42
+
+
+class ZygoteTest(unittest.TestCase):
+
+  def setUp(self):
+    self.sock_path = '/tmp/zygote_test.%d.sock' % posix.getpid()
+    self.server_pid = posix.fork()
+    if self.server_pid == 0:
+      try:
+        zygote.Serve(self.sock_path, _FakeShell)
+      except SystemExit as e:  # A runner is done.  Don't return to unittest.
+        sys.stdout.flush()
+        posix._exit(e.code)
+      posix._exit(1)
+
+    for _ in xrange(100):  # Wait for it to listen
+      try:
+        posix.close(posix.unix_connect(self.sock_path))
+        break
+      except OSError:
+        time.sleep(0.01)
+
+  def tearDown(self):
+    posix.kill(self.server_pid, signal.SIGTERM)
+    posix.waitpid(self.server_pid, 0)
+    posix.unlink(self.sock_path)
+
+  def _Request(self, argv, stdin_str):
+    in_r, in_w = posix.pipe()
+    out_r, out_w = posix.pipe()
+    posix.write(in_w, stdin_str)
+    posix.close(in_w)
+
+    status = zygote.Request(
+        self.sock_path, argv, {'FOO': 'bar'}, '/tmp', [in_r, out_w, 2])
+    posix.close(in_r)
+    posix.close(out_w)
+
+    chunks = []
+    while True:
+      chunk = posix.read(out_r, 4096)
+      if not chunk:
+        break
+      chunks.append(chunk)
+    posix.close(out_r)
+    return status, ''.join(chunks)
+
+  def testRequest(self):
+    status, out = self._Request(['-c', 'echo hi'], 'line\n')
+    self.assertEqual(42, status)
+    self.assertEqual('-c echo hi bar /tmp line\n', out)
+
+    # The server is still there for the next one.
+    status, out = self._Request(['x'], '')
+    self.assertEqual(42, status)
+    self.assertEqual('x bar /tmp \n', out)
+
+  def testKilled(self):
+    status, out = self._Request(['kill'], '')
+    self.assertEqual(128 + signal.SIGKILL, status)
+    self.assertEqual('', out)
+
+  def testStaleSocket(self):
+    posix.kill(self.server_pid, signal.SIGKILL)
+    posix.waitpid(self.server_pid, 0)
+    # The socket file is still there, but a new server replaces it.
+    self.setUp()
+    status, _ = self._Request(['y'], '')
+    self.assertEqual(42, status)
+
+  def testBadCwd(self):
+    in_r, in_w = posix.pipe()
+    posix.close(in_w)
+    err_r, err_w = posix.pipe()
+    status = zygote.Request(
+        self.sock_path, [], {}, '/nonexistent', [in_r, 1, err_w])
+    posix.close(in_r)
+    posix.close(err_w)
+    self.assertEqual(2, status)
+    self.assertIn("Couldn't change to '/nonexistent'", posix.read(err_r, 4096))
+    posix.close(err_r)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -333,6 +333,33 @@ class LineLexerTest(unittest.TestCase):
     self.assertTokensEqual(
         token(Id.Op_LParen, '('), l.LookAhead(lex_mode_e.ShCommand))
 
+  def testReadBatch(self):
+    # Batched lexing gives the same tokens when the parser changes the mode in
+    # the middle of a batch, and after MaybeUnreadOne().
+    batch_func = match._MatchOshTokens_Slow(match.MATCHER)
+    line = 'echo "${x:-y}" # comment\n'
+    modes = [
+        lex_mode_e.ShCommand, lex_mode_e.ShCommand, lex_mode_e.ShCommand,
+        lex_mode_e.DQ, lex_mode_e.VSub_1, lex_mode_e.VSub_2,
+        lex_mode_e.VSub_ArgDQ, lex_mode_e.VSub_ArgDQ, lex_mode_e.DQ,
+        lex_mode_e.ShCommand, lex_mode_e.ShCommand, lex_mode_e.Comment,
+        lex_mode_e.ShCommand, lex_mode_e.ShCommand,
+    ]
+    l1 = LineLexer(match.MATCHER, line, self.arena)
+    l2 = LineLexer(match.MATCHER, line, self.arena, batch_func=batch_func)
+    for i, lex_mode in enumerate(modes):
+      t1 = l1.Read(lex_mode)
+      t2 = l2.Read(lex_mode)
+      self.assertTokensEqual(t1, t2)
+      if i == 2:
+        self.assertEqual(Id.Left_DoubleQuote, t2.id)
+        self.assertEqual(True, l1.MaybeUnreadOne())
+        self.assertEqual(True, l2.MaybeUnreadOne())
+        self.assertTokensEqual(
+            token(Id.Left_DoubleQuote, '"'), l2.Read(lex_mode_e.ShCommand))
+        l1.Read(lex_mode_e.ShCommand)
+    self.assertEqual(Id.Eol_Tok, t2.id)
+
 
 class RegexTest(unittest.TestCase):
 
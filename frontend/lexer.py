@@ -12,13 +12,15 @@ from _devbuild.gen.syntax_asdl import token, line_span
 from _devbuild.gen.types_asdl import lex_mode_t
 from _devbuild.gen.id_kind_asdl import Id_t, Id
 from asdl import const
+from core.meta import IdInstance
 from core.util import log
 
-from typing import Callable, List, Tuple, TYPE_CHECKING
+from typing import Callable, List, Tuple, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
+  from typing import Sequence
   from core.alloc import Arena
   from frontend.reader import _Reader
-  from frontend.match import MatchFunc
+  from frontend.match import MatchFunc, BatchMatchFunc
 
 
 def C(pat, tok_type):
@@ -34,14 +36,26 @@ def R(pat, tok_type):
 
 
 class LineLexer(object):
-  def __init__(self, match_func, line, arena):
-    # type: (MatchFunc, str, Arena) -> None
+  def __init__(self, match_func, line, arena, batch_func=None):
+    # type: (MatchFunc, str, Arena, Optional[BatchMatchFunc]) -> None
+    """
+    Args:
+      batch_func: Optional.  Lexes many tokens in one call, and returns
+        packed (id, start_pos, end_pos) triples.
+    """
     self.match_func = match_func
     self.arena = arena
 
     self.arena_skip = False  # For MaybeUnreadOne
     self.last_span_id = const.NO_INTEGER  # For MaybeUnreadOne
 
+    # Tokens lexed ahead of time.  They're only valid for the same line, mode,
+    # and position.
+    self.batch_func = batch_func
+    self.batch = None  # type: Sequence[int]
+    self.batch_mode = None  # type: Optional[lex_mode_t]
+    self.batch_index = 0
+
     self.Reset(line, -1, 0)  # Invalid line_id to start
 
   def __repr__(self):
@@ -55,6 +69,7 @@ class LineLexer(object):
     self.line = line
     self.line_id = line_id
     self.line_pos = line_pos
+    self.batch_mode = None  # invalidate
 
   def MaybeUnreadOne(self):
     # type: () -> bool
@@ -119,7 +134,22 @@ class LineLexer(object):
     line = self.line
     line_pos = self.line_pos
 
-    tok_type, end_pos = self.match_func(lex_mode, line, line_pos)
+    if self.batch_func:
+      batch = self.batch
+      i = self.batch_index
+      # The parser changed the mode, we unread a char, or we used up the batch.
+      if (lex_mode is not self.batch_mode or i == len(batch) or
+          batch[i+1] != line_pos):
+        batch = self.batch_func(lex_mode, line, line_pos)
+        self.batch = batch
+        self.batch_mode = lex_mode
+        i = 0
+      tok_type = IdInstance(batch[i])
+      end_pos = batch[i+2]
+      self.batch_index = i + 3
+    else:
+      tok_type, end_pos = self.match_func(lex_mode, line, line_pos)
+
     if tok_type == Id.Eol_Tok:  # Do NOT add a span for this sentinel!
       return token(tok_type, '', const.NO_INTEGER)
 
@@ -2,13 +2,17 @@
 match.py - match with generated re2c code or Python regexes.
 """
 
-from _devbuild.gen.id_kind_asdl import Id, Id_t
+import array
+
+from _devbuild.gen.id_kind_asdl import Id, Id_t, Kind, ID_INSTANCES
 from _devbuild.gen.types_asdl import lex_mode_t
 #from core import util
-from core.meta import IdInstance
+from core.meta import IdInstance, LookupKind
 from frontend import lex
 
-from typing import Iterator, Tuple, Callable, Dict, List, Any, TYPE_CHECKING
+from typing import (
+    Iterator, Tuple, Callable, Dict, List, Optional, Any, TYPE_CHECKING
+)
 
 # bin/osh should work without compiling fastlex?  But we want all the unit
 # tests to run with a known version of it.
@@ -25,8 +29,10 @@ else:
 
 
 if TYPE_CHECKING:
+  from typing import Sequence
   SRE_Pattern = Any  # Do we need a .pyi file for re or _sre?
   MatchFunc = Callable[[lex_mode_t, str, int], Tuple[Id_t, int]]
+  BatchMatchFunc = Callable[[lex_mode_t, str, int], Sequence[int]]
   SimpleMatchFunc = Callable[[str, int], Tuple[Id_t, int]]
   LexerPairs = List[Tuple[SRE_Pattern, Id_t]]
 
@@ -85,6 +91,63 @@ def _MatchOshToken_Fast(lex_mode, line, start_pos):
   return IdInstance(tok_type), end_pos
 
 
+def _MakeBatchStopIds():
+  # type: () -> str
+  """Flag the tokens after which the parser is likely to change lex modes.
+
+  A batch that goes past one of them is still correct, since LineLexer checks
+  the mode of every Read(), but the rest of it is wasted work.
+  """
+  stop_kinds = (
+      Kind.Left, Kind.Right, Kind.Backtick,
+      Kind.VSub, Kind.VTest, Kind.VOp0, Kind.VOp1, Kind.VOp2,
+  )
+  # A comment is lexed in its own mode, not word by word.
+  stop_ids = (Id.Lit_Pound, Id.Ignored_Comment)
+
+  flags = []
+  for id_ in ID_INSTANCES:
+    if id_ is not None and (LookupKind(id_) in stop_kinds or id_ in stop_ids):
+      flags.append('\1')
+    else:
+      flags.append('\0')
+  return ''.join(flags)
+
+
+_BATCH_STOP_IDS = _MakeBatchStopIds()
+
+
+def _MatchOshTokens_Fast(lex_mode, line, start_pos):
+  # type: (lex_mode_t, str, int) -> Sequence[int]
+  """Returns packed (id, start_pos, end_pos) triples, up to a mode change."""
+  s = fastlex.MatchOshTokens(lex_mode.enum_id, line, start_pos,
+                             _BATCH_STOP_IDS)
+  return array.array('i', s)
+
+
+class _MatchOshTokens_Slow(object):
+  """The same interface as _MatchOshTokens_Fast, built on a MatchFunc.
+
+  Only used to test LineLexer without fastlex.
+  """
+  def __init__(self, match_func):
+    # type: (MatchFunc) -> None
+    self.match_func = match_func
+
+  def __call__(self, lex_mode, line, start_pos):
+    # type: (lex_mode_t, str, int) -> Sequence[int]
+    result = array.array('i')
+    pos = start_pos
+    while True:
+      tok_type, end_pos = self.match_func(lex_mode, line, pos)
+      result.extend((tok_type.enum_id, pos, end_pos))
+      if (tok_type == Id.Eol_Tok or end_pos == pos or
+          _BATCH_STOP_IDS[tok_type.enum_id] == '\1'):
+        break
+      pos = end_pos
+    return result
+
+
 class SimpleLexer(object):
   """Lexer for echo -e, which interprets C-escaped strings."""
   def __init__(self, match_func):
@@ -147,6 +210,7 @@ def _MatchBraceRangeToken_Fast(line, start_pos):
 
 if fastlex:
   MATCHER = _MatchOshToken_Fast
+  BATCH_MATCHER = _MatchOshTokens_Fast  # type: Optional[BatchMatchFunc]
   ECHO_MATCHER = _MatchEchoToken_Fast
   GLOB_MATCHER = _MatchGlobToken_Fast
   PS1_MATCHER = _MatchPS1Token_Fast
@@ -156,6 +220,8 @@ if fastlex:
   ShouldHijack = fastlex.ShouldHijack
 else:
   MATCHER = _MatchOshToken_Slow(lex.LEXER_DEF)
+  # Batching would only add work to the regex matcher.
+  BATCH_MATCHER = None
   ECHO_MATCHER = _MatchTokenSlow(lex.ECHO_E_DEF)
   GLOB_MATCHER = _MatchTokenSlow(lex.GLOB_DEF)
   PS1_MATCHER = _MatchTokenSlow(lex.PS1_DEF)
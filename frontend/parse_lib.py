@@ -25,7 +25,7 @@ from osh import word_parse
 
 #from oil_lang import cmd_parse as oil_cmd_parse
 
-from typing import Any, List, Tuple, Dict, Optional, IO, TYPE_CHECKING
+from typing import Any, List, Tuple, Dict, Optional, Union, IO, TYPE_CHECKING
 if TYPE_CHECKING:
   from core.alloc import Arena
   from core.util import DebugFile
@@ -220,10 +220,37 @@ class ParseContext(object):
 
   def __init__(self, arena, parse_opts, aliases, oil_grammar, trail=None,
                one_pass_parse=False):
-    # type: (Arena, OilParseOptions, Dict[str, Any], Grammar, Optional[_BaseTrail], bool) -> None
+    # type: (Arena, OilParseOptions, Dict[str, Any], Union[Grammar, meta.LazyOilGrammar, None], Optional[_BaseTrail], bool) -> None
+    """
+    Args:
+      oil_grammar: A LazyOilGrammar is only loaded when we parse an Oil
+        expression.
+    """
     self.arena = arena
     self.parse_opts = parse_opts
     self.aliases = aliases
+    self.oil_grammar = oil_grammar
+
+    # Created by _InitOil()
+    self.e_parser = None  # type: expr_parse.ExprParser
+    self.tr = None  # type: expr_to_ast.Transformer
+    self.p_printer = None  # type: expr_parse.ParseTreePrinter
+
+    self.parsing_expr = False  # "single-threaded" state
+
+    # Completion state lives here since it may span multiple parsers.
+    self.trail = trail or _NullTrail()
+    self.one_pass_parse = one_pass_parse
+
+  def _InitOil(self):
+    # type: () -> None
+    """Create the Oil expression parser the first time it's needed."""
+    if self.e_parser is not None:
+      return
+
+    oil_grammar = self.oil_grammar
+    if isinstance(oil_grammar, meta.LazyOilGrammar):
+      oil_grammar = oil_grammar.Get()
 
     self.e_parser = expr_parse.ExprParser(self, oil_grammar)
     # NOTE: The transformer is really a pure function.
@@ -234,12 +261,6 @@ class ParseContext(object):
       self.tr = None
       names = {}
 
-    self.parsing_expr = False  # "single-threaded" state
-
-    # Completion state lives here since it may span multiple parsers.
-    self.trail = trail or _NullTrail()
-    self.one_pass_parse = one_pass_parse
-
     self.p_printer = expr_parse.ParseTreePrinter(names)  # print raw nodes
 
   def _MakeLexer(self, line_reader):
@@ -249,7 +270,8 @@ class ParseContext(object):
     NOTE: I tried to combine the LineLexer and Lexer, and it didn't perform
     better.
     """
-    line_lexer = lexer.LineLexer(match.MATCHER, '', self.arena)
+    line_lexer = lexer.LineLexer(match.MATCHER, '', self.arena,
+                                 batch_func=match.BATCH_MATCHER)
     return lexer.Lexer(line_lexer, line_reader)
 
   def MakeOshParser(self, line_reader, emit_comp_dummy=False,
@@ -309,6 +331,7 @@ class ParseContext(object):
   def _ParseOil(self, lexer, start_symbol):
     # type: (Lexer, int) -> Tuple[PNode, token]
     """Helper Oil expression parsing."""
+    self._InitOil()
     self.parsing_expr = True
     try:
       return self.e_parser.Parse(lexer, grammar_nt.oil_arglist)
@@ -324,6 +347,7 @@ class ParseContext(object):
     if self.parsing_expr:
       p_die("Assignment expression can't be nested like this", token=kw_token)
 
+    self._InitOil()
     self.parsing_expr = True
     try:
       pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
@@ -354,6 +378,7 @@ class ParseContext(object):
   def ParseOilExpr(self, lexer, start_symbol, print_parse_tree=False):
     # type: (Lexer, int, bool) -> Tuple[expr_t, token]
     """For Oil expressions that aren't assignments.  Currently unused."""
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
 
     if print_parse_tree:
@@ -365,6 +390,7 @@ class ParseContext(object):
   def ParseOilForExpr(self, lexer, start_symbol, print_parse_tree=False):
     # type: (Lexer, int, bool) -> Tuple[expr_t, expr_t, token]
     """For Oil expressions that aren't assignments.  Currently unused."""
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
 
     if print_parse_tree:
@@ -376,6 +402,7 @@ class ParseContext(object):
   def ParseFuncProc(self, lexer, start_symbol, print_parse_tree=False):
     # type: (Lexer, int, bool) -> Tuple[token, List[param], type_expr_t, token]
     """For Oil expressions that aren't assignments.  Currently unused."""
+    self._InitOil()
     pnode, last_token = self.e_parser.Parse(lexer, start_symbol)
 
     if print_parse_tree:
@@ -52,6 +52,72 @@ fastlex_MatchOshToken(PyObject *self, PyObject *args) {
   return Py_BuildValue("(ii)", id, end_pos);
 }
 
+// Like MatchOshToken, but lex tokens in a loop until Eol_Tok, or a token
+// whose ID is flagged in stop_ids.  That is usually where the parser changes
+// the lexer mode.
+//
+// Returns a string of packed C ints, 3 for each token:
+//   (id, start_pos, end_pos)
+// The caller can load it with array.array('i', s).
+static PyObject *
+fastlex_MatchOshTokens(PyObject *self, PyObject *args) {
+  int lex_mode;
+
+  unsigned char* line;
+  int line_len;
+
+  int start_pos;
+
+  unsigned char* stop_ids;
+  int num_stop_ids;
+  if (!PyArg_ParseTuple(args, "is#is#",
+                        &lex_mode, &line, &line_len, &start_pos,
+                        &stop_ids, &num_stop_ids)) {
+    return NULL;
+  }
+
+  // Same bounds checking as MatchOshToken.
+  if (start_pos > line_len) {
+    PyErr_Format(PyExc_ValueError,
+                 "Invalid MatchOshTokens call (start_pos = %d, line_len = %d)",
+                 start_pos, line_len);
+    return NULL;
+  }
+
+  // Every token but the last one consumes at least one byte, so this is an
+  // upper bound on the number of tokens.
+  int max_tokens = line_len - start_pos + 1;
+  PyObject* result = PyString_FromStringAndSize(
+      NULL, max_tokens * 3 * sizeof(int));
+  if (result == NULL) {
+    return NULL;
+  }
+  int* out = (int*)PyString_AS_STRING(result);
+
+  int n = 0;
+  int pos = start_pos;
+  while (1) {
+    int id;
+    int end_pos;
+    MatchOshToken(lex_mode, line, line_len, pos, &id, &end_pos);
+    out[n++] = id;
+    out[n++] = pos;
+    out[n++] = end_pos;
+
+    // Stop at an empty match too, since the next one would be the same.
+    if (id == id__Eol_Tok || end_pos == pos ||
+        (id < num_stop_ids && stop_ids[id])) {
+      break;
+    }
+    pos = end_pos;
+  }
+
+  if (_PyString_Resize(&result, n * sizeof(int)) < 0) {
+    return NULL;
+  }
+  return result;
+}
+
 static PyObject *
 fastlex_MatchEchoToken(PyObject *self, PyObject *args) {
   unsigned char* line;
@@ -211,6 +277,8 @@ fastlex_ShouldHijack(PyObject *self, PyObject *args) {
 static PyMethodDef methods[] = {
   {"MatchOshToken", fastlex_MatchOshToken, METH_VARARGS,
    "(lexer mode, line, start_pos) -> (id, end_pos)."},
+  {"MatchOshTokens", fastlex_MatchOshTokens, METH_VARARGS,
+   "(lexer mode, line, start_pos, stop_ids) -> packed (id, start, end) ints."},
   {"MatchEchoToken", fastlex_MatchEchoToken, METH_VARARGS,
    "(line, start_pos) -> (id, end_pos)."},
   {"MatchGlobToken", fastlex_MatchGlobToken, METH_VARARGS,
@@ -10,6 +10,7 @@ fastlex_test.py: Tests for fastlex
 """
 from __future__ import print_function
 
+import array
 import unittest
 
 #from core.util import log
@@ -69,6 +70,33 @@ class LexTest(unittest.TestCase):
 
     self.assertEqual(expected, tok_type)
 
+  def testMatchOshTokens(self):
+    line = 'echo "hi" x\n'
+    no_stop = '\0' * 256
+
+    s = fastlex.MatchOshTokens(lex_mode_e.ShCommand.enum_id, line, 0, no_stop)
+    a = array.array('i', s)
+    tokens = [(IdInstance(a[i]), a[i+1], a[i+2]) for i in xrange(0, len(a), 3)]
+    print(tokens)
+    # Every token matches MatchOshToken, and the batch ends at Eol_Tok.
+    for tok_type, start_pos, end_pos in tokens:
+      self.assertEqual(
+          (tok_type, end_pos),
+          MatchOshToken(lex_mode_e.ShCommand, line, start_pos))
+    self.assertEqual(Id.Eol_Tok, tokens[-1][0])
+
+    # Stop after Left_DoubleQuote
+    stop = list(no_stop)
+    stop[Id.Left_DoubleQuote.enum_id] = '\1'
+    s = fastlex.MatchOshTokens(lex_mode_e.ShCommand.enum_id, line, 0,
+                               ''.join(stop))
+    a = array.array('i', s)
+    self.assertEqual([Id.Left_DoubleQuote.enum_id, 5, 6], a[-3:].tolist())
+
+    self.assertRaises(
+        ValueError, fastlex.MatchOshTokens, lex_mode_e.ShCommand.enum_id,
+        line, len(line) + 1, no_stop)
+
   def testIsValidVarName(self):
     self.assertEqual(True, fastlex.IsValidVarName('abc'))
     self.assertEqual(True, fastlex.IsValidVarName('foo_bar'))
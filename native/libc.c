@@ -13,6 +13,7 @@
 #include <limits.h>
 #include <wchar.h>
 #include <stdlib.h>
+#include <string.h>  // strcmp, strdup
 #include <sys/ioctl.h>
 #include <locale.h>
 #include <fnmatch.h>
@@ -157,17 +158,76 @@ func_glob(PyObject *self, PyObject *args) {
   return matches;
 }
 
+// Compiled regexes, so that loops over [[ $x =~ $pat ]] and ${x//pat/rep}
+// don't call regcomp() over and over.  ${x//pat/rep} calls
+// regex_first_group_match() once per match with the same pattern.
+//
+// It's small, so a linear search is fine.  When it's full, we evict the least
+// recently used entry.
+
+#define REGEX_CACHE_SIZE 16
+
+typedef struct {
+  char* pattern;  // NULL if the slot is empty
+  regex_t re;
+  unsigned long last_used;  // 0 if the slot is empty
+} RegexCacheEntry;
+
+static RegexCacheEntry regex_cache[REGEX_CACHE_SIZE];
+static unsigned long regex_cache_clock = 0;
+
+// Return the compiled regex for a pattern, or NULL if it's invalid.  *ret is
+// the error code from regcomp().  The regex is owned by the cache, and is only
+// valid until the next call.
+static regex_t* cached_regcomp(const char* pattern, int* ret) {
+  RegexCacheEntry* victim = &regex_cache[0];
+  int i;
+
+  regex_cache_clock++;
+  for (i = 0; i < REGEX_CACHE_SIZE; i++) {
+    RegexCacheEntry* e = &regex_cache[i];
+    if (e->pattern != NULL && strcmp(e->pattern, pattern) == 0) {
+      e->last_used = regex_cache_clock;
+      *ret = 0;
+      return &e->re;
+    }
+    if (e->last_used < victim->last_used) {
+      victim = e;  // empty slots come first
+    }
+  }
+
+  if (victim->pattern != NULL) {
+    regfree(&victim->re);
+    free(victim->pattern);
+    victim->pattern = NULL;
+    victim->last_used = 0;
+  }
+
+  // This is an extended regular expression rather than a basic one, i.e. we
+  // use 'a*' instaed of 'a\*'.
+  *ret = regcomp(&victim->re, pattern, REG_EXTENDED);
+  if (*ret != 0) {
+    return NULL;  // the slot stays empty
+  }
+  victim->pattern = strdup(pattern);
+  if (victim->pattern == NULL) {
+    regfree(&victim->re);
+    *ret = REG_ESPACE;
+    return NULL;
+  }
+  victim->last_used = regex_cache_clock;
+  return &victim->re;
+}
+
 static PyObject *
 func_regex_parse(PyObject *self, PyObject *args) {
   const char* pattern;
   if (!PyArg_ParseTuple(args, "s", &pattern)) {
     return NULL;
   }
-  regex_t pat;
-  // This is an extended regular expression rather than a basic one, i.e. we
-  // use 'a*' instaed of 'a\*'.
-  int ret = regcomp(&pat, pattern, REG_EXTENDED);
-  regfree(&pat);
+  // [[ $x =~ foo ]] is checked at parse time, so this also warms the cache.
+  int ret;
+  cached_regcomp(pattern, &ret);
 
   // Copied from man page
 
@@ -258,24 +318,24 @@ func_regex_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
-  if (regcomp(&pat, pattern, REG_EXTENDED) != 0) {
+  int status;
+  regex_t* pat = cached_regcomp(pattern, &status);
+  if (pat == NULL) {
     // When the regex contains a variable, it can't be checked at compile-time.
     PyErr_SetString(PyExc_RuntimeError, "Invalid regex syntax (func_regex_match)");
     return NULL;
   }
 
-  int outlen = pat.re_nsub + 1;
+  int outlen = pat->re_nsub + 1;
   PyObject *ret = PyList_New(outlen);
 
   if (ret == NULL) {
-    regfree(&pat);
     return NULL;
   }
 
   int match;
   regmatch_t *pmatch = (regmatch_t*) malloc(sizeof(regmatch_t) * outlen);
-  if (match = (regexec(&pat, str, outlen, pmatch, 0) == 0)) {
+  if (match = (regexec(pat, str, outlen, pmatch, 0) == 0)) {
     int i;
     for (i = 0; i < outlen; i++) {
       int len = pmatch[i].rm_eo - pmatch[i].rm_so;
@@ -285,9 +345,9 @@ func_regex_match(PyObject *self, PyObject *args) {
   }
 
   free(pmatch);
-  regfree(&pat);
 
   if (!match) {
+    Py_DECREF(ret);
     Py_RETURN_NONE;
   }
 
@@ -310,13 +370,14 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
     return NULL;
   }
 
-  regex_t pat;
   regmatch_t m[NMATCH];
 
   // Could have been checked by regex_parse for [[ =~ ]], but not for glob
   // patterns like ${foo/x*/y}.
 
-  if (regcomp(&pat, pattern, REG_EXTENDED) != 0) {
+  int status;
+  regex_t* pat = cached_regcomp(pattern, &status);
+  if (pat == NULL) {
     PyErr_SetString(PyExc_RuntimeError,
                     "Invalid regex syntax (func_regex_first_group_match)");
     return NULL;
@@ -325,8 +386,7 @@ func_regex_first_group_match(PyObject *self, PyObject *args) {
   debug("first_group_match pat %s str %s pos %d", pattern, str, pos);
 
   // Match at offset 'pos'
-  int result = regexec(&pat, str + pos, NMATCH, m, 0 /*flags*/);
-  regfree(&pat);
+  int result = regexec(pat, str + pos, NMATCH, m, 0 /*flags*/);
 
   if (result != 0) {
     Py_RETURN_NONE;  // no match
@@ -352,6 +412,203 @@ func_print_time(PyObject *self, PyObject *args) {
   Py_RETURN_NONE;
 }
 
+// IFS splitting, the same as IfsSplitter.Split() followed by _SpansToParts()
+// in osh/split.py.  The states, actions, and transitions mirror TRANSITIONS
+// and LAST_SPAN_ACTION there, and split_test.py compares the two.
+
+enum { CH_WHITE, CH_GRAY, CH_BLACK, CH_BACKSLASH };
+
+enum {
+  ST_START, ST_WHITE1, ST_GRAY, ST_WHITE2, ST_BLACK, ST_BACKSLASH
+};
+
+enum { EMIT_NOTHING, EMIT_PART, EMIT_DELIM, EMIT_EMPTY, EMIT_ESCAPE };
+
+// The span types of runtime.asdl.
+enum { SPAN_BLACK, SPAN_DELIM, SPAN_BACKSLASH };
+
+static const unsigned char ifs_transitions[6][4][2] = {
+  // ST_START.  Leading whitespace was skipped, so CH_WHITE can't happen.
+  {{ST_WHITE1, EMIT_NOTHING}, {ST_GRAY, EMIT_EMPTY},
+   {ST_BLACK, EMIT_NOTHING}, {ST_BACKSLASH, EMIT_NOTHING}},
+  // ST_WHITE1
+  {{ST_WHITE1, EMIT_NOTHING}, {ST_GRAY, EMIT_NOTHING},
+   {ST_BLACK, EMIT_DELIM}, {ST_BACKSLASH, EMIT_DELIM}},
+  // ST_GRAY
+  {{ST_WHITE2, EMIT_NOTHING}, {ST_GRAY, EMIT_EMPTY},
+   {ST_BLACK, EMIT_DELIM}, {ST_BLACK, EMIT_DELIM}},
+  // ST_WHITE2
+  {{ST_WHITE2, EMIT_NOTHING}, {ST_GRAY, EMIT_EMPTY},
+   {ST_BLACK, EMIT_DELIM}, {ST_BACKSLASH, EMIT_DELIM}},
+  // ST_BLACK
+  {{ST_WHITE1, EMIT_PART}, {ST_GRAY, EMIT_PART},
+   {ST_BLACK, EMIT_NOTHING}, {ST_BACKSLASH, EMIT_PART}},
+  // ST_BACKSLASH
+  {{ST_BLACK, EMIT_ESCAPE}, {ST_BLACK, EMIT_ESCAPE},
+   {ST_BLACK, EMIT_ESCAPE}, {ST_BLACK, EMIT_ESCAPE}},
+};
+
+static const unsigned char ifs_last_action[6] = {
+  EMIT_NOTHING,  // ST_START can't happen
+  EMIT_NOTHING,  // ST_WHITE1: ignore trailing IFS whitespace
+  EMIT_DELIM,    // ST_GRAY
+  EMIT_DELIM,    // ST_WHITE2
+  EMIT_PART,     // ST_BLACK
+  EMIT_ESCAPE,   // ST_BACKSLASH
+};
+
+// Turns spans into parts as they're emitted.  Black spans that are joined by
+// a backslash accumulate in buf before we append the part.
+typedef struct {
+  const char *s;
+  Py_ssize_t start_index;
+  int join_next;
+  int last_span_was_black;
+
+  char *buf;
+  Py_ssize_t buf_len;
+  int have_part;  // buf holds a part, possibly empty
+
+  PyObject *parts;
+} ifs_parts_t;
+
+static int ifs_flush(ifs_parts_t *p) {
+  if (!p->have_part) {
+    return 0;
+  }
+  p->have_part = 0;
+  PyObject *part = PyString_FromStringAndSize(p->buf, p->buf_len);
+  if (part == NULL) {
+    return -1;
+  }
+  int status = PyList_Append(p->parts, part);
+  Py_DECREF(part);
+  return status;
+}
+
+static int ifs_span(ifs_parts_t *p, int span_type, Py_ssize_t end_index) {
+  if (span_type == SPAN_BLACK) {
+    if (p->have_part && p->join_next) {
+      p->join_next = 0;
+    } else {
+      if (ifs_flush(p) < 0) {
+        return -1;
+      }
+      p->have_part = 1;
+      p->buf_len = 0;
+    }
+    Py_ssize_t len = end_index - p->start_index;
+    memcpy(p->buf + p->buf_len, p->s + p->start_index, len);
+    p->buf_len += len;
+    p->last_span_was_black = 1;
+  } else if (span_type == SPAN_BACKSLASH) {
+    if (p->last_span_was_black) {
+      p->join_next = 1;
+    }
+    p->last_span_was_black = 0;
+  } else {
+    p->last_span_was_black = 0;
+  }
+  p->start_index = end_index;
+  return 0;
+}
+
+static int ifs_emit(ifs_parts_t *p, int action, Py_ssize_t i) {
+  switch (action) {
+  case EMIT_PART:
+    return ifs_span(p, SPAN_BLACK, i);
+  case EMIT_DELIM:
+    return ifs_span(p, SPAN_DELIM, i);
+  case EMIT_EMPTY:
+    // An ignored delimiter, then an EMPTY part that is NOT ignored.
+    if (ifs_span(p, SPAN_DELIM, i) < 0) {
+      return -1;
+    }
+    return ifs_span(p, SPAN_BLACK, i);
+  case EMIT_ESCAPE:
+    return ifs_span(p, SPAN_BACKSLASH, i);
+  default:
+    return 0;
+  }
+}
+
+static PyObject *
+func_ifs_split(PyObject *self, PyObject *args) {
+  const char *s;
+  const char *ifs_whitespace;
+  const char *ifs_other;
+  int n, allow_escape;
+
+  if (!PyArg_ParseTuple(args, "s#ssi", &s, &n, &ifs_whitespace, &ifs_other,
+                        &allow_escape)) {
+    return NULL;
+  }
+
+  // Classify bytes.  Like the Python version, whitespace wins over other IFS
+  // chars, which win over backslash.
+  unsigned char kinds[256];
+  memset(kinds, CH_BLACK, sizeof(kinds));
+  if (allow_escape) {
+    kinds['\\'] = CH_BACKSLASH;
+  }
+  const char *c;
+  for (c = ifs_other; *c; ++c) {
+    kinds[(unsigned char)*c] = CH_GRAY;
+  }
+  for (c = ifs_whitespace; *c; ++c) {
+    kinds[(unsigned char)*c] = CH_WHITE;
+  }
+
+  ifs_parts_t p = {0};
+  p.s = s;
+  p.parts = PyList_New(0);
+  if (p.parts == NULL) {
+    return NULL;
+  }
+  if (n == 0) {
+    return p.parts;
+  }
+  // Parts are never longer than the string.
+  p.buf = PyMem_Malloc(n);
+  if (p.buf == NULL) {
+    Py_DECREF(p.parts);
+    return PyErr_NoMemory();
+  }
+
+  // Ignore leading whitespace.
+  int i = 0;
+  while (i < n && kinds[(unsigned char)s[i]] == CH_WHITE) {
+    i++;
+  }
+  if (i != 0 && ifs_span(&p, SPAN_DELIM, i) < 0) {
+    goto error;
+  }
+  if (i == n) {  // only whitespace
+    PyMem_Free(p.buf);
+    return p.parts;
+  }
+
+  int state = ST_START;
+  for (; i < n; ++i) {
+    const unsigned char *t = ifs_transitions[state][kinds[(unsigned char)s[i]]];
+    if (ifs_emit(&p, t[1], i) < 0) {
+      goto error;
+    }
+    state = t[0];
+  }
+  if (ifs_emit(&p, ifs_last_action[state], n) < 0 || ifs_flush(&p) < 0) {
+    goto error;
+  }
+
+  PyMem_Free(p.buf);
+  return p.parts;
+
+error:
+  PyMem_Free(p.buf);
+  Py_DECREF(p.parts);
+  return NULL;
+}
+
 // A copy of socket.gethostname() from socketmodule.c.  That module brings in
 // too many dependencies.
 
@@ -438,6 +695,10 @@ static PyMethodDef methods[] = {
   // "Print three floating point values for the 'time' builtin.
   {"print_time", func_print_time, METH_VARARGS, ""},
 
+  // Split a string with IFS, returning a list of parts.  The same as
+  // IfsSplitter.Split() and _SpansToParts() in osh/split.py.
+  {"ifs_split", func_ifs_split, METH_VARARGS, ""},
+
   {"gethostname", socket_gethostname, METH_NOARGS, ""},
 
   // ioctl() to get the terminal width.
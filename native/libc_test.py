@@ -161,6 +161,22 @@ class LibcTest(unittest.TestCase):
     self.assertRaises(
         RuntimeError, libc.regex_first_group_match, r'*', 'abcd', 0)
 
+  def testRegexCache(self):
+    # More patterns than fit in the cache, so entries are evicted and
+    # compiled again.
+    pats = ['(x%d)y' % i for i in xrange(40)]
+    for _ in xrange(3):
+      for i, pat in enumerate(pats):
+        s = 'ab x%dy' % i
+        self.assertEqual(
+            (3, len(s) - 1), libc.regex_first_group_match(pat, s, 0))
+        self.assertEqual([s[3:], s[3:-1]], libc.regex_match(pat, s))
+        self.assertEqual(None, libc.regex_match(pat, 'ab'))
+
+    # A cached pattern that fails to compile still fails.
+    for _ in xrange(2):
+      self.assertRaises(RuntimeError, libc.regex_match, r'*', 'abcd')
+
   def testRegexFirstGroupMatchError(self):
     # Helping to debug issue #291
     s = ''
@@ -176,6 +192,16 @@ class LibcTest(unittest.TestCase):
     # Consistent with GNU
     self.assertEqual(None, libc.realpath('_tmp/nonexistent/supernonexistent'))
 
+  def testIfsSplit(self):
+    # More cases in osh/split_test.py, which compares with the Python version.
+    self.assertEqual([], libc.ifs_split('', ' \t\n', '', True))
+    self.assertEqual(['a', 'b c'],
+                     libc.ifs_split(' a  b\\ c ', ' \t\n', '', True))
+    self.assertEqual(['a', 'b\\', 'c'],
+                     libc.ifs_split(' a  b\\ c ', ' \t\n', '', False))
+    self.assertEqual(['', 'a', '', 'b'],
+                     libc.ifs_split('_a__b_ ', ' ', '_', True))
+
   def testPrintTime(self):
     libc.print_time(0.1, 0.2, 0.3)
 
@@ -28,6 +28,8 @@ Other notes:
 """
 from __future__ import print_function
 
+import errno
+import os
 import signal
 import subprocess
 import unittest
@@ -44,7 +46,9 @@ FUNCS = [
     "getcwd",
     "listdir",
     "lstat",
+    "mkdir",
     "readlink",
+    "rename",
     "stat",
     "umask",
     "uname",
@@ -52,6 +56,7 @@ FUNCS = [
     "execv",
     "execve",
     "fork",
+    "spawn",
     "geteuid",
     "getpid",
     "getuid",
@@ -60,6 +65,9 @@ FUNCS = [
     "close",
     "dup2",
     "read",
+    "read_all",
+    "read_line",
+    "read_lines",
     "write",
     "fdopen",
     "isatty",
@@ -101,6 +109,139 @@ class PosixTest(unittest.TestCase):
     posix_.read(0, 0)
     posix_.write(1, '')
 
+  def testSpawn(self):
+    r, w = posix_.pipe()
+    posix_.dup2(w, 9)
+    posix_.close(w)
+    # The child inherits fds, and SIGPIPE is reset
+    argv = ['/bin/sh', '-c', 'echo "$FOO" >&9; kill -PIPE $$']
+    pid = posix_.spawn('/bin/sh', argv, {'FOO': 'bar'}, [signal.SIGPIPE])
+    posix_.close(9)
+    self.assertEqual('bar\n', posix_.read(r, 100))
+    posix_.close(r)
+
+    _, status = posix_.waitpid(pid, 0)
+    self.assertEqual(True, posix_.WIFSIGNALED(status))
+    self.assertEqual(signal.SIGPIPE, posix_.WTERMSIG(status))
+
+    try:
+      posix_.spawn('/nonexistent', ['x'], {}, [])
+    except OSError as e:
+      self.assertEqual(errno.ENOENT, e.errno)
+    else:
+      self.fail('Expected OSError')
+
+  def testReadAll(self):
+    # Bigger than the initial buffer and a pipe's capacity, so it grows.
+    big = 'x' * 100000 + '\n\n'
+    r, w = posix_.pipe()
+    pid = posix_.fork()
+    if pid == 0:
+      posix_.close(r)
+      posix_.write(w, big)
+      posix_._exit(0)
+    posix_.close(w)
+    self.assertEqual(big, posix_.read_all(r))
+    posix_.close(r)
+    posix_.waitpid(pid, 0)
+
+    # A regular file, with trailing newlines stripped
+    path = '/tmp/posix_test.%d' % posix_.getpid()
+    with open(path, 'w') as f:
+      f.write('a\nb\n\n')
+    fd = posix_.open(path, posix_.O_RDONLY, 0)
+    self.assertEqual('a\nb', posix_.read_all(fd, True))
+    self.assertEqual('', posix_.read_all(fd, True))  # at EOF
+    posix_.close(fd)
+    os.remove(path)
+
+  def testReadLine(self):
+    # A regular file.  Lines longer than the initial buffer make it grow.
+    long_line = 'y' * 1000 + '\n'
+    path = '/tmp/posix_test.%d' % posix_.getpid()
+    with open(path, 'w') as f:
+      f.write('one\n' + long_line + '\nlast')
+    fd = posix_.open(path, posix_.O_RDONLY, 0)
+    self.assertEqual('one\n', posix_.read_line(fd))
+    # It seeked back to just after the newline.
+    self.assertEqual(4, os.lseek(fd, 0, os.SEEK_CUR))
+    self.assertEqual(long_line, posix_.read_line(fd))
+    self.assertEqual('\n', posix_.read_line(fd))
+    self.assertEqual('last', posix_.read_line(fd))
+    self.assertEqual('', posix_.read_line(fd))  # EOF
+    posix_.close(fd)
+    os.remove(path)
+
+    # A pipe leaves the bytes after the newline.
+    r, w = posix_.pipe()
+    posix_.write(w, 'a\nb\n')
+    posix_.close(w)
+    self.assertEqual('a\n', posix_.read_line(r))
+    self.assertEqual('b\n', posix_.read(r, 100))
+    posix_.close(r)
+
+  def testReadLines(self):
+    path = '/tmp/posix_test.%d' % posix_.getpid()
+    with open(path, 'w') as f:
+      f.write('one\ntwo\n\nlast')
+    fd = posix_.open(path, posix_.O_RDONLY, 0)
+    self.assertEqual(['one\n', 'two\n'], posix_.read_lines(fd, '\n', 2, False))
+    # It seeked back to just after the second line.
+    self.assertEqual(8, os.lseek(fd, 0, os.SEEK_CUR))
+    self.assertEqual(['', 'last'], posix_.read_lines(fd, '\n', 0, True))
+    self.assertEqual([], posix_.read_lines(fd, '\n', 0, True))  # EOF
+    posix_.close(fd)
+    os.remove(path)
+
+    # Lines longer than the initial buffer make it grow.
+    r, w = posix_.pipe()
+    long_line = 'y' * 100000
+    pid = posix_.fork()
+    if pid == 0:
+      posix_.close(r)
+      posix_.write(w, ('%s\0' % long_line) * 3)
+      posix_._exit(0)
+    posix_.close(w)
+    self.assertEqual([long_line] * 3, posix_.read_lines(r, '\0', 0, True))
+    posix_.waitpid(pid, 0)
+    posix_.close(r)
+
+    # With a count, a pipe leaves the bytes after the last line.
+    r, w = posix_.pipe()
+    posix_.write(w, 'a:b:c')
+    posix_.close(w)
+    self.assertEqual(['a:'], posix_.read_lines(r, ':', 1, False))
+    self.assertEqual('b:c', posix_.read(r, 100))
+    posix_.close(r)
+
+  def testSendFds(self):
+    path = '/tmp/posix_test.%d.sock' % posix_.getpid()
+    listen_fd = posix_.unix_listen(path, 1)
+    client = posix_.unix_connect(path)
+    server = posix_.unix_accept(listen_fd)
+    posix_.close(listen_fd)
+    posix_.unlink(path)
+
+    r, w = posix_.pipe()
+    self.assertEqual(3, posix_.send_fds(client, 'abc', [w]))
+    posix_.close(w)
+
+    data, fds = posix_.recv_fds(server, 100)
+    self.assertEqual('abc', data)
+    self.assertEqual(1, len(fds))
+    # The received descriptor is the write end of the same pipe.
+    posix_.write(fds[0], 'passed')
+    posix_.close(fds[0])
+    self.assertEqual('passed', posix_.read(r, 100))
+    posix_.close(r)
+
+    # At least one byte has to carry the descriptors.
+    self.assertRaises(ValueError, posix_.send_fds, client, '', [0])
+
+    posix_.close(client)
+    self.assertEqual(('', []), posix_.recv_fds(server, 100))  # EOF
+    posix_.close(server)
+
   def testRead(self):
     if posix_.environ.get('EINTR_TEST'):
       # Now we can do kill -TERM PID can get EINTR.
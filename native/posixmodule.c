@@ -52,6 +52,11 @@ corresponding Unix manual entries for more information on calls.");
 #include <fcntl.h>
 #endif /* HAVE_FCNTL_H */
 
+#include <spawn.h>  /* for posix_spawn() */
+#include <sys/ioctl.h>  /* for FIONREAD */
+#include <sys/socket.h>  /* for send_fds() */
+#include <sys/un.h>
+
 /* sys/resource.h is needed for at least: wait3(), wait4(), broken nice. */
 #if defined(HAVE_SYS_RESOURCE_H)
 #include <sys/resource.h>
@@ -1319,6 +1324,117 @@ posix_fork(PyObject *self, PyObject *noargs)
 }
 #endif
 
+/* OSH addition: posix_spawn() for the common case of an external command
+   with no redirects to apply in the child.  It doesn't copy the shell's page
+   tables like fork() does. */
+
+PyDoc_STRVAR_remove(posix_spawn__doc__,
+"spawn(path, args, env, sigdefault) -> pid\n\n\
+Start a process with posix_spawn().\n\
+\n\
+    path: path of executable file\n\
+    args: list of arguments\n\
+    env: dictionary of strings mapping to strings\n\
+    sigdefault: list of signals to reset to SIG_DFL in the child");
+
+static PyObject *
+posix_spawn_(PyObject *self, PyObject *args)
+{
+    char *path;
+    PyObject *argv, *env, *sigdefault;
+    char **argvlist = NULL;
+    char **envlist = NULL;
+    Py_ssize_t i, argc, envc = 0;
+    PyObject *key, *val;
+    Py_ssize_t pos = 0;
+    posix_spawnattr_t attr;
+    sigset_t sigs;
+    short flags = POSIX_SPAWN_SETSIGDEF;
+    pid_t pid;
+    int err;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "sO!O!O!:spawn", &path,
+                          &PyList_Type, &argv, &PyDict_Type, &env,
+                          &PyList_Type, &sigdefault))
+        return NULL;
+
+    argc = PyList_GET_SIZE(argv);
+    argvlist = PyMem_NEW(char *, argc + 1);
+    if (argvlist == NULL)
+        return PyErr_NoMemory();
+    for (i = 0; i < argc; i++) {
+        if (!PyArg_Parse(PyList_GET_ITEM(argv, i),
+                         "s;spawn() arg 2 must contain only strings",
+                         &argvlist[i]))
+            goto fail_1;
+    }
+    argvlist[argc] = NULL;
+
+    envlist = PyMem_NEW(char *, PyDict_Size(env) + 1);
+    if (envlist == NULL) {
+        PyErr_NoMemory();
+        goto fail_1;
+    }
+    while (PyDict_Next(env, &pos, &key, &val)) {
+        char *p, *k, *v;
+        size_t len;
+
+        if (!PyArg_Parse(key, "s;spawn() arg 3 contains a non-string key",
+                         &k) ||
+            !PyArg_Parse(val, "s;spawn() arg 3 contains a non-string value",
+                         &v))
+            goto fail_2;
+
+        len = PyString_Size(key) + PyString_Size(val) + 2;
+        p = PyMem_NEW(char, len);
+        if (p == NULL) {
+            PyErr_NoMemory();
+            goto fail_2;
+        }
+        PyOS_snprintf(p, len, "%s=%s", k, v);
+        envlist[envc++] = p;
+    }
+    envlist[envc] = NULL;
+
+    sigemptyset(&sigs);
+    for (i = 0; i < PyList_GET_SIZE(sigdefault); i++) {
+        long sig = PyInt_AsLong(PyList_GET_ITEM(sigdefault, i));
+        if (sig == -1 && PyErr_Occurred())
+            goto fail_2;
+        sigaddset(&sigs, (int)sig);
+    }
+
+    err = posix_spawnattr_init(&attr);
+    if (err != 0) {
+        errno = err;
+        posix_error();
+        goto fail_2;
+    }
+#ifdef POSIX_SPAWN_USEVFORK
+    flags |= POSIX_SPAWN_USEVFORK;
+#endif
+    posix_spawnattr_setflags(&attr, flags);
+    posix_spawnattr_setsigdefault(&attr, &sigs);
+
+    err = posix_spawn(&pid, path, NULL, &attr, argvlist, envlist);
+    posix_spawnattr_destroy(&attr);
+    if (err != 0) {
+        errno = err;
+        posix_error();
+    } else {
+        result = PyLong_FromPid(pid);
+    }
+
+  fail_2:
+    while (--envc >= 0)
+        PyMem_DEL(envlist[envc]);
+    PyMem_DEL(envlist);
+  fail_1:
+    PyMem_DEL(argvlist);
+    return result;
+}
+
 #ifdef HAVE_GETEGID
 PyDoc_STRVAR_remove(posix_getegid__doc__,
 "getegid() -> egid\n\n\
@@ -2115,6 +2231,604 @@ posix_read(PyObject *self, PyObject *args)
 }
 
 
+/* OVM_MAIN patch: read_all() for command sub.  Reading 4096 bytes at a time
+ * and joining the chunks in Python copies the output twice. */
+
+/* A guess at how many bytes are left to read, or 0. */
+static Py_ssize_t
+_read_all_hint(int fd)
+{
+    struct stat st;
+    if (fstat(fd, &st) == 0 && S_ISREG(st.st_mode)) {
+        off_t pos = lseek(fd, 0, SEEK_CUR);
+        if (pos >= 0 && st.st_size > pos)
+            return (Py_ssize_t)(st.st_size - pos);
+        return 0;
+    }
+#ifdef FIONREAD
+    {
+        int avail = 0;
+        if (ioctl(fd, FIONREAD, &avail) == 0 && avail > 0)
+            return avail;
+    }
+#endif
+    return 0;
+}
+
+PyDoc_STRVAR_remove(posix_read_all__doc__,
+"read_all(fd, strip_newlines=False) -> string\n\n\
+Read a file descriptor until EOF, optionally removing trailing newlines.");
+
+static PyObject *
+posix_read_all(PyObject *self, PyObject *args)
+{
+    int fd, strip_newlines = 0;
+    Py_ssize_t size, len = 0, hint;
+    ssize_t n;
+    char *buf;
+    PyObject *buffer;
+    if (!PyArg_ParseTuple(args, "i|i:read_all", &fd, &strip_newlines))
+        return NULL;
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+
+    /* One more than the hint, so we can see EOF without growing. */
+    size = _read_all_hint(fd) + 1;
+    if (size < 4096)
+        size = 4096;
+    buffer = PyString_FromStringAndSize((char *)NULL, size);
+    if (buffer == NULL)
+        return NULL;
+
+    while (1) {
+        if (len == size) {
+            /* Grow geometrically, or to what's already in the pipe. */
+            Py_ssize_t new_size = size * 2;
+            hint = _read_all_hint(fd);
+            if (len + hint + 1 > new_size)
+                new_size = len + hint + 1;
+            if (_PyString_Resize(&buffer, new_size) < 0)
+                return NULL;  /* buffer was freed */
+            size = new_size;
+        }
+        buf = PyString_AS_STRING(buffer);
+
+        Py_BEGIN_ALLOW_THREADS
+        n = read(fd, buf + len, size - len);
+        Py_END_ALLOW_THREADS
+
+        if (n > 0) {
+            len += n;
+        } else if (n == 0) {  /* EOF */
+            break;
+        } else {
+            if (PyErr_CheckSignals()) {
+                Py_DECREF(buffer);
+                return NULL;  /* Propagate KeyboardInterrupt */
+            }
+            if (errno != EINTR) {
+                Py_DECREF(buffer);
+                return posix_error();
+            }
+            /* Otherwise, try again on EINTR. */
+        }
+    }
+
+    if (strip_newlines) {
+        buf = PyString_AS_STRING(buffer);
+        while (len > 0 && buf[len - 1] == '\n')
+            len--;
+    }
+    if (len != size && _PyString_Resize(&buffer, len) < 0)
+        return NULL;
+    return buffer;
+}
+
+
+/* OVM_MAIN patch: read_line() for the 'read' builtin.  It must not consume
+ * any bytes after the newline, because another process may read them.
+ *
+ * - For a regular file, we read a block and then lseek() back to just after
+ *   the newline, like bash.
+ * - Otherwise, e.g. for a pipe or terminal, we have to read one byte at a
+ *   time, as POSIX requires.  Doing that here saves a Python call per byte.
+ */
+
+PyDoc_STRVAR_remove(posix_read_line__doc__,
+"read_line(fd) -> string\n\n\
+Read up to and including a newline.  Returns '' at EOF.");
+
+static PyObject *
+posix_read_line(PyObject *self, PyObject *args)
+{
+    int fd, seekable;
+    struct stat st;
+    Py_ssize_t size = 256, len = 0;
+    ssize_t n;
+    char *buf, *newline;
+    PyObject *buffer;
+    if (!PyArg_ParseTuple(args, "i:read_line", &fd))
+        return NULL;
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+
+    seekable = (fstat(fd, &st) == 0 && S_ISREG(st.st_mode) &&
+                lseek(fd, 0, SEEK_CUR) >= 0);
+
+    buffer = PyString_FromStringAndSize((char *)NULL, size);
+    if (buffer == NULL)
+        return NULL;
+
+    while (1) {
+        if (len == size) {
+            if (_PyString_Resize(&buffer, size * 2) < 0)
+                return NULL;  /* buffer was freed */
+            size *= 2;
+        }
+        buf = PyString_AS_STRING(buffer);
+
+        Py_BEGIN_ALLOW_THREADS
+        n = read(fd, buf + len, seekable ? size - len : 1);
+        Py_END_ALLOW_THREADS
+
+        if (n > 0) {
+            newline = memchr(buf + len, '\n', n);
+            len += n;
+            if (newline != NULL) {
+                Py_ssize_t end = newline - buf + 1;
+                /* Give back what we read past the newline. */
+                if (end < len && lseek(fd, end - len, SEEK_CUR) < 0) {
+                    Py_DECREF(buffer);
+                    return posix_error();
+                }
+                len = end;
+                break;
+            }
+        } else if (n == 0) {  /* EOF */
+            break;
+        } else {
+            if (PyErr_CheckSignals()) {
+                if (seekable && len > 0)
+                    lseek(fd, -len, SEEK_CUR);  /* unread the partial line */
+                Py_DECREF(buffer);
+                return NULL;  /* Propagate KeyboardInterrupt */
+            }
+            if (errno != EINTR) {
+                Py_DECREF(buffer);
+                return posix_error();
+            }
+            /* Otherwise, try again on EINTR. */
+        }
+    }
+
+    if (len != size && _PyString_Resize(&buffer, len) < 0)
+        return NULL;
+    return buffer;
+}
+
+/* OVM_MAIN patch: read_lines() for the 'mapfile' builtin.
+ *
+ * - With count == 0, we read the whole input, so we can read big blocks from
+ *   any kind of file.
+ * - With a count, we read blocks from a regular file and lseek() back past
+ *   the last line, like read_line().  Otherwise we read a byte at a time.
+ */
+
+PyDoc_STRVAR_remove(posix_read_lines__doc__,
+"read_lines(fd, delim, count, strip) -> list of strings\n\n\
+Read up to count lines ending with delim, or all of them if count is 0.\n\
+If strip is true, remove the delimiters.");
+
+static int
+append_line(PyObject *lines, char *start, Py_ssize_t len)
+{
+    int status;
+    PyObject *line = PyString_FromStringAndSize(start, len);
+    if (line == NULL)
+        return -1;
+    status = PyList_Append(lines, line);
+    Py_DECREF(line);
+    return status;
+}
+
+static PyObject *
+posix_read_lines(PyObject *self, PyObject *args)
+{
+    int fd, strip, seekable, bulk;
+    char delim;
+    struct stat st;
+    Py_ssize_t count, num_lines = 0;
+    Py_ssize_t size = 65536, len = 0, start = 0, scan = 0;
+    ssize_t n;
+    char *buf, *new_buf, *end;
+    PyObject *lines;
+    if (!PyArg_ParseTuple(args, "icni:read_lines", &fd, &delim, &count,
+                          &strip))
+        return NULL;
+    if (!_PyVerify_fd(fd))
+        return posix_error();
+
+    seekable = (fstat(fd, &st) == 0 && S_ISREG(st.st_mode) &&
+                lseek(fd, 0, SEEK_CUR) >= 0);
+    bulk = (count == 0 || seekable);
+
+    lines = PyList_New(0);
+    if (lines == NULL)
+        return NULL;
+    buf = PyMem_Malloc(size);
+    if (buf == NULL) {
+        Py_DECREF(lines);
+        return PyErr_NoMemory();
+    }
+
+    while (count == 0 || num_lines < count) {
+        /* Split the lines we have. */
+        end = memchr(buf + scan, delim, len - scan);
+        if (end != NULL) {
+            if (append_line(lines, buf + start,
+                            end - buf - start + (strip ? 0 : 1)) < 0)
+                goto error;
+            num_lines++;
+            start = scan = end - buf + 1;
+            continue;
+        }
+        scan = len;
+
+        /* Move the partial line to the front, and make room for more. */
+        if (start > 0) {
+            memmove(buf, buf + start, len - start);
+            len -= start;
+            scan = len;
+            start = 0;
+        }
+        if (len == size) {
+            new_buf = PyMem_Realloc(buf, size * 2);
+            if (new_buf == NULL) {
+                PyErr_NoMemory();
+                goto error;
+            }
+            buf = new_buf;
+            size *= 2;
+        }
+
+        Py_BEGIN_ALLOW_THREADS
+        n = read(fd, buf + len, bulk ? size - len : 1);
+        Py_END_ALLOW_THREADS
+
+        if (n > 0) {
+            len += n;
+        } else if (n == 0) {  /* EOF, with a possible unterminated line */
+            if (len > 0 && append_line(lines, buf, len) < 0)
+                goto error;
+            len = 0;
+            break;
+        } else {
+            if (PyErr_CheckSignals())
+                goto error;  /* Propagate KeyboardInterrupt */
+            if (errno != EINTR) {
+                posix_error();
+                goto error;
+            }
+            /* Otherwise, try again on EINTR. */
+        }
+    }
+
+    /* Give back what we read past the last line. */
+    if (len > start && lseek(fd, start - len, SEEK_CUR) < 0) {
+        posix_error();
+        goto error;
+    }
+    PyMem_Free(buf);
+    return lines;
+
+error:
+    if (seekable && len > start)
+        lseek(fd, start - len, SEEK_CUR);
+    PyMem_Free(buf);
+    Py_DECREF(lines);
+    return NULL;
+}
+
+
+/* OVM_MAIN patch: Unix domain sockets and SCM_RIGHTS, for 'osh --server'.
+ * The OVM build doesn't have the socket module, and Python 2's socket module
+ * can't pass file descriptors anyway.
+ *
+ * Every descriptor these functions return is close-on-exec. */
+
+#define MAX_PASSED_FDS 16
+
+static int
+_unix_addr(const char *path, struct sockaddr_un *addr)
+{
+    if (strlen(path) >= sizeof(addr->sun_path)) {
+        errno = ENAMETOOLONG;
+        return -1;
+    }
+    memset(addr, 0, sizeof(*addr));
+    addr->sun_family = AF_UNIX;
+    strcpy(addr->sun_path, path);
+    return 0;
+}
+
+static int
+_unix_socket(void)
+{
+    int fd;
+#ifdef SOCK_CLOEXEC
+    fd = socket(AF_UNIX, SOCK_STREAM | SOCK_CLOEXEC, 0);
+#else
+    fd = socket(AF_UNIX, SOCK_STREAM, 0);
+    if (fd >= 0)
+        fcntl(fd, F_SETFD, FD_CLOEXEC);
+#endif
+    return fd;
+}
+
+PyDoc_STRVAR_remove(posix_unix_listen__doc__,
+"unix_listen(path, backlog) -> fd\n\n\
+Create a Unix stream socket bound to path, and listen on it.");
+
+static PyObject *
+posix_unix_listen(PyObject *self, PyObject *args)
+{
+    char *path;
+    int backlog, fd;
+    struct sockaddr_un addr;
+    if (!PyArg_ParseTuple(args, "si:unix_listen", &path, &backlog))
+        return NULL;
+    if (_unix_addr(path, &addr) < 0)
+        return posix_error_with_filename(path);
+
+    fd = _unix_socket();
+    if (fd < 0)
+        return posix_error();
+    if (bind(fd, (struct sockaddr *)&addr, sizeof(addr)) < 0 ||
+        listen(fd, backlog) < 0) {
+        int saved_errno = errno;
+        close(fd);
+        errno = saved_errno;
+        return posix_error_with_filename(path);
+    }
+    return PyInt_FromLong(fd);
+}
+
+PyDoc_STRVAR_remove(posix_unix_connect__doc__,
+"unix_connect(path) -> fd\n\n\
+Connect a Unix stream socket to path.");
+
+static PyObject *
+posix_unix_connect(PyObject *self, PyObject *args)
+{
+    char *path;
+    int fd, res;
+    struct sockaddr_un addr;
+    if (!PyArg_ParseTuple(args, "s:unix_connect", &path))
+        return NULL;
+    if (_unix_addr(path, &addr) < 0)
+        return posix_error_with_filename(path);
+
+    fd = _unix_socket();
+    if (fd < 0)
+        return posix_error();
+    while (1) {
+        Py_BEGIN_ALLOW_THREADS
+        res = connect(fd, (struct sockaddr *)&addr, sizeof(addr));
+        Py_END_ALLOW_THREADS
+        if (res == 0 || errno != EINTR)
+            break;
+        if (PyErr_CheckSignals()) {
+            close(fd);
+            return NULL;  /* Propagate KeyboardInterrupt */
+        }
+    }
+    if (res < 0) {
+        int saved_errno = errno;
+        close(fd);
+        errno = saved_errno;
+        return posix_error_with_filename(path);
+    }
+    return PyInt_FromLong(fd);
+}
+
+PyDoc_STRVAR_remove(posix_unix_accept__doc__,
+"unix_accept(fd) -> fd2\n\n\
+Accept a connection on a listening socket.");
+
+static PyObject *
+posix_unix_accept(PyObject *self, PyObject *args)
+{
+    int fd, conn;
+    if (!PyArg_ParseTuple(args, "i:unix_accept", &fd))
+        return NULL;
+    while (1) {
+        Py_BEGIN_ALLOW_THREADS
+#ifdef SOCK_CLOEXEC
+        conn = accept4(fd, NULL, NULL, SOCK_CLOEXEC);
+#else
+        conn = accept(fd, NULL, NULL);
+#endif
+        Py_END_ALLOW_THREADS
+        if (conn >= 0)
+            break;
+        if (PyErr_CheckSignals())
+            return NULL;  /* Propagate KeyboardInterrupt */
+        if (errno != EINTR)
+            return posix_error();
+    }
+#ifndef SOCK_CLOEXEC
+    fcntl(conn, F_SETFD, FD_CLOEXEC);
+#endif
+    return PyInt_FromLong(conn);
+}
+
+PyDoc_STRVAR_remove(posix_send_fds__doc__,
+"send_fds(fd, data, fds) -> int\n\n\
+Send data over a Unix socket, along with copies of the descriptors in the\n\
+list fds.  Returns the number of bytes sent, which may be less than\n\
+len(data).  The descriptors are sent with the first byte.");
+
+static PyObject *
+posix_send_fds(PyObject *self, PyObject *args)
+{
+    int fd, num_fds, i;
+    Py_buffer pbuf;
+    PyObject *fd_list;
+    struct msghdr msg;
+    struct iovec iov;
+    union {
+        struct cmsghdr hdr;
+        char buf[CMSG_SPACE(sizeof(int) * MAX_PASSED_FDS)];
+    } cmsg_buf;
+    struct cmsghdr *cmsg;
+    int *fd_array;
+    ssize_t n;
+
+    if (!PyArg_ParseTuple(args, "is*O!:send_fds", &fd, &pbuf,
+                          &PyList_Type, &fd_list))
+        return NULL;
+    num_fds = PyList_GET_SIZE(fd_list);
+    if (num_fds > MAX_PASSED_FDS || pbuf.len == 0) {
+        PyBuffer_Release(&pbuf);
+        PyErr_SetString(PyExc_ValueError,
+                        "send_fds: need data, and at most 16 fds");
+        return NULL;
+    }
+
+    memset(&msg, 0, sizeof(msg));
+    iov.iov_base = pbuf.buf;
+    iov.iov_len = pbuf.len;
+    msg.msg_iov = &iov;
+    msg.msg_iovlen = 1;
+    if (num_fds > 0) {
+        msg.msg_control = cmsg_buf.buf;
+        msg.msg_controllen = CMSG_SPACE(sizeof(int) * num_fds);
+        cmsg = CMSG_FIRSTHDR(&msg);
+        cmsg->cmsg_level = SOL_SOCKET;
+        cmsg->cmsg_type = SCM_RIGHTS;
+        cmsg->cmsg_len = CMSG_LEN(sizeof(int) * num_fds);
+        fd_array = (int *)CMSG_DATA(cmsg);
+        for (i = 0; i < num_fds; ++i) {
+            fd_array[i] = (int)PyInt_AsLong(PyList_GET_ITEM(fd_list, i));
+            if (fd_array[i] == -1 && PyErr_Occurred()) {
+                PyBuffer_Release(&pbuf);
+                return NULL;
+            }
+        }
+    }
+
+    while (1) {
+        Py_BEGIN_ALLOW_THREADS
+        n = sendmsg(fd, &msg, 0);
+        Py_END_ALLOW_THREADS
+        if (n >= 0)
+            break;
+        if (PyErr_CheckSignals()) {
+            PyBuffer_Release(&pbuf);
+            return NULL;  /* Propagate KeyboardInterrupt */
+        }
+        if (errno != EINTR) {
+            PyBuffer_Release(&pbuf);
+            return posix_error();
+        }
+    }
+    PyBuffer_Release(&pbuf);
+    return PyInt_FromSsize_t(n);
+}
+
+PyDoc_STRVAR_remove(posix_recv_fds__doc__,
+"recv_fds(fd, buffersize) -> (string, list of fds)\n\n\
+Receive data from a Unix socket, along with any descriptors that were sent\n\
+with it.  An empty string means EOF.");
+
+static PyObject *
+posix_recv_fds(PyObject *self, PyObject *args)
+{
+    int fd, size, i, num_fds;
+    struct msghdr msg;
+    struct iovec iov;
+    union {
+        struct cmsghdr hdr;
+        char buf[CMSG_SPACE(sizeof(int) * MAX_PASSED_FDS)];
+    } cmsg_buf;
+    struct cmsghdr *cmsg;
+    int *fd_array;
+    ssize_t n;
+    int flags = 0;
+    PyObject *buffer, *fd_list, *result;
+
+    if (!PyArg_ParseTuple(args, "ii:recv_fds", &fd, &size))
+        return NULL;
+    if (size < 0) {
+        errno = EINVAL;
+        return posix_error();
+    }
+    buffer = PyString_FromStringAndSize((char *)NULL, size);
+    if (buffer == NULL)
+        return NULL;
+
+    memset(&msg, 0, sizeof(msg));
+    iov.iov_base = PyString_AS_STRING(buffer);
+    iov.iov_len = size;
+    msg.msg_iov = &iov;
+    msg.msg_iovlen = 1;
+    msg.msg_control = cmsg_buf.buf;
+    msg.msg_controllen = sizeof(cmsg_buf.buf);
+#ifdef MSG_CMSG_CLOEXEC
+    flags = MSG_CMSG_CLOEXEC;
+#endif
+
+    while (1) {
+        Py_BEGIN_ALLOW_THREADS
+        n = recvmsg(fd, &msg, flags);
+        Py_END_ALLOW_THREADS
+        if (n >= 0)
+            break;
+        if (PyErr_CheckSignals()) {
+            Py_DECREF(buffer);
+            return NULL;  /* Propagate KeyboardInterrupt */
+        }
+        if (errno != EINTR) {
+            Py_DECREF(buffer);
+            return posix_error();
+        }
+    }
+
+    fd_list = PyList_New(0);
+    if (fd_list == NULL) {
+        Py_DECREF(buffer);
+        return NULL;
+    }
+    for (cmsg = CMSG_FIRSTHDR(&msg); cmsg != NULL;
+         cmsg = CMSG_NXTHDR(&msg, cmsg)) {
+        if (cmsg->cmsg_level != SOL_SOCKET || cmsg->cmsg_type != SCM_RIGHTS)
+            continue;
+        num_fds = (cmsg->cmsg_len - CMSG_LEN(0)) / sizeof(int);
+        fd_array = (int *)CMSG_DATA(cmsg);
+        for (i = 0; i < num_fds; ++i) {
+            PyObject *item = PyInt_FromLong(fd_array[i]);
+            if (item == NULL || PyList_Append(fd_list, item) < 0) {
+                Py_XDECREF(item);
+                Py_DECREF(fd_list);
+                Py_DECREF(buffer);
+                return NULL;
+            }
+            Py_DECREF(item);
+#ifndef MSG_CMSG_CLOEXEC
+            fcntl(fd_array[i], F_SETFD, FD_CLOEXEC);
+#endif
+        }
+    }
+
+    if (n != size && _PyString_Resize(&buffer, n) < 0) {
+        Py_DECREF(fd_list);
+        return NULL;
+    }
+    result = Py_BuildValue("NN", buffer, fd_list);
+    return result;
+}
+
+
 PyDoc_STRVAR_remove(posix_write__doc__,
 "write(fd, string) -> byteswritten\n\n\
 Write a string to a file descriptor.");
@@ -42,7 +42,7 @@ class Repr(object):
         status = 1
       else:
         sys.stdout.write('%s = ' % name)
-        cell.PrettyPrint()  # may be color
+        cell.PrettyPrint(sys.stdout)  # may be color
         sys.stdout.write('\n')
     return status
 
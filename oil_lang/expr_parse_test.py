@@ -140,6 +140,28 @@ EOF)
       #print(p)
       pass
 
+  def testLazyGrammar(self):
+    loader = pyutil.GetResourceLoader()
+    lazy = meta.LazyOilGrammar(loader)
+    parse_ctx = parse_lib.ParseContext(self.arena, parse_lib.OilParseOptions(),
+                                       {}, lazy)
+
+    line_reader = reader.StringLineReader('echo hi\n', self.arena)
+    parse_ctx.MakeOshParser(line_reader).ParseLogicalLine()
+    self.assertEqual(None, lazy.oil_grammar)  # OSH doesn't need it
+
+    line_reader = reader.StringLineReader('var x = 1 + 2\n', self.arena)
+    parse_ctx.MakeOshParser(line_reader).ParseLogicalLine()
+    gr = lazy.oil_grammar
+    self.assertNotEqual(None, gr)
+    self.assertIs(gr, lazy.Get())
+
+    # The tables that aren't saved are derived when loading.
+    for num, name in gr.number2symbol.iteritems():
+      self.assertEqual(num, gr.symbol2number[name])
+    for num, (states, first) in gr.dfas.iteritems():
+      self.assertIs(gr.states[num - 256], states)
+
 
 if __name__ == '__main__':
   unittest.main()
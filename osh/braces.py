@@ -299,11 +299,9 @@ def _LeadingZeros(s):
 
 
 def _RangeStrings(part):
-  # type: (word_part__BracedRange) -> List[str]
-
+  # type: (word_part__BracedRange) -> Iterator[str]
+  """Generate the strings of a range, e.g. {1..10..2} or {a..z}."""
   if part.kind == Id.Range_Int:
-    nums = []
-
     z1 = _LeadingZeros(part.start)
     z2 = _LeadingZeros(part.end)
 
@@ -323,40 +321,34 @@ def _RangeStrings(part):
     step = part.step
     if step > 0:
       while True:
-        nums.append(fmt % n)
+        yield fmt % n
         n += step
         if n > end:
           break
     else:
       while True:
-        nums.append(fmt % n)
+        yield fmt % n
         n += step
         if n < end:
           break
 
-    return nums
-
   else:  # Id.Range_Char
-    chars = []
-
     n = ord(part.start)
     ord_end = ord(part.end)
     step = part.step
     if step > 0:
       while True:
-        chars.append(chr(n))
+        yield chr(n)
         n += step
         if n > ord_end:
           break
     else:
       while True:
-        chars.append(chr(n))
+        yield chr(n)
         n += step
         if n < ord_end:
           break
 
-    return chars
-
 
 def _ExpandPart(parts,  # type: List[word_part_t]
                 first_alt_index,  # type: int
@@ -448,3 +440,70 @@ def BraceExpandWords(words):
     else:
       out.append(w)
   return out
+
+
+# Literals that evaluate to themselves.  Other literals may be globs (Lit_Star),
+# tildes (Lit_TildeLike), escapes, etc.
+_STATIC_LITERAL_IDS = (Id.Lit_Chars, Id.Lit_Other)
+
+
+def _IsStatic(parts):
+  # type: (List[word_part_t]) -> bool
+  """Are the parts only literals, ranges, and tuples of those?"""
+  for part in parts:
+    if isinstance(part, word_part__Literal):
+      if part.token.id not in _STATIC_LITERAL_IDS:
+        return False
+    elif isinstance(part, word_part__BracedRange):
+      pass
+    elif isinstance(part, word_part__BracedTuple):
+      for w in part.words:
+        assert isinstance(w, word__Compound)  # for MyPy
+        if not _IsStatic(w.parts):
+          return False
+    else:  # substitutions, quotes, etc.
+      return False
+  return True
+
+
+def _StaticStrings(parts):
+  # type: (List[word_part_t]) -> Iterator[str]
+  """Like _BraceExpand(), but generates strings instead of part lists.
+
+  The parts must satisfy _IsStatic().
+  """
+  first_alt_index = -1
+  for i, part in enumerate(parts):
+    if isinstance(part, (word_part__BracedTuple, word_part__BracedRange)):
+      first_alt_index = i
+      break
+
+  if first_alt_index == -1:
+    yield ''.join(part.token.val for part in parts)
+    return
+
+  prefix = ''.join(part.token.val for part in parts[:first_alt_index])
+  expand_part = parts[first_alt_index]
+  tail_parts = parts[first_alt_index+1 : ]
+
+  if isinstance(expand_part, word_part__BracedTuple):
+    for w in expand_part.words:
+      for alt in _StaticStrings(w.parts):
+        for suffix in _StaticStrings(tail_parts):
+          yield prefix + alt + suffix
+  else:
+    for alt in _RangeStrings(expand_part):
+      for suffix in _StaticStrings(tail_parts):
+        yield prefix + alt + suffix
+
+
+def BraceExpandStatic(w):
+  # type: (word_t) -> Optional[Iterator[str]]
+  """Generate the strings of a brace expansion of literals, like {1..1000000}.
+
+  Returns None if w isn't a BracedTree, or if evaluating it could depend on
+  state.  Empty strings are skipped, since word evaluation elides them.
+  """
+  if not isinstance(w, word__BracedTree) or not _IsStatic(w.parts):
+    return None
+  return (s for s in _StaticStrings(w.parts) if s)
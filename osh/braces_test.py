@@ -182,6 +182,30 @@ class BracesTest(unittest.TestCase):
       _PrettyPrint(word.Compound(parts))
       print('')
 
+  def testBraceExpandStatic(self):
+    def _Expand(s):
+      w = _assertReadWord(self, s)
+      tree = braces._BraceDetect(w) or w
+      return braces.BraceExpandStatic(tree)
+
+    self.assertEqual(None, _Expand('hi'))  # not a BracedTree
+    self.assertEqual(None, _Expand('$x{1..3}'))
+    self.assertEqual(None, _Expand('*{1..3}'))  # glob
+    self.assertEqual(None, _Expand('{a,"b"}'))
+
+    self.assertEqual(['1', '2', '3'], list(_Expand('{1..3}')))
+    self.assertEqual(
+        ['B-a-c-E', 'B-a-d-E', 'B-b-c-E', 'B-b-d-E'],
+        list(_Expand('B-{a,b}-{c,d}-E')))
+    self.assertEqual(
+        ['a-', '01-', '03-', '-'], list(_Expand('{a,{01..3..2},}-')))
+    self.assertEqual(['a'], list(_Expand('{,a}')))  # empty strings are elided
+
+    # The strings are generated as they're consumed.
+    it = _Expand('x{1..1000000000}')
+    self.assertEqual('x1', it.next())
+    self.assertEqual('x2', it.next())
+
 
 if __name__ == '__main__':
   unittest.main()
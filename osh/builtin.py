@@ -78,6 +78,8 @@ _SPECIAL_ASSIGN_BUILTINS = {
 
 _NORMAL_BUILTINS = {
     "read": builtin_e.READ,
+    "mapfile": builtin_e.MAPFILE,
+    "readarray": builtin_e.MAPFILE,
     "echo": builtin_e.ECHO,
     "printf": builtin_e.PRINTF,
 
@@ -265,21 +267,14 @@ READ_SPEC.ShortFlag('-n', args.Int)
 READ_SPEC.ShortFlag('-a', args.Str)  # name of array to read into
 
 
-# sys.stdin.readline() in Python has buffering!  TODO: Rewrite this tight loop
-# in C?  Less garbage probably.
-# NOTE that dash, mksh, and zsh all read a single byte at a time.  It appears
-# to be required by POSIX?  Could try libc getline and make this an option.
+# sys.stdin.readline() in Python has buffering!  We can't read past the
+# newline, because the rest of stdin belongs to the next command.
+#
+# dash, mksh, and zsh all read a single byte at a time, as POSIX requires for
+# pipes.  Like bash, read_line() reads a block from a regular file and then
+# seeks back.
 def ReadLineFromStdin():
-  chars = []
-  while True:
-    c = posix.read(0, 1)
-    if not c:
-      break
-    chars.append(c)
-
-    if c == '\n':
-      break
-  return ''.join(chars)
+  return posix.read_line(0)
 
 
 class Read(object):
@@ -375,6 +370,64 @@ class Read(object):
     return status
 
 
+MAPFILE_SPEC = _Register('mapfile')
+MAPFILE_SPEC.ShortFlag('-t')  # remove the delimiter
+MAPFILE_SPEC.ShortFlag('-n', args.Int)  # max number of lines
+MAPFILE_SPEC.ShortFlag('-s', args.Int)  # number of lines to skip
+MAPFILE_SPEC.ShortFlag('-u', args.Int)  # fd to read from
+MAPFILE_SPEC.ShortFlag('-d', args.Str)  # delimiter
+
+
+class MapFile(object):
+  """mapfile / readarray: read lines into an array.
+
+  Unlike a 'read' loop, posix.read_lines() reads big blocks and splits them
+  in C.  It only reads a byte at a time with -n on a pipe.
+  """
+  def __init__(self, mem, errfmt):
+    self.mem = mem
+    self.errfmt = errfmt
+
+  def __call__(self, arg_vec):
+    arg, i = MAPFILE_SPEC.ParseVec(arg_vec)
+    try:
+      name = arg_vec.strs[i]
+    except IndexError:
+      name = 'MAPFILE'  # default variable name
+
+    if arg.d is None:
+      delim = '\n'
+    elif arg.d == '':
+      delim = '\0'  # like bash
+    else:
+      delim = arg.d[0]
+
+    count = arg.n or 0  # 0 means all lines
+    skip = arg.s or 0
+    # Like bash, these are status 1 rather than usage errors.
+    if count < 0:
+      self.errfmt.Print('mapfile: invalid line count %d', count)
+      return 1
+    if skip < 0:
+      self.errfmt.Print('mapfile: invalid skip count %d', skip)
+      return 1
+    if count:
+      count += skip
+
+    fd = 0 if arg.u is None else arg.u
+    try:
+      lines = posix.read_lines(fd, delim, count, bool(arg.t))
+    except OSError as e:
+      self.errfmt.Print("mapfile: can't read fd %d: %s", fd,
+                        posix.strerror(e.errno))
+      return 1
+
+    if skip:
+      del lines[:skip]
+    state.SetArrayDynamic(self.mem, name, lines)
+    return 0
+
+
 CD_SPEC = _Register('cd')
 CD_SPEC.ShortFlag('-L')
 CD_SPEC.ShortFlag('-P')
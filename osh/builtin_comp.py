@@ -135,7 +135,7 @@ class SpecBuilder(object):
         actions.append(completion.FileSystemAction(exec_only=True))
 
         # Look on the file system.
-        a = completion.ExternalCommandAction(ex.mem)
+        a = completion.ExternalCommandAction(ex.search_path)
 
       elif name == 'directory':
         a = completion.FileSystemAction(dirs_only=True)
@@ -266,8 +266,10 @@ class Complete(object):
     except util.ParseError as e:
       # error printed above
       return 2
+    arena = self.spec_builder.parse_ctx.arena
     for command in commands:
       self.comp_lookup.RegisterName(command, base_opts, user_spec)
+      arena.Pin(('complete', command))  # the spec may have a -W word
 
     patterns = []
     for pat in patterns:
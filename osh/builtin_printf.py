@@ -167,6 +167,7 @@ class Printf(object):
         arena.PopSource()
 
       self.parse_cache[fmt] = parts
+      arena.Pin(('printf', fmt))
 
     if 0:
       print()
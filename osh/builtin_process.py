@@ -326,8 +326,16 @@ class Trap(object):
 
       raise AssertionError('Signal or trap')
 
-    # Try parsing the code first.
-    node = self.ex.ParseTrapCode(code_str)
+    # Try parsing the code first.  It's in its own generation of the Arena,
+    # so redefining the trap releases only this code.
+    arena = self.ex.arena
+    arena.BeginGeneration()
+    try:
+      node = self.ex.ParseTrapCode(code_str)
+      if node is not None:
+        arena.Pin(('trap', sig_key))
+    finally:
+      arena.EndGeneration()
     if node is None:
       return 1  # ParseTrapCode() prints an error for us.
 
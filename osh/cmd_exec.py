@@ -15,24 +15,29 @@ This just does head?  Last one wins.
 """
 from __future__ import print_function
 
+import cStringIO
 import resource
 import time
 import sys
 
 from _devbuild.gen.id_kind_asdl import Id
+from _devbuild.gen import syntax_asdl
 from _devbuild.gen.syntax_asdl import (
-    command_e, command__OilFuncProc, redir_e, assign_op_e, source,
+    command_e, command__Case, command__OilFuncProc, command__Simple, redir_e,
+    assign_op_e, source, word_part__CommandSub, word_part__Splice,
+    word_part__FuncCall, bool_expr__Unary,
 )
-from _devbuild.gen.syntax_asdl import word, command_t
+from _devbuild.gen.syntax_asdl import word, word_t, command_t, expr_t
 from _devbuild.gen.runtime_asdl import (
     lvalue, redirect,
     value, value_e, value_t,
-    scope_e, var_flags_e, builtin_e,
+    scope_e, var_flags_e, builtin_e, builtin_t,
     arg_vector, cmd_value, cmd_value_e,
 )
 from _devbuild.gen.types_asdl import redir_arg_type_e
 
 from asdl import const
+from asdl import runtime
 
 from core import main_loop
 from core import process
@@ -50,6 +55,7 @@ from osh import braces
 from osh import builtin
 from osh import builtin_pure
 from osh import expr_eval
+from osh import glob_
 from osh import state
 from osh import word_
 
@@ -59,7 +65,7 @@ try:
 except ImportError:
   from benchmarks import fake_libc as libc  # type: ignore
 
-from typing import List
+from typing import List, Dict, Tuple, Any, Callable, Iterator
 
 
 
@@ -74,9 +80,34 @@ _DISALLOWED = (
     command_e.CommandList,  # Happens in $(command sub)
 )
 
+# Facts about each type of command node that _Execute() needs on every call.
+# They only depend on the tag, so we compute them once.
+_EVAL_REDIRECTS = 1 << 0  # node.redirects are evaluated before _Dispatch()
+_DISALLOW_ERREXIT = 1 << 1  # for strict_errexit
+
+def _MakeCommandFlags():
+  # type: () -> List[int]
+  tags = [
+      (tag, name) for name, tag in vars(command_e).iteritems()
+      if not name.startswith('_')
+  ]
+  flags = [0] * (max(tag for tag, _ in tags) + 1)
+  for tag, name in tags:
+    cls = getattr(syntax_asdl, 'command__' + name)
+    # NOTE: Function definitions have redirects, but we do NOT want to
+    # evaluate them yet!  They're evaluated on every invocation.
+    if 'redirects' in cls.__slots__ and tag != command_e.FuncDef:
+      flags[tag] |= _EVAL_REDIRECTS
+    if tag in _DISALLOWED:
+      flags[tag] |= _DISALLOW_ERREXIT
+  return flags
+
+_COMMAND_FLAGS = _MakeCommandFlags()
+
+
 def _DisallowErrExit(node):
   # type: (command_t) -> bool
-  if node.tag in _DISALLOWED:
+  if _COMMAND_FLAGS[node.tag] & _DISALLOW_ERREXIT:
     return True
 
   # '! foo' is a pipeline according to the POSIX shell grammar, but it's NOT
@@ -86,6 +117,14 @@ def _DisallowErrExit(node):
   return False
 
 
+def _Chain(segments):
+  # type: (List[Any]) -> Iterator[str]
+  """Iterate over lists of strings and generators of strings, in order."""
+  for seg in segments:
+    for s in seg:
+      yield s
+
+
 class _ControlFlow(RuntimeError):
   """Internal execption for control flow.
 
@@ -128,6 +167,148 @@ class _ControlFlow(RuntimeError):
     return '<_ControlFlow %s>' % self.token
 
 
+# How _CaseMatcher checks a pattern that isn't a literal string.
+_PAT_ANY = 0  # *
+_PAT_PREFIX = 1  # foo*
+_PAT_SUFFIX = 2  # *.py
+_PAT_CONTAINS = 3  # *foo*
+_PAT_FNMATCH = 4  # other globs, like [a-z]*
+_PAT_WORD = 5  # words with expansions, like $x*, which we evaluate every time
+
+
+class _CaseMatcher(object):
+  """The patterns of a 'case' statement, compiled once.
+
+  Literal patterns are looked up in a dict, and simple globs are checked with
+  string methods instead of fnmatch().
+
+  Patterns are numbered in order across all arms, because the first one that
+  matches wins.  A dict hit only wins if no pattern before it matches.
+  """
+
+  def __init__(self):
+    # type: () -> None
+    self.arm_indices = []  # type: List[int]  # pattern number -> arm index
+    self.literals = {}  # type: Dict[str, int]  # string -> pattern number
+    # (pattern number, _PAT_*, arg) for other patterns, in order
+    self.checks = []  # type: List[Tuple[int, int, Any]]
+
+  def AddPattern(self, arm_index, pat):
+    # type: (int, str) -> None
+    """Add a constant pattern, with glob escaping."""
+    num = len(self.arm_indices)
+    self.arm_indices.append(arm_index)
+
+    lit = glob_.GlobLiteral(pat)
+    if lit is not None:
+      self.literals.setdefault(lit, num)  # the first one wins
+      return
+
+    if pat == '*':
+      self.checks.append((num, _PAT_ANY, None))
+      return
+
+    if pat.endswith('*'):
+      prefix = glob_.GlobLiteral(pat[:-1])
+      if prefix is not None:
+        self.checks.append((num, _PAT_PREFIX, prefix))
+        return
+
+    if pat.startswith('*'):
+      suffix = glob_.GlobLiteral(pat[1:])
+      if suffix is not None:
+        self.checks.append((num, _PAT_SUFFIX, suffix))
+        return
+      if pat.endswith('*'):
+        middle = glob_.GlobLiteral(pat[1:-1])
+        if middle is not None:
+          self.checks.append((num, _PAT_CONTAINS, middle))
+          return
+
+    self.checks.append((num, _PAT_FNMATCH, pat))
+
+  def AddWord(self, arm_index, pat_word):
+    # type: (int, word_t) -> None
+    """Add a pattern that has to be evaluated every time."""
+    num = len(self.arm_indices)
+    self.arm_indices.append(arm_index)
+    self.checks.append((num, _PAT_WORD, pat_word))
+
+  def Match(self, s, eval_word):
+    # type: (str, Callable[[word_t], str]) -> int
+    """Return the index of the arm that matches s, or -1.
+
+    Args:
+      eval_word: Evaluates a _PAT_WORD pattern to a string.  Like the
+        original loop, it's only called on patterns before the first match.
+    """
+    n = len(self.arm_indices)
+    first = self.literals.get(s, n)
+    for num, kind, arg in self.checks:
+      if num >= first:
+        break
+
+      if kind == _PAT_ANY:
+        matched = True
+      elif kind == _PAT_PREFIX:
+        matched = s.startswith(arg)
+      elif kind == _PAT_SUFFIX:
+        matched = s.endswith(arg)
+      elif kind == _PAT_CONTAINS:
+        matched = arg in s
+      elif kind == _PAT_FNMATCH:
+        matched = libc.fnmatch(arg, s)
+      else:
+        matched = libc.fnmatch(eval_word(arg), s)
+
+      if matched:
+        first = num
+        break
+
+    if first == n:
+      return -1
+    return self.arm_indices[first]
+
+
+class _NeedsFork(Exception):
+  """A command sub running in the shell process needs a child process.
+
+  Raised when it reaches an external command, a redirect, a pipeline, etc.
+  RunCommandSub() undoes its changes and forks instead.
+  """
+  pass
+
+
+# Builtins that only use shell variables and stdout, so a command sub can run
+# them in the shell process.  Assignment builtins like 'local' are also OK.
+_IN_PROCESS_BUILTINS = frozenset([
+    builtin_e.COLON, builtin_e.SHIFT,
+    builtin_e.ECHO, builtin_e.PRINTF, builtin_e.TRUE, builtin_e.FALSE,
+    builtin_e.TEST, builtin_e.BRACKET, builtin_e.GETOPTS, builtin_e.PWD,
+])
+
+
+def _BuiltinInProcessOk(builtin_id, argv):
+  # type: (builtin_t, List[str]) -> bool
+  if builtin_id not in _IN_PROCESS_BUILTINS:
+    return False
+  # 'test -t 1' has to see the pipe that a child would write to, not our
+  # stdout.
+  if builtin_id in (builtin_e.TEST, builtin_e.BRACKET) and '-t' in argv:
+    return False
+  return True
+
+# Commands that don't start processes or change state outside of Mem.
+_IN_PROCESS_COMMANDS = frozenset([
+    command_e.Simple, command_e.ExpandedAlias, command_e.Sentence,
+    command_e.CommandList, command_e.BraceGroup, command_e.DoGroup,
+    command_e.AndOr, command_e.If, command_e.Case, command_e.WhileUntil,
+    command_e.ForEach, command_e.ForExpr, command_e.DParen,
+    command_e.DBracket, command_e.Assignment, command_e.ControlFlow,
+    command_e.NoOp,
+])
+
+
 class Deps(object):
   def __init__(self):
     self.splitter = None
@@ -141,6 +322,7 @@ class Deps(object):
 
     self.search_path = None
     self.ext_prog = None
+    self.source_cache = None  # optional, for the 'source' builtin
 
     self.dumper = None
     self.tracer = None
@@ -196,6 +378,7 @@ class Executor(object):
 
     self.search_path = exec_deps.search_path
     self.ext_prog = exec_deps.ext_prog
+    self.source_cache = exec_deps.source_cache
     self.traps = exec_deps.traps
     self.trap_nodes = exec_deps.trap_nodes
 
@@ -212,6 +395,21 @@ class Executor(object):
     self.loop_level = 0  # for detecting bad top-level break/continue
     self.check_command_sub_status = False  # a hack
 
+    # For shopt -s fast_command_sub.  The number of command subs running in
+    # this process, and a cache of func_node -> whether its body can.
+    self.in_process_depth = 0
+    self.in_process_funcs = {}  # type: Dict[command_t, bool]
+
+    # Case node -> its compiled patterns
+    self.case_matchers = {}  # type: Dict[command__Case, _CaseMatcher]
+
+    # command_e tag -> bound method that runs the node, e.g. _DoSimple
+    self.dispatch = [self._DoNotImplemented] * len(_COMMAND_FLAGS)
+    for name, tag in vars(command_e).iteritems():
+      if not name.startswith('_') and hasattr(self, '_Do' + name):
+        self.dispatch[tag] = getattr(self, '_Do' + name)
+    self.dispatch[command_e.BraceGroup] = self._DoCommandList
+
   def _EvalHelper(self, c_parser, src):
     self.arena.PushSource(src)
     try:
@@ -219,6 +417,47 @@ class Executor(object):
     finally:
       self.arena.PopSource()
 
+  def _SourceFile(self, f, path, src):
+    """Parse and execute a sourced file, using the cache if it's enabled."""
+    cache = self.source_cache
+    key = cache.MakeKey(path) if cache else None
+    if key is None:
+      line_reader = reader.FileLineReader(f, self.arena)
+      c_parser = self.parse_ctx.MakeOshParser(line_reader)
+      return self._EvalHelper(c_parser, src)
+
+    self.arena.PushSource(src)
+    try:
+      entry = cache.Get(key, src)
+      if entry is not None:  # skip lexing and parsing
+        nodes, line_nums = entry
+        status, resume_line = main_loop.BatchFromNodes(
+            self, nodes, line_nums, cache.ParseState)
+        if resume_line == -1:
+          return status
+
+        # A command changed an alias or parse option, so the rest of the file
+        # has to be parsed with it.
+        for _ in xrange(resume_line - 1):
+          f.readline()
+        line_reader = reader.FileLineReader(f, self.arena)
+        line_reader.line_num = resume_line
+        c_parser = self.parse_ctx.MakeOshParser(line_reader)
+        return main_loop.Batch(self, c_parser, self.arena)
+
+      line_begin = self.arena.LastLineId()
+      span_begin = self.arena.LastSpanId()
+
+      line_reader = reader.FileLineReader(f, self.arena)
+      c_parser = self.parse_ctx.MakeOshParser(line_reader)
+      status, nodes, line_nums = main_loop.BatchAndRecord(
+          self, c_parser, line_reader, self.arena, cache.ParseState)
+      if nodes is not None:
+        cache.Put(key, nodes, line_nums, src, line_begin, span_begin)
+      return status
+    finally:
+      self.arena.PopSource()
+
   def _Eval(self, arg_vec):
     if self.exec_opts.strict_eval_builtin:
       # To be less confusing, eval accepts EXACTLY one string arg.
@@ -278,16 +517,14 @@ class Executor(object):
       return 1
 
     try:
-      line_reader = reader.FileLineReader(f, self.arena)
-      c_parser = self.parse_ctx.MakeOshParser(line_reader)
-
       # A sourced module CAN have a new arguments array, but it always shares
       # the same variable scope as the caller.  The caller could be at either a
       # global or a local scope.
       source_argv = argv[2:]
       self.mem.PushSource(path, source_argv)
       try:
-        status = self._EvalHelper(c_parser, source.SourcedFile(path, call_spid))
+        status = self._SourceFile(f, resolved,
+                                  source.SourcedFile(path, call_spid))
       finally:
         self.mem.PopSource(source_argv)
 
@@ -572,6 +809,9 @@ class Executor(object):
     """
     Assume we will run the node in another process.  Return a process.
     """
+    if self.in_process_depth:
+      raise _NeedsFork()
+
     if node.tag == command_e.ControlFlow:
       # Pipeline or subshells with control flow are invalid, e.g.:
       # - break | less
@@ -636,6 +876,8 @@ class Executor(object):
 
     builtin_id = builtin.ResolveSpecial(arg0)
     if builtin_id != builtin_e.NONE:
+      if self.in_process_depth and not _BuiltinInProcessOk(builtin_id, argv):
+        raise _NeedsFork()
       status = self._RunBuiltin(builtin_id, cmd_val, fork_external)
       # TODO: Enable this and fix spec test failures.
       # Also update _SPECIAL_BUILTINS in osh/builtin.py.
@@ -673,14 +915,21 @@ class Executor(object):
       # isinstance(val.obj, objects.Proc)
       val = self.mem.GetVar(arg0)
       if val.tag == value_e.Obj and isinstance(val.obj, objects.Proc):
+        if self.in_process_depth:
+          raise _NeedsFork()
         status = self._RunOilProc(val.obj.node, argv[1:])
         return status
 
     builtin_id = builtin.Resolve(arg0)
 
     if builtin_id != builtin_e.NONE:
+      if self.in_process_depth and not _BuiltinInProcessOk(builtin_id, argv):
+        raise _NeedsFork()
       return self._RunBuiltin(builtin_id, cmd_val, fork_external)
 
+    if self.in_process_depth:
+      raise _NeedsFork()
+
     environ = self.mem.GetExported()  # Include temporary variables
 
     if cmd_val.block:
@@ -771,468 +1020,471 @@ class Executor(object):
       self.mem.SetVar(lvalue.Named(env_pair.name), val, flags,
                       scope_e.LocalOnly)
 
-  def _Dispatch(self, node, fork_external):
-    # If we call RunCommandSub in a recursive call to the executor, this will
-    # be set true (if strict-errexit is false).  But it only lasts for one
-    # command.
-    self.check_command_sub_status = False
-
-    #argv0 = None  # for error message
-    check_errexit = False  # for errexit
-
-    if node.tag == command_e.Simple:
-      check_errexit = True
-
-      # Find span_id for a basic implementation of $LINENO, e.g.
-      # PS4='+$SOURCE_NAME:$LINENO:'
-      # NOTE: osh2oil uses node.more_env, but we don't need that.
-      span_id = const.NO_INTEGER
-      if node.words:
-        span_id = word_.LeftMostSpanForWord(node.words[0])
-      elif node.redirects:
-        span_id = node.redirects[0].op  # note: this could be a here doc?
-
-      self.mem.SetCurrentSpanId(span_id)
-
-      # PROBLEM: We want to log argv in 'xtrace' mode, but we may have already
-      # redirected here, which screws up logging.  For example, 'echo hi
-      # >/dev/null 2>&1'.  We want to evaluate argv and log it BEFORE applying
-      # redirects.
-
-      # Another problem:
-      # - tracing can be called concurrently from multiple processes, leading
-      # to overlap.  Maybe have a mode that creates a file per process.
-      # xtrace-proc
-      # - line numbers for every command would be very nice.  But then you have
-      # to print the filename too.
-
-      words = braces.BraceExpandWords(node.words)
-      cmd_val = self.word_ev.EvalWordSequence2(words, allow_assign=True)
-
-      # STUB for compatibility.
-      if cmd_val.tag == cmd_value_e.Argv:
-        argv = cmd_val.argv
-        cmd_val.block = node.block  # may be None
-      else:
-        argv = ['TODO: trace string for assignment']
-        if node.block:
-          e_die("Assignment builtins don't accept blocks",
-                span_id=node.block.spids[0])
-
-      # This comes before evaluating env, in case there are problems evaluating
-      # it.  We could trace the env separately?  Also trace unevaluated code
-      # with set-o verbose?
-      self.tracer.OnSimpleCommand(argv)
-
-      # NOTE: RunSimpleCommand never returns when fork_external=False!
-      if node.more_env:  # I think this guard is necessary?
-        is_other_special = False  # TODO: There are other special builtins too!
-        if cmd_val.tag == cmd_value_e.Assign or is_other_special:
-          # Special builtins have their temp env persisted.
-          self._EvalTempEnv(node.more_env, ())
-          status = self._RunSimpleCommand(cmd_val, fork_external)
-        else:
-          self.mem.PushTemp()
-          try:
-            self._EvalTempEnv(node.more_env, (var_flags_e.Exported,))
-            status = self._RunSimpleCommand(cmd_val, fork_external)
-          finally:
-            self.mem.PopTemp()
-      else:
+  def _DoSimple(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # Find span_id for a basic implementation of $LINENO, e.g.
+    # PS4='+$SOURCE_NAME:$LINENO:'
+    # NOTE: osh2oil uses node.more_env, but we don't need that.
+    span_id = const.NO_INTEGER
+    if node.words:
+      span_id = word_.LeftMostSpanForWord(node.words[0])
+    elif node.redirects:
+      span_id = node.redirects[0].op  # note: this could be a here doc?
+
+    self.mem.SetCurrentSpanId(span_id)
+
+    # PROBLEM: We want to log argv in 'xtrace' mode, but we may have already
+    # redirected here, which screws up logging.  For example, 'echo hi
+    # >/dev/null 2>&1'.  We want to evaluate argv and log it BEFORE applying
+    # redirects.
+
+    # Another problem:
+    # - tracing can be called concurrently from multiple processes, leading
+    # to overlap.  Maybe have a mode that creates a file per process.
+    # xtrace-proc
+    # - line numbers for every command would be very nice.  But then you have
+    # to print the filename too.
+
+    words = braces.BraceExpandWords(node.words)
+    cmd_val = self.word_ev.EvalWordSequence2(words, allow_assign=True)
+
+    # STUB for compatibility.
+    if cmd_val.tag == cmd_value_e.Argv:
+      argv = cmd_val.argv
+      cmd_val.block = node.block  # may be None
+    else:
+      argv = ['TODO: trace string for assignment']
+      if node.block:
+        e_die("Assignment builtins don't accept blocks",
+              span_id=node.block.spids[0])
+
+    # This comes before evaluating env, in case there are problems evaluating
+    # it.  We could trace the env separately?  Also trace unevaluated code
+    # with set-o verbose?
+    self.tracer.OnSimpleCommand(argv)
+
+    # NOTE: RunSimpleCommand never returns when fork_external=False!
+    if node.more_env:  # I think this guard is necessary?
+      is_other_special = False  # TODO: There are other special builtins too!
+      if cmd_val.tag == cmd_value_e.Assign or is_other_special:
+        # Special builtins have their temp env persisted.
+        self._EvalTempEnv(node.more_env, ())
         status = self._RunSimpleCommand(cmd_val, fork_external)
-
-    elif node.tag == command_e.ExpandedAlias:
-      # Expanded aliases need redirects and env bindings from the calling
-      # context, as well as redirects in the expansion!
-
-      # TODO: SetCurrentSpanId to OUTSIDE?  Don't bother with stuff inside
-      # expansion, since aliases are discouarged.
-
-      if node.more_env:
+      else:
         self.mem.PushTemp()
         try:
           self._EvalTempEnv(node.more_env, (var_flags_e.Exported,))
-          status = self._Execute(node.child)
+          status = self._RunSimpleCommand(cmd_val, fork_external)
         finally:
           self.mem.PopTemp()
-      else:
-        status = self._Execute(node.child)
-
-    elif node.tag == command_e.Sentence:
-      # Don't check_errexit since this isn't a real node!
-      if node.terminator.id == Id.Op_Semi:
-        status = self._Execute(node.child)
-      else:
-        status = self._RunJobInBackground(node.child)
-
-    elif node.tag == command_e.Pipeline:
-      check_errexit = True
-      if node.stderr_indices:
-        e_die("|& isn't supported", span_id=node.spids[0])
-
-      if node.negated:
-        self._PushErrExit(node.spids[0])  # ! spid
-        try:
-          status2 = self._RunPipeline(node)
-        finally:
-          self._PopErrExit()
-
-        # errexit is disabled for !.
-        check_errexit = False
-        status = 1 if status2 == 0 else 0
-      else:
-        status = self._RunPipeline(node)
-
-    elif node.tag == command_e.Subshell:
-      check_errexit = True
-      # This makes sure we don't waste a process if we'd launch one anyway.
-      p = self._MakeProcess(node.command_list)
-      status = p.Run(self.waiter)
-
-    elif node.tag == command_e.DBracket:
-      span_id = node.spids[0]
-      self.mem.SetCurrentSpanId(span_id)
+    else:
+      status = self._RunSimpleCommand(cmd_val, fork_external)
+    return status, True
 
-      check_errexit = True
-      result = self.bool_ev.Eval(node.expr)
-      status = 0 if result else 1
+  def _DoExpandedAlias(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # Expanded aliases need redirects and env bindings from the calling
+    # context, as well as redirects in the expansion!
 
-    elif node.tag == command_e.DParen:
-      span_id = node.spids[0]
-      self.mem.SetCurrentSpanId(span_id)
+    # TODO: SetCurrentSpanId to OUTSIDE?  Don't bother with stuff inside
+    # expansion, since aliases are discouarged.
 
-      check_errexit = True
-      i = self.arith_ev.Eval(node.child)
-      status = 0 if i != 0 else 1
+    if node.more_env:
+      self.mem.PushTemp()
+      try:
+        self._EvalTempEnv(node.more_env, (var_flags_e.Exported,))
+        status = self._Execute(node.child)
+      finally:
+        self.mem.PopTemp()
+    else:
+      status = self._Execute(node.child)
+    return status, False
+
+  def _DoSentence(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # Don't check_errexit since this isn't a real node!
+    if node.terminator.id == Id.Op_Semi:
+      status = self._Execute(node.child)
+    else:
+      status = self._RunJobInBackground(node.child)
+    return status, False
 
-    elif node.tag == command_e.OilCondition:
-      # TODO: Do we need location information?  Yes, probably for execptions in
-      # Oil expressions.
-      #span_id = node.spids[0]
-      #self.mem.SetCurrentSpanId(span_id)
+  def _DoPipeline(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    if node.stderr_indices:
+      e_die("|& isn't supported", span_id=node.spids[0])
 
-      obj = self.expr_ev.EvalExpr(node.e)
-      status = 0 if obj else 1
+    if node.negated:
+      self._PushErrExit(node.spids[0])  # ! spid
+      try:
+        status2 = self._RunPipeline(node)
+      finally:
+        self._PopErrExit()
 
-    elif node.tag == command_e.OilAssign:
-      self.mem.SetCurrentSpanId(node.keyword.span_id)  # point to var/setvar
+      # errexit is disabled for !.
+      status = 1 if status2 == 0 else 0
+      return status, False
+
+    status = self._RunPipeline(node)
+    return status, True
+
+  def _DoSubshell(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # This makes sure we don't waste a process if we'd launch one anyway.
+    p = self._MakeProcess(node.command_list)
+    status = p.Run(self.waiter)
+    return status, True
+
+  def _DoDBracket(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    span_id = node.spids[0]
+    self.mem.SetCurrentSpanId(span_id)
+
+    result = self.bool_ev.Eval(node.expr)
+    status = 0 if result else 1
+    return status, True
+
+  def _DoDParen(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    span_id = node.spids[0]
+    self.mem.SetCurrentSpanId(span_id)
+
+    i = self.arith_ev.Eval(node.child)
+    status = 0 if i != 0 else 1
+    return status, True
+
+  def _DoOilCondition(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # TODO: Do we need location information?  Yes, probably for execptions in
+    # Oil expressions.
+    #span_id = node.spids[0]
+    #self.mem.SetCurrentSpanId(span_id)
+
+    obj = self.expr_ev.EvalExpr(node.e)
+    status = 0 if obj else 1
+    return status, False
+
+  def _DoOilAssign(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    self.mem.SetCurrentSpanId(node.keyword.span_id)  # point to var/setvar
+
+    lval = self.expr_ev.EvalLHS(node.lhs)
+    py_val = self.expr_ev.EvalExpr(node.rhs)
+
+    if node.op.id == Id.Arith_Equal:
+
+      # Maintain the 'value' invariant in osh/runtime.asdl.
+      if isinstance(py_val, str):  # var s = "hello $name"
+        val = value.Str(py_val)
+      elif isinstance(py_val, objects.StrArray):  # var a = @(a b)
+        # It's safe to convert StrArray to MaybeStrArray.
+        val = value.MaybeStrArray(py_val)
+      elif isinstance(py_val, dict):  # var d = {name: "bob"}
+        val = value.AssocArray(py_val)
+      else:
+        val = value.Obj(py_val)
 
-      lval = self.expr_ev.EvalLHS(node.lhs)
-      py_val = self.expr_ev.EvalExpr(node.rhs)
+      if node.keyword.id in (Id.KW_Var, Id.KW_Const):
+        lookup_mode = scope_e.LocalOnly
+      else:
+        lookup_mode = scope_e.Dynamic
 
-      if node.op.id == Id.Arith_Equal:
+      flags = ()
+      self.mem.SetVar(lval, val, flags, lookup_mode,
+                      keyword_id=node.keyword.id)
 
-        # Maintain the 'value' invariant in osh/runtime.asdl.
-        if isinstance(py_val, str):  # var s = "hello $name"
-          val = value.Str(py_val)
-        elif isinstance(py_val, objects.StrArray):  # var a = @(a b)
-          # It's safe to convert StrArray to MaybeStrArray.
-          val = value.MaybeStrArray(py_val)
-        elif isinstance(py_val, dict):  # var d = {name: "bob"}
-          val = value.AssocArray(py_val)
-        else:
-          val = value.Obj(py_val)
+    elif node.op.id == Id.Arith_PlusEqual:
+      new_py_val = self.expr_ev.EvalPlusEquals(lval, py_val)
+      # This should only be an int or float, so we don't eed the object above
+      val = value.Obj(new_py_val)
 
-        if node.keyword.id in (Id.KW_Var, Id.KW_Const):
-          lookup_mode = scope_e.LocalOnly
-        else:
-          lookup_mode = scope_e.Dynamic
+      flags = ()
+      self.mem.SetVar(lval, val, flags, scope_e.LocalOnly,
+                      keyword_id=node.keyword.id)
 
-        flags = ()
-        self.mem.SetVar(lval, val, flags, lookup_mode,
-                        keyword_id=node.keyword.id)
+    else:
+      raise NotImplementedError(node.op)
+
+    status = 0  # TODO: what should status be?
+    return status, False
+
+  def _DoAssignment(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    """Only unqualified assignment."""
+    lookup_mode = scope_e.Dynamic
+    for pair in node.pairs:
+      # Use the spid of each pair.
+      self.mem.SetCurrentSpanId(pair.spids[0])
+
+      if pair.op == assign_op_e.PlusEqual:
+        assert pair.rhs, pair.rhs  # I don't think a+= is valid?
+        val = self.word_ev.EvalRhsWord(pair.rhs)
+        old_val, lval = expr_eval.EvalLhsAndLookup(pair.lhs, self.arith_ev,
+                                                   self.mem, self.exec_opts,
+                                                   lookup_mode=lookup_mode)
+        sig = (old_val.tag, val.tag)
+        if sig == (value_e.Undef, value_e.Str):
+          pass  # val is RHS
+        elif sig == (value_e.Undef, value_e.MaybeStrArray):
+          pass  # val is RHS
+        elif sig == (value_e.Str, value_e.Str):
+          val = value.Str(old_val.s + val.s)
+        elif sig == (value_e.Str, value_e.MaybeStrArray):
+          e_die("Can't append array to string")
+        elif sig == (value_e.MaybeStrArray, value_e.Str):
+          e_die("Can't append string to array")
+        elif sig == (value_e.MaybeStrArray, value_e.MaybeStrArray):
+          val = value.MaybeStrArray(old_val.strs + val.strs)
+
+      else:  # plain assignment
+        spid = pair.spids[0]  # Source location for tracing
+        lval = expr_eval.EvalLhs(pair.lhs, self.arith_ev, self.mem, spid,
+                                 lookup_mode)
+
+        # RHS can be a string or array.
+        if pair.rhs:
+          val = self.word_ev.EvalRhsWord(pair.rhs)
+          assert isinstance(val, value_t), val
 
-      elif node.op.id == Id.Arith_PlusEqual:
-        new_py_val = self.expr_ev.EvalPlusEquals(lval, py_val)
-        # This should only be an int or float, so we don't eed the object above
-        val = value.Obj(new_py_val)
+        else:  # e.g. 'readonly x' or 'local x'
+          val = None
 
-        flags = ()
-        self.mem.SetVar(lval, val, flags, scope_e.LocalOnly,
-                        keyword_id=node.keyword.id)
+      # NOTE: In bash and mksh, declare -a myarray makes an empty cell with
+      # Undef value, but the 'array' attribute.
 
-      else:
-        raise NotImplementedError(node.op)
+      #log('setting %s to %s with flags %s', lval, val, flags)
+      flags = ()
+      self.mem.SetVar(lval, val, flags, lookup_mode)
+      self.tracer.OnAssignment(lval, pair.op, val, flags, lookup_mode)
 
-      status = 0  # TODO: what should status be?
+    # PATCH to be compatible with existing shells: If the assignment had a
+    # command sub like:
+    #
+    # s=$(echo one; false)
+    #
+    # then its status will be in mem.last_status, and we can check it here.
+    # If there was NOT a command sub in the assignment, then we don't want to
+    # check it.
+
+    # Only do this if there was a command sub?  How?  Look at node?
+    # Set a flag in mem?   self.mem.last_status or
+    if self.check_command_sub_status:
+      last_status = self.mem.LastStatus()
+      self._CheckStatus(last_status, node)
+      status = last_status  # A global assignment shouldn't clear $?.
+    else:
+      status = 0
+    return status, False
 
-    elif node.tag == command_e.Assignment:  # Only unqualified assignment
+  def _DoReturn(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    val = self.expr_ev.EvalExpr(node.e)
+    raise _ControlFlow(node.keyword, val)
 
-      lookup_mode = scope_e.Dynamic
-      for pair in node.pairs:
-        # Use the spid of each pair.
-        self.mem.SetCurrentSpanId(pair.spids[0])
+  def _DoControlFlow(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    tok = node.token
 
-        if pair.op == assign_op_e.PlusEqual:
-          assert pair.rhs, pair.rhs  # I don't think a+= is valid?
-          val = self.word_ev.EvalRhsWord(pair.rhs)
-          old_val, lval = expr_eval.EvalLhsAndLookup(pair.lhs, self.arith_ev,
-                                                     self.mem, self.exec_opts,
-                                                     lookup_mode=lookup_mode)
-          sig = (old_val.tag, val.tag)
-          if sig == (value_e.Undef, value_e.Str):
-            pass  # val is RHS
-          elif sig == (value_e.Undef, value_e.MaybeStrArray):
-            pass  # val is RHS
-          elif sig == (value_e.Str, value_e.Str):
-            val = value.Str(old_val.s + val.s)
-          elif sig == (value_e.Str, value_e.MaybeStrArray):
-            e_die("Can't append array to string")
-          elif sig == (value_e.MaybeStrArray, value_e.Str):
-            e_die("Can't append string to array")
-          elif sig == (value_e.MaybeStrArray, value_e.MaybeStrArray):
-            val = value.MaybeStrArray(old_val.strs + val.strs)
-
-        else:  # plain assignment
-          spid = pair.spids[0]  # Source location for tracing
-          lval = expr_eval.EvalLhs(pair.lhs, self.arith_ev, self.mem, spid,
-                                   lookup_mode)
-
-          # RHS can be a string or array.
-          if pair.rhs:
-            val = self.word_ev.EvalRhsWord(pair.rhs)
-            assert isinstance(val, value_t), val
-
-          else:  # e.g. 'readonly x' or 'local x'
-            val = None
-
-        # NOTE: In bash and mksh, declare -a myarray makes an empty cell with
-        # Undef value, but the 'array' attribute.
-
-        #log('setting %s to %s with flags %s', lval, val, flags)
-        flags = ()
-        self.mem.SetVar(lval, val, flags, lookup_mode)
-        self.tracer.OnAssignment(lval, pair.op, val, flags, lookup_mode)
-
-      # PATCH to be compatible with existing shells: If the assignment had a
-      # command sub like:
-      #
-      # s=$(echo one; false)
-      #
-      # then its status will be in mem.last_status, and we can check it here.
-      # If there was NOT a command sub in the assignment, then we don't want to
-      # check it.
-
-      # Only do this if there was a command sub?  How?  Look at node?
-      # Set a flag in mem?   self.mem.last_status or
-      if self.check_command_sub_status:
-        last_status = self.mem.LastStatus()
-        self._CheckStatus(last_status, node)
-        status = last_status  # A global assignment shouldn't clear $?.
+    if node.arg_word:  # Evaluate the argument
+      val = self.word_ev.EvalWordToString(node.arg_word)
+      assert val.tag == value_e.Str
+      try:
+        arg = int(val.s)  # They all take integers
+      except ValueError:
+        e_die('%r expected a number, got %r',
+            node.token.val, val.s, word=node.arg_word)
+    else:
+      if tok.id in (Id.ControlFlow_Exit, Id.ControlFlow_Return):
+        arg = self.mem.LastStatus()
       else:
-        status = 0
-
-    elif node.tag == command_e.Return:
-      val = self.expr_ev.EvalExpr(node.e)
-      raise _ControlFlow(node.keyword, val)
-
-    elif node.tag == command_e.ControlFlow:
-      tok = node.token
-
-      if node.arg_word:  # Evaluate the argument
-        val = self.word_ev.EvalWordToString(node.arg_word)
-        assert val.tag == value_e.Str
-        try:
-          arg = int(val.s)  # They all take integers
-        except ValueError:
-          e_die('%r expected a number, got %r',
-              node.token.val, val.s, word=node.arg_word)
+        arg = 0  # break 0 levels, nothing for continue
+
+    # NOTE: A top-level 'return' is OK, unlike in bash.  If you can return
+    # from a sourced script, it makes sense to return from a main script.
+    ok = True
+    if (tok.id in (Id.ControlFlow_Break, Id.ControlFlow_Continue) and
+        self.loop_level == 0):
+      ok = False
+
+    if ok:
+      if tok.id == Id.ControlFlow_Exit:
+        raise util.UserExit(arg)  # handled differently than other control flow
       else:
-        if tok.id in (Id.ControlFlow_Exit, Id.ControlFlow_Return):
-          arg = self.mem.LastStatus()
-        else:
-          arg = 0  # break 0 levels, nothing for continue
-
-      # NOTE: A top-level 'return' is OK, unlike in bash.  If you can return
-      # from a sourced script, it makes sense to return from a main script.
-      ok = True
-      if (tok.id in (Id.ControlFlow_Break, Id.ControlFlow_Continue) and
-          self.loop_level == 0):
-        ok = False
-
-      if ok:
-        if tok.id == Id.ControlFlow_Exit:
-          raise util.UserExit(arg)  # handled differently than other control flow
-        else:
-          raise _ControlFlow(tok, arg)
+        raise _ControlFlow(tok, arg)
+    else:
+      msg = 'Invalid control flow at top level'
+      if self.exec_opts.strict_control_flow:
+        e_die(msg, token=tok)
       else:
-        msg = 'Invalid control flow at top level'
-        if self.exec_opts.strict_control_flow:
-          e_die(msg, token=tok)
-        else:
-          # Only print warnings, never fatal.
-          # Bash oddly only exits 1 for 'return', but no other shell does.
-          self.errfmt.Print(msg, prefix='warning: ', span_id=tok.span_id)
-          status = 0
-
-    # The only difference between these two is that CommandList has no
-    # redirects.  We already took care of that above.
-    elif node.tag in (command_e.CommandList, command_e.BraceGroup):
-      status = self._ExecuteList(node.children)
-      check_errexit = False
-
-    elif node.tag == command_e.AndOr:
-      # NOTE: && and || have EQUAL precedence in command mode.  See case #13
-      # in dbracket.test.sh.
+        # Only print warnings, never fatal.
+        # Bash oddly only exits 1 for 'return', but no other shell does.
+        self.errfmt.Print(msg, prefix='warning: ', span_id=tok.span_id)
+        status = 0
+    return status, False
 
-      left = node.children[0]
+  def _DoCommandList(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # For both CommandList and BraceGroup.  The only difference is that
+    # CommandList has no redirects, and _Execute() took care of those.
+    status = self._ExecuteList(node.children)
+    return status, False
 
-      # Suppress failure for every child except the last one.
-      self._PushErrExit(node.spids[0])
-      try:
-        status = self._Execute(left)
-      finally:
-        self._PopErrExit()
+  def _DoAndOr(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # NOTE: && and || have EQUAL precedence in command mode.  See case #13
+    # in dbracket.test.sh.
+    check_errexit = False
 
-      i = 1
-      n = len(node.children)
-      while i < n:
-        #log('i %d status %d', i, status)
-        child = node.children[i]
-        op_id = node.ops[i-1]
+    left = node.children[0]
 
-        #log('child %s op_id %s', child, op_id)
+    # Suppress failure for every child except the last one.
+    self._PushErrExit(node.spids[0])
+    try:
+      status = self._Execute(left)
+    finally:
+      self._PopErrExit()
 
-        if op_id == Id.Op_DPipe and status == 0:
-          i += 1
-          continue  # short circuit
+    i = 1
+    n = len(node.children)
+    while i < n:
+      #log('i %d status %d', i, status)
+      child = node.children[i]
+      op_id = node.ops[i-1]
 
-        elif op_id == Id.Op_DAmp and status != 0:
-          i += 1
-          continue  # short circuit
+      #log('child %s op_id %s', child, op_id)
 
-        if i == n - 1:  # errexit handled differently for last child
-          status = self._Execute(child)
-          check_errexit = True
-        else:
-          self._PushErrExit(node.spids[i])  # blame the right && or ||
-          try:
-            status = self._Execute(child)
-          finally:
-            self._PopErrExit()
+      if op_id == Id.Op_DPipe and status == 0:
+        i += 1
+        continue  # short circuit
 
+      elif op_id == Id.Op_DAmp and status != 0:
         i += 1
+        continue  # short circuit
 
-    elif node.tag == command_e.WhileUntil:
-      if node.keyword.id == Id.KW_While:
-        _DonePredicate = lambda status: status != 0
+      if i == n - 1:  # errexit handled differently for last child
+        status = self._Execute(child)
+        check_errexit = True
       else:
-        _DonePredicate = lambda status: status == 0
+        self._PushErrExit(node.spids[i])  # blame the right && or ||
+        try:
+          status = self._Execute(child)
+        finally:
+          self._PopErrExit()
 
-      status = 0
+      i += 1
+    return status, check_errexit
 
-      self.loop_level += 1
-      try:
-        while True:
-          self._PushErrExit(node.spids[0])  # while/until spid
-          try:
-            cond_status = self._ExecuteList(node.cond)
-          finally:
-            self._PopErrExit()
-
-          done = cond_status != 0
-          if _DonePredicate(cond_status):
-            break
-          try:
-            status = self._Execute(node.body)  # last one wins
-          except _ControlFlow as e:
-            if e.IsBreak():
-              status = 0
-              break
-            elif e.IsContinue():
-              status = 0
-              continue
-            else:  # return needs to pop up more
-              raise
-      finally:
-        self.loop_level -= 1
+  def _DoWhileUntil(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    if node.keyword.id == Id.KW_While:
+      _DonePredicate = lambda status: status != 0
+    else:
+      _DonePredicate = lambda status: status == 0
 
-    elif node.tag == command_e.ForEach:
-      self.mem.SetCurrentSpanId(node.spids[0])  # for x in $LINENO
+    status = 0
 
-      iter_name = node.iter_name
-      if node.do_arg_iter:
-        iter_list = self.mem.GetArgv()
-      else:
-        words = braces.BraceExpandWords(node.iter_words)
-        iter_list = self.word_ev.EvalWordSequence(words)
-        # We need word splitting and so forth
-        # NOTE: This expands globs too.  TODO: We should pass in a Globber()
-        # object.
+    self.loop_level += 1
+    try:
+      while True:
+        self._PushErrExit(node.spids[0])  # while/until spid
+        try:
+          cond_status = self._ExecuteList(node.cond)
+        finally:
+          self._PopErrExit()
 
-      status = 0  # in case we don't loop
-      self.loop_level += 1
-      try:
-        for x in iter_list:
-          #log('> ForEach setting %r', x)
-          state.SetLocalString(self.mem, iter_name, x)
-          #log('<')
-
-          try:
-            status = self._Execute(node.body)  # last one wins
-          except _ControlFlow as e:
-            if e.IsBreak():
-              status = 0
-              break
-            elif e.IsContinue():
-              status = 0
-            else:  # return needs to pop up more
-              raise
-      finally:
-        self.loop_level -= 1
+        done = cond_status != 0
+        if _DonePredicate(cond_status):
+          break
+        try:
+          status = self._Execute(node.body)  # last one wins
+        except _ControlFlow as e:
+          if e.IsBreak():
+            status = 0
+            break
+          elif e.IsContinue():
+            status = 0
+            continue
+          else:  # return needs to pop up more
+            raise
+    finally:
+      self.loop_level -= 1
+    return status, False
 
-    elif node.tag == command_e.ForExpr:
-      status = 0
-      init, cond, body, update = node.init, node.cond, node.body, node.update
-      if init:
-        self.arith_ev.Eval(init)
+  def _DoForEach(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    self.mem.SetCurrentSpanId(node.spids[0])  # for x in $LINENO
 
-      self.loop_level += 1
-      try:
-        while True:
-          if cond:
-            b = self.arith_ev.Eval(cond)
-            if not b:
-              break
-
-          try:
-            status = self._Execute(body)
-          except _ControlFlow as e:
-            if e.IsBreak():
-              status = 0
-              break
-            elif e.IsContinue():
-              status = 0
-            else:  # return needs to pop up more
-              raise
-
-          if update:
-            self.arith_ev.Eval(update)
+    iter_name = node.iter_name
+    if node.do_arg_iter:
+      iter_list = self.mem.GetArgv()
+    else:
+      iter_list = self._EvalForEachWords(node.iter_words)
 
-      finally:
-        self.loop_level -= 1
+    status = 0  # in case we don't loop
+    self.loop_level += 1
+    try:
+      for x in iter_list:
+        #log('> ForEach setting %r', x)
+        state.SetLocalString(self.mem, iter_name, x)
+        #log('<')
 
-    elif node.tag == command_e.OilForIn:
-      # NOTE: This is a metacircular implementation using the iterable
-      # protocol.
-      status = 0
+        try:
+          status = self._Execute(node.body)  # last one wins
+        except _ControlFlow as e:
+          if e.IsBreak():
+            status = 0
+            break
+          elif e.IsContinue():
+            status = 0
+          else:  # return needs to pop up more
+            raise
+    finally:
+      self.loop_level -= 1
+    return status, False
 
-      obj = self.expr_ev.EvalExpr(node.iterable)
-      if isinstance(obj, str):
-        e_die("Strings aren't iterable")
-      else:
-        it = iter(obj)
+  def _EvalForEachWords(self, words):
+    # type: (List[word_t]) -> Iterator[str]
+    """Expand the words of a 'for' loop.
 
-      body = node.body
-      iter_name = node.lhs.name.val  # TODO: proper lvalue
+    Like other shells, we evaluate the words before the first iteration.  The
+    exception is a brace expansion of literals like {1..1000000}, which can't
+    depend on state.  We generate its strings as the loop consumes them.
+    """
+    segments = []  # type: List[Any]  # lists and generators of strings
+    pending = []  # type: List[word_t]
+    for w in words:
+      strs = braces.BraceExpandStatic(w)
+      if strs is None:
+        pending.append(w)
+        continue
+      if pending:
+        # We need word splitting and so forth
+        # NOTE: This expands globs too.  TODO: We should pass in a Globber()
+        # object.
+        segments.append(
+            self.word_ev.EvalWordSequence(braces.BraceExpandWords(pending)))
+        pending = []
+      segments.append(strs)
+    if pending:
+      segments.append(
+          self.word_ev.EvalWordSequence(braces.BraceExpandWords(pending)))
+    return _Chain(segments)
+
+  def _DoForExpr(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    status = 0
+    init, cond, body, update = node.init, node.cond, node.body, node.update
+    if init:
+      self.arith_ev.Eval(init)
+
+    self.loop_level += 1
+    try:
       while True:
-        try:
-          loop_val = next(it)
-        except StopIteration:
-          break
-        state.SetLocalString(self.mem, iter_name, loop_val)
+        if cond:
+          b = self.arith_ev.Eval(cond)
+          if not b:
+            break
 
-        # Copied from above
         try:
           status = self._Execute(body)
         except _ControlFlow as e:
@@ -1244,106 +1496,193 @@ class Executor(object):
           else:  # return needs to pop up more
             raise
 
-    elif node.tag == command_e.DoGroup:
-      status = self._ExecuteList(node.children)
-      check_errexit = False  # not real statements
+        if update:
+          self.arith_ev.Eval(update)
 
-    elif node.tag == command_e.FuncDef:
-      # TODO: if shopt -s namespaces, then enter it in self.mem
-      # self.mem.SetVar(value.Obj(...))
+    finally:
+      self.loop_level -= 1
+    return status, False
+
+  def _DoOilForIn(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # NOTE: This is a metacircular implementation using the iterable
+    # protocol.
+    status = 0
+
+    obj = self.expr_ev.EvalExpr(node.iterable)
+    if isinstance(obj, str):
+      e_die("Strings aren't iterable")
+    else:
+      it = iter(obj)
 
-      # NOTE: Would it make sense to evaluate the redirects BEFORE entering?
-      # It will save time on function calls.
-      self.procs[node.name] = node
-      status = 0
+    body = node.body
+    iter_name = node.lhs.name.val  # TODO: proper lvalue
+    while True:
+      try:
+        loop_val = next(it)
+      except StopIteration:
+        break
+      state.SetLocalString(self.mem, iter_name, loop_val)
 
-    elif node.tag == command_e.OilFuncProc:
-      if node.which == Id.KW_Func:
-        # NOTE: It has the Python pitfall where mutable objects shouldn't be
-        # used as default args.
+      # Copied from above
+      try:
+        status = self._Execute(body)
+      except _ControlFlow as e:
+        if e.IsBreak():
+          status = 0
+          break
+        elif e.IsContinue():
+          status = 0
+        else:  # return needs to pop up more
+          raise
+    return status, False
+
+  def _DoDoGroup(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    status = self._ExecuteList(node.children)
+    return status, False
+
+  def _DoFuncDef(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # TODO: if shopt -s namespaces, then enter it in self.mem
+    # self.mem.SetVar(value.Obj(...))
+
+    # NOTE: Would it make sense to evaluate the redirects BEFORE entering?
+    # It will save time on function calls.
+    if self.in_process_depth:
+      raise _NeedsFork()
+    self.procs[node.name] = node
+    self.arena.Pin(('proc', node.name))
+    self.in_process_funcs.clear()
+    status = 0
+    return status, False
+
+  def _DoOilFuncProc(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    if node.which == Id.KW_Func:
+      # NOTE: It has the Python pitfall where mutable objects shouldn't be
+      # used as default args.
+
+      n = len(node.params)
+      default_vals = [None] * n
+      for i, param in enumerate(node.params):
+        if param.default:
+          obj = self.expr_ev.EvalExpr(param.default)
+          default_vals[i] = value.Obj(obj)
+
+      obj = objects.Func(node, default_vals, self)
+    else:
+      obj = objects.Proc(node)
+
+    self.mem.SetVar(
+        lvalue.Named(node.name.val), value.Obj(obj), (), scope_e.GlobalOnly)
+    self.arena.Pin(('proc', node.name.val))
+    status = 0
+    return status, False
+
+  def _DoIf(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    done = False
+    for arm in node.arms:
+      self._PushErrExit(arm.spids[0])  # if/elif spid
+      try:
+        status = self._ExecuteList(arm.cond)
+      finally:
+        self._PopErrExit()
 
-        n = len(node.params)
-        default_vals = [None] * n
-        for i, param in enumerate(node.params):
-          if param.default:
-            obj = self.expr_ev.EvalExpr(param.default)
-            default_vals[i] = value.Obj(obj)
+      if status == 0:
+        status = self._ExecuteList(arm.action)
+        done = True
+        break
+    # TODO: The compiler should flatten this
+    if not done and node.else_action is not None:
+      status = self._ExecuteList(node.else_action)
+    return status, False
+
+  def _DoNoOp(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    status = 0  # make it true
+    return status, False
+
+  def _DoCase(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    val = self.word_ev.EvalWordToString(node.to_match)
+    to_match = val.s
+
+    matcher = self.case_matchers.get(node)
+    if matcher is None:
+      matcher = self._CompileCase(node)
+
+    status = 0  # If there are no arms, it should be zero?
+
+    arm_index = matcher.Match(to_match, self._EvalCasePattern)
+    if arm_index != -1:
+      # TODO: Parse ;;& and for fallthrough and such?
+      status = self._ExecuteList(node.arms[arm_index].action)
+    return status, False
+
+  def _CompileCase(self, node):
+    # type: (command__Case) -> _CaseMatcher
+    matcher = _CaseMatcher()
+    for i, arm in enumerate(node.arms):
+      for pat_word in arm.pat_list:
+        # TODO: case "$@") shouldn't succeed?  That's a type error?
+        # That requires strict-array?
+        ok, _, _ = word_.StaticEval(pat_word)
+        if ok:
+          matcher.AddPattern(i, self._EvalCasePattern(pat_word))
+        else:
+          matcher.AddWord(i, pat_word)
 
-        obj = objects.Func(node, default_vals, self)
-      else:
-        obj = objects.Proc(node)
+    # Nodes from 'eval' aren't reused, so don't let them pile up.
+    if len(self.case_matchers) >= 1000:
+      self.case_matchers.clear()
+    self.case_matchers[node] = matcher
+    return matcher
 
-      self.mem.SetVar(
-          lvalue.Named(node.name.val), value.Obj(obj), (), scope_e.GlobalOnly)
-      status = 0
+  def _EvalCasePattern(self, pat_word):
+    # type: (word_t) -> str
+    return self.word_ev.EvalWordToString(pat_word, do_fnmatch=True).s
 
-    elif node.tag == command_e.If:
-      done = False
-      for arm in node.arms:
-        self._PushErrExit(arm.spids[0])  # if/elif spid
-        try:
-          status = self._ExecuteList(arm.cond)
-        finally:
-          self._PopErrExit()
+  def _DoTimeBlock(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    # TODO:
+    # - When do we need RUSAGE_CHILDREN?
+    # - Respect TIMEFORMAT environment variable.
+    # "If this variable is not set, Bash acts as if it had the value"
+    # $'\nreal\t%3lR\nuser\t%3lU\nsys\t%3lS'
+    # "A trailing newline is added when the format string is displayed."
 
-        if status == 0:
-          status = self._ExecuteList(arm.action)
-          done = True
-          break
-      # TODO: The compiler should flatten this
-      if not done and node.else_action is not None:
-        status = self._ExecuteList(node.else_action)
-
-    elif node.tag == command_e.NoOp:
-      status = 0  # make it true
-
-    elif node.tag == command_e.Case:
-      val = self.word_ev.EvalWordToString(node.to_match)
-      to_match = val.s
-
-      status = 0  # If there are no arms, it should be zero?
-      done = False
-
-      for arm in node.arms:
-        for pat_word in arm.pat_list:
-          # NOTE: Is it OK that we're evaluating these as we go?
-
-          # TODO: case "$@") shouldn't succeed?  That's a type error?
-          # That requires strict-array?
-
-          pat_val = self.word_ev.EvalWordToString(pat_word, do_fnmatch=True)
-          #log('Matching word %r against pattern %r', to_match, pat_val.s)
-          if libc.fnmatch(pat_val.s, to_match):
-            status = self._ExecuteList(arm.action)
-            done = True  # TODO: Parse ;;& and for fallthrough and such?
-            break  # Only execute action ONCE
-        if done:
-          break
+    start_t = time.time()  # calls gettimeofday() under the hood
+    start_u = resource.getrusage(resource.RUSAGE_SELF)
+    status = self._Execute(node.pipeline)
 
-    elif node.tag == command_e.TimeBlock:
-      # TODO:
-      # - When do we need RUSAGE_CHILDREN?
-      # - Respect TIMEFORMAT environment variable.
-      # "If this variable is not set, Bash acts as if it had the value"
-      # $'\nreal\t%3lR\nuser\t%3lU\nsys\t%3lS'
-      # "A trailing newline is added when the format string is displayed."
+    end_t = time.time()
+    end_u = resource.getrusage(resource.RUSAGE_SELF)
 
-      start_t = time.time()  # calls gettimeofday() under the hood
-      start_u = resource.getrusage(resource.RUSAGE_SELF)
-      status = self._Execute(node.pipeline)
+    real = end_t - start_t
+    user = end_u.ru_utime - start_u.ru_utime
+    sys_ = end_u.ru_stime - start_u.ru_stime
+    libc.print_time(real, user, sys_)
+    return status, False
 
-      end_t = time.time()
-      end_u = resource.getrusage(resource.RUSAGE_SELF)
+  def _Dispatch(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    """Run a node without its redirects.
 
-      real = end_t - start_t
-      user = end_u.ru_utime - start_u.ru_utime
-      sys_ = end_u.ru_stime - start_u.ru_stime
-      libc.print_time(real, user, sys_)
+    Returns:
+      The status, and whether to check it for errexit.
+    """
+    # If we call RunCommandSub in a recursive call to the executor, this will
+    # be set true (if strict-errexit is false).  But it only lasts for one
+    # command.
+    self.check_command_sub_status = False
 
-    else:
-      raise NotImplementedError(node.__class__.__name__)
+    return self.dispatch[node.tag](node, fork_external)
 
-    return status, check_errexit
+  def _DoNotImplemented(self, node, fork_external):
+    # type: (command_t, bool) -> Tuple[int, bool]
+    raise NotImplementedError(node.__class__.__name__)
 
   def _Execute(self, node, fork_external=True):
     """Apply redirects, call _Dispatch(), and performs the errexit check.
@@ -1365,7 +1704,6 @@ class Executor(object):
         self._Execute(trap_node)
 
     # strict_errexit check for all compound commands.
-    # TODO: Speed this up with some kind of bit mask?
     eo = self.exec_opts
     if eo.strict_errexit and _DisallowErrExit(node):
 
@@ -1375,22 +1713,14 @@ class Executor(object):
         e_die("errexit is disabled here, but strict_errexit disallows it "
               "with a compound command (%s)", node_str, span_id=span_id)
 
-    # These nodes have no redirects.  NOTE: Function definitions have
-    # redirects, but we do NOT want to evaluate them yet!  They're evaluated
-    # on every invocation.
-    # TODO: Speed this up with some kind of bit mask?
-    if node.tag in (
-        command_e.NoOp, command_e.ControlFlow, command_e.Pipeline,
-        command_e.AndOr, command_e.CommandList, command_e.Sentence,
-        command_e.TimeBlock, command_e.FuncDef, command_e.OilAssign,
-        command_e.OilCondition, command_e.OilFuncProc, command_e.Return):
-      redirects = []
-    else:
+    if _COMMAND_FLAGS[node.tag] & _EVAL_REDIRECTS and node.redirects:
       try:
         redirects = self._EvalRedirects(node)
       except util.RedirectEvalError as e:
         ui.PrettyPrintError(e, self.arena)
         redirects = None
+    else:
+      redirects = []
 
     check_errexit = True
 
@@ -1398,6 +1728,8 @@ class Executor(object):
       status = 1
 
     elif redirects:
+      if self.in_process_depth:
+        raise _NeedsFork()
       if self.fd_state.Push(redirects, self.waiter):
         try:
           status, check_errexit = self._Dispatch(node, fork_external)
@@ -1508,7 +1840,111 @@ class Executor(object):
     else:
       return False  # nothing run, don't use its status
 
-  def RunCommandSub(self, node):
+  def _InProcessOk(self, obj):
+    # type: (Any) -> bool
+    """Can this part of a command sub run without forking?
+
+    This is a conservative check, so that we rarely start running in-process
+    and then hit _NeedsFork.
+    """
+    if isinstance(obj, list):
+      for item in obj:
+        if not self._InProcessOk(item):
+          return False
+      return True
+
+    if not isinstance(obj, runtime.CompoundObj):
+      return True  # e.g. a string or an Id
+
+    if isinstance(obj, command_t):
+      if obj.tag not in _IN_PROCESS_COMMANDS:
+        return False
+      if getattr(obj, 'redirects', None):
+        return False
+      if obj.tag == command_e.Sentence and obj.terminator.id == Id.Op_Amp:
+        return False
+      if obj.tag == command_e.Simple and not self._SimpleInProcessOk(obj):
+        return False
+
+    elif isinstance(obj, word_part__CommandSub):
+      if obj.left_token.id in (Id.Left_ProcSubIn, Id.Left_ProcSubOut):
+        return False
+
+    elif isinstance(obj, (expr_t, word_part__Splice, word_part__FuncCall)):
+      return False  # Oil expressions can call procs
+
+    elif isinstance(obj, bool_expr__Unary):
+      if obj.op_id == Id.BoolUnary_t:
+        return False  # [[ -t 1 ]] has to see the pipe
+
+    for name in obj.__slots__:
+      if not self._InProcessOk(getattr(obj, name, None)):
+        return False
+    return True
+
+  def _SimpleInProcessOk(self, node):
+    # type: (command__Simple) -> bool
+    if node.block or not node.words:
+      return False
+
+    ok, arg0, _ = word_.StaticEval(node.words[0])
+    if not ok:
+      return False  # e.g. $cmd
+
+    # Same order as RunSimpleCommand()
+    if builtin.ResolveAssign(arg0) != builtin_e.NONE:
+      return True
+    builtin_id = builtin.ResolveSpecial(arg0)
+    if builtin_id != builtin_e.NONE:
+      return builtin_id in _IN_PROCESS_BUILTINS
+
+    func_node = self.procs.get(arg0)
+    if func_node is not None:
+      ok = self.in_process_funcs.get(func_node)
+      if ok is None:
+        self.in_process_funcs[func_node] = True  # in case it's recursive
+        ok = not func_node.redirects and self._InProcessOk(func_node.body)
+        self.in_process_funcs[func_node] = ok
+      return ok
+
+    return builtin.Resolve(arg0) in _IN_PROCESS_BUILTINS
+
+  def _RunCommandSubInProcess(self, node):
+    # type: (command_t) -> Tuple[str, int]
+    """Run a command sub like a child process would, but without forking.
+
+    Changes to variables are undone with Mem.PopSandbox(), and builtins write
+    to a buffer instead of stdout.
+
+    Raises:
+      _NeedsFork, after undoing the changes.
+    """
+    errexit = self.exec_opts.errexit
+    saved_errexit = errexit.errexit
+    saved_stdout = sys.stdout
+    buf = cStringIO.StringIO()
+
+    self.mem.PushSandbox()
+    self.in_process_depth += 1
+    sys.stdout = buf
+    try:
+      if not self.exec_opts.inherit_errexit:
+        errexit.Disable()  # like SubProgramThunk
+      try:
+        self.ExecuteAndCatch(node)
+        status = self.LastStatus()
+      except util.UserExit as e:
+        status = e.status
+    finally:
+      sys.stdout = saved_stdout
+      self.in_process_depth -= 1
+      errexit.errexit = saved_errexit
+      self.mem.PopSandbox()
+
+    return buf.getvalue().rstrip('\n'), status
+
+  def _ForkCommandSub(self, node):
+    # type: (command_t) -> Tuple[str, int]
     p = self._MakeProcess(node,
                           inherit_errexit=self.exec_opts.inherit_errexit)
 
@@ -1517,16 +1953,26 @@ class Executor(object):
     _ = p.Start()
     #log('Command sub started %d', pid)
 
-    chunks = []
     posix.close(w)  # not going to write
-    while True:
-      byte_str = posix.read(r, 4096)
-      if not byte_str:
-        break
-      chunks.append(byte_str)
+    # Read into one growing buffer, and strip trailing newlines in place.
+    stdout_str = posix.read_all(r, True)
     posix.close(r)
 
     status = p.Wait(self.waiter)
+    return stdout_str, status
+
+  def RunCommandSub(self, node):
+    stdout_str = None
+    if (self.exec_opts.fast_command_sub and not self.traps and
+        self._InProcessOk(node)):
+      try:
+        stdout_str, status = self._RunCommandSubInProcess(node)
+      except _NeedsFork:
+        if self.in_process_depth:
+          raise  # The enclosing command sub has to fork too.
+
+    if stdout_str is None:
+      stdout_str, status = self._ForkCommandSub(node)
 
     # OSH has the concept of aborting in the middle of a WORD.  We're not
     # waiting until the command is over!
@@ -1546,9 +1992,9 @@ class Executor(object):
       self.mem.SetLastStatus(status)
 
     # Runtime errors test case: # $("echo foo > $@")
-    # Why rstrip()?
+    # Why are trailing newlines stripped?
     # https://unix.stackexchange.com/questions/17747/why-does-shell-command-substitution-gobble-up-a-trailing-newline-char
-    return ''.join(chunks).rstrip('\n')
+    return stdout_str
 
   def RunProcessSub(self, node, op_id):
     """Process sub creates a forks a process connected to a pipe.
@@ -1634,6 +2080,8 @@ class Executor(object):
       return 1
 
     if def_redirects:
+      if self.in_process_depth:
+        raise _NeedsFork()
       if not self.fd_state.Push(def_redirects, self.waiter):
         return 1  # error
 
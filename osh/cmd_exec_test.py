@@ -9,14 +9,20 @@
 cmd_exec_test.py: Tests for cmd_exec.py
 """
 
+import os
 import unittest
 
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.syntax_asdl import suffix_op, word_part, token
 from _devbuild.gen.syntax_asdl import word
+from core import main_loop
 from core import test_lib
+from frontend import parse_lib
+from osh import cmd_exec  # module under test
 from osh import state
 
+import posix_ as posix
+
 
 def InitEvaluator():
   word_ev = test_lib.MakeTestEvaluator()
@@ -68,5 +74,86 @@ class VarOpTest(unittest.TestCase):
     print(part_vals)
 
 
+class CaseMatcherTest(unittest.TestCase):
+
+  def testMatch(self):
+    m = cmd_exec._CaseMatcher()
+    m.AddPattern(0, 'foo')
+    m.AddPattern(0, r'a\*b')
+    m.AddWord(1, 'WORD')  # evaluated by the callback
+    m.AddPattern(2, '*.py')
+    m.AddPattern(3, 'ab?')
+    m.AddPattern(4, 'pre*')
+    m.AddPattern(5, '*mid*')
+    m.AddPattern(6, 'foo')  # shadowed by arm 0
+    m.AddPattern(6, 'bar')
+    m.AddPattern(7, '*')
+
+    evaluated = []
+    def EvalWord(w):
+      evaluated.append(w)
+      return 'dyn*'
+
+    CASES = [
+        ('foo', 0, 0),
+        ('a*b', 0, 0),
+        ('dynamic', 1, 1),
+        ('x.py', 2, 1),
+        ('abc', 3, 1),
+        ('prefix', 4, 1),
+        ('amidb', 5, 1),
+        ('bar', 6, 1),
+        ('zzz', 7, 1),
+    ]
+    for s, arm_index, num_evaluated in CASES:
+      del evaluated[:]
+      self.assertEqual(arm_index, m.Match(s, EvalWord), s)
+      self.assertEqual(num_evaluated, len(evaluated), s)
+
+    m = cmd_exec._CaseMatcher()
+    m.AddPattern(0, 'foo')
+    self.assertEqual(-1, m.Match('bar', EvalWord))
+
+
+class CommandSubTest(unittest.TestCase):
+
+  def testTerminalStdout(self):
+    # Even when stdout is a terminal, a command sub's stdout isn't.  So -t
+    # makes it fork.
+    code_str = """\
+f() { test -t 1 && echo TTY || echo NOTTY; }
+a=$(f)
+b=$([[ -t 1 ]] && echo TTY || echo NOTTY)
+c=$(test -t 0 && echo TTY || echo NOTTY)
+d=$(test -n x && echo in-process)
+"""
+    arena = test_lib.MakeArena('<cmd_exec_test.py>')
+    parse_ctx = parse_lib.ParseContext(
+        arena, parse_lib.OilParseOptions(), {}, None)
+    ex = test_lib.InitExecutor(parse_ctx=parse_ctx)
+    ex.exec_opts.fast_command_sub = True
+
+    master, slave = os.openpty()
+    saved = [os.dup(0), os.dup(1)]
+    posix.dup2(slave, 0)
+    posix.dup2(slave, 1)
+    try:
+      line_reader, _ = test_lib.InitLexer(code_str, arena)
+      c_parser = parse_ctx.MakeOshParser(line_reader)
+      main_loop.Batch(ex, c_parser, arena)
+    finally:
+      for i, fd in enumerate(saved):
+        posix.dup2(fd, i)
+        posix.close(fd)
+      posix.close(slave)
+      posix.close(master)
+
+    self.assertEqual(3, ex.job_state.num_started)  # all but d forked
+    self.assertEqual('NOTTY', state.GetGlobal(ex.mem, 'a').s)
+    self.assertEqual('NOTTY', state.GetGlobal(ex.mem, 'b').s)
+    self.assertEqual('TTY', state.GetGlobal(ex.mem, 'c').s)
+    self.assertEqual('in-process', state.GetGlobal(ex.mem, 'd').s)
+
+
 if __name__ == '__main__':
   unittest.main()
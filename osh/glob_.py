@@ -15,6 +15,8 @@ from core import util
 #from core.util import log
 from frontend import match
 
+from typing import Optional
+
 
 def LooksLikeGlob(s):
   # type: (str) -> bool
@@ -93,6 +95,32 @@ def ExtendedRegexEscape(s):
   return util.BackslashEscape(s, ERE_META_CHARS)
 
 
+def GlobLiteral(s):  # used by cmd_exec
+  # type: (str) -> Optional[str]
+  """If a glob pattern only matches one string, return it.  Otherwise None.
+
+  Unlike GlobUnescape, any character can be escaped, as in fnmatch().  We're
+  conservative: any [ means a char class, and any ( an extended glob like
+  @(a|b).
+  """
+  out = []
+  i = 0
+  n = len(s)
+  while i < n:
+    c = s[i]
+    if c == '\\':
+      if i == n - 1:
+        return None  # trailing backslash
+      i += 1
+      out.append(s[i])
+    elif c in '*?[(':
+      return None
+    else:
+      out.append(c)
+    i += 1
+  return ''.join(out)
+
+
 def GlobUnescape(s):  # used by cmd_exec
   """Remove glob escaping from a string.
 
@@ -56,6 +56,26 @@ class GlobEscapeTest(unittest.TestCase):
       self.assertEqual(expected, glob_.LooksLikeGlob(pat),
                        '%s: expected %r' % (pat, expected))
 
+  def testGlobLiteral(self):
+    CASES = [
+        (r'foo', 'foo'),
+        (r'', ''),
+        (r'\*.sh', '*.sh'),
+        (r'a\b', 'ab'),  # fnmatch() allows escaping any char
+        (r'a\\b', r'a\b'),
+        (r']', ']'),
+
+        (r'*', None),
+        (r'?', None),
+        (r'[ab]', None),
+        (r'[', None),  # conservative
+        (r'@(a|b)', None),
+        ('a\\', None),  # trailing backslash
+    ]
+    for pat, expected in CASES:
+      self.assertEqual(expected, glob_.GlobLiteral(pat),
+                       '%s: expected %r' % (pat, expected))
+
   def testGlobStripRegexes(self):
     s = 'aabbccdd'
 
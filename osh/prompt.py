@@ -216,6 +216,7 @@ class Evaluator(object):
       except util.ParseError as e:
         ps1_word = word_.ErrorWord("<ERROR: Can't parse PS1: %s>", e)
       self.parse_cache[ps1_str] = ps1_word
+      self.parse_ctx.arena.Pin(('PS1', ps1_str))
 
     # Evaluate, e.g. "${debian_chroot}\u" -> '\u'
     val2 = self.ex.word_ev.EvalForPlugin(ps1_word)
@@ -274,6 +275,7 @@ class UserPlugin(object):
         self.arena.PopSource()
 
       self.parse_cache[prompt_cmd] = node
+      self.arena.Pin(('PROMPT_COMMAND', prompt_cmd))
 
     # Save this so PROMPT_COMMAND can't set $?
     self.mem.PushStatusFrame()
@@ -33,6 +33,14 @@ from core.util import log
 
 from typing import List
 
+# libc.ifs_split() does Split() and _SpansToParts() in one pass in C.  The
+# Python version is still used by 'read', which needs the spans, and as an
+# oracle in split_test.py.
+try:
+  from libc import ifs_split
+except ImportError:
+  ifs_split = None
+
 # Enums for the state machine
 CH = runtime_asdl.char_kind_e
 EMIT = runtime_asdl.emit_e
@@ -88,17 +96,43 @@ class SplitContext(object):
     # Split into (ifs_whitespace, ifs_other)
     self.splitters = {}  # IFS value -> splitter instance
 
-  def _GetSplitter(self):
-    """Based on the current stack frame, get the splitter."""
+    # The splitter and join char for the current $IFS.  They're valid while
+    # mem.ifs_version is the same, which saves looking up IFS for every word.
+    self.ifs_version = -1
+    self.splitter = None  # type: IfsSplitter
+    self.join_char = None  # type: str
+
+  def _Update(self):
+    # type: () -> None
+    """Recompute the splitter and join char if IFS may have changed."""
+    if self.ifs_version == self.mem.ifs_version:
+      return
+
     val = self.mem.GetVar('IFS')
     if val.tag == value_e.Undef:
       ifs = DEFAULT_IFS
+      # https://www.gnu.org/software/bash/manual/bashref.html#Special-Parameters
+      # http://pubs.opengroup.org/onlinepubs/9699919799/utilities/V3_chap02.html#tag_18_05_02
+      # "When the expansion occurs within a double-quoted string (see
+      # Double-Quotes), it shall expand to a single field with the value of
+      # each parameter separated by the first character of the IFS variable,
+      # or by a <space> if IFS is unset. If IFS is set to a null string, this
+      # is not equivalent to unsetting it; its first character does not
+      # exist, so the parameter values are concatenated."
+      self.join_char = ' '
     elif val.tag == value_e.Str:
       ifs = val.s
+      self.join_char = ifs[0] if ifs else ''
     else:
       # TODO: Raise proper error
       raise AssertionError("IFS shouldn't be an array")
 
+    self.splitter = self._GetSplitter(ifs)
+    self.ifs_version = self.mem.ifs_version
+
+  def _GetSplitter(self, ifs):
+    # type: (str) -> IfsSplitter
+    """Get the splitter for an IFS value."""
     try:
       sp = self.splitters[ifs]
     except KeyError:
@@ -126,30 +160,13 @@ class SplitContext(object):
     For decaying arrays by joining, eg. "$@" -> $@.
     array
     """
-    # https://www.gnu.org/software/bash/manual/bashref.html#Special-Parameters
-    # http://pubs.opengroup.org/onlinepubs/9699919799/utilities/V3_chap02.html#tag_18_05_02
-    # "When the expansion occurs within a double-quoted string (see
-    # Double-Quotes), it shall expand to a single field with the value of
-    # each parameter separated by the first character of the IFS variable, or
-    # by a <space> if IFS is unset. If IFS is set to a null string, this is
-    # not equivalent to unsetting it; its first character does not exist, so
-    # the parameter values are concatenated."
-    val = self.mem.GetVar('IFS')
-    if val.tag == value_e.Undef:
-      return ' '
-    elif val.tag == value_e.Str:
-      if val.s:
-        return val.s[0]
-      else:
-        return ''
-    else:
-      # TODO: Raise proper error
-      raise AssertionError("IFS shouldn't be an array")
+    self._Update()
+    return self.join_char
 
   def Escape(self, s):
     """Escape IFS chars."""
-    sp = self._GetSplitter()
-    return sp.Escape(s)
+    self._Update()
+    return self.splitter.Escape(s)
 
   def SplitForWordEval(self, s):
     # type: (str) -> List[str]
@@ -169,7 +186,11 @@ class SplitContext(object):
     Returns:
       Array of (ignored Bool, start_index Int) tuples.
     """
-    sp = self._GetSplitter()
+    self._Update()
+    sp = self.splitter
+    if ifs_split:
+      return ifs_split(s, sp.ifs_whitespace, sp.ifs_other, True)
+
     spans = sp.Split(s, True)
     if 0:
       for span in spans:
@@ -178,8 +199,8 @@ class SplitContext(object):
 
   def SplitForRead(self, line, allow_escape):
     # type: (str, bool) -> List[str]
-    sp = self._GetSplitter()
-    return sp.Split(line, allow_escape)
+    self._Update()
+    return self.splitter.Split(line, allow_escape)
 
 
 class _BaseSplitter(object):
@@ -3,9 +3,13 @@
 split.test.py: Tests for split.py
 """
 
+import random
 import unittest
 
+from _devbuild.gen.runtime_asdl import lvalue, scope_e
+from core import test_lib
 from osh import split  # module under test
+from osh import state
 
 
 def _RunSplitCases(test, sp, cases):
@@ -26,6 +30,12 @@ def _RunSplitCases(test, sp, cases):
     test.assertEqual(expected_parts, parts,
         '%r: %s != %s' % (s, expected_parts, parts))
 
+    if split.ifs_split:
+      native_parts = split.ifs_split(s, sp.ifs_whitespace, sp.ifs_other,
+                                     allow_escape)
+      test.assertEqual(expected_parts, native_parts,
+          '%r: %s != %s' % (s, expected_parts, native_parts))
+
 
 class SplitTest(unittest.TestCase):
 
@@ -164,6 +174,69 @@ class SplitTest(unittest.TestCase):
     sp = split.IfsSplitter('', '_-')
     _RunSplitCases(self, sp, CASES)
 
+  def testNativeMatchesPython(self):
+    if not split.ifs_split:
+      return
+
+    # Random strings of IFS chars, backslashes, and other chars.
+    r = random.Random(42)
+    alphabet = 'ab \t\n_-\\'
+    for ifs_whitespace, ifs_other in [
+        (split.DEFAULT_IFS, ''), (' ', '_'), ('', '_-'), ('\t', ''), ('', ''),
+        (' ', '\\'), (' \n', '_\\')]:
+      sp = split.IfsSplitter(ifs_whitespace, ifs_other)
+      for _ in xrange(2000):
+        s = ''.join(r.choice(alphabet) for _ in xrange(r.randint(0, 12)))
+        for allow_escape in (True, False):
+          expected = split._SpansToParts(s, sp.Split(s, allow_escape))
+          actual = split.ifs_split(s, ifs_whitespace, ifs_other, allow_escape)
+          self.assertEqual(expected, actual,
+              '%r %r %r %s: %s != %s' % (
+              s, ifs_whitespace, ifs_other, allow_escape, expected, actual))
+
+
+class SplitContextTest(unittest.TestCase):
+
+  def testIfsChanges(self):
+    arena = test_lib.MakeArena('<split_test.py>')
+    mem = state.Mem('', [], {}, arena)
+    splitter = split.SplitContext(mem)
+
+    self.assertEqual(['a', 'b'], splitter.SplitForWordEval('a b'))
+    self.assertEqual(' ', splitter.GetJoinChar())
+
+    # Temp binding, like IFS=: cmd
+    mem.PushTemp()
+    state.SetLocalString(mem, 'IFS', ':')
+    self.assertEqual(['a b', 'c'], splitter.SplitForWordEval('a b:c'))
+    self.assertEqual(':', splitter.GetJoinChar())
+    mem.PopTemp()
+    self.assertEqual(['a', 'b:c'], splitter.SplitForWordEval('a b:c'))
+
+    state.SetGlobalString(mem, 'IFS', '')
+    self.assertEqual(['a b'], splitter.SplitForWordEval('a b'))
+    self.assertEqual('', splitter.GetJoinChar())
+
+    mem.Unset(lvalue.Named('IFS'), scope_e.Dynamic)
+    self.assertEqual(['a', 'b'], splitter.SplitForWordEval('a b'))
+    self.assertEqual(' ', splitter.GetJoinChar())
+
+    # A command sub that runs in-process restores IFS.
+    mem.PushSandbox()
+    state.SetGlobalString(mem, 'IFS', '-')
+    self.assertEqual('-', splitter.GetJoinChar())
+    mem.PopSandbox()
+    self.assertEqual(' ', splitter.GetJoinChar())
+
+    # Looking up IFS only happens after a change.
+    version = mem.ifs_version
+    splitter.SplitForWordEval('a b')
+    mem.PushTemp()
+    state.SetLocalString(mem, 'x', 'y')
+    self.assertEqual(version, mem.ifs_version)
+    mem.PopTemp()
+    self.assertEqual(version, mem.ifs_version)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -11,7 +11,9 @@ from __future__ import print_function
 
 import cStringIO
 
-from typing import List
+from typing import List, Dict, Tuple, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+  from _devbuild.gen.runtime_asdl import cell
 
 from _devbuild.gen.id_kind_asdl import Id
 from _devbuild.gen.syntax_asdl import lhs_expr
@@ -39,11 +41,45 @@ _READLINE_DELIMS = ' \t\n"\'><=;|&(:'
 
 
 class SearchPath(object):
-  """For looking up files in $PATH."""
+  """For looking up files in $PATH.
+
+  $PATH is split once per value.  Lookups aren't cached, since any process can
+  add an executable at any time, and checking whether a cached answer is still
+  right costs as many syscalls as searching again.  (The 'hash' table of
+  commands that were run is separate.  See CachedLookup().)
+  """
 
   def __init__(self, mem):
     self.mem = mem
-    self.cache = {}
+
+    self.path_str = None  # The $PATH that path_dirs is for
+    self.path_dirs = []  # type: List[str]
+
+    # The 'hash' builtin's table: name -> full path
+    self.hashed = {}  # type: Dict[str, str]
+    # dir -> (mtime, executable names), for completion
+    self.dir_listings = {}  # type: Dict[str, Tuple[float, List[str]]]
+
+  def _DirMtime(self, path_dir):
+    # type: (str) -> float
+    try:
+      return posix.stat(path_dir).st_mtime
+    except OSError:
+      return -1.0  # It may be created later
+
+  def _PathDirs(self):
+    # type: () -> List[str]
+    path_val = self.mem.GetVar('PATH')
+    if path_val.tag == value_e.Str:
+      path_str = path_val.s
+    else:
+      path_str = ''  # treat as empty path
+
+    if path_str != self.path_str:
+      self.path_str = path_str
+      self.path_dirs = path_str.split(':') if path_str else []
+      self.hashed.clear()  # bash also does this
+    return self.path_dirs
 
   def Lookup(self, name, exec_required=True):
     """
@@ -55,15 +91,7 @@ class SearchPath(object):
       else:
         return None
 
-    # TODO: Could cache this computation to avoid allocating every time for all
-    # the splitting.
-    path_val = self.mem.GetVar('PATH')
-    if path_val.tag == value_e.Str and path_val.s:
-      path_list = path_val.s.split(':')
-    else:
-      path_list = []  # treat as empty path
-
-    for path_dir in path_list:
+    for path_dir in self._PathDirs():
       full_path = os_path.join(path_dir, name)
 
       # NOTE: dash and bash only check for EXISTENCE in 'command -v' (and 'type
@@ -80,28 +108,66 @@ class SearchPath(object):
     return None
 
   def CachedLookup(self, name):
-    if name in self.cache:
-      return self.cache[name]
+    """For external commands and 'hash'.
+
+    Like bash, a hit stays in the hash table until $PATH changes or 'hash -r',
+    even if the file system changes.
+    """
+    self._PathDirs()  # clears the table if $PATH changed
+    full_path = self.hashed.get(name)
+    if full_path is not None:
+      return full_path
 
     full_path = self.Lookup(name)
     if full_path is not None:
-      self.cache[name] = full_path
+      self.hashed[name] = full_path
     return full_path
 
   def MaybeRemoveEntry(self, name):
     """When the file system changes."""
-    try:
-      del self.cache[name]
-    except KeyError:
-      pass
+    self.hashed.pop(name, None)
 
   def ClearCache(self):
     """For hash -r."""
-    self.cache.clear()
+    self.hashed.clear()
 
   def CachedCommands(self):
     """For hash -r."""
-    return sorted(self.cache.values())
+    return sorted(self.hashed.values())
+
+  def Executables(self):
+    # type: () -> List[str]
+    """The names of the executables in $PATH, for completion.
+
+    Directory listings are cached until the mtime changes.
+    """
+    executables = []  # type: List[str]
+    for path_dir in self._PathDirs():
+      mtime = self._DirMtime(path_dir)
+      if mtime == -1.0:
+        # There could be a directory that doesn't exist in the $PATH.
+        continue
+      entry = self.dir_listings.get(path_dir)
+      if entry is not None and entry[0] == mtime:
+        dir_exes = entry[1]
+      else:
+        try:
+          entries = posix.listdir(path_dir)
+        except OSError:
+          continue
+        dir_exes = []
+        for name in entries:
+          path = os_path.join(path_dir, name)
+          # TODO: Handle exception if file gets deleted in between listing and
+          # check?
+          if not posix.access(path, posix.X_OK):
+            continue
+          dir_exes.append(name)  # append the name, not the path
+
+        self.dir_listings[path_dir] = (mtime, dir_exes)
+
+      executables.extend(dir_exes)
+    return executables
 
 
 class _ErrExit(object):
@@ -233,6 +299,8 @@ SHOPT_OPTION_NAMES = [
     'expand_aliases', 'extglob', 'lastpipe',  # language features always on
     'progcomp', 'histappend', 'hostcomplete',  # not sure what these are
     'cmdhist',  # multi-line commands in history
+
+    'fast_command_sub',  # run some command subs without forking
 ] + _STRICT_OPTION_NAMES + _OIL_OPTION_NAMES
 
 # Oil parse options only.
@@ -340,6 +408,10 @@ class ExecOpts(object):
     self.vi = False
     self.emacs = False
 
+    # Run command subs made of builtins and functions in this process, e.g.
+    # x=$(echo hi).  See Executor.RunCommandSub().
+    self.fast_command_sub = False
+
     # 
     # Turned on with shopt -s all:oil
     #
@@ -576,6 +648,53 @@ def _DumpVarFrame(frame):
   return vars_json
 
 
+class _Sandbox(object):
+  """Undo log for running a command sub in the shell process.
+
+  The frames that exist when the sandbox is pushed are shared with the caller.
+  The first write to a cell in a shared frame replaces it with a copy, and
+  PopSandbox() puts the original back.  Frames pushed later, e.g. for function
+  calls, are private and need no bookkeeping.
+  """
+
+  def __init__(self, mem):
+    # type: (Mem) -> None
+    self.shared = set(id(frame) for frame in mem.var_stack)
+    # (id(frame), name) -> (frame, name, original cell or None)
+    self.saved = {}  # type: Dict[Tuple[int, str], Tuple[Dict[str, cell], str, Optional[cell]]]
+
+    frame = mem.argv_stack[-1]
+    self.arg_frame = frame
+    self.argv = frame.argv
+    self.num_shifted = frame.num_shifted
+
+    self.last_status = mem.last_status[-1]
+    self.pipe_status = mem.pipe_status[-1]
+    self.current_spid = mem.current_spid
+
+  def Save(self, namespace, name):
+    # type: (Dict[str, cell], str) -> bool
+    """Record the binding before it's changed.  Returns True the first time."""
+    if id(namespace) not in self.shared:
+      return False
+    key = (id(namespace), name)
+    if key in self.saved:
+      return False
+    self.saved[key] = (namespace, name, namespace.get(name))
+    return True
+
+
+def _CopyCell(c):
+  # type: (cell) -> cell
+  """Copy a cell and the mutable containers in its value."""
+  val = c.val
+  if val.tag == value_e.MaybeStrArray:
+    val = value.MaybeStrArray(list(val.strs))
+  elif val.tag == value_e.AssocArray:
+    val = value.AssocArray(dict(val.d))
+  return runtime_asdl.cell(val, c.exported, c.readonly)
+
+
 class DirStack(object):
   """For pushd/popd/dirs."""
   def __init__(self):
@@ -638,6 +757,36 @@ class Mem(object):
     self.argv_stack = [_ArgFrame(argv)]
     self.var_stack = [{}]
 
+    # name -> the frames of var_stack that bind it, from bottom to top.  Makes
+    # dynamic lookup O(1) instead of O(stack depth).
+    self.var_index = {}  # type: Dict[str, List[Dict[str, cell]]]
+
+    # Computed variables like $LINENO.  They're looked up before user
+    # variables.
+    self.special_vars = {
+        'ARGV': self._Argv,
+        'PIPESTATUS': self._PipeStatus,
+        'FUNCNAME': self._FuncName,
+        'BASH_SOURCE': self._BashSource,
+        'CALL_SOURCE': self._CallSource,
+        'BASH_LINENO': self._BashLineNo,
+        'LINENO': self._LineNo,
+        'SOURCE_NAME': self._SourceName,
+    }
+
+    # The dict returned by GetExported(), or None if a change to an exported
+    # variable invalidated it.
+    self.exported = None  # type: Optional[Dict[str, str]]
+
+    # Incremented whenever the value of $IFS may have changed: a cell named
+    # IFS is bound, set, unset, or goes out of scope.  SplitContext caches
+    # what it derives from $IFS until then.
+    self.ifs_version = 0
+
+    # Non-empty while a command sub runs in-process.  See PushSandbox().
+    self.sandbox_stack = []  # type: List[_Sandbox]
+    self.sandbox = None  # type: Optional[_Sandbox]  # top of the stack
+
     # The debug_stack isn't strictly necessary for execution.  We use it for
     # crash dumps and for 3 parallel arrays: FUNCNAME, CALL_SOURCE,
     # BASH_LINENO.  The First frame points at the global vars and argv.
@@ -802,6 +951,11 @@ class Mem(object):
     # type: () -> int
     return self.current_spid
 
+  def ClearCurrentSpanId(self):
+    # type: () -> None
+    """Called when the Arena discards the current span."""
+    self.current_spid = const.NO_INTEGER
+
   #
   # Status Variable Stack (for isolating $PS1 and $PS4)
   #
@@ -852,7 +1006,7 @@ class Mem(object):
     self.bash_source.pop()
     self._PopDebugStack()
 
-    self.var_stack.pop()
+    self._PopVarFrame()
     self.argv_stack.pop()
 
   def PushSource(self, source_name, argv):
@@ -878,7 +1032,72 @@ class Mem(object):
 
   def PopTemp(self):
     self._PopDebugStack()
-    self.var_stack.pop()
+    self._PopVarFrame()
+
+  def _PopVarFrame(self):
+    frame = self.var_stack.pop()
+    var_index = self.var_index
+    for name in frame:
+      frames = var_index[name]
+      frames.pop()
+      if not frames:
+        del var_index[name]
+    if 'IFS' in frame:
+      self.ifs_version += 1
+
+    # Pushing an empty frame doesn't change the exported vars, but popping a
+    # frame with an exported var does, e.g. 'FOO=bar cmd' or 'local -x'.
+    if self.exported is not None:
+      for cell in frame.itervalues():
+        if cell.exported:
+          self.exported = None
+          break
+
+  #
+  # Sandbox for command subs that run in-process
+  #
+
+  def PushSandbox(self):
+    # type: () -> None
+    """Start isolating changes, like a forked child process would."""
+    self.sandbox = _Sandbox(self)
+    self.sandbox_stack.append(self.sandbox)
+
+  def PopSandbox(self):
+    # type: () -> None
+    """Undo every change made since the matching PushSandbox()."""
+    sb = self.sandbox_stack.pop()
+    self.sandbox = self.sandbox_stack[-1] if self.sandbox_stack else None
+
+    var_index = self.var_index
+    for namespace, name, orig in sb.saved.itervalues():
+      if orig is None:  # bound inside the sandbox
+        del namespace[name]
+        frames = [f for f in var_index[name] if f is not namespace]
+        if frames:
+          var_index[name] = frames
+        else:
+          del var_index[name]
+      else:
+        namespace[name] = orig
+      if name == 'IFS':
+        self.ifs_version += 1
+    if sb.saved:
+      self.exported = None
+
+    sb.arg_frame.argv = sb.argv
+    sb.arg_frame.num_shifted = sb.num_shifted
+    self.last_status[-1] = sb.last_status
+    self.pipe_status[-1] = sb.pipe_status
+    self.current_spid = sb.current_spid
+
+  def _WritableCell(self, namespace, name):
+    # type: (Dict[str, cell], str) -> cell
+    """Return the cell to mutate.  In a sandbox, shared cells are copied."""
+    sb = self.sandbox
+    if sb is not None and sb.Save(namespace, name):
+      namespace[name] = _CopyCell(namespace[name])
+    return namespace[name]
 
   def TopNamespace(self):
     """For evalblock()."""
@@ -972,11 +1191,10 @@ class Mem(object):
       namespace: The namespace it should be set to or deleted from.
     """
     if lookup_mode == scope_e.Dynamic:
-      for i in xrange(len(self.var_stack) - 1, -1, -1):
-        namespace = self.var_stack[i]
-        if name in namespace:
-          cell = namespace[name]
-          return cell, namespace
+      frames = self.var_index.get(name)
+      if frames:
+        namespace = frames[-1]
+        return namespace[name], namespace
       return None, self.var_stack[0]  # set in global namespace
 
     elif lookup_mode == scope_e.LocalOnly:
@@ -990,6 +1208,23 @@ class Mem(object):
     else:
       raise AssertionError(lookup_mode)
 
+  def _BindCell(self, namespace, name, cell):
+    # type: (Dict[str, cell], str, cell) -> None
+    """Add a cell to a namespace that _FindCellAndNamespace() returned."""
+    if self.sandbox is not None:
+      self.sandbox.Save(namespace, name)
+    if name == 'IFS':
+      self.ifs_version += 1
+    if name not in namespace:
+      frames = self.var_index.get(name)
+      if frames is None:
+        self.var_index[name] = [namespace]
+      elif namespace is self.var_stack[0]:
+        frames.insert(0, namespace)  # e.g. a global under a local
+      else:
+        frames.append(namespace)  # the top frame
+    namespace[name] = cell
+
   def IsAssocArray(self, name, lookup_mode):
     """Returns whether a name resolve to a cell with an associative array.
     
@@ -1053,6 +1288,10 @@ class Mem(object):
       cell, namespace = self._FindCellAndNamespace(lval.name, lookup_mode)
       self._CheckOilKeyword(keyword_id, lval, cell)
       if cell:
+        cell = self._WritableCell(namespace, lval.name)
+        if cell.exported:
+          self.exported = None
+
         # Clear before checking readonly bit.
         # NOTE: Could be cell.flags &= flag_clear_mask 
         if var_flags_e.Exported in flags_to_clear:
@@ -1065,6 +1304,8 @@ class Mem(object):
             # TODO: error context
             e_die("Can't assign to readonly value %r", lval.name)
           cell.val = val
+          if lval.name == 'IFS':
+            self.ifs_version += 1
 
         # NOTE: Could be cell.flags |= flag_set_mask 
         if var_flags_e.Exported in flags_to_set:
@@ -1080,7 +1321,10 @@ class Mem(object):
         cell = runtime_asdl.cell(val,
                                  var_flags_e.Exported in flags_to_set,
                                  var_flags_e.ReadOnly in flags_to_set)
-        namespace[lval.name] = cell
+        self._BindCell(namespace, lval.name, cell)
+
+      if cell.exported:
+        self.exported = None
 
       # Maintain invariant that only strings and undefined cells can be
       # exported.
@@ -1123,7 +1367,7 @@ class Mem(object):
               cell.val.__class__.__name__, span_id=left_spid)
 
       if cell_tag == value_e.MaybeStrArray:
-        strs = cell.val.strs
+        strs = self._WritableCell(namespace, lval.name).val.strs
         try:
           strs[lval.index] = val.s
         except IndexError:
@@ -1154,7 +1398,7 @@ class Mem(object):
       if cell.readonly:
         e_die("Can't assign to readonly associative array", span_id=left_spid)
 
-      cell.val.d[lval.key] = val.s
+      self._WritableCell(namespace, lval.name).val.d[lval.key] = val.s
 
     else:
       raise AssertionError(lval.__class__.__name__)
@@ -1167,7 +1411,8 @@ class Mem(object):
 
     # arrays can't be exported; can't have AssocArray flag
     readonly = var_flags_e.ReadOnly in flags_to_set
-    namespace[lval.name] = runtime_asdl.cell(new_value, False, readonly)
+    self._BindCell(namespace, lval.name,
+                   runtime_asdl.cell(new_value, False, readonly))
 
   def InternalSetGlobal(self, name, new_val):
     """For setting read-only globals internally.
@@ -1180,89 +1425,22 @@ class Mem(object):
 
     Use case: SHELLOPTS.
     """
-    cell = self.var_stack[0][name]
+    cell = self._WritableCell(self.var_stack[0], name)
     cell.val = new_val
+    if cell.exported:
+      self.exported = None
+    if name == 'IFS':
+      self.ifs_version += 1
 
   def GetVar(self, name, lookup_mode=scope_e.Dynamic):
     assert isinstance(name, str), name
 
-    # TODO: Short-circuit down to _FindCellAndNamespace by doing a single hash
-    # lookup:
-    # COMPUTED_VARS = {'PIPESTATUS': 1, 'FUNCNAME': 1, ...}
-    # if name not in COMPUTED_VARS: ...
-
-    if name == 'ARGV':
-      # TODO:
-      # - Reuse the MaybeStrArray?
-      # - @@ could be an alias for ARGV (in command mode, but not expr mode)
-      return value.MaybeStrArray(self.GetArgv())
-
-    if name == 'PIPESTATUS':
-      return value.MaybeStrArray([str(i) for i in self.pipe_status[-1]])
-
     # Do lookup of system globals before looking at user variables.  Note: we
     # could optimize this at compile-time like $?.  That would break
     # ${!varref}, but it's already broken for $?.
-    if name == 'FUNCNAME':
-      # bash wants it in reverse order.  This is a little inefficient but we're
-      # not depending on deque().
-      strs = []
-      for func_name, source_name, _, _, _ in reversed(self.debug_stack):
-        if func_name:
-          strs.append(func_name)
-        if source_name:
-          strs.append('source')  # bash doesn't give name
-        # Temp stacks are ignored
-
-      if self.has_main:
-        strs.append('main')  # bash does this
-      return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
-
-    # This isn't the call source, it's the source of the function DEFINITION
-    # (or the sourced # file itself).
-    if name == 'BASH_SOURCE':
-      return value.MaybeStrArray(list(reversed(self.bash_source)))
-
-    # This is how bash source SHOULD be defined, but it's not!
-    if name == 'CALL_SOURCE':
-      strs = []
-      for func_name, source_name, call_spid, _, _ in reversed(self.debug_stack):
-        # should only happen for the first entry
-        if call_spid == const.NO_INTEGER:
-          continue
-        span = self.arena.GetLineSpan(call_spid)
-        source_str = self.arena.GetLineSourceString(span.line_id)
-        strs.append(source_str)
-      if self.has_main:
-        strs.append('-')  # Bash does this to line up with main?
-      return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
-
-    if name == 'BASH_LINENO':
-      strs = []
-      for _, _, call_spid, _, _ in reversed(self.debug_stack):
-        # should only happen for the first entry
-        if call_spid == const.NO_INTEGER:
-          continue
-        span = self.arena.GetLineSpan(call_spid)
-        line_num = self.arena.GetLineNumber(span.line_id)
-        strs.append(str(line_num))
-      if self.has_main:
-        strs.append('0')  # Bash does this to line up with main?
-      return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
-
-    if name == 'LINENO':
-      span = self.arena.GetLineSpan(self.current_spid)
-      # TODO: maybe use interned GetLineNumStr?
-      s = str(self.arena.GetLineNumber(span.line_id))
-      self.line_num.s = s
-      return self.line_num
-
-    # This is OSH-specific.  Get rid of it in favor of ${BASH_SOURCE[0]} ?
-    if name == 'SOURCE_NAME':
-      # Update and reuse an object.
-      span = self.arena.GetLineSpan(self.current_spid)
-      self.source_name.s = self.arena.GetLineSourceString(span.line_id)
-      return self.source_name
+    special = self.special_vars.get(name)
+    if special is not None:
+      return special()
 
     cell, _ = self._FindCellAndNamespace(name, lookup_mode)
 
@@ -1271,6 +1449,80 @@ class Mem(object):
 
     return value.Undef()
 
+  def _Argv(self):
+    # TODO:
+    # - Reuse the MaybeStrArray?
+    # - @@ could be an alias for ARGV (in command mode, but not expr mode)
+    return value.MaybeStrArray(self.GetArgv())
+
+  def _PipeStatus(self):
+    return value.MaybeStrArray([str(i) for i in self.pipe_status[-1]])
+
+  def _FuncName(self):
+    # bash wants it in reverse order.  This is a little inefficient but we're
+    # not depending on deque().
+    strs = []
+    for func_name, source_name, _, _, _ in reversed(self.debug_stack):
+      if func_name:
+        strs.append(func_name)
+      if source_name:
+        strs.append('source')  # bash doesn't give name
+      # Temp stacks are ignored
+
+    if self.has_main:
+      strs.append('main')  # bash does this
+    return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
+
+  def _BashSource(self):
+    # This isn't the call source, it's the source of the function DEFINITION
+    # (or the sourced # file itself).
+    return value.MaybeStrArray(list(reversed(self.bash_source)))
+
+  def _CallSource(self):
+    # This is how bash source SHOULD be defined, but it's not!
+    strs = []
+    for func_name, source_name, call_spid, _, _ in reversed(self.debug_stack):
+      # should only happen for the first entry
+      if call_spid == const.NO_INTEGER:
+        continue
+      span = self.arena.GetLineSpan(call_spid)
+      source_str = self.arena.GetLineSourceString(span.line_id)
+      strs.append(source_str)
+    if self.has_main:
+      strs.append('-')  # Bash does this to line up with main?
+    return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
+
+  def _BashLineNo(self):
+    strs = []
+    for _, _, call_spid, _, _ in reversed(self.debug_stack):
+      # should only happen for the first entry
+      if call_spid == const.NO_INTEGER:
+        continue
+      span = self.arena.GetLineSpan(call_spid)
+      line_num = self.arena.GetLineNumber(span.line_id)
+      strs.append(str(line_num))
+    if self.has_main:
+      strs.append('0')  # Bash does this to line up with main?
+    return value.MaybeStrArray(strs)  # TODO: Reuse this object too?
+
+  def _LineNo(self):
+    if self.current_spid == const.NO_INTEGER:
+      return self.line_num  # e.g. in PS1, before any command has run
+    span = self.arena.GetLineSpan(self.current_spid)
+    # TODO: maybe use interned GetLineNumStr?
+    s = str(self.arena.GetLineNumber(span.line_id))
+    self.line_num.s = s
+    return self.line_num
+
+  def _SourceName(self):
+    # This is OSH-specific.  Get rid of it in favor of ${BASH_SOURCE[0]} ?
+    if self.current_spid == const.NO_INTEGER:
+      return self.source_name
+    # Update and reuse an object.
+    span = self.arena.GetLineSpan(self.current_spid)
+    self.source_name.s = self.arena.GetLineSourceString(span.line_id)
+    return self.source_name
+
   def GetCell(self, name):
     """For the 'repr' builtin."""
     cell, _ = self._FindCellAndNamespace(name, scope_e.Dynamic)
@@ -1290,7 +1542,12 @@ class Mem(object):
         found = True
         if cell.readonly:
           return False, found
-        namespace[lval.name].val = value.Undef()
+        cell = self._WritableCell(namespace, lval.name)
+        if cell.exported:
+          self.exported = None
+        cell.val = value.Undef()
+        if lval.name == 'IFS':
+          self.ifs_version += 1
         cell.exported = False
         return True, found # found
       else:
@@ -1310,7 +1567,10 @@ class Mem(object):
     """
     cell, namespace = self._FindCellAndNamespace(name, lookup_mode)
     if cell:
+      cell = self._WritableCell(namespace, name)
       if flag == var_flags_e.Exported:
+        if cell.exported:
+          self.exported = None
         cell.exported = False
       else:
         raise AssertionError
@@ -1319,11 +1579,14 @@ class Mem(object):
       return False
 
   def GetExported(self):
-    """Get all the variables that are marked exported."""
-    # TODO: This is run on every SimpleCommand.  Should we have a dirty flag?
-    # We have to notice these things:
-    # - If an exported variable is changed.
-    # - If the set of exported variables changes.
+    """Get all the variables that are marked exported.
+
+    This is run on every external command, so the dict is cached until an
+    exported variable is changed, or the set of exported variables changes.
+    Callers must not mutate it.
+    """
+    if self.exported is not None:
+      return self.exported
 
     exported = {}
     # Search from globals up.  Names higher on the stack will overwrite names
@@ -1334,6 +1597,7 @@ class Mem(object):
         # changed to MaybeStrArray, also clear its 'exported' flag.
         if cell.exported and cell.val.tag == value_e.Str:
           exported[name] = cell.val.s
+    self.exported = exported
     return exported
 
   def VarNames(self):
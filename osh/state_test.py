@@ -3,6 +3,8 @@
 state_test.py: Tests for state.py
 """
 
+import os
+import shutil
 import unittest
 
 from _devbuild.gen.runtime_asdl import (
@@ -50,6 +52,57 @@ class MemTest(unittest.TestCase):
     # Not hermetic, but should be true on POSIX systems.
     self.assertEqual('/usr/bin/env', search_path.Lookup('env'))
 
+  def testSearchPathHashTable(self):
+    tmp_dir = '/tmp/state_test.%d' % os.getpid()
+    bin1 = tmp_dir + '/bin1'
+    bin2 = tmp_dir + '/bin2'
+    for d in (tmp_dir, bin1, bin2):
+      os.mkdir(d)
+
+    def MakeExe(path):
+      with open(path, 'w') as f:
+        f.write('#!/bin/sh\n')
+      os.chmod(path, 0o755)
+
+    mem = _InitMem()
+    search_path = state.SearchPath(mem)
+    mem.SetVar(lvalue.Named('PATH'), value.Str('%s:%s' % (bin1, bin2)),
+               (), scope_e.GlobalOnly)
+
+    self.assertEqual(None, search_path.Lookup('foo'))
+
+    # Another process adds foo to the second dir.  The next lookup sees it.
+    MakeExe(bin2 + '/foo')
+    self.assertEqual(bin2 + '/foo', search_path.CachedLookup('foo'))
+    self.assertEqual([bin2 + '/foo'], search_path.CachedCommands())
+
+    # One that shadows it.
+    MakeExe(bin1 + '/foo')
+    self.assertEqual(bin1 + '/foo', search_path.Lookup('foo'))
+    # But commands that were run stay in the hash table.
+    self.assertEqual(bin2 + '/foo', search_path.CachedLookup('foo'))
+
+    # Changing $PATH clears the hash table.
+    mem.SetVar(lvalue.Named('PATH'), value.Str(bin2), (), scope_e.GlobalOnly)
+    self.assertEqual(bin2 + '/foo', search_path.Lookup('foo'))
+    self.assertEqual([], search_path.CachedCommands())
+
+    mem.SetVar(lvalue.Named('PATH'), value.Str('_nonexistent:' + bin2), (),
+               scope_e.GlobalOnly)
+    self.assertEqual(['foo'], search_path.Executables())
+
+    # Permissions are checked on every lookup.
+    mem.SetVar(lvalue.Named('PATH'), value.Str(bin1), (), scope_e.GlobalOnly)
+    with open(bin1 + '/bar', 'w') as f:
+      f.write('#!/bin/sh\n')
+    self.assertEqual(None, search_path.Lookup('bar'))
+    os.chmod(bin1 + '/bar', 0o755)
+    self.assertEqual(bin1 + '/bar', search_path.Lookup('bar'))
+    os.chmod(bin1 + '/bar', 0o644)
+    self.assertEqual(None, search_path.Lookup('bar'))
+
+    shutil.rmtree(tmp_dir)
+
   def testPushTemp(self):
     mem = _InitMem()
 
@@ -260,6 +313,134 @@ class MemTest(unittest.TestCase):
     e = mem.GetExported()
     self.assertEqual('u', e['U'])
 
+  def testExportedCache(self):
+    mem = _InitMem()
+
+    mem.SetVar(
+        lvalue.Named('U'), value.Str('u'), (var_flags_e.Exported,),
+        scope_e.Dynamic)
+    e = mem.GetExported()
+    self.assertEqual('u', e['U'])
+
+    # Changing an unexported variable reuses the dict
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('x'), (), scope_e.Dynamic)
+    self.assertIs(e, mem.GetExported())
+
+    # A function call with a local
+    mem.PushCall('my-func', 0, [])
+    mem.SetVar(
+        lvalue.Named('y'), value.Str('y'), (), scope_e.LocalOnly)
+    self.assertIs(e, mem.GetExported())
+    mem.SetVar(
+        lvalue.Named('U'), value.Str('local'), (var_flags_e.Exported,),
+        scope_e.LocalOnly)
+    self.assertEqual('local', mem.GetExported()['U'])
+    mem.PopCall()
+    self.assertEqual('u', mem.GetExported()['U'])
+
+    # Temp binding: 'V=v cmd'
+    e = mem.GetExported()
+    mem.PushTemp()
+    mem.SetVar(
+        lvalue.Named('V'), value.Str('v'), (var_flags_e.Exported,),
+        scope_e.LocalOnly)
+    self.assertEqual('v', mem.GetExported()['V'])
+    mem.PopTemp()
+    self.assertEqual(e, mem.GetExported())
+    self.assertEqual(None, mem.GetExported().get('V'))
+
+    # export -n U
+    mem.ClearFlag('U', var_flags_e.Exported, scope_e.Dynamic)
+    self.assertEqual(None, mem.GetExported().get('U'))
+
+    # export U; unset U
+    mem.SetVar(
+        lvalue.Named('U'), None, (var_flags_e.Exported,), scope_e.Dynamic)
+    self.assertEqual('u', mem.GetExported()['U'])
+    mem.Unset(lvalue.Named('U'), scope_e.Dynamic)
+    self.assertEqual(None, mem.GetExported().get('U'))
+
+  def testDynamicLookup(self):
+    mem = _InitMem()
+
+    # f() { local x=f; g; }  g() { x=global-from-g; }
+    mem.PushCall('f', 0, [])
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('f'), (), scope_e.LocalOnly)
+    mem.PushCall('g', 0, [])
+    self.assertEqual('f', mem.GetVar('x').s)
+
+    # A new global under the local
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('global'), (), scope_e.GlobalOnly)
+    self.assertEqual('f', mem.GetVar('x').s)
+    self.assertEqual('global', mem.GetVar('x', scope_e.GlobalOnly).s)
+
+    # A local that shadows both
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('g'), (), scope_e.LocalOnly)
+    self.assertEqual('g', mem.GetVar('x').s)
+
+    mem.PopCall()
+    self.assertEqual('f', mem.GetVar('x').s)
+    mem.PopCall()
+    self.assertEqual('global', mem.GetVar('x').s)
+    self.assertEqual([mem.var_stack[0]], mem.var_index['x'])
+
+    # Only in a popped frame
+    mem.PushCall('f', 0, [])
+    mem.SetVar(
+        lvalue.Named('y'), value.Str('y'), (), scope_e.LocalOnly)
+    mem.PopCall()
+    self.assertEqual(value_e.Undef, mem.GetVar('y').tag)
+    self.assertEqual(None, mem.var_index.get('y'))
+
+    # Special vars come first
+    mem.SetVar(
+        lvalue.Named('PIPESTATUS'), value.Str('x'), (), scope_e.Dynamic)
+    self.assertEqual(value_e.MaybeStrArray, mem.GetVar('PIPESTATUS').tag)
+
+  def testSandbox(self):
+    mem = _InitMem()
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('x'), (), scope_e.Dynamic)
+    mem.SetVar(
+        lvalue.Indexed('a', 0), value.Str('a0'), (), scope_e.Dynamic)
+    mem.SetArgv(['1', '2'])
+    exported = mem.GetExported()
+
+    mem.PushSandbox()
+    mem.SetVar(
+        lvalue.Named('x'), value.Str('changed'), (var_flags_e.Exported,),
+        scope_e.Dynamic)
+    mem.SetVar(
+        lvalue.Indexed('a', 1), value.Str('a1'), (), scope_e.Dynamic)
+    mem.SetVar(
+        lvalue.Named('new'), value.Str('new'), (), scope_e.Dynamic)
+    mem.Shift(1)
+    mem.SetLastStatus(42)
+
+    # A function frame is private to the sandbox
+    mem.PushCall('f', 0, [])
+    mem.SetVar(
+        lvalue.Named('new'), value.Str('local'), (), scope_e.LocalOnly)
+    mem.PopCall()
+
+    self.assertEqual('changed', mem.GetVar('x').s)
+    self.assertEqual(['a0', 'a1'], mem.GetVar('a').strs)
+    self.assertEqual('changed', mem.GetExported()['x'])
+    mem.PopSandbox()
+
+    self.assertEqual('x', mem.GetVar('x').s)
+    self.assertEqual(['a0'], mem.GetVar('a').strs)
+    self.assertEqual(value_e.Undef, mem.GetVar('new').tag)
+    self.assertEqual(None, mem.var_index.get('new'))
+    self.assertEqual(['1', '2'], mem.GetArgv())
+    self.assertEqual(0, mem.LastStatus())
+    self.assertEqual(exported, mem.GetExported())
+    self.assertEqual(None, mem.sandbox)
+
   def testUnset(self):
     mem = _InitMem()
     # unset a
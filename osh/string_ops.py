@@ -155,6 +155,348 @@ def AdvanceUtf8Chars(s, num_chars, byte_offset):
 # mksh.  Dash doesn't implement it.
 
 
+# A glob without extended glob syntax is a sequence of "segments" separated
+# by *, e.g. a?c*.py is ['a', ?, 'c'] * ['.py'].  Each segment matches a fixed
+# number of characters.  So to find the shortest prefix that matches, we can
+# match the first segment at the start, and then put each of the others at the
+# first place it matches.  The other 3 operators are similar.  This is one
+# pass over the string in the common case, instead of one fnmatch() call per
+# prefix or suffix.
+#
+# An atom of a segment is a literal string, None for ?, or a (glob, is_ascii)
+# tuple for a char class like [a-z].  Atoms other than literal strings match
+# one UTF-8 character.
+
+def _CharClassEnd(pat, i):
+  """Return the position after the char class at pat[i], or -1 if the [ is a
+  literal.  Follows the rules of fnmatch()."""
+  n = len(pat)
+  j = i + 1
+  if j < n and pat[j] in '!^':
+    j += 1
+  if j < n and pat[j] == ']':  # []] and [!]] include ]
+    j += 1
+  while j < n:
+    c = pat[j]
+    if c == '\\':
+      j += 2
+    elif c == '[' and j + 1 < n and pat[j+1] in ':.=':  # [:alpha:] etc.
+      k = pat.find(pat[j+1] + ']', j + 2)
+      if k == -1:
+        return -1
+      j = k + 2
+    elif c == ']':
+      return j + 1
+    else:
+      j += 1
+  return -1
+
+
+def _ParseStripGlob(pat):
+  """Split a glob pattern into segments, or return None if we can't.
+
+  Args:
+    pat: a glob-escaped pattern, as passed to fnmatch()
+  """
+  segments = [[]]
+  seg = segments[0]
+  lit = []  # literal chars of the current atom
+
+  i = 0
+  n = len(pat)
+  while i < n:
+    c = pat[i]
+    if c in '?*+@!' and i + 1 < n and pat[i+1] == '(':
+      return None  # extended glob like @(a|b)
+
+    if c == '\\':
+      if i + 1 == n:
+        return None  # trailing backslash
+      lit.append(pat[i+1])
+      i += 2
+      continue
+
+    if c == '[':
+      end = _CharClassEnd(pat, i)
+      if end == -1:
+        lit.append(c)
+        i += 1
+        continue
+
+    if c in '*?[':
+      if lit:
+        seg.append(''.join(lit))
+        lit = []
+      if c == '*':
+        seg = []
+        segments.append(seg)
+      elif c == '?':
+        seg.append(None)
+      else:
+        glob = pat[i:end]
+        seg.append((glob, all(ord(b) < 0x80 for b in glob)))
+        i = end
+        continue
+    else:
+      lit.append(c)
+    i += 1
+
+  if lit:
+    seg.append(''.join(lit))
+  return segments
+
+
+def _CharEnd(s, i):
+  """Return the position after the character at s[i].
+
+  Invalid UTF-8 is treated as one character per byte.
+  """
+  if ord(s[i]) < 0x80:
+    return i + 1
+  try:
+    return _NextUtf8Char(s, i)
+  except util.InvalidUtf8:
+    return i + 1
+
+
+def _CharStart(s, i):
+  """Return the position of the character that ends at s[i]."""
+  j = i - 1
+  while j > 0 and j > i - 4 and (ord(s[j]) >> 6) == 0b10:
+    j -= 1
+  if _CharEnd(s, j) == i:
+    return j
+  return i - 1  # invalid UTF-8
+
+
+# For [[:alpha:]] and family with non-ASCII characters.
+_NAMED_CLASSES = {
+    'alnum': lambda c: c.isalnum(),
+    'alpha': lambda c: c.isalpha(),
+    'blank': lambda c: c in u' \t',
+    'cntrl': lambda c: ord(c) < 0x20 or 0x7f <= ord(c) < 0xa0,
+    'digit': lambda c: c in u'0123456789',
+    'graph': lambda c: ord(c) > 0x20 and not c.isspace() and
+                       not 0x7f <= ord(c) < 0xa0,
+    'lower': lambda c: c.islower(),
+    'print': lambda c: ord(c) >= 0x20 and not 0x7f <= ord(c) < 0xa0,
+    'punct': lambda c: ord(c) > 0x20 and not c.isalnum() and
+                       not c.isspace() and not 0x7f <= ord(c) < 0xa0,
+    'space': lambda c: c.isspace(),
+    'upper': lambda c: c.isupper(),
+    'xdigit': lambda c: c in u'0123456789abcdefABCDEF',
+}
+
+
+def _ClassMatchesUnicode(glob, ch):
+  """Match one character against a char class by code point.
+
+  fnmatch() works on bytes in our locale, so it can't match a multi-byte
+  character, or a class that contains one.
+  """
+  try:
+    glob = glob.decode('utf-8')
+    ch = ch.decode('utf-8')
+  except UnicodeDecodeError:
+    return bool(libc.fnmatch(glob, ch))  # invalid UTF-8 is bytes
+
+  i = 1
+  negated = glob[i] in u'!^'
+  if negated:
+    i += 1
+  n = len(glob) - 1  # the closing ].  _CharClassEnd() found it.
+  matched = False
+  while i < n:
+    c = glob[i]
+    if c == u'[' and glob[i+1] in u':.=':  # [:alpha:] [.a.] [=a=]
+      delim = glob[i+1]
+      end = glob.index(delim + u']', i + 2)
+      name = glob[i+2:end]
+      i = end + 2
+      if delim == u':':
+        pred = _NAMED_CLASSES.get(name)
+        if pred is not None and pred(ch):
+          matched = True
+        continue
+      lo = name
+    else:
+      if c == u'\\' and i + 1 < n:
+        i += 1
+      lo = glob[i]
+      i += 1
+
+    hi = lo
+    if i + 1 < n and glob[i] == u'-':  # a range like a-z
+      hi = glob[i+1]
+      if hi == u'\\' and i + 2 < n:
+        hi = glob[i+2]
+        i += 1
+      i += 2
+    if lo <= ch <= hi:
+      matched = True
+
+  return matched != negated
+
+
+def _AtomMatches(atom, ch):
+  """Does a ? or char class atom match one character?"""
+  if atom is None:  # ?
+    return True
+  glob, is_ascii = atom
+  if is_ascii and len(ch) == 1:
+    return bool(libc.fnmatch(glob, ch))
+  return _ClassMatchesUnicode(glob, ch)
+
+
+def _MatchForward(seg, s, i):
+  """Match a segment starting at s[i].  Returns the end position or -1."""
+  n = len(s)
+  for atom in seg:
+    if isinstance(atom, str):
+      if not s.startswith(atom, i):
+        return -1
+      i += len(atom)
+    else:
+      if i >= n:
+        return -1
+      end = _CharEnd(s, i)
+      if not _AtomMatches(atom, s[i:end]):
+        return -1
+      i = end
+  return i
+
+
+def _MatchBackward(seg, s, i):
+  """Match a segment ending at s[i].  Returns the start position or -1."""
+  for atom in reversed(seg):
+    if isinstance(atom, str):
+      if not s.endswith(atom, 0, i):
+        return -1
+      i -= len(atom)
+    else:
+      if i <= 0:
+        return -1
+      start = _CharStart(s, i)
+      if not _AtomMatches(atom, s[start:i]):
+        return -1
+      i = start
+  return i
+
+
+def _FindFirst(seg, s, lo):
+  """Return the (start, end) of the first match of a segment at or after lo,
+  or None."""
+  if not seg:
+    return lo, lo
+  n = len(s)
+  i = lo
+  first = seg[0]
+  while i <= n:
+    if isinstance(first, str):  # skip to the literal
+      i = s.find(first, i)
+      if i == -1:
+        return None
+      end = _MatchForward(seg, s, i)
+      if end != -1:
+        return i, end
+      i += 1
+    else:
+      end = _MatchForward(seg, s, i)
+      if end != -1:
+        return i, end
+      if i == n:
+        return None
+      i = _CharEnd(s, i)
+  return None
+
+
+def _FindLast(seg, s, hi):
+  """Return the (start, end) of the last match of a segment that ends at or
+  before hi, or None."""
+  if not seg:
+    return hi, hi
+  i = hi
+  last = seg[-1]
+  while i >= 0:
+    if isinstance(last, str):  # skip back to the literal
+      i = s.rfind(last, 0, i)
+      if i == -1:
+        return None
+      i += len(last)
+      start = _MatchBackward(seg, s, i)
+      if start != -1:
+        return start, i
+      i -= 1
+    else:
+      start = _MatchBackward(seg, s, i)
+      if start != -1:
+        return start, i
+      if i == 0:
+        return None
+      i = _CharStart(s, i)
+  return None
+
+
+def _StripGlob(s, op_id, segments):
+  """Implement ${x#pat} and family with a pattern split by _ParseStripGlob.
+
+  With a single segment, there's only one prefix or suffix to try.
+  Otherwise, the segments between the first and last one are placed as early
+  as possible for prefixes, and as late as possible for suffixes.
+  """
+  n = len(s)
+  first, middle, last = segments[0], segments[1:-1], segments[-1]
+
+  if op_id in (Id.VOp1_Pound, Id.VOp1_DPound):  # prefix
+    pos = _MatchForward(first, s, 0)
+    if pos == -1:
+      return s
+    if len(segments) == 1:
+      return s[pos:]
+
+    for seg in middle:
+      m = _FindFirst(seg, s, pos)
+      if m is None:
+        return s
+      pos = m[1]
+
+    if op_id == Id.VOp1_Pound:  # shortest
+      m = _FindFirst(last, s, pos)
+    else:  # longest
+      m = _FindLast(last, s, n)
+      if m is not None and m[0] < pos:
+        m = None
+    if m is None:
+      return s
+    return s[m[1]:]
+
+  elif op_id in (Id.VOp1_Percent, Id.VOp1_DPercent):  # suffix
+    pos = _MatchBackward(last, s, n)
+    if pos == -1:
+      return s
+    if len(segments) == 1:
+      return s[:pos]
+
+    for seg in reversed(middle):
+      m = _FindLast(seg, s, pos)
+      if m is None:
+        return s
+      pos = m[0]
+
+    if op_id == Id.VOp1_Percent:  # shortest
+      m = _FindLast(first, s, pos)
+    else:  # longest
+      m = _FindFirst(first, s, 0)
+      if m is not None and m[1] > pos:
+        m = None
+    if m is None:
+      return s
+    return s[:m[0]]
+
+  else:
+    raise NotImplementedError("Can't use %s with pattern" % op_id)
+
+
 # TODO:
 # - Unicode support: Convert both pattern, string, and replacement to unicode,
 #   then the result back at the end.
@@ -210,19 +552,12 @@ def DoUnarySuffixOp(s, op, arg):
     else:  # e.g. ^ ^^ , ,,
       raise AssertionError(op.op_id)
 
-  # For patterns, do fnmatch() in a loop.
-  #
-  # TODO:
-  # - The loop needs to iterate over code points, not bytes!
-  #   - The forward case can probably be handled in a similar manner.
-  #   - The backward case might be handled by pre-calculating an array of start
-  #     positions with _NextUtf8Char.
-  # - Another potential fast path:
-  #   v=aabbccdd
-  #   echo ${v#*b}  # strip shortest prefix
-  #
-  # If the whole thing doesn't match '*b*', then no test can succeed.  So we
-  # can fail early.  Conversely echo ${v%%c*} and '*c*'.
+  segments = _ParseStripGlob(arg)
+  if segments is not None:
+    return _StripGlob(s, op.op_id, segments)
+
+  # For extended globs, do fnmatch() in a loop.  This is O(n^2), and it
+  # iterates over bytes rather than code points.
   #
   # (Although honestly this whole construct is nuts and should be deprecated.)
 
@@ -304,9 +639,7 @@ def _PatSubAll(s, regex, replace_str):
 class GlobReplacer(object):
 
   def __init__(self, regex, replace_str, slash_spid):
-    # TODO: It would be nice to cache the compilation of the regex here,
-    # instead of just the string.  That would require more sophisticated use of
-    # the Python/C API in libc.c, which we might want to avoid.
+    # NOTE: libc.c caches the compiled regex, so we only keep the string.
     self.regex = regex
     self.replace_str = replace_str
     self.slash_spid = slash_spid
@@ -55,6 +55,55 @@ class LibStrTest(unittest.TestCase):
       print('%d test %06r return %06r' % (i, s[i:], s[:i]))
     print()
 
+  def testParseStripGlob(self):
+    CASES = [
+        ('a?c*.py', [['a', None, 'c'], ['.py']]),
+        ('*', [[], []]),
+        (r'\*x[!a-z]', [['*x', ('[!a-z]', True)]]),
+        ('[]a][[:alpha:]]', [[('[]a]', True), ('[[:alpha:]]', True)]]),
+        ('[!\xce\xbc]', [[('[!\xce\xbc]', False)]]),
+        ('a[b', [['a[b']]),  # unbalanced [ is literal
+
+        ('@(a|b)', None),
+        ('a\\', None),
+    ]
+    for pat, expected in CASES:
+      self.assertEqual(expected, string_ops._ParseStripGlob(pat), pat)
+
+  def testStripGlob(self):
+    from _devbuild.gen.id_kind_asdl import Id
+
+    def Strip(s, op_id, pat):
+      return string_ops._StripGlob(s, op_id, string_ops._ParseStripGlob(pat))
+
+    s = 'a/b.tar.gz'
+    self.assertEqual('b.tar.gz', Strip(s, Id.VOp1_Pound, '*/'))
+    self.assertEqual('tar.gz', Strip(s, Id.VOp1_Pound, '*.'))
+    self.assertEqual('gz', Strip(s, Id.VOp1_DPound, '*.'))
+    self.assertEqual('a/b.tar', Strip(s, Id.VOp1_Percent, '.*'))
+    self.assertEqual('a/b', Strip(s, Id.VOp1_DPercent, '.*'))
+    self.assertEqual('a/b.tar.g', Strip(s, Id.VOp1_Percent, '?'))
+    self.assertEqual(s, Strip(s, Id.VOp1_Pound, 'x*'))
+    self.assertEqual(s, Strip(s, Id.VOp1_DPercent, '*x'))
+
+    # ? and char classes match a UTF-8 character, not a byte.
+    mu = '\xce\xbc'
+    self.assertEqual('-', Strip(mu + '-', Id.VOp1_Pound, '?'))
+    self.assertEqual('a', Strip('a' + mu, Id.VOp1_Percent, '[!a]'))
+    self.assertEqual('z', Strip('x%sy%sz' % (mu, mu), Id.VOp1_DPound, '*?y?'))
+
+    # Classes are matched by code point, whether or not they contain one.
+    s = mu + 'a'
+    self.assertEqual(s, Strip(s, Id.VOp1_Pound, '[!%s]' % mu))
+    self.assertEqual('a', Strip(s, Id.VOp1_Pound, '[%s]' % mu))
+    self.assertEqual('a', Strip(s, Id.VOp1_Pound, '[!a]'))
+    self.assertEqual(s, Strip(s, Id.VOp1_Pound, '[a]'))
+    self.assertEqual('a', Strip(s, Id.VOp1_Pound, '[[:alpha:]]'))
+    self.assertEqual(s, Strip(s, Id.VOp1_Pound, '[![:alpha:]]'))
+    alpha_omega = '\xce\xb1-\xcf\x89'
+    self.assertEqual('a', Strip(s, Id.VOp1_Pound, '[%s]' % alpha_omega))
+    self.assertEqual(s, Strip(s, Id.VOp1_Pound, '[a-z]'))
+
   def testPatSubAllMatches(self):
     s = 'oXooXoooX'
 
@@ -108,14 +108,19 @@ class Grammar(object):
         are not changed back to dict. For parsing, this has no effect on
         performance because OrderedDict uses dict's __getitem__ with nothing in
         between.
+
+        Oil patch: marshal doesn't preserve sharing, so we don't write tables
+        that loads() can derive.  number2symbol is the inverse of
+        symbol2number, and dfas has the same DFAs as states, so we only write
+        the 'first' sets.
         """
         #self.report()
+        firsts = [self.dfas[i + 256][1] for i in xrange(len(self.states))]
         payload = (
           self.MARSHAL_HEADER,
           self.symbol2number,
-          self.number2symbol,
           self.states,
-          self.dfas,
+          firsts,
           self.labels,
           self.keywords,
           self.tokens,
@@ -135,7 +140,7 @@ class Grammar(object):
           name = self.number2symbol[num]
           f.write('%s = %d\n' % (name, num))
 
-    MARSHAL_HEADER = 'PGEN2\n'  # arbitrary header
+    MARSHAL_HEADER = 'PGEN2 v2\n'  # arbitrary header, changed with format
 
     def loads(self, s):
         # type: (str) -> None
@@ -150,9 +155,8 @@ class Grammar(object):
 
         ( _,
           self.symbol2number,
-          self.number2symbol,
           self.states,
-          self.dfas,
+          firsts,
           self.labels,
           self.keywords,
           self.tokens,
@@ -162,7 +166,16 @@ class Grammar(object):
         #self.report()
 
         assert isinstance(self.symbol2number, dict), self.symbol2number
-        assert isinstance(self.number2symbol, dict), self.number2symbol
+
+        self.number2symbol = {}
+        for name, num in self.symbol2number.iteritems():
+          self.number2symbol[num] = name
+
+        # Symbol numbers start at 256, in the order of states.  See
+        # pgen.MakeGrammar().
+        self.dfas = {}
+        for i, states in enumerate(self.states):
+          self.dfas[i + 256] = (states, firsts[i])
 
     def report(self):
         # type: () -> None
@@ -419,3 +419,27 @@ echo {z..3}
 ## BUG zsh STDOUT:
 BUG
 ## END
+
+#### for loop words are evaluated before a brace range
+x=1
+for i in $x {1..2} $x; do
+  x=9
+  echo $i
+done
+for i in {1..100000}; do
+  echo $i
+  break
+done
+## STDOUT:
+1
+1
+2
+1
+1
+## END
+## N-I mksh STDOUT:
+1
+{1..2}
+1
+{1..100000}
+## END
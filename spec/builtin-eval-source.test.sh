@@ -201,3 +201,34 @@ echo 'exit 42' > lib.sh
 echo 'should not get here'
 ## stdout-json: ""
 ## status: 42
+
+#### aliases defined while sourcing apply to the rest of the file (with cache)
+cd $TMP
+cat > alias-lib.sh <<'EOF2'
+if test -n "$X"; then alias hi='echo ALIAS'; fi
+hi there
+EOF2
+cat > alias-main.sh <<'EOF2'
+shopt -s expand_aliases  # bash
+hi() { echo FUNC "$@"; }
+. ./alias-lib.sh
+X=1
+. ./alias-lib.sh
+unalias hi
+X=
+. ./alias-lib.sh
+EOF2
+rm -r -f source-cache
+# OSH parses the file once, and then uses the cache.  The second process gets
+# the nodes from disk.
+OSH_SOURCE_CACHE=1 OSH_SOURCE_CACHE_DIR=source-cache $SH alias-main.sh
+OSH_SOURCE_CACHE=1 OSH_SOURCE_CACHE_DIR=source-cache X=1 $SH -c '
+shopt -s expand_aliases
+hi() { echo FUNC "$@"; }
+. ./alias-lib.sh'
+## STDOUT:
+FUNC there
+ALIAS there
+FUNC there
+ALIAS there
+## END
@@ -0,0 +1,89 @@
+# mapfile / readarray are bash-only
+
+#### mapfile reads lines into MAPFILE
+printf 'a\nb\nc' > tmp.txt
+mapfile < tmp.txt
+echo ${#MAPFILE[@]}
+printf '[%s]\n' "${MAPFILE[@]}"
+## STDOUT:
+3
+[a
+]
+[b
+]
+[c]
+## END
+
+#### readarray -t into a named array
+printf 'a\nb\n\nc\n' | { readarray -t lines; echo ${#lines[@]}; printf '[%s]\n' "${lines[@]}"; }
+## STDOUT:
+4
+[a]
+[b]
+[]
+[c]
+## END
+
+#### mapfile -n and -s
+seq 10 > tmp.txt
+mapfile -t -s 2 -n 3 nums < tmp.txt
+echo "${nums[@]}"
+mapfile -t -s 8 nums < tmp.txt
+echo "${nums[@]}"
+## STDOUT:
+3 4 5
+9 10
+## END
+
+#### mapfile -n leaves the rest of the input
+seq 5 > tmp.txt
+{ mapfile -t -n 2 first; cat; } < tmp.txt
+echo "${first[@]}"
+seq 5 | { mapfile -t -n 2 first; cat; echo "${first[@]}"; }
+## STDOUT:
+3
+4
+5
+1 2
+3
+4
+5
+1 2
+## END
+
+#### mapfile -d
+printf 'a:b:c' | { mapfile -t -d : parts; echo ${#parts[@]}; echo "${parts[@]}"; }
+printf 'x\0y\0' | { mapfile -t -d '' parts; echo ${#parts[@]}; echo "${parts[@]}"; }
+## STDOUT:
+3
+a b c
+2
+x y
+## END
+
+#### mapfile -u
+seq 3 > tmp.txt
+mapfile -t -u 5 nums 5< tmp.txt
+echo "${nums[@]}"
+mapfile -u 8 nums 2>/dev/null
+echo status=$?
+## STDOUT:
+1 2 3
+status=1
+## END
+
+#### mapfile replaces the array
+a=(x y z w)
+mapfile -t a <<< hi
+echo "${a[@]}"
+mapfile -t a < /dev/null
+echo ${#a[@]}
+## STDOUT:
+hi
+0
+## END
+
+#### mapfile invalid count
+mapfile -n -1 a < /dev/null 2>/dev/null
+echo status=$?
+## stdout: status=1
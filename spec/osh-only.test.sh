@@ -60,5 +60,32 @@ status=1
 OK
 ## END
 
+#### shopt -s fast_command_sub runs builtins and functions without forking
+shopt -s fast_command_sub
+set -- a b
+x=global
+f() { local y=local; x=changed; shift; echo "$y $1"; }
+out=$(f "$@"; echo $x)
+echo "$out" x=$x args=$@
+
+# The sub's changes to arrays aren't visible
+arr=(1 2)
+out=$(arr[0]=X; echo ${arr[@]})
+echo $out ${arr[@]}
+
+# Falls back to forking for external commands and cd
+out=$(echo one; cd /; pwd; seq 2)
+echo $out $(pwd | grep -c '^/$')
+
+out=$(echo before; exit 3)
+echo "$out" status=$?
+## STDOUT:
+local b
+changed x=global args=a b
+X 2 1 2
+one / 1 2 0
+before status=3
+## END
+
 # NOTE: strict_arith has one case in arith.test.sh), strict_word-eval has a case in var-op-other.
 